@@ -0,0 +1,33 @@
+"""conversationsに会議単位のキーセットページネーション用インデックスを追加.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-18
+
+発言一覧は id をカーソルにしたキーセットページネーションで取得する。
+会議で絞り込む場合は minutes_id ごとに id 順で読むため、(minutes_id, id) の
+複合インデックスを追加する。絞り込みなしの場合は主キーで足りる。
+"""
+
+from alembic import op
+
+
+revision = "045"
+down_revision = "044"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add (minutes_id, id) index to conversations."""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_conversations_minutes_id_id
+        ON conversations (minutes_id, id);
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Drop (minutes_id, id) index from conversations."""
+    op.execute("""
+        DROP INDEX IF EXISTS idx_conversations_minutes_id_id;
+    """)
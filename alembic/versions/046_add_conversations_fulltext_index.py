@@ -0,0 +1,68 @@
+"""conversations.commentに日本語全文検索用のN-gramインデックスを追加.
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-18
+
+発言内容の検索は ILIKE '%...%' による全件走査になっていたため、
+NFKC正規化・小文字化した本文の1文字・2文字のN-gramを tsvector にする
+IMMUTABLE関数を定義し、その式に GIN インデックスを張る。
+
+pg_bigm は公式のPostgreSQLイメージに含まれず、pg_trgm は3文字未満の
+検索語にインデックスを使えない（日本語の検索語は2文字が多い）ため、
+拡張機能に頼らずSQL関数でバイグラムを生成する。
+インデックス式から呼ぶ関数はスキーマ修飾する（pg_dump のリストアは
+search_path を空にして実行されるため）。
+"""
+
+from alembic import op
+
+
+revision = "046"
+down_revision = "045"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add bigram full-text index to conversations.comment."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ja_search_normalize(body text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+        AS $$
+            SELECT lower(normalize(body, NFKC))
+        $$;
+    """)
+    op.execute(r"""
+        CREATE OR REPLACE FUNCTION ja_bigram_tsvector(body text)
+        RETURNS tsvector
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT COALESCE(array_to_tsvector(array_agg(DISTINCT gram)), ''::tsvector)
+            FROM (
+                SELECT substr(t.norm, i, n) AS gram
+                FROM (SELECT public.ja_search_normalize(body) AS norm) AS t,
+                     generate_series(1, 2) AS n,
+                     generate_series(1, char_length(t.norm) - n + 1) AS i
+            ) AS grams
+            WHERE gram !~ '\s'
+        $$;
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_conversations_comment_bigram
+        ON conversations USING gin (ja_bigram_tsvector(comment));
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Drop bigram full-text index from conversations."""
+    op.execute("""
+        DROP INDEX IF EXISTS idx_conversations_comment_bigram;
+    """)
+    op.execute("""
+        DROP FUNCTION IF EXISTS ja_bigram_tsvector(text);
+    """)
+    op.execute("""
+        DROP FUNCTION IF EXISTS ja_search_normalize(text);
+    """)
@@ -0,0 +1,217 @@
+"""モニタリング用の集計をマテリアライズドビューとして追加.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-18
+
+MonitoringRepositoryImpl は会議・発言・発言者・政治家をJOINして件数や
+カバレッジを画面表示のたびに集計していた。集計結果をマテリアライズドビューに
+保持し、`sagebase refresh-monitoring`（REFRESH MATERIALIZED VIEW CONCURRENTLY）で
+更新する。各ビューの refreshed_at は最後に更新した時刻を表す。
+
+CONCURRENTLY での更新には一意インデックスが必要なため、各ビューの id に張る。
+集計は多対多のJOINによる行の掛け合わせを避けるため、テーブルごとに
+先に集計してから結合する。
+
+ビューが参照するテーブルのカラムを削除・型変更する場合は、先にビューを
+削除して作り直す必要がある。
+"""
+
+from alembic import op
+
+
+revision = "047"
+down_revision = "046"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add monitoring materialized views."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_monitoring_overall AS
+        SELECT
+            1 AS id,
+            (SELECT COUNT(*) FROM governing_bodies) AS total_governing_bodies,
+            (SELECT COUNT(DISTINCT governing_body_id) FROM conferences)
+                AS active_governing_bodies,
+            (SELECT COUNT(*) FROM conferences) AS total_conferences,
+            (SELECT COUNT(DISTINCT conference_id) FROM meetings)
+                AS active_conferences,
+            (SELECT COUNT(*) FROM meetings) AS total_meetings,
+            (SELECT COUNT(*) FROM politicians) AS total_politicians,
+            (SELECT COUNT(DISTINCT p.id)
+             FROM politicians p
+             JOIN conference_members cm ON p.id = cm.politician_id)
+                AS active_politicians,
+            (SELECT COUNT(*) FROM political_parties) AS total_parties,
+            (SELECT COUNT(DISTINCT pmh.political_party_id)
+             FROM party_membership_history pmh
+             WHERE pmh.end_date IS NULL) AS active_parties,
+            (SELECT COUNT(*) FROM conversations) AS total_conversations,
+            (SELECT COUNT(DISTINCT speaker_id) FROM conversations
+             WHERE speaker_id IS NOT NULL) AS linked_conversations,
+            (SELECT COUNT(*) FROM speakers) AS total_speakers,
+            (SELECT COUNT(*) FROM speakers
+             WHERE type = 'politician' OR type = '政治家') AS linked_speakers,
+            now() AS refreshed_at;
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_monitoring_overall_id
+        ON mv_monitoring_overall (id);
+    """)
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_conference_coverage AS
+        WITH meeting_conversations AS (
+            SELECT mi.meeting_id, COUNT(*) AS conversation_count
+            FROM minutes mi
+            JOIN conversations conv ON mi.id = conv.minutes_id
+            GROUP BY mi.meeting_id
+        ),
+        conference_meetings AS (
+            SELECT
+                m.conference_id,
+                COUNT(*) AS meeting_count,
+                SUM(COALESCE(mc.conversation_count, 0))::bigint
+                    AS conversation_count,
+                MIN(m.date) AS first_meeting_date,
+                MAX(m.date) AS last_meeting_date
+            FROM meetings m
+            LEFT JOIN meeting_conversations mc ON m.id = mc.meeting_id
+            GROUP BY m.conference_id
+        ),
+        conference_politicians AS (
+            SELECT conference_id, COUNT(DISTINCT politician_id) AS politician_count
+            FROM conference_members
+            GROUP BY conference_id
+        )
+        SELECT
+            c.id,
+            c.name,
+            gb.name AS governing_body_name,
+            COALESCE(cm.meeting_count, 0) AS meeting_count,
+            COALESCE(cp.politician_count, 0) AS politician_count,
+            COALESCE(cm.conversation_count, 0) AS conversation_count,
+            cm.first_meeting_date,
+            cm.last_meeting_date,
+            now() AS refreshed_at
+        FROM conferences c
+        JOIN governing_bodies gb ON c.governing_body_id = gb.id
+        LEFT JOIN conference_meetings cm ON c.id = cm.conference_id
+        LEFT JOIN conference_politicians cp ON c.id = cp.conference_id;
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_conference_coverage_id
+        ON mv_conference_coverage (id);
+    """)
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_governing_body_coverage AS
+        WITH meeting_conversations AS (
+            SELECT mi.meeting_id, COUNT(*) AS conversation_count
+            FROM minutes mi
+            JOIN conversations conv ON mi.id = conv.minutes_id
+            GROUP BY mi.meeting_id
+        ),
+        body_conferences AS (
+            SELECT governing_body_id, COUNT(*) AS conference_count
+            FROM conferences
+            GROUP BY governing_body_id
+        ),
+        body_meetings AS (
+            SELECT
+                c.governing_body_id,
+                COUNT(*) AS meeting_count,
+                SUM(COALESCE(mc.conversation_count, 0))::bigint
+                    AS conversation_count,
+                MIN(m.date) AS first_meeting_date,
+                MAX(m.date) AS last_meeting_date
+            FROM meetings m
+            JOIN conferences c ON m.conference_id = c.id
+            LEFT JOIN meeting_conversations mc ON m.id = mc.meeting_id
+            GROUP BY c.governing_body_id
+        ),
+        body_politicians AS (
+            SELECT
+                c.governing_body_id,
+                COUNT(DISTINCT cm.politician_id) AS politician_count
+            FROM conference_members cm
+            JOIN conferences c ON cm.conference_id = c.id
+            GROUP BY c.governing_body_id
+        )
+        SELECT
+            gb.id,
+            gb.name,
+            gb.type,
+            gb.organization_code,
+            gb.organization_type,
+            COALESCE(bc.conference_count, 0) AS conference_count,
+            COALESCE(bm.meeting_count, 0) AS meeting_count,
+            COALESCE(bp.politician_count, 0) AS politician_count,
+            COALESCE(bm.conversation_count, 0) AS conversation_count,
+            bm.first_meeting_date,
+            bm.last_meeting_date,
+            now() AS refreshed_at
+        FROM governing_bodies gb
+        LEFT JOIN body_conferences bc ON gb.id = bc.governing_body_id
+        LEFT JOIN body_meetings bm ON gb.id = bm.governing_body_id
+        LEFT JOIN body_politicians bp ON gb.id = bp.governing_body_id;
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_governing_body_coverage_id
+        ON mv_governing_body_coverage (id);
+    """)
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_party_coverage AS
+        WITH party_politicians AS (
+            SELECT
+                pmh.political_party_id,
+                COUNT(DISTINCT p.id) AS politician_count
+            FROM party_membership_history pmh
+            JOIN politicians p ON pmh.politician_id = p.id
+            WHERE pmh.end_date IS NULL
+            GROUP BY pmh.political_party_id
+        ),
+        party_speakers AS (
+            SELECT
+                s.political_party_name,
+                COUNT(DISTINCT s.id) AS speaker_count,
+                COUNT(c.id) AS conversation_count
+            FROM speakers s
+            LEFT JOIN conversations c ON s.id = c.speaker_id
+            WHERE s.political_party_name IS NOT NULL
+            GROUP BY s.political_party_name
+        )
+        SELECT
+            pp.id,
+            pp.name,
+            COALESCE(ppol.politician_count, 0) AS politician_count,
+            COALESCE(ps.speaker_count, 0) AS speaker_count,
+            COALESCE(ps.conversation_count, 0) AS conversation_count,
+            now() AS refreshed_at
+        FROM political_parties pp
+        LEFT JOIN party_politicians ppol ON pp.id = ppol.political_party_id
+        LEFT JOIN party_speakers ps ON pp.name = ps.political_party_name;
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_party_coverage_id
+        ON mv_party_coverage (id);
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Drop monitoring materialized views."""
+    op.execute("""
+        DROP MATERIALIZED VIEW IF EXISTS mv_party_coverage;
+    """)
+    op.execute("""
+        DROP MATERIALIZED VIEW IF EXISTS mv_governing_body_coverage;
+    """)
+    op.execute("""
+        DROP MATERIALIZED VIEW IF EXISTS mv_conference_coverage;
+    """)
+    op.execute("""
+        DROP MATERIALIZED VIEW IF EXISTS mv_monitoring_overall;
+    """)
@@ -0,0 +1,146 @@
+"""発言一括登録（ConversationRepositoryImpl.bulk_create）のベンチマーク.
+
+1k / 10k / 100k 件の発言を bulk_create で登録し、rows/秒 を計測する。
+比較用に、従来の1件ずつ INSERT ... RETURNING を発行する方式も計測できる。
+計測はトランザクション内で行い、最後にロールバックするためデータは残らない。
+
+Usage (Docker経由で実行):
+    docker compose -f docker/docker-compose.yml exec sagebase \
+        uv run python scripts/benchmark_conversation_bulk_insert.py
+
+    # 件数を指定し、従来方式（1件ずつINSERT）とも比較する
+    docker compose -f docker/docker-compose.yml exec sagebase \
+        uv run python scripts/benchmark_conversation_bulk_insert.py \
+        --sizes 1000 10000 --compare-row-by-row
+
+前提条件:
+    - Docker環境が起動済み（just up-detached）
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.conversation import Conversation
+from src.infrastructure.config.async_database import async_db
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationRepositoryImpl,
+)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# 本会議の平均的な発言に近い長さのダミー本文
+SAMPLE_COMMENT = "ただいまから本日の会議を開きます。" * 8
+
+
+def _make_conversations(count: int) -> list[Conversation]:
+    return [
+        Conversation(
+            comment=SAMPLE_COMMENT,
+            sequence_number=i + 1,
+            speaker_name=f"ベンチマーク発言者{i % 50}",
+        )
+        for i in range(count)
+    ]
+
+
+async def _insert_row_by_row(
+    session: AsyncSession, conversations: list[Conversation]
+) -> None:
+    """従来方式: 1件ずつ INSERT ... RETURNING id を発行する."""
+    query = text("""
+        INSERT INTO conversations
+        (minutes_id, speaker_id, speaker_name, comment, sequence_number,
+         chapter_number, sub_chapter_number)
+        VALUES
+        (:minutes_id, :speaker_id, :speaker_name, :comment,
+         :sequence_number, :chapter_number, :sub_chapter_number)
+        RETURNING id
+    """)
+    for conv in conversations:
+        result = await session.execute(
+            query,
+            {
+                "minutes_id": conv.minutes_id,
+                "speaker_id": conv.speaker_id,
+                "speaker_name": conv.speaker_name,
+                "comment": conv.comment,
+                "sequence_number": conv.sequence_number,
+                "chapter_number": conv.chapter_number,
+                "sub_chapter_number": conv.sub_chapter_number,
+            },
+        )
+        conv.id = result.scalar()
+
+
+async def _measure(size: int, row_by_row: bool) -> float:
+    """指定件数を登録し rows/秒 を返す（計測後にロールバック）."""
+    conversations = _make_conversations(size)
+    async with async_db.get_session_autocommit() as session:
+        try:
+            started = time.perf_counter()
+            if row_by_row:
+                await _insert_row_by_row(session, conversations)
+            else:
+                await ConversationRepositoryImpl(session).bulk_create(conversations)
+            elapsed = time.perf_counter() - started
+        finally:
+            await session.rollback()
+
+    ids = [c.id for c in conversations]
+    if None in ids or ids != sorted(ids):
+        raise RuntimeError("IDが入力順に採番されていません")
+    return size / elapsed if elapsed > 0 else float("inf")
+
+
+async def main(sizes: list[int], compare_row_by_row: bool) -> None:
+    methods = [("bulk_create", False)]
+    if compare_row_by_row:
+        methods.append(("row-by-row", True))
+
+    results: list[tuple[str, int, float]] = []
+    for size in sizes:
+        for label, row_by_row in methods:
+            rate = await _measure(size, row_by_row)
+            logger.info("%s: %d件 %.0f rows/s", label, size, rate)
+            results.append((label, size, rate))
+
+    print()
+    print(f"{'method':<14}{'rows':>10}{'rows/s':>14}")
+    for label, size, rate in results:
+        print(f"{label:<14}{size:>10,}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="発言一括登録のベンチマーク")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="計測する件数（デフォルト: 1000 10000 100000）",
+    )
+    parser.add_argument(
+        "--compare-row-by-row",
+        action="store_true",
+        help="従来の1件ずつINSERTする方式も計測する",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.compare_row_by_row))
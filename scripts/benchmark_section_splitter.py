@@ -0,0 +1,159 @@
+"""キーワードによる議事録セクション分割（split_by_keywords）のベンチマーク.
+
+約500KBの合成議事録を作り、LLMが返すセクション先頭キーワードで分割する時間を
+計測する。比較用に、キーワードごとに正規化済み全文を str.find で検索し、
+正規化後の位置をそのまま元テキストに適用する従来方式も計測し、
+両者で境界が食い違ったセクション数を表示する。
+
+合成議事録には全角英数字・半角カナ・タブを混ぜ、正規化で文字数が変わる状況を
+再現する。--missing-ratio で議事録に存在しないキーワードの割合を指定できる。
+
+Usage:
+    uv run python scripts/benchmark_section_splitter.py
+
+    # 1MB・キーワードの2割が見つからない場合
+    uv run python scripts/benchmark_section_splitter.py \
+        --size-kb 1000 --missing-ratio 0.2
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.external.minutes_divider.section_splitter import (
+    split_by_keywords,
+)
+
+
+SPEAKERS = [
+    "○議長(山田太郎君)",
+    "◆委員(佐藤花子君)",
+    "◎市長(鈴木一郎君)",
+    "◯部長(田中次郎君)",
+]
+SENTENCES = [
+    "本市の財政状況について令和５年度の決算を踏まえてお伺いします。",
+    "ＤＸ推進計画の進捗は第２期の目標に対して８割程度です。",
+    "ｺﾐｭﾆﾃｨﾊﾞｽの運行経路の見直しを検討しております。",
+    "ただいまの質問にお答えいたします。\t以上です。",
+]
+KEYWORD_LENGTH = 30
+
+
+def _make_minutes(
+    size_bytes: int, missing_ratio: float, seed: int
+) -> tuple[str, list[str]]:
+    """合成議事録とセクション先頭キーワードのリストを作る."""
+    rng = random.Random(seed)
+    sections: list[str] = []
+    keywords: list[str] = []
+    total = 0
+    while total < size_bytes:
+        header = f"{rng.choice(SPEAKERS)}第{len(sections) + 1}項 "
+        body = "".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 40)))
+        section = header + body
+        sections.append(section)
+        total += len(section.encode("utf-8"))
+        if rng.random() < missing_ratio:
+            keywords.append(f"存在しないキーワード{len(keywords)}")
+        else:
+            keywords.append(section[:KEYWORD_LENGTH])
+    return "".join(sections), keywords
+
+
+def _legacy_normalize(text: str) -> str:
+    normalized = unicodedata.normalize("NFKC", text)
+    normalized = normalized.replace("◯", "○").replace("●", "○")
+    normalized = normalized.replace("\t", " ")
+    return re.sub(r" +", " ", normalized)
+
+
+def _legacy_split(text: str, keywords: list[str]) -> list[str]:
+    """従来方式: キーワードごとに str.find し、正規化後の位置で元テキストを切る."""
+    normalized = _legacy_normalize(text)
+    starts: list[int] = []
+    for index, keyword in enumerate(keywords):
+        key = _legacy_normalize(keyword)
+        origin = starts[-1] + 1 if starts else 0
+        found = normalized.find(key, origin)
+        if found == -1 and len(key) > 10:
+            found = normalized.find(key[:10], origin)
+        if found == -1:
+            if index == 0:
+                starts.append(0)
+            continue
+        starts.append(found)
+    ends = starts[1:] + [len(normalized)]
+    return [text[s:e].strip() for s, e in zip(starts, ends, strict=True)]
+
+
+def _new_split(text: str, keywords: list[str]) -> list[str]:
+    result = split_by_keywords(text, keywords)
+    return [text[span.start : span.end].strip() for span in result.spans]
+
+
+def _measure(func, text: str, keywords: list[str], repeat: int):
+    best = float("inf")
+    sections: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        sections = func(text, keywords)
+        best = min(best, time.perf_counter() - started)
+    return best, sections
+
+
+def main(size_kb: int, missing_ratio: float, repeat: int, seed: int) -> None:
+    text, keywords = _make_minutes(size_kb * 1000, missing_ratio, seed)
+    print(
+        f"議事録: {len(text.encode('utf-8')):,} bytes / {len(text):,} 文字, "
+        f"キーワード: {len(keywords)} 件"
+    )
+
+    legacy_time, legacy_sections = _measure(_legacy_split, text, keywords, repeat)
+    new_time, new_sections = _measure(_new_split, text, keywords, repeat)
+
+    # 正しい境界ではセクションは発言者マーカーから始まる
+    misaligned = sum(
+        1 for section in legacy_sections if not section.startswith(("○", "◆", "◎", "◯"))
+    )
+    new_misaligned = sum(
+        1 for section in new_sections if not section.startswith(("○", "◆", "◎", "◯"))
+    )
+
+    print()
+    print(f"{'method':<12}{'sections':>10}{'seconds':>12}{'misaligned':>12}")
+    print(
+        f"{'legacy':<12}{len(legacy_sections):>10,}{legacy_time:>12.4f}"
+        f"{misaligned:>12,}"
+    )
+    print(
+        f"{'splitter':<12}{len(new_sections):>10,}{new_time:>12.4f}"
+        f"{new_misaligned:>12,}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="議事録セクション分割のベンチマーク")
+    parser.add_argument(
+        "--size-kb", type=int, default=500, help="議事録のサイズ（KB, デフォルト: 500）"
+    )
+    parser.add_argument(
+        "--missing-ratio",
+        type=float,
+        default=0.0,
+        help="議事録に存在しないキーワードの割合（デフォルト: 0.0）",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="計測回数（最良値を表示, デフォルト: 3）"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    args = parser.parse_args()
+    main(args.size_kb, args.missing_ratio, args.repeat, args.seed)
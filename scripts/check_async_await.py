@@ -52,6 +52,8 @@ class AsyncAwaitChecker(ast.NodeVisitor):
             "get_by_speaker",
             "bulk_create",
             "bulk_update",
+            "bulk_update_fields",
+            "bulk_upsert_on",
             "bulk_delete",
             # その他の非同期メソッド
             "fetch_html",
@@ -0,0 +1,328 @@
+"""重要なリポジトリクエリの実行計画をベースラインと比較する.
+
+合成データ（実運用に近い件数）を投入して ANALYZE したうえで、登録した
+リポジトリのメソッドを実行し、発行されたSQLを EXPLAIN (FORMAT JSON) する。
+計画の形（ノード種別・テーブル・インデックス）と推定コストを
+database/query_plan_baselines.json と比べ、悪化していれば差分を表示して
+終了コード1で終わる。データの投入から比較まで1つのトランザクション内で行い、
+最後にロールバックするためデータは残らない。
+
+計画はテーブルの既存データにも左右されるため、マイグレーション直後の
+空のデータベースで実行する。意図して計画を変えた場合は --update で
+ベースラインを更新してコミットする。ベースラインのファイルがまだない
+場合は、比較せずに終了コード2で終わる（最初に --update で作成する）。
+
+Usage (Docker経由で実行):
+    docker compose -f docker/docker-compose.yml exec sagebase \
+        uv run python scripts/check_query_plans.py
+
+    # ベースラインを更新する
+    docker compose -f docker/docker-compose.yml exec sagebase \
+        uv run python scripts/check_query_plans.py --update
+
+前提条件:
+    - Docker環境が起動済み（just up-detached）
+    - alembic upgrade head 済みの空のデータベース
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.config.database import DATABASE_URL
+from src.infrastructure.monitoring.query_plan_regression import (
+    DEFAULT_COST_TOLERANCE,
+    QueryPlanCase,
+    QueryPlanSummary,
+    capture_statements,
+    explain_statement,
+    find_regressions,
+    load_baselines,
+    save_baselines,
+)
+from src.infrastructure.persistence.async_session_adapter import AsyncSessionAdapter
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationRepositoryImpl,
+)
+from src.infrastructure.persistence.politician_repository_impl import (
+    PoliticianRepositoryImpl,
+)
+from src.infrastructure.persistence.speaker_repository_impl import (
+    SpeakerRepositoryImpl,
+)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = (
+    Path(__file__).resolve().parent.parent / "database" / "query_plan_baselines.json"
+)
+
+# 合成データで投入する行にはこの接頭辞を付ける
+SEED_PREFIX = "計画検証"
+
+# scale=1 の件数（発言は 会議体 × 会議 × 議事録あたりの発言 で約30万件）
+SEED_GOVERNING_BODIES = 1_000
+SEED_CONFERENCES_PER_BODY = 3
+SEED_MEETINGS_PER_CONFERENCE = 10
+SEED_CONVERSATIONS_PER_MINUTES = 10
+SEED_POLITICIANS = 10_000
+SEED_SPEAKERS = 20_000
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO governing_bodies (name, type)
+    SELECT :prefix || '自治体' || i,
+           CASE WHEN i % 20 = 0 THEN '都道府県' ELSE '市町村' END
+    FROM generate_series(1, :governing_bodies) AS i
+    """,
+    """
+    INSERT INTO conferences (name, governing_body_id)
+    SELECT :prefix || '議会' || n, gb.id
+    FROM governing_bodies gb
+    CROSS JOIN generate_series(1, :conferences_per_body) AS n
+    WHERE gb.name LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO meetings (conference_id, date, name)
+    SELECT c.id, DATE '2015-01-01' + ((c.id * 37 + n * 11) % 3650), '定例会'
+    FROM conferences c
+    CROSS JOIN generate_series(1, :meetings_per_conference) AS n
+    WHERE c.name LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO minutes (meeting_id)
+    SELECT m.id
+    FROM meetings m
+    JOIN conferences c ON m.conference_id = c.id
+    WHERE c.name LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO politicians (name, prefecture, furigana)
+    SELECT :prefix || '議員' || i, '東京都', 'けいかくけんしょう' || i
+    FROM generate_series(1, :politicians) AS i
+    """,
+    """
+    INSERT INTO speakers (name, type, is_politician, politician_id)
+    SELECT :prefix || '発言者' || i,
+           CASE WHEN p.id IS NULL THEN NULL ELSE '政治家' END,
+           p.id IS NOT NULL,
+           p.id
+    FROM generate_series(1, :speakers) AS i
+    LEFT JOIN politicians p
+        ON i % 2 = 0 AND p.name = :prefix || '議員' || (i / 2)
+    """,
+    """
+    INSERT INTO conversations
+        (minutes_id, speaker_id, speaker_name, comment, sequence_number)
+    SELECT mi.id, s.id, s.name,
+           '議案第' || n || '号について' || s.name || 'から質問します。', n
+    FROM minutes mi
+    JOIN meetings m ON mi.meeting_id = m.id
+    JOIN conferences c ON m.conference_id = c.id
+    CROSS JOIN generate_series(1, :conversations_per_minutes) AS n
+    JOIN speakers s
+        ON s.name = :prefix || '発言者' || (1 + (mi.id * 31 + n) % :speakers)
+    WHERE c.name LIKE :prefix || '%'
+    """,
+]
+
+ANALYZED_TABLES = [
+    "governing_bodies",
+    "conferences",
+    "meetings",
+    "minutes",
+    "politicians",
+    "speakers",
+    "conversations",
+]
+
+
+def _seed(session: Session, scale: float) -> dict[str, Any]:
+    """合成データを投入し、検証に使うIDや名前を返す."""
+    params = {
+        "prefix": SEED_PREFIX,
+        "governing_bodies": max(1, int(SEED_GOVERNING_BODIES * scale)),
+        "conferences_per_body": SEED_CONFERENCES_PER_BODY,
+        "meetings_per_conference": SEED_MEETINGS_PER_CONFERENCE,
+        "conversations_per_minutes": SEED_CONVERSATIONS_PER_MINUTES,
+        "politicians": max(1, int(SEED_POLITICIANS * scale)),
+        "speakers": max(2, int(SEED_SPEAKERS * scale)),
+    }
+    for statement in SEED_STATEMENTS:
+        session.execute(text(statement), params)
+    for table in ANALYZED_TABLES:
+        session.execute(text(f"ANALYZE {table}"))
+
+    sample = session.execute(
+        text("""
+        SELECT mi.id AS minutes_id, mi.meeting_id, conv.speaker_id,
+               s.name AS speaker_name, s.politician_id, p.name AS politician_name
+        FROM conversations conv
+        JOIN minutes mi ON conv.minutes_id = mi.id
+        JOIN speakers s ON conv.speaker_id = s.id
+        JOIN politicians p ON s.politician_id = p.id
+        WHERE s.name LIKE :prefix || '%'
+        ORDER BY conv.id
+        LIMIT 1
+        """),
+        {"prefix": SEED_PREFIX},
+    ).one()
+    return dict(sample._mapping)
+
+
+def _cases(sample: dict[str, Any]) -> list[QueryPlanCase]:
+    """実行計画を検証するリポジトリのメソッド."""
+    return [
+        QueryPlanCase(
+            "conversations.get_by_minutes",
+            lambda s: ConversationRepositoryImpl(s).get_by_minutes(
+                sample["minutes_id"]
+            ),
+        ),
+        QueryPlanCase(
+            "conversations.get_by_meeting",
+            lambda s: ConversationRepositoryImpl(s).get_by_meeting(
+                sample["meeting_id"]
+            ),
+        ),
+        QueryPlanCase(
+            "conversations.get_by_speaker",
+            lambda s: ConversationRepositoryImpl(s).get_by_speaker(
+                sample["speaker_id"], limit=100
+            ),
+        ),
+        QueryPlanCase(
+            "conversations.get_keyset_page",
+            lambda s: ConversationRepositoryImpl(s).get_keyset_page(page_size=50),
+        ),
+        QueryPlanCase(
+            "conversations.get_keyset_page.meeting",
+            lambda s: ConversationRepositoryImpl(s).get_keyset_page(
+                page_size=50, meeting_id=sample["meeting_id"]
+            ),
+        ),
+        QueryPlanCase(
+            "conversations.search_by_text",
+            lambda s: ConversationRepositoryImpl(s).search_by_text(
+                "議案第3号", limit=20
+            ),
+        ),
+        QueryPlanCase(
+            "speakers.find_by_name",
+            lambda s: SpeakerRepositoryImpl(s).find_by_name(sample["speaker_name"]),
+        ),
+        QueryPlanCase(
+            "speakers.get_by_politician_id",
+            lambda s: SpeakerRepositoryImpl(s).get_by_politician_id(
+                sample["politician_id"]
+            ),
+        ),
+        QueryPlanCase(
+            "politicians.get_by_name",
+            lambda s: PoliticianRepositoryImpl(s).get_by_name(
+                sample["politician_name"]
+            ),
+        ),
+        QueryPlanCase(
+            "politicians.search_by_name",
+            lambda s: PoliticianRepositoryImpl(s).search_by_name("議員12"),
+        ),
+    ]
+
+
+async def collect_plans(database_url: str, scale: float) -> dict[str, QueryPlanSummary]:
+    """合成データを投入し、登録したメソッドの実行計画を集める（最後にロールバック）."""
+    engine = create_engine(database_url)
+    plans: dict[str, QueryPlanSummary] = {}
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            # メソッド内のコミットはセーブポイントの解放にとどめる
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                logger.info("合成データを投入しています (scale=%s)", scale)
+                sample = _seed(session, scale)
+                repository_session = AsyncSessionAdapter(session)
+
+                for case in _cases(sample):
+                    with capture_statements(engine) as captured:
+                        await case.run(repository_session)
+                    if not captured:
+                        logger.warning("%s はSQLを発行しませんでした", case.name)
+                    for index, statement in enumerate(captured, start=1):
+                        name = (
+                            case.name if len(captured) == 1 else f"{case.name}#{index}"
+                        )
+                        plans[name] = explain_statement(connection, statement)
+            finally:
+                session.close()
+                transaction.rollback()
+    finally:
+        engine.dispose()
+    return plans
+
+
+async def main(update: bool, scale: float, cost_tolerance: float) -> int:
+    if not update and not BASELINE_PATH.exists():
+        # 合成データの投入には時間がかかるため、比較できない場合は先に終える
+        print(
+            f"ベースライン {BASELINE_PATH} がありません。\n"
+            "マイグレーション直後の空のデータベースで --update を付けて実行し、"
+            "作成したファイルをコミットしてください。",
+            file=sys.stderr,
+        )
+        return 2
+
+    plans = await collect_plans(DATABASE_URL, scale)
+
+    if update:
+        save_baselines(BASELINE_PATH, plans)
+        logger.info("%d件の計画を %s に保存しました", len(plans), BASELINE_PATH)
+        return 0
+
+    regressions = find_regressions(load_baselines(BASELINE_PATH), plans, cost_tolerance)
+    if regressions:
+        print("\n\n".join(regressions))
+        print(f"\n{len(regressions)}/{len(plans)} 件の実行計画が悪化しました")
+        return 1
+
+    print(f"{len(plans)} 件の実行計画はベースラインどおりです")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="実行計画の回帰チェック")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="比較せずにベースラインを書き換える",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="合成データの件数の倍率（ベースラインと同じ値で比較すること）",
+    )
+    parser.add_argument(
+        "--cost-tolerance",
+        type=float,
+        default=DEFAULT_COST_TOLERANCE,
+        help="推定コストの増加の許容率（デフォルト: 0.5 = 1.5倍まで）",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.update, args.scale, args.cost_tolerance)))
@@ -120,6 +120,13 @@ class BatchImportKokkaiSpeechesInputDTO:
     session_to: int | None = None
     # バッチ設定
     sleep_interval: float = 2.0
+    # 取得ステージが先読みできる会議数（書き込み待ちキューの上限）
+    queue_depth: int = 2
+    # 複数プロセスで分担する場合のシャード番号と総数（issueIDのハッシュで分割）
+    shard_index: int = 0
+    shard_count: int = 1
+    # 呼び出し側で列挙済みの対象会議（指定時は meeting_list API を呼ばない）
+    meetings: list[KokkaiMeetingDTO] | None = None
 
 
 @dataclass
@@ -60,6 +60,8 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
     - _apply_extraction(): 抽出結果をエンティティに適用する
     - _get_confidence_score(): 信頼度スコアを取得する（オプション）
     - _get_metadata(): 抽出メタデータを取得する（オプション）
+    - _get_entities() / _save_entities(): 一括取得・一括保存（オプション、
+      execute_batch()用。デフォルトは1件ずつ処理する）
     """
 
     def __init__(
@@ -81,6 +83,7 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
         entity_id: int,
         extraction_result: TExtractionResult,
         pipeline_version: str,
+        commit: bool = True,
     ) -> UpdateEntityResult:
         """AI抽出結果でエンティティを更新する。
 
@@ -94,6 +97,8 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
             entity_id: 更新対象のエンティティID
             extraction_result: AI抽出結果
             pipeline_version: パイプラインバージョン（例: "gemini-2.0-flash-v1"）
+            commit: Falseならコミット・ロールバックせずフラッシュのみ行う
+                （呼び出し側のトランザクションに含める場合）
 
         Returns:
             UpdateEntityResult: 更新結果
@@ -145,7 +150,7 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
         try:
             await self._apply_extraction(entity, extraction_result, log_id)
             await self._save_entity(entity)
-            await self._session.commit()
+            await self._end_write(commit)
 
             logger.info(
                 f"Successfully updated: {self._get_entity_type().value} id={entity_id}"
@@ -154,13 +159,133 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
                 updated=True, reason=None, extraction_log_id=log_id
             )
         except Exception as e:
-            await self._session.rollback()
+            if commit:
+                await self._session.rollback()
             logger.error(
                 f"Failed to update entity: {self._get_entity_type().value} "
                 f"id={entity_id}, error={e}"
             )
             raise
 
+    async def execute_batch(
+        self,
+        items: list[tuple[int, TExtractionResult]],
+        pipeline_version: str,
+        commit: bool = True,
+    ) -> list[UpdateEntityResult]:
+        """複数のAI抽出結果で複数のエンティティを一括更新する。
+
+        execute() と同じ監査セマンティクス（抽出ログは必ず保存、手動検証済みは
+        上書きしない）を保ったまま、抽出ログの作成・エンティティの取得・保存を
+        それぞれ一括で行い、コミットは最後に1回だけ行う。
+
+        Args:
+            items: (エンティティID, AI抽出結果) のリスト
+            pipeline_version: パイプラインバージョン（例: "gemini-2.0-flash-v1"）
+            commit: Falseならコミット・ロールバックせずフラッシュのみ行う
+                （呼び出し側のトランザクションに含める場合）
+
+        Returns:
+            list[UpdateEntityResult]: itemsと同じ順序の更新結果
+        """
+        if not items:
+            return []
+
+        entity_type = self._get_entity_type()
+
+        # ログの作成を含めて途中で失敗した場合はロールバックし、
+        # 呼び出し側が1件ずつの処理に切り替えられる状態に戻す
+        # （commit=False の場合は呼び出し側がセーブポイントで戻す）
+        try:
+            # 1. 抽出ログを必ず保存（複数行INSERT）
+            logs = [
+                ExtractionLog(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    pipeline_version=pipeline_version,
+                    extracted_data=self._to_extracted_data(extraction_result),
+                    confidence_score=self._get_confidence_score(extraction_result),
+                    extraction_metadata=self._get_metadata(extraction_result),
+                )
+                for entity_id, extraction_result in items
+            ]
+            created_logs = await self._extraction_log_repo.bulk_create(logs)
+            log_ids: list[int] = []
+            for created_log in created_logs:
+                if created_log.id is None:
+                    raise ValueError("Failed to create extraction log: ID is None")
+                log_ids.append(created_log.id)
+
+            logger.info(
+                f"Extraction logs saved: {entity_type.value} count={len(log_ids)}"
+            )
+
+            # 2. 現在のエンティティを一括取得
+            entities = await self._get_entities([entity_id for entity_id, _ in items])
+
+            # 3. ガード処理と 4. AI結果の反映（メモリ上）
+            results: list[UpdateEntityResult] = []
+            to_save: list[TEntity] = []
+            for (entity_id, extraction_result), log_id in zip(
+                items, log_ids, strict=True
+            ):
+                entity = entities.get(entity_id)
+                if entity is None:
+                    results.append(
+                        UpdateEntityResult(
+                            updated=False,
+                            reason="entity_not_found",
+                            extraction_log_id=log_id,
+                        )
+                    )
+                    continue
+                if not entity.can_be_updated_by_ai():
+                    results.append(
+                        UpdateEntityResult(
+                            updated=False,
+                            reason="manually_verified",
+                            extraction_log_id=log_id,
+                        )
+                    )
+                    continue
+                await self._apply_extraction(entity, extraction_result, log_id)
+                to_save.append(entity)
+                results.append(
+                    UpdateEntityResult(
+                        updated=True, reason=None, extraction_log_id=log_id
+                    )
+                )
+
+            skipped = len(results) - len(to_save)
+            if skipped:
+                logger.info(
+                    f"Skipped {skipped} {entity_type.value} updates "
+                    f"(not found or manually verified)"
+                )
+
+            # 5. 一括保存してコミット
+            if to_save:
+                await self._save_entities(to_save)
+            await self._end_write(commit)
+        except Exception as e:
+            if commit:
+                await self._session.rollback()
+            logger.error(
+                f"Failed to update entities: {entity_type.value} "
+                f"count={len(items)}, error={e}"
+            )
+            raise
+
+        logger.info(f"Successfully updated: {entity_type.value} count={len(to_save)}")
+        return results
+
+    async def _end_write(self, commit: bool) -> None:
+        """書き込みを確定する（commit=False ならフラッシュのみ）"""
+        if commit:
+            await self._session.commit()
+        else:
+            await self._session.flush()
+
     @abstractmethod
     def _get_entity_type(self) -> EntityType:
         """エンティティタイプを返す。
@@ -216,6 +341,37 @@ class UpdateEntityFromExtractionUseCase(ABC, Generic[TEntity, TExtractionResult]
         """
         ...
 
+    async def _get_entities(self, entity_ids: list[int]) -> dict[int, TEntity]:
+        """エンティティを一括取得する（オプション）。
+
+        デフォルト実装では _get_entity() を1件ずつ呼び出す。
+        サブクラスでオーバーライドして1クエリで取得できる。
+
+        Args:
+            entity_ids: エンティティIDのリスト
+
+        Returns:
+            エンティティIDをキーとする辞書（存在しないIDは含まない）
+        """
+        entities: dict[int, TEntity] = {}
+        for entity_id in entity_ids:
+            entity = await self._get_entity(entity_id)
+            if entity is not None:
+                entities[entity_id] = entity
+        return entities
+
+    async def _save_entities(self, entities: list[TEntity]) -> None:
+        """エンティティを一括保存する（オプション）。
+
+        デフォルト実装では _save_entity() を1件ずつ呼び出す。
+        サブクラスでオーバーライドして1文で保存できる。
+
+        Args:
+            entities: 保存するエンティティのリスト
+        """
+        for entity in entities:
+            await self._save_entity(entity)
+
     def _get_confidence_score(self, result: TExtractionResult) -> float | None:
         """信頼度スコアを取得する（オプション）。
 
@@ -1,14 +1,19 @@
 """国会会議録APIからの発言バッチインポートユースケース.
 
 meeting_list APIで対象会議を列挙し、各会議の発言を一括インポートする。
+発言の取得（ネットワーク）とDB保存を上限付きキューでパイプライン化し、
+次の会議の取得と現在の会議の書き込みを並行して進める。
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import zlib
 
-from itertools import groupby
+from collections import Counter
+from dataclasses import dataclass, field
 from operator import attrgetter
 
 from src.application.dtos.kokkai_speech_dto import (
@@ -16,8 +21,9 @@ from src.application.dtos.kokkai_speech_dto import (
     BatchImportKokkaiSpeechesOutputDTO,
     BatchProgressCallback,
     FailedMeetingInfo,
-    ImportKokkaiSpeechesInputDTO,
+    ImportKokkaiSpeechesOutputDTO,
     KokkaiMeetingDTO,
+    KokkaiSpeechDTO,
     SessionProgress,
 )
 from src.application.usecases.import_kokkai_speeches_usecase import (
@@ -29,6 +35,17 @@ from src.domain.services.interfaces.kokkai_speech_service import IKokkaiSpeechSe
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _FetchedMeeting:
+    """取得ステージから書き込みステージへ渡す会議単位のデータ."""
+
+    meeting: KokkaiMeetingDTO
+    speeches: list[KokkaiSpeechDTO] = field(default_factory=list)
+    error: Exception | None = None
+    # インポート済みのためAPI取得を省略した会議
+    already_imported: bool = False
+
+
 class BatchImportKokkaiSpeechesUseCase:
     """meeting_list APIで対象会議を列挙し、各会議の発言を一括インポートする."""
 
@@ -43,15 +60,44 @@ class BatchImportKokkaiSpeechesUseCase:
     async def fetch_target_meetings(
         self, input_dto: BatchImportKokkaiSpeechesInputDTO
     ) -> list[KokkaiMeetingDTO]:
-        """対象会議の列挙（プレビュー用）."""
-        return await self._speech_service.fetch_meetings(
-            name_of_house=input_dto.name_of_house,
-            name_of_meeting=input_dto.name_of_meeting,
-            from_date=input_dto.from_date,
-            until_date=input_dto.until_date,
-            session_from=input_dto.session_from,
-            session_to=input_dto.session_to,
-        )
+        """対象会議の列挙（プレビュー用）.
+
+        input_dto.meetings が指定されていればAPIを呼ばずにそれを使う。
+        shard_count > 1 の場合は担当シャードの会議のみを返す。
+        """
+        if input_dto.meetings is not None:
+            meetings = list(input_dto.meetings)
+        else:
+            meetings = await self._speech_service.fetch_meetings(
+                name_of_house=input_dto.name_of_house,
+                name_of_meeting=input_dto.name_of_meeting,
+                from_date=input_dto.from_date,
+                until_date=input_dto.until_date,
+                session_from=input_dto.session_from,
+                session_to=input_dto.session_to,
+            )
+        if input_dto.shard_count <= 1:
+            return meetings
+        return [
+            m
+            for m in meetings
+            if self.shard_of(m.issue_id, input_dto.shard_count) == input_dto.shard_index
+        ]
+
+    @staticmethod
+    def shard_of(issue_id: str, shard_count: int) -> int:
+        """issueIDから担当シャード番号を決める（プロセス間で安定なハッシュ）."""
+        return zlib.crc32(issue_id.encode("utf-8")) % shard_count
+
+    @classmethod
+    def partition_meetings(
+        cls, meetings: list[KokkaiMeetingDTO], shard_count: int
+    ) -> list[list[KokkaiMeetingDTO]]:
+        """会議をシャードごとに分ける（shard_of と同じ割り当て）."""
+        shards: list[list[KokkaiMeetingDTO]] = [[] for _ in range(shard_count)]
+        for meeting in meetings:
+            shards[cls.shard_of(meeting.issue_id, shard_count)].append(meeting)
+        return shards
 
     async def execute(
         self,
@@ -61,8 +107,10 @@ class BatchImportKokkaiSpeechesUseCase:
         """バッチインポート実行.
 
         1. meeting_list APIで対象会議を列挙
-        2. 回次（session）ごとにグループ化して処理
-        3. 個別エラーは記録して続行
+        2. インポート済み会議のURLを1クエリで取得（これらはAPI取得せずスキップ）
+        3. 回次（session）順に並べ、取得ステージと書き込みステージを
+           上限付きキューで接続してパイプライン処理
+        4. 個別エラーは会議単位で記録して続行
         """
         output = BatchImportKokkaiSpeechesOutputDTO()
 
@@ -76,92 +124,38 @@ class BatchImportKokkaiSpeechesUseCase:
 
         logger.info("バッチインポート開始: %d 件の会議を処理します", len(meetings))
 
-        # 2. 回次ごとにグループ化して処理
-        sorted_meetings = sorted(meetings, key=attrgetter("session"))
-        global_index = 0
-
-        for session_num, session_meetings_iter in groupby(
-            sorted_meetings, key=attrgetter("session")
-        ):
-            session_meetings = list(session_meetings_iter)
-            session_prog = SessionProgress(session=session_num)
-
+        # 2. インポート済み会議を事前解決
+        imported_urls = await self._import_usecase.find_imported_meeting_urls(
+            [m.meeting_url for m in meetings if m.meeting_url]
+        )
+        if imported_urls:
             logger.info(
-                "=== 回次 %d の処理開始 (%d件) ===",
-                session_num,
-                len(session_meetings),
+                "インポート済み会議 %d 件はAPI取得をスキップします", len(imported_urls)
             )
 
-            for j, meeting in enumerate(session_meetings):
-                meeting_label = (
-                    f"{meeting.name_of_house}{meeting.name_of_meeting}"
-                    f" {meeting.issue} ({meeting.date})"
-                )
-
-                if progress_callback:
-                    progress_callback(global_index, len(meetings), meeting_label)
-
-                try:
-                    single_input = ImportKokkaiSpeechesInputDTO(
-                        issue_id=meeting.issue_id,
-                    )
-                    result = await self._import_usecase.execute(single_input)
-
-                    # 結果を集約
-                    output.total_speeches_imported += result.total_speeches_imported
-                    output.total_speeches_skipped += result.total_speeches_skipped
-                    output.total_speakers_created += result.total_speakers_created
-                    output.total_meetings_processed += 1
-                    session_prog.speeches_imported += result.total_speeches_imported
-                    session_prog.speeches_skipped += result.total_speeches_skipped
-                    session_prog.meetings_processed += 1
-
-                    if (
-                        result.total_speeches_skipped > 0
-                        and result.total_speeches_imported == 0
-                    ):
-                        output.total_meetings_skipped += 1
-                        session_prog.meetings_skipped += 1
-                        logger.info(
-                            "[%d/%d] %s: スキップ（取得済み）",
-                            j + 1,
-                            len(session_meetings),
-                            meeting_label,
-                        )
-                    else:
-                        logger.info(
-                            "[%d/%d] %s: %d件インポート",
-                            j + 1,
-                            len(session_meetings),
-                            meeting_label,
-                            result.total_speeches_imported,
-                        )
-
-                    if result.errors:
-                        output.errors.extend(result.errors)
-
-                except Exception as e:
-                    error_msg = f"会議 {meeting_label} の処理中にエラー: {e}"
-                    logger.exception(error_msg)
-                    output.errors.append(error_msg)
-                    output.failed_meetings.append(
-                        FailedMeetingInfo.from_meeting(meeting, e)
-                    )
-
-                global_index += 1
-
-                # API負荷軽減のためスリープ
-                if global_index < len(meetings) and input_dto.sleep_interval > 0:
-                    await asyncio.sleep(input_dto.sleep_interval)
-
-            logger.info(
-                "=== 回次 %d 完了: %d処理, %dスキップ, %d件インポート ===",
-                session_num,
-                session_prog.meetings_processed,
-                session_prog.meetings_skipped,
-                session_prog.speeches_imported,
+        # 3. 回次順に取得 → 書き込みをパイプライン処理
+        sorted_meetings = sorted(meetings, key=attrgetter("session"))
+        queue: asyncio.Queue[_FetchedMeeting | None] = asyncio.Queue(
+            maxsize=max(1, input_dto.queue_depth)
+        )
+        fetch_task = asyncio.create_task(
+            self._fetch_stage(
+                sorted_meetings, imported_urls, queue, input_dto.sleep_interval
             )
-            output.session_progress.append(session_prog)
+        )
+        try:
+            await self._write_stage(
+                queue,
+                Counter(m.session for m in sorted_meetings),
+                len(meetings),
+                output,
+                progress_callback,
+            )
+        finally:
+            if not fetch_task.done():
+                fetch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await fetch_task
 
         # 完了通知
         if progress_callback:
@@ -175,3 +169,149 @@ class BatchImportKokkaiSpeechesUseCase:
             len(output.errors),
         )
         return output
+
+    async def _fetch_stage(
+        self,
+        meetings: list[KokkaiMeetingDTO],
+        imported_urls: set[str],
+        queue: asyncio.Queue[_FetchedMeeting | None],
+        sleep_interval: float,
+    ) -> None:
+        """取得ステージ: 会議ごとに発言を取得してキューへ投入する.
+
+        キューが満杯の間は書き込みステージを待つため、先読みはqueue_depth件まで。
+        取得エラーは会議単位でキューに載せ、書き込みステージで記録する。
+        インポート済み会議はAPIを呼ばずにスキップ扱いで流す。
+        """
+        for i, meeting in enumerate(meetings):
+            if meeting.meeting_url in imported_urls:
+                await queue.put(_FetchedMeeting(meeting, already_imported=True))
+                continue
+
+            try:
+                speeches = await self._speech_service.fetch_speeches(
+                    issue_id=meeting.issue_id
+                )
+                await queue.put(_FetchedMeeting(meeting, speeches))
+            except Exception as e:
+                await queue.put(_FetchedMeeting(meeting, [], error=e))
+
+            # API負荷軽減のためスリープ（書き込みステージとは並行して進む）
+            if i + 1 < len(meetings) and sleep_interval > 0:
+                await asyncio.sleep(sleep_interval)
+
+        await queue.put(None)
+
+    async def _write_stage(
+        self,
+        queue: asyncio.Queue[_FetchedMeeting | None],
+        session_sizes: Counter[int],
+        total: int,
+        output: BatchImportKokkaiSpeechesOutputDTO,
+        progress_callback: BatchProgressCallback | None,
+    ) -> None:
+        """書き込みステージ: 取得済み会議を順にDBへ保存し、回次ごとに集計する."""
+        session_prog: SessionProgress | None = None
+        session_index = 0
+        global_index = 0
+
+        while (item := await queue.get()) is not None:
+            meeting = item.meeting
+
+            # 回次の切り替わり
+            if session_prog is None or session_prog.session != meeting.session:
+                if session_prog is not None:
+                    self._finish_session(session_prog, output)
+                session_prog = SessionProgress(session=meeting.session)
+                session_index = 0
+                logger.info(
+                    "=== 回次 %d の処理開始 (%d件) ===",
+                    meeting.session,
+                    session_sizes[meeting.session],
+                )
+
+            meeting_label = (
+                f"{meeting.name_of_house}{meeting.name_of_meeting}"
+                f" {meeting.issue} ({meeting.date})"
+            )
+            position = f"[{session_index + 1}/{session_sizes[meeting.session]}]"
+
+            if progress_callback:
+                progress_callback(global_index, total, meeting_label)
+
+            if item.already_imported:
+                output.total_meetings_processed += 1
+                output.total_meetings_skipped += 1
+                session_prog.meetings_processed += 1
+                session_prog.meetings_skipped += 1
+                logger.info("%s %s: スキップ（取得済み）", position, meeting_label)
+                session_index += 1
+                global_index += 1
+                continue
+
+            try:
+                if item.error is not None:
+                    raise item.error
+                result = await self._import_usecase.import_speeches(item.speeches)
+                self._aggregate_result(
+                    result, output, session_prog, meeting_label, position
+                )
+            except Exception as e:
+                error_msg = f"会議 {meeting_label} の処理中にエラー: {e}"
+                logger.exception(error_msg)
+                output.errors.append(error_msg)
+                output.failed_meetings.append(
+                    FailedMeetingInfo.from_meeting(meeting, e)
+                )
+
+            session_index += 1
+            global_index += 1
+
+        if session_prog is not None:
+            self._finish_session(session_prog, output)
+
+    @staticmethod
+    def _aggregate_result(
+        result: ImportKokkaiSpeechesOutputDTO,
+        output: BatchImportKokkaiSpeechesOutputDTO,
+        session_prog: SessionProgress,
+        meeting_label: str,
+        position: str,
+    ) -> None:
+        """単一会議の結果を全体・回次の集計に反映する."""
+        output.total_speeches_imported += result.total_speeches_imported
+        output.total_speeches_skipped += result.total_speeches_skipped
+        output.total_speakers_created += result.total_speakers_created
+        output.total_meetings_processed += 1
+        session_prog.speeches_imported += result.total_speeches_imported
+        session_prog.speeches_skipped += result.total_speeches_skipped
+        session_prog.meetings_processed += 1
+
+        if result.total_speeches_skipped > 0 and result.total_speeches_imported == 0:
+            output.total_meetings_skipped += 1
+            session_prog.meetings_skipped += 1
+            logger.info("%s %s: スキップ（取得済み）", position, meeting_label)
+        else:
+            logger.info(
+                "%s %s: %d件インポート",
+                position,
+                meeting_label,
+                result.total_speeches_imported,
+            )
+
+        if result.errors:
+            output.errors.extend(result.errors)
+
+    @staticmethod
+    def _finish_session(
+        session_prog: SessionProgress, output: BatchImportKokkaiSpeechesOutputDTO
+    ) -> None:
+        """回次の処理完了をログ出力し、進捗を記録する."""
+        logger.info(
+            "=== 回次 %d 完了: %d処理, %dスキップ, %d件インポート ===",
+            session_prog.session,
+            session_prog.meetings_processed,
+            session_prog.meetings_skipped,
+            session_prog.speeches_imported,
+        )
+        output.session_progress.append(session_prog)
@@ -6,6 +6,7 @@
 from dataclasses import dataclass, field
 
 from src.domain.entities.government_official import GovernmentOfficial
+from src.domain.entities.speaker import Speaker
 from src.domain.repositories.government_official_repository import (
     GovernmentOfficialRepository,
 )
@@ -70,13 +71,14 @@ class BatchLinkSpeakersToGovernmentOfficialsUseCase:
 
         # 4. Speakerを正規化名で照合
         details: list[BatchLinkDetail] = []
+        linked_speakers: list[Speaker] = []
         for speaker in unlinked:
             normalized_speaker = NameNormalizer.normalize(speaker.name)
             if normalized_speaker in official_map:
                 official = official_map[normalized_speaker]
                 if not dry_run:
                     speaker.link_to_government_official(official.id)  # type: ignore[arg-type]
-                    await self.speaker_repository.update(speaker)
+                    linked_speakers.append(speaker)
                 details.append(
                     BatchLinkDetail(
                         government_official_id=official.id,  # type: ignore[arg-type]
@@ -87,6 +89,13 @@ class BatchLinkSpeakersToGovernmentOfficialsUseCase:
                     )
                 )
 
+        # 5. 紐付けたSpeakerを1文で更新
+        if linked_speakers:
+            await self.speaker_repository.bulk_update_fields(
+                linked_speakers,
+                fields=["government_official_id", "is_politician", "skip_reason"],
+            )
+
         return BatchLinkOutputDto(
             linked_count=len(details),
             skipped_count=len(unlinked) - len(details),
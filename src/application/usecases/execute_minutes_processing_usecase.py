@@ -5,6 +5,7 @@ GCSまたはPDFから議事録テキストを取得し、MinutesProcessingServic
 発言を抽出してデータベースに保存します。
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -20,7 +21,6 @@ from src.common.logging import get_logger
 from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
-from src.domain.entities.speaker import Speaker
 from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
 from src.domain.interfaces.role_name_mapping_service import IRoleNameMappingService
 from src.domain.services.interfaces.minutes_processing_service import (
@@ -29,11 +29,15 @@ from src.domain.services.interfaces.minutes_processing_service import (
 from src.domain.services.interfaces.storage_service import IStorageService
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
 from src.domain.services.speaker_domain_service import SpeakerDomainService
+from src.domain.value_objects.speaker_party_resolution import SpeakerPartyKey
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 
 
 logger = get_logger(__name__)
 
+# 議事録分割パイプラインの抽出ログに記録するバージョン
+_PIPELINE_VERSION = "minutes-divider-v1"
+
 
 @dataclass
 class ExecuteMinutesProcessingDTO:
@@ -114,26 +118,28 @@ class ExecuteMinutesProcessingUseCase:
 
             # 既存のConversationsをチェック・削除
             if existing_minutes and existing_minutes.id:
-                conversations = await self.uow.conversation_repository.get_by_minutes(
-                    existing_minutes.id
-                )
-                if conversations:
-                    if not request.force_reprocess:
-                        raise ValueError(
-                            f"Meeting {meeting.id} already has conversations"
+                if request.force_reprocess:
+                    # 強制再処理の場合は既存conversationsを1文で削除
+                    deleted_count = (
+                        await self.uow.conversation_repository.delete_by_minutes(
+                            existing_minutes.id
                         )
-                    else:
-                        # 強制再処理の場合は既存conversationsを削除
+                    )
+                    if deleted_count:
                         logger.info(
-                            f"Deleting {len(conversations)} existing conversations "
+                            f"Deleted {deleted_count} existing conversations "
                             f"for force reprocessing"
                         )
-                        for conv in conversations:
-                            if conv.id:
-                                await self.uow.conversation_repository.delete(conv.id)
-                        # Flush to ensure deletions are applied
-                        await self.uow.flush()
-                        logger.info("Existing conversations deleted")
+                else:
+                    conversations = (
+                        await self.uow.conversation_repository.get_by_minutes(
+                            existing_minutes.id
+                        )
+                    )
+                    if conversations:
+                        raise ValueError(
+                            f"Meeting {meeting.id} already has conversations"
+                        )
 
             # 議事録テキストを取得
             extracted_text = await self._fetch_minutes_text(meeting)
@@ -279,6 +285,8 @@ class ExecuteMinutesProcessingUseCase:
 
         Issue #865: Statement処理パイプラインへの抽出ログ統合
         - Conversationを作成後、UseCaseで抽出ログを記録
+        - 抽出ログの作成・Conversationへの紐付けは会議ごとに一括で行い、
+          発言数に関わらずクエリ数を一定に保つ
 
         Args:
             results: 抽出された発言データ（ドメイン値オブジェクト）
@@ -303,69 +311,114 @@ class ExecuteMinutesProcessingUseCase:
             f"Created {len(saved)} conversations in database", minutes_id=minutes_id
         )
 
-        # 各Conversationに対して話者マッチングと抽出ログを記録
-        # Issue #865: Statement処理パイプラインへの抽出ログ統合
+        # 話者マッチング: speaker_nameからSpeakerを検索してspeaker_idを設定
+        # （全発言者を1クエリで検索する）
+        speaker_keys = self._speaker_keys(result.speaker for result in results)
+        speaker_ids: dict[str, int] = {}
+        try:
+            matched_ids = await self.uow.speaker_repository.find_ids_by_name_party(
+                list(dict.fromkeys(speaker_keys.values()))
+            )
+            speaker_ids = {
+                speaker_name: matched_ids[key]
+                for speaker_name, key in speaker_keys.items()
+                if key in matched_ids
+            }
+        except Exception as e:
+            logger.warning(f"Failed to match speakers: {e}", error=str(e))
+
+        # 抽出ログを一括記録（Issue #865: Statement処理パイプラインへの抽出ログ統合）
+        items: list[tuple[int, ConversationExtractionResult]] = []
         for idx, (conv, result) in enumerate(zip(saved, results, strict=True)):
             if conv.id is None:
                 logger.warning(f"Conversation {idx} has no ID, skipping extraction log")
                 continue
+            items.append(
+                (
+                    conv.id,
+                    ConversationExtractionResult(
+                        comment=result.speech_content,
+                        speaker_name=result.speaker,
+                        speaker_id=speaker_ids.get(result.speaker),
+                        sequence_number=idx + 1,
+                        minutes_id=minutes_id,
+                    ),
+                )
+            )
 
-            try:
-                # 話者マッチング: speaker_nameからSpeakerを検索してspeaker_idを設定
-                speaker_id = None
-                if result.speaker:
-                    # 名前から政党情報を抽出
-                    clean_name, party_info = (
-                        self.speaker_service.extract_party_from_name(result.speaker)
-                    )
-                    # Speakerを検索
-                    existing_speaker = (
-                        await self.uow.speaker_repository.get_by_name_party_position(
-                            clean_name, party_info, None
-                        )
-                    )
-                    if existing_speaker and existing_speaker.id:
-                        speaker_id = existing_speaker.id
-                        logger.debug(
-                            f"Matched speaker: {result.speaker} "
-                            f"-> Speaker ID {speaker_id}",
-                            conversation_id=conv.id,
-                        )
+        await self._save_extraction_logs(items, minutes_id)
 
-                # 抽出結果を作成
-                extraction_result = ConversationExtractionResult(
-                    comment=result.speech_content,
-                    speaker_name=result.speaker,
-                    speaker_id=speaker_id,  # マッチしたspeaker_idを設定
-                    sequence_number=idx + 1,
-                    minutes_id=minutes_id,
-                )
+        logger.info(
+            f"Saved {len(saved)} conversations with extraction logs",
+            minutes_id=minutes_id,
+        )
+        return saved
 
-                # UseCaseで更新（抽出ログ自動記録）
-                await self.update_statement_usecase.execute(
-                    entity_id=conv.id,
-                    extraction_result=extraction_result,
-                    pipeline_version="minutes-divider-v1",
-                )
-                logger.debug(
-                    f"Extraction log saved for conversation {conv.id}",
-                    conversation_id=conv.id,
-                    speaker_id=speaker_id,
+    async def _save_extraction_logs(
+        self,
+        items: list[tuple[int, ConversationExtractionResult]],
+        minutes_id: int,
+    ) -> None:
+        """抽出ログを一括記録する（失敗した場合は発言ごとに記録し直す）
+
+        記録は議事録処理のトランザクション内で行い、コミットしない（コミットは
+        execute の最後の1回のみ）。一括記録・1件ごとの記録はそれぞれ
+        セーブポイント内で行い、失敗した記録だけを取り消す。
+        抽出ログ記録エラーは警告レベルとし、処理は継続する。
+        記録できなかった発言のIDは警告ログに出力する。
+        """
+        try:
+            async with self.uow.savepoint():
+                await self.update_statement_usecase.execute_batch(
+                    items, pipeline_version=_PIPELINE_VERSION, commit=False
                 )
+            return
+        except Exception as e:
+            logger.warning(
+                f"Batch extraction log write failed for minutes {minutes_id}, "
+                f"retrying per conversation: {e}",
+                minutes_id=minutes_id,
+                error=str(e),
+            )
 
+        failed_ids: list[int] = []
+        for conversation_id, extraction_result in items:
+            try:
+                async with self.uow.savepoint():
+                    await self.update_statement_usecase.execute(
+                        conversation_id,
+                        extraction_result,
+                        pipeline_version=_PIPELINE_VERSION,
+                        commit=False,
+                    )
             except Exception as e:
-                # 抽出ログ記録エラーは警告レベル（処理は継続）
-                logger.warning(
-                    f"Failed to save extraction log for conversation {conv.id}: {e}",
-                    conversation_id=conv.id,
+                failed_ids.append(conversation_id)
+                logger.debug(
+                    f"Failed to save extraction log for conversation {conversation_id}",
+                    conversation_id=conversation_id,
                     error=str(e),
                 )
 
-        logger.info(
-            f"Saved {len(saved)} conversations with extraction logs",
-            minutes_id=minutes_id,
-        )
-        return saved
+        if failed_ids:
+            logger.warning(
+                f"Failed to save extraction logs for {len(failed_ids)} of "
+                f"{len(items)} conversations in minutes {minutes_id}",
+                minutes_id=minutes_id,
+                conversation_ids=failed_ids,
+            )
+
+    def _speaker_keys(
+        self, speaker_names: Iterable[str | None]
+    ) -> dict[str, SpeakerPartyKey]:
+        """発言者名ごとに (政党情報を除いた名前, 政党名) の組を求める"""
+        keys: dict[str, SpeakerPartyKey] = {}
+        for speaker_name in speaker_names:
+            if speaker_name and speaker_name not in keys:
+                # 名前から政党情報を抽出
+                keys[speaker_name] = self.speaker_service.extract_party_from_name(
+                    speaker_name
+                )
+        return keys
 
     async def _extract_and_create_speakers(
         self, conversations: list[Conversation]
@@ -378,33 +431,13 @@ class ExecuteMinutesProcessingUseCase:
         Returns:
             int: 作成された発言者数
         """
-        speaker_names: set[tuple[str, str | None]] = set()
+        speaker_keys = self._speaker_keys(conv.speaker_name for conv in conversations)
 
-        for conv in conversations:
-            if conv.speaker_name:
-                # 名前から政党情報を抽出
-                clean_name, party_info = self.speaker_service.extract_party_from_name(
-                    conv.speaker_name
-                )
-                speaker_names.add((clean_name, party_info))
-
-        # 発言者レコードを作成
-        created_count = 0
-        for name, party_info in speaker_names:
-            # 既存の発言者をチェック
-            existing = await self.uow.speaker_repository.get_by_name_party_position(
-                name, party_info, None
-            )
-
-            if not existing:
-                # 新規発言者を作成
-                speaker = Speaker(
-                    name=name,
-                    political_party_name=party_info,
-                    is_politician=bool(party_info),  # 政党があれば政治家と仮定
-                )
-                await self.uow.speaker_repository.create(speaker)
-                created_count += 1
+        # 既存の発言者を1クエリで検索し、未登録の発言者を1文で作成
+        resolution = await self.uow.speaker_repository.resolve_by_name_party(
+            list(dict.fromkeys(speaker_keys.values()))
+        )
+        created_count = resolution.created_count
 
         logger.info(f"Created {created_count} new speakers")
         return created_count
@@ -14,6 +14,7 @@ from src.application.dtos.expand_group_judges_preview_dto import (
     GroupJudgePreviewItem,
     GroupJudgePreviewMember,
 )
+from src.common.instrumentation import detect_n_plus_one
 from src.domain.entities.proposal_judge import ProposalJudge
 from src.domain.entities.proposal_parliamentary_group_judge import (
     ProposalParliamentaryGroupJudge,
@@ -62,6 +63,7 @@ class ExpandGroupJudgesToIndividualUseCase:
         self._deliberation_repo = deliberation_repository
         self._parliamentary_group_repo = parliamentary_group_repository
 
+    @detect_n_plus_one()
     async def execute(
         self, request: ExpandGroupJudgesRequestDTO
     ) -> ExpandGroupJudgesResultDTO:
@@ -144,6 +146,7 @@ class ExpandGroupJudgesToIndividualUseCase:
 
         return result
 
+    @detect_n_plus_one()
     async def preview(self, group_judge_ids: list[int]) -> ExpandGroupJudgesPreviewDTO:
         """指定した会派賛否IDリストに対しプレビューを生成する."""
         result = ExpandGroupJudgesPreviewDTO(success=True)
@@ -15,6 +15,7 @@ from src.application.dtos.proposal_judge_dto import (
     MatchProposalJudgesOutputDTO,
     ProposalJudgeDTO,
 )
+from src.common.instrumentation import detect_n_plus_one
 from src.domain.entities.extracted_proposal_judge import ExtractedProposalJudge
 from src.domain.entities.proposal_judge import ProposalJudge
 from src.domain.repositories.extracted_proposal_judge_repository import (
@@ -77,6 +78,7 @@ class ExtractProposalJudgesUseCase:
         self.scraper = web_scraper_service
         self.llm = llm_service
 
+    @detect_n_plus_one()
     async def extract_judges(
         self, request: ExtractProposalJudgesInputDTO
     ) -> ExtractProposalJudgesOutputDTO:
@@ -154,6 +156,7 @@ class ExtractProposalJudgesUseCase:
             judges=[self._to_extracted_dto(j) for j in created_judges],
         )
 
+    @detect_n_plus_one()
     async def match_judges(
         self, request: MatchProposalJudgesInputDTO
     ) -> MatchProposalJudgesOutputDTO:
@@ -214,6 +217,7 @@ class ExtractProposalJudgesUseCase:
             results=results,
         )
 
+    @detect_n_plus_one()
     async def create_judges(
         self, request: CreateProposalJudgesInputDTO
     ) -> CreateProposalJudgesOutputDTO:
@@ -10,6 +10,7 @@ from typing import Any
 from uuid import UUID
 
 from src.application.dtos.work_history_dto import WorkHistoryDTO, WorkType
+from src.common.instrumentation import detect_n_plus_one
 from src.domain.entities.politician_operation_log import PoliticianOperationType
 from src.domain.entities.proposal_operation_log import ProposalOperationType
 from src.domain.repositories.parliamentary_group_membership_repository import (
@@ -60,6 +61,7 @@ class GetWorkHistoryUseCase:
         self.politician_log_repo = politician_operation_log_repository
         self.proposal_log_repo = proposal_operation_log_repository
 
+    @detect_n_plus_one()
     async def execute(
         self,
         user_id: UUID | None = None,
@@ -23,7 +23,6 @@ from src.domain.entities.conference import Conference
 from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
-from src.domain.entities.speaker import Speaker
 from src.domain.services.interfaces.kokkai_speech_service import IKokkaiSpeechService
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
 
@@ -52,50 +51,209 @@ class ImportKokkaiSpeechesUseCase:
     async def execute(
         self, input_dto: ImportKokkaiSpeechesInputDTO
     ) -> ImportKokkaiSpeechesOutputDTO:
-        """メイン処理: API取得 → エンティティ変換 → DB保存."""
-        uow = self._uow_factory()
+        """メイン処理: API取得 → エンティティ変換 → DB保存.
+
+        発言はAPIのページ単位で逐次受け取り、会議（issueID）の発言が出揃った
+        時点でその会議を専用のUnitOfWorkで保存・コミットする。
+        保持する発言は処理中の会議分と1ページ分に限られる。
+        保存済みの会議の発言が後から届いた場合は取り置き、取得の完了後に
+        既存の議事録へ追加する。
+        """
         output = ImportKokkaiSpeechesOutputDTO()
+        pending: list[KokkaiSpeechDTO] = []
+        completed_issue_ids: set[str] = set()
+        late_speeches: dict[str, list[KokkaiSpeechDTO]] = {}
+        total_fetched = 0
+
+        async for page in self._speech_service.iter_speeches(
+            issue_id=input_dto.issue_id,
+            name_of_house=input_dto.name_of_house,
+            from_date=input_dto.from_date,
+            until_date=input_dto.until_date,
+        ):
+            total_fetched += len(page)
+            for speech in page:
+                # issueIDが切り替わった時点で直前の会議の発言は出揃っている
+                if pending and speech.issue_id != pending[0].issue_id:
+                    await self._import_meeting(
+                        pending, completed_issue_ids, late_speeches, output
+                    )
+                    pending = []
+                pending.append(speech)
 
-        try:
-            # 1. APIから発言データを取得
-            speeches = await self._speech_service.fetch_speeches(
-                issue_id=input_dto.issue_id,
-                name_of_house=input_dto.name_of_house,
-                from_date=input_dto.from_date,
-                until_date=input_dto.until_date,
+        if pending:
+            await self._import_meeting(
+                pending, completed_issue_ids, late_speeches, output
             )
-            if not speeches:
-                logger.info("取得対象の発言データがありません")
-                return output
 
-            logger.info("APIから %d 件の発言データを取得しました", len(speeches))
+        for speeches in late_speeches.values():
+            await self._merge_late_speeches(speeches, output)
+
+        if total_fetched == 0:
+            logger.info("取得対象の発言データがありません")
+            return output
+
+        logger.info("APIから %d 件の発言データを取得しました", total_fetched)
+        self._log_summary(output)
+        return output
+
+    async def _import_meeting(
+        self,
+        speeches: list[KokkaiSpeechDTO],
+        completed_issue_ids: set[str],
+        late_speeches: dict[str, list[KokkaiSpeechDTO]],
+        output: ImportKokkaiSpeechesOutputDTO,
+    ) -> None:
+        """出揃った1会議分の発言を専用のUnitOfWorkで保存・コミットする."""
+        issue_id = speeches[0].issue_id
+        if issue_id in completed_issue_ids:
+            # 保存済み会議の発言は重複チェックでスキップされるため取り置き、
+            # 取得の完了後に既存の議事録へ追加する
+            logger.warning(
+                "会議 %s の発言が連続して返されませんでした（%d件を後で追加）",
+                issue_id,
+                len(speeches),
+            )
+            late_speeches.setdefault(issue_id, []).extend(speeches)
+            return
+        completed_issue_ids.add(issue_id)
+
+        uow = self._uow_factory()
+        try:
+            await self._save_speeches(uow, speeches, output)
+            await uow.commit()
+        except Exception:
+            await uow.rollback()
+            raise
+
+    async def _merge_late_speeches(
+        self,
+        speeches: list[KokkaiSpeechDTO],
+        output: ImportKokkaiSpeechesOutputDTO,
+    ) -> None:
+        """保存済み会議に後から届いた発言を、既存の議事録に追加して保存する.
 
-            # 2. GoverningBody "国会" を取得
-            governing_body = await uow.governing_body_repository.get_by_name_and_type(
-                self._KOKKAI_GB_NAME, self._KOKKAI_GB_TYPE
+        保存済みの発言（発言順で判定）は除く。先の保存で議事録を作成できて
+        いない場合は通常の保存処理に回す。失敗した場合はロールバックして
+        エラーとして記録し、他の会議の取り込みは続ける。
+        """
+        first = speeches[0]
+        # 失敗時に件数を反映しないよう、コミットできた分だけ output に加える
+        merged = ImportKokkaiSpeechesOutputDTO()
+        uow = self._uow_factory()
+        try:
+            await uow.meeting_repository.lock_for_import(first.issue_id)
+            meeting = await uow.meeting_repository.get_by_url(first.meeting_url)
+            minutes = (
+                await uow.minutes_repository.get_by_meeting(meeting.id)
+                if meeting and meeting.id
+                else None
             )
-            if not governing_body or not governing_body.id:
-                output.errors.append("GoverningBody '国会' が見つかりません")
-                return output
-
-            # 3. issueIDごとにグループ化して処理
-            sorted_speeches = sorted(speeches, key=attrgetter("issue_id"))
-            for issue_id, group in groupby(sorted_speeches, key=attrgetter("issue_id")):
-                speech_list = list(group)
-                try:
-                    await self._process_meeting_speeches(
-                        uow, speech_list, governing_body.id, output
+            if minutes and minutes.id:
+                existing_convs = await uow.conversation_repository.get_by_minutes(
+                    minutes.id
+                )
+                saved_orders = {conv.sequence_number for conv in existing_convs}
+                new_speeches = [
+                    speech
+                    for speech in speeches
+                    if speech.speech_order not in saved_orders
+                ]
+                merged.total_speeches_skipped += len(speeches) - len(new_speeches)
+                if new_speeches:
+                    await self._save_conversations(
+                        uow, new_speeches, minutes.id, merged
                     )
-                except Exception as e:
-                    error_msg = f"会議 {issue_id} の処理中にエラー: {e}"
-                    logger.exception(error_msg)
-                    output.errors.append(error_msg)
+            else:
+                await self._save_speeches(uow, speeches, merged)
+            await uow.commit()
+        except Exception as e:
+            await uow.rollback()
+            error_msg = f"会議 {first.issue_id} の発言の追加中にエラー: {e}"
+            logger.exception(error_msg)
+            output.errors.append(error_msg)
+            return
+
+        output.total_speeches_imported += merged.total_speeches_imported
+        output.total_speeches_skipped += merged.total_speeches_skipped
+        output.total_meetings_created += merged.total_meetings_created
+        output.total_speakers_created += merged.total_speakers_created
+        output.errors.extend(merged.errors)
+
+    async def import_speeches(
+        self, speeches: list[KokkaiSpeechDTO]
+    ) -> ImportKokkaiSpeechesOutputDTO:
+        """取得済みの発言データをDBに保存する（API取得は行わない）.
+
+        バッチインポートの書き込みステージから呼ばれ、呼び出しごとに
+        専用のUnitOfWorkでコミットする。
+        """
+        output = ImportKokkaiSpeechesOutputDTO()
+        if not speeches:
+            logger.info("取得対象の発言データがありません")
+            return output
 
+        uow = self._uow_factory()
+        try:
+            await self._save_speeches(uow, speeches, output)
             await uow.commit()
         except Exception:
             await uow.rollback()
             raise
 
+        self._log_summary(output)
+        return output
+
+    async def find_imported_meeting_urls(self, meeting_urls: list[str]) -> set[str]:
+        """インポート済み（発言が1件以上ある）会議のURL集合を1クエリで取得する.
+
+        読み取りのみだが、接続をトランザクション中のまま残さないよう
+        専用のUnitOfWorkをコミットして終える。
+        """
+        if not meeting_urls:
+            return set()
+        uow = self._uow_factory()
+        try:
+            urls = await uow.meeting_repository.get_urls_with_conversations(
+                meeting_urls
+            )
+            await uow.commit()
+        except Exception:
+            await uow.rollback()
+            raise
+        return urls
+
+    async def _save_speeches(
+        self,
+        uow: IUnitOfWork,
+        speeches: list[KokkaiSpeechDTO],
+        output: ImportKokkaiSpeechesOutputDTO,
+    ) -> None:
+        """発言データを会議ごとにエンティティ化して保存（コミットは呼び出し側）."""
+        # GoverningBody "国会" を取得
+        governing_body = await uow.governing_body_repository.get_by_name_and_type(
+            self._KOKKAI_GB_NAME, self._KOKKAI_GB_TYPE
+        )
+        if not governing_body or not governing_body.id:
+            output.errors.append("GoverningBody '国会' が見つかりません")
+            return
+
+        # issueIDごとにグループ化して処理
+        sorted_speeches = sorted(speeches, key=attrgetter("issue_id"))
+        for issue_id, group in groupby(sorted_speeches, key=attrgetter("issue_id")):
+            speech_list = list(group)
+            try:
+                await self._process_meeting_speeches(
+                    uow, speech_list, governing_body.id, output
+                )
+            except Exception as e:
+                error_msg = f"会議 {issue_id} の処理中にエラー: {e}"
+                logger.exception(error_msg)
+                output.errors.append(error_msg)
+
+    @staticmethod
+    def _log_summary(output: ImportKokkaiSpeechesOutputDTO) -> None:
+        """インポート結果のサマリーをログ出力."""
         logger.info(
             "インポート完了: %d件保存, %d件スキップ, %d会議作成, %d発言者作成",
             output.total_speeches_imported,
@@ -103,7 +261,6 @@ class ImportKokkaiSpeechesUseCase:
             output.total_meetings_created,
             output.total_speakers_created,
         )
-        return output
 
     async def _process_meeting_speeches(
         self,
@@ -115,6 +272,10 @@ class ImportKokkaiSpeechesUseCase:
         """単一会議の発言群を処理."""
         first = speeches[0]
 
+        # 並行実行中の他ワーカーと同じ会議を取り込まないよう、issueID単位で
+        # ロックしてから重複チェックする（ロックはコミットまで保持）
+        await uow.meeting_repository.lock_for_import(first.issue_id)
+
         # 重複チェック: 同じ meetingURL のMeetingが既にあるか
         existing_meeting = await uow.meeting_repository.get_by_url(first.meeting_url)
         if existing_meeting and existing_meeting.id:
@@ -177,16 +338,26 @@ class ImportKokkaiSpeechesUseCase:
             output.errors.append(f"Minutes作成に失敗: {first.issue_id}")
             return
 
-        # Speaker処理 + Conversation作成
+        await self._save_conversations(uow, speeches, minutes.id, output)
+
+    async def _save_conversations(
+        self,
+        uow: IUnitOfWork,
+        speeches: list[KokkaiSpeechDTO],
+        minutes_id: int,
+        output: ImportKokkaiSpeechesOutputDTO,
+    ) -> None:
+        """単一会議の発言をConversationとして議事録に一括保存する."""
+        # Speaker一括解決 + Conversation作成
+        speaker_ids = await self._resolve_speakers(uow, speeches, output)
         conversations: list[Conversation] = []
         for speech in speeches:
-            speaker_id = await self._resolve_speaker(uow, speech, output)
             speaker_name = self._normalize_speaker_name(speech.speaker)
             conv = Conversation(
                 comment=speech.speech,
                 sequence_number=speech.speech_order,
-                minutes_id=minutes.id,
-                speaker_id=speaker_id,
+                minutes_id=minutes_id,
+                speaker_id=speaker_ids.get(speaker_name) if speaker_name else None,
                 speaker_name=speaker_name,
                 is_manually_verified=True,
             )
@@ -195,7 +366,9 @@ class ImportKokkaiSpeechesUseCase:
         # 一括保存
         created = await uow.conversation_repository.bulk_create(conversations)
         output.total_speeches_imported += len(created)
-        logger.info("会議 %s: %d 件の発言を保存しました", first.issue_id, len(created))
+        logger.info(
+            "会議 %s: %d 件の発言を保存しました", speeches[0].issue_id, len(created)
+        )
 
     async def _resolve_conference(
         self,
@@ -225,37 +398,30 @@ class ImportKokkaiSpeechesUseCase:
         )
         return await uow.conference_repository.create(new_conference)
 
-    async def _resolve_speaker(
+    async def _resolve_speakers(
         self,
         uow: IUnitOfWork,
-        speech: KokkaiSpeechDTO,
+        speeches: list[KokkaiSpeechDTO],
         output: ImportKokkaiSpeechesOutputDTO,
-    ) -> int | None:
-        """発言者を検索/作成してIDを返す."""
-        name = self._normalize_speaker_name(speech.speaker)
-        if not name:
-            return None
-
-        # 既存Speaker検索
-        existing = await uow.speaker_repository.find_by_name(name)
-        if existing:
-            # name_yomi が未設定なら更新
-            if not existing.name_yomi and speech.speaker_yomi:
-                yomi = self._normalize_speaker_name(speech.speaker_yomi)
-                if yomi:
-                    existing.name_yomi = yomi
-                    await uow.speaker_repository.update(existing)
-            return existing.id
-
-        # 新規Speaker作成
-        name_yomi = self._normalize_speaker_name(speech.speaker_yomi)
-        speaker = Speaker(
-            name=name,
-            name_yomi=name_yomi if name_yomi else None,
-        )
-        created = await uow.speaker_repository.create(speaker)
-        output.total_speakers_created += 1
-        return created.id
+    ) -> dict[str, int]:
+        """会議内の発言者を一括で検索/作成し、正規化名 → Speaker ID を返す."""
+        name_yomi_map: dict[str, str | None] = {}
+        for speech in speeches:
+            name = self._normalize_speaker_name(speech.speaker)
+            if not name:
+                continue
+            # 同名の発言で最初に見つかった読み仮名を採用
+            if not name_yomi_map.get(name):
+                name_yomi_map[name] = (
+                    self._normalize_speaker_name(speech.speaker_yomi) or None
+                )
+
+        if not name_yomi_map:
+            return {}
+
+        resolution = await uow.speaker_repository.resolve_by_names(name_yomi_map)
+        output.total_speakers_created += resolution.created_count
+        return resolution.speaker_ids
 
     @staticmethod
     def _normalize_speaker_name(name: str | None) -> str:
@@ -11,6 +11,7 @@ from src.application.dtos.proposal_parliamentary_group_judge_dto import (
     ProposalParliamentaryGroupJudgeDTO,
     ProposalParliamentaryGroupJudgeListOutputDTO,
 )
+from src.common.instrumentation import detect_n_plus_one
 from src.common.logging import get_logger
 from src.domain.entities.proposal_parliamentary_group_judge import (
     ProposalParliamentaryGroupJudge,
@@ -336,6 +337,7 @@ class ManageParliamentaryGroupJudgesUseCase:
                 message=f"削除中にエラーが発生しました: {e!s}",
             )
 
+    @detect_n_plus_one()
     async def list_by_proposal(
         self, proposal_id: int
     ) -> ProposalParliamentaryGroupJudgeListOutputDTO:
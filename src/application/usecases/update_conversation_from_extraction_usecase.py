@@ -78,6 +78,26 @@ class UpdateConversationFromExtractionUseCase(
         """
         await self._conversation_repo.update(entity)
 
+    async def _get_entities(self, entity_ids: list[int]) -> dict[int, Conversation]:
+        """発言エンティティを1クエリで一括取得する。
+
+        Args:
+            entity_ids: 発言IDのリスト
+
+        Returns:
+            発言IDをキーとする発言エンティティの辞書
+        """
+        conversations = await self._conversation_repo.get_by_ids(entity_ids)
+        return {c.id: c for c in conversations if c.id is not None}
+
+    async def _save_entities(self, entities: list[Conversation]) -> None:
+        """発言エンティティと抽出ログIDの紐付けを1文で一括保存する。
+
+        Args:
+            entities: 保存する発言エンティティのリスト
+        """
+        await self._conversation_repo.bulk_update_from_extraction(entities)
+
     def _to_extracted_data(
         self, result: ConversationExtractionResult
     ) -> dict[str, Any]:  # type: ignore[override]
@@ -5,6 +5,7 @@ import functools
 import time
 
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any, TypeVar, cast
 
 from src.common.logging import LogContext, get_logger
@@ -15,6 +16,22 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# N+1クエリの検出処理（処理名・閾値を受け取るコンテキストマネージャー）
+QueryDetector = Callable[[str, int | None], AbstractContextManager[Any]]
+
+# インフラ層（src.infrastructure.monitoring.query_counter）が登録する
+_query_detector: QueryDetector | None = None
+
+
+def set_query_detector(detector: QueryDetector | None) -> None:
+    """detect_n_plus_one が使う検出処理を登録する（None で検出しない）.
+
+    Args:
+        detector: 処理名と閾値を受け取り、ブロック内のSQLを検査する関数
+    """
+    global _query_detector
+    _query_detector = detector
+
 
 def measure_time(
     metric_name: str | None = None,
@@ -218,6 +235,50 @@ def count_calls(
     return decorator
 
 
+def detect_n_plus_one(
+    name: str | None = None,
+    threshold: int | None = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """呼び出しごとにSQLの発行回数を数え、N+1クエリを検出するデコレーター.
+
+    検出処理が登録されていないとき（N_PLUS_ONE_DETECTION が off の既定を含む）は
+    何もせずに呼び出す。
+
+    Args:
+        name: ログに出す処理名（指定しない場合はクラス名・関数名から生成）
+        threshold: 同じ形のSQLを許容する回数（指定しない場合は設定値）
+
+    Returns:
+        デコレーター関数
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        actual_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
+            detector = _query_detector
+            if detector is None:
+                return func(*args, **kwargs)
+            with detector(actual_name, threshold):
+                return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+            detector = _query_detector
+            if detector is None:
+                return await func(*args, **kwargs)  # type: ignore[misc]
+            with detector(actual_name, threshold):
+                return await func(*args, **kwargs)  # type: ignore[misc]
+
+        if asyncio.iscoroutinefunction(func):
+            return async_wrapper  # type: ignore[return-value]
+        else:
+            return sync_wrapper
+
+    return decorator
+
+
 class MetricsContext:
     """メトリクス記録用のコンテキストマネージャー."""
 
@@ -102,6 +102,15 @@ def get_meter() -> Meter:
     return _meter
 
 
+def is_metrics_initialized() -> bool:
+    """メトリクスが初期化済みか（setup_metrics() を呼んだか）.
+
+    Returns:
+        bool: 初期化済みなら True
+    """
+    return _meter is not None
+
+
 def create_counter(
     name: str,
     description: str = "",
@@ -232,6 +241,22 @@ class CommonMetrics:
             "ms",
         )
 
+    @staticmethod
+    def db_query_duration():
+        return create_histogram(
+            "db_query_duration_milliseconds",
+            "Database statement latency by query fingerprint",
+            "ms",
+        )
+
+    @staticmethod
+    def db_queries_total():
+        return create_counter(
+            "db_queries_total",
+            "Total number of database statements by query fingerprint",
+            "1",
+        )
+
     @staticmethod
     def db_connections_active():
         return create_up_down_counter(
@@ -94,3 +94,16 @@ class IMinutesDividerService(ABC):
             SpeakerAndSpeechContentList: 発言者と発言内容のリスト
         """
         pass
+
+    def rule_based_speech_divide(
+        self, section_string: SectionString
+    ) -> SpeakerAndSpeechContentList | None:
+        """LLMを使わずに（発言者マーカーなどで）分割できる場合はその結果を返す
+
+        Args:
+            section_string: セクション情報
+
+        Returns:
+            SpeakerAndSpeechContentList | None: 分割結果（LLMが必要な場合はNone）
+        """
+        return None
@@ -1,6 +1,7 @@
 """Base repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.entities.base import BaseEntity
 
@@ -35,6 +36,28 @@ class BaseRepository[T: BaseEntity](ABC):
         """Update an existing entity."""
         pass
 
+    @abstractmethod
+    async def bulk_update_fields(
+        self, entities: list[T], fields: Sequence[str]
+    ) -> list[int]:
+        """Update the given fields of many entities at once.
+
+        Returns:
+            IDs of the updated rows
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_upsert_on(
+        self, entities: list[T], conflict_keys: Sequence[str]
+    ) -> list[int]:
+        """Insert many entities, updating rows that conflict on the given keys.
+
+        Returns:
+            IDs of the inserted or updated rows
+        """
+        pass
+
     @abstractmethod
     async def delete(self, entity_id: int) -> bool:
         """Delete an entity by ID."""
@@ -1,10 +1,13 @@
 """Conversation repository interface."""
 
 from abc import abstractmethod
+from datetime import date
 from typing import Any
 
 from src.domain.entities.conversation import Conversation
 from src.domain.repositories.base import BaseRepository
+from src.domain.value_objects.conversation_search_hit import ConversationSearchHit
+from src.domain.value_objects.keyset_page import KeysetPage, TotalCountMode
 
 
 class ConversationRepository(BaseRepository[Conversation]):
@@ -51,6 +54,28 @@ class ConversationRepository(BaseRepository[Conversation]):
         """Create multiple conversations at once."""
         pass
 
+    @abstractmethod
+    async def delete_by_minutes(self, minutes_id: int) -> int:
+        """Delete all conversations of a minutes record in one statement.
+
+        Returns:
+            Number of deleted conversations
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_from_extraction(
+        self, conversations: list[Conversation]
+    ) -> int:
+        """Write extraction-derived fields and log links for many conversations.
+
+        Manually verified conversations are left untouched.
+
+        Returns:
+            Number of updated conversations
+        """
+        pass
+
     @abstractmethod
     async def save_speaker_and_speech_content_list(
         self, speaker_and_speech_content_list: list[Any], minutes_id: int | None = None
@@ -77,25 +102,63 @@ class ConversationRepository(BaseRepository[Conversation]):
         pass
 
     @abstractmethod
-    async def get_conversations_with_pagination(
+    async def get_keyset_page(
         self,
-        page: int = 1,
-        page_size: int = 10,
-        speaker_name: str | None = None,
+        page_size: int = 50,
+        after_id: int | None = None,
         meeting_id: int | None = None,
-        has_speaker_id: bool | None = None,
-    ) -> dict[str, Any]:
-        """Get conversations with pagination and filters.
+        speaker_name: str | None = None,
+        is_manually_verified: bool | None = None,
+        descending: bool = True,
+        total_count_mode: TotalCountMode = TotalCountMode.NONE,
+    ) -> KeysetPage[Conversation]:
+        """Get a page of conversations ordered by ID using keyset pagination.
+
+        OFFSETを使わずIDをカーソルにするため、何ページ目でも取得コストは
+        先頭ページと同じになる。
 
         Args:
-            page: Page number (1-based)
             page_size: Number of items per page
-            speaker_name: Optional filter by speaker name
+            after_id: Cursor returned as next_cursor of the previous page
             meeting_id: Optional filter by meeting ID
-            has_speaker_id: Optional filter by presence of speaker ID
+            speaker_name: Optional partial match on speaker name
+            is_manually_verified: Optional filter by verification state
+            descending: Order by ID descending (newest first)
+            total_count_mode: How to compute the total count
+
+        Returns:
+            KeysetPage of conversations
+        """
+        pass
+
+    @abstractmethod
+    async def search_by_text(
+        self,
+        query: str,
+        speaker_id: int | None = None,
+        speaker_name: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        governing_body_id: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[ConversationSearchHit]:
+        """Search conversation text with the full-text index, ranked by relevance.
+
+        空白で区切った検索語をすべて含む発言を、関連度の高い順に返す。
+
+        Args:
+            query: Search words separated by whitespace
+            speaker_id: Optional filter by speaker ID
+            speaker_name: Optional partial match on speaker name
+            start_date: Optional lower bound of the meeting date (inclusive)
+            end_date: Optional upper bound of the meeting date (inclusive)
+            governing_body_id: Optional filter by governing body ID
+            limit: Maximum number of hits
+            offset: Number of hits to skip
 
         Returns:
-            Dictionary with conversations and pagination info
+            Hits ordered by score, then by newer meeting date
         """
         pass
 
@@ -30,6 +30,18 @@ class ExtractionLogRepository(BaseRepository[ExtractionLog]):
         """
         pass
 
+    @abstractmethod
+    async def bulk_create(self, logs: list[ExtractionLog]) -> list[ExtractionLog]:
+        """抽出ログを一括作成する。
+
+        Args:
+            logs: 作成する抽出ログのリスト
+
+        Returns:
+            IDが設定された抽出ログのリスト（入力と同じ順序）
+        """
+        pass
+
     @abstractmethod
     async def get_by_pipeline_version(
         self,
@@ -73,3 +73,24 @@ class MeetingRepository(BaseRepository[Meeting]):
     ) -> list[Meeting]:
         """院名と日付範囲で会議を取得する."""
         pass
+
+    @abstractmethod
+    async def get_urls_with_conversations(self, urls: list[str]) -> set[str]:
+        """指定URLのうち、発言（Conversation）が1件以上ある会議のURLを取得する."""
+        pass
+
+    @abstractmethod
+    async def get_pending_minutes_processing(
+        self, limit: int | None = None
+    ) -> list[Meeting]:
+        """議事録テキストがあり、発言（Conversation）がまだない会議を取得する."""
+        pass
+
+    @abstractmethod
+    async def lock_for_import(self, key: str) -> None:
+        """会議の取り込みを排他するロックを取得する.
+
+        ロックは現在のトランザクションの終了（コミット/ロールバック）まで保持され、
+        同じキーで取り込み中の他プロセスがあれば終了を待つ。
+        """
+        pass
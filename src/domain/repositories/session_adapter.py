@@ -6,6 +6,7 @@ provides concrete implementations following the Dependency Inversion Principle.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 
@@ -89,6 +90,16 @@ class ISessionAdapter(ABC):
         """
         pass
 
+    @abstractmethod
+    def begin_nested(self) -> AbstractAsyncContextManager[None]:
+        """Start a nested transaction (SAVEPOINT) for an ``async with`` block.
+
+        Leaving the block releases the savepoint. If the block raises, only
+        the changes made inside it are rolled back and the outer transaction
+        stays usable.
+        """
+        pass
+
     @abstractmethod
     async def flush(self) -> None:
         """Flush pending changes to the database.
@@ -10,6 +10,11 @@ from src.domain.repositories.base import BaseRepository
 from src.domain.value_objects.speaker_classification_stats import (
     SpeakerClassificationStats,
 )
+from src.domain.value_objects.speaker_name_resolution import SpeakerNameResolution
+from src.domain.value_objects.speaker_party_resolution import (
+    SpeakerPartyKey,
+    SpeakerPartyResolution,
+)
 from src.domain.value_objects.speaker_with_conversation_count import (
     SpeakerWithConversationCount,
 )
@@ -262,3 +267,55 @@ class SpeakerRepository(BaseRepository[Speaker]):
              "total_kept_non_politician": int}
         """
         pass
+
+    @abstractmethod
+    async def resolve_by_names(
+        self, name_yomi_map: dict[str, str | None]
+    ) -> SpeakerNameResolution:
+        """発言者名の集合を一括で解決する（存在しなければ作成）.
+
+        1. 名前一覧に一致する既存Speakerを1クエリで取得
+        2. 未登録の名前を1回の複数行INSERTで作成
+        3. name_yomiが未設定の既存Speakerに読み仮名を1回のUPDATEで補完
+
+        Args:
+            name_yomi_map: 正規化済み発言者名 → 読み仮名（不明ならNone）
+
+        Returns:
+            名前 → Speaker ID の対応と作成・更新件数
+        """
+        pass
+
+    @abstractmethod
+    async def find_ids_by_name_party(
+        self, keys: list[SpeakerPartyKey]
+    ) -> dict[SpeakerPartyKey, int]:
+        """(発言者名, 政党名) の組に一致する既存Speakerを1クエリで取得する.
+
+        各組の一致条件は get_by_name_party_position(name, party, None) と同じ
+        （政党名がNoneなら名前のみで一致）。複数一致する場合はIDが最小のものを返す。
+
+        Args:
+            keys: (発言者名, 政党名) のリスト
+
+        Returns:
+            一致した組 → Speaker ID（一致しない組は含まない）
+        """
+        pass
+
+    @abstractmethod
+    async def resolve_by_name_party(
+        self, keys: list[SpeakerPartyKey]
+    ) -> SpeakerPartyResolution:
+        """(発言者名, 政党名) の組の集合を一括で解決する（存在しなければ作成）.
+
+        1. 既存Speakerを find_ids_by_name_party() の1クエリで取得
+        2. 未登録の組を1回の複数行INSERTで作成（政党名があれば政治家として作成）
+
+        Args:
+            keys: (発言者名, 政党名) のリスト
+
+        Returns:
+            組 → Speaker ID の対応と作成件数
+        """
+        pass
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.application.dtos.kokkai_speech_dto import KokkaiMeetingDTO, KokkaiSpeechDTO
@@ -25,6 +26,20 @@ class IKokkaiSpeechService(Protocol):
         """
         ...
 
+    def iter_speeches(
+        self,
+        *,
+        issue_id: str | None = None,
+        name_of_house: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+    ) -> AsyncIterator[list[KokkaiSpeechDTO]]:
+        """発言データをAPIのページ単位で逐次返す.
+
+        条件は fetch_speeches と同じ。広い日付範囲でも全件をメモリに保持しない。
+        """
+        ...
+
     async def fetch_meetings(
         self,
         *,
@@ -40,3 +55,16 @@ class IKokkaiSpeechService(Protocol):
         回次範囲または日付範囲で対象会議を列挙する。
         """
         ...
+
+    def iter_meetings(
+        self,
+        *,
+        name_of_house: str | None = None,
+        name_of_meeting: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+        session_from: int | None = None,
+        session_to: int | None = None,
+    ) -> AsyncIterator[list[KokkaiMeetingDTO]]:
+        """会議一覧をAPIのページ単位で逐次返す."""
+        ...
@@ -5,6 +5,7 @@ across multiple repository operations while maintaining Clean Architecture princ
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import TypeVar
 
 from src.domain.repositories.conference_repository import ConferenceRepository
@@ -71,6 +72,15 @@ class IUnitOfWork(ABC):
         """Rollback the current transaction."""
         pass
 
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """Start a SAVEPOINT for an ``async with`` block.
+
+        If the block raises, only its changes are rolled back; the rest of the
+        transaction is kept and committed later with commit().
+        """
+        pass
+
     @abstractmethod
     async def flush(self) -> None:
         """Flush changes to database without committing.
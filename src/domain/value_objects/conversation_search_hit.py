@@ -0,0 +1,29 @@
+"""発言の全文検索結果を表す値オブジェクト"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from src.domain.entities.conversation import Conversation
+
+
+@dataclass(frozen=True)
+class ConversationSearchHit:
+    """全文検索にヒットした発言と、その会議の情報
+
+    Attributes:
+        conversation: ヒットした発言
+        score: 関連度（検索語の出現回数を発言の長さで補正した値、大きいほど上位）
+        meeting_id: 会議ID
+        meeting_date: 開催日
+        meeting_name: 会議名
+        governing_body_id: 開催主体ID
+        governing_body_name: 開催主体名
+    """
+
+    conversation: Conversation
+    score: float
+    meeting_id: int | None = None
+    meeting_date: date | None = None
+    meeting_name: str | None = None
+    governing_body_id: int | None = None
+    governing_body_name: str | None = None
@@ -0,0 +1,36 @@
+"""キーセットページネーションの結果を表す値オブジェクト"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class TotalCountMode(Enum):
+    """ページ取得時に総件数をどう求めるか.
+
+    件数の数え上げはページの取得より重くなり得るため、用途に応じて選ぶ。
+    """
+
+    EXACT = "exact"  # COUNT(*) で正確に数える
+    ESTIMATED = "estimated"  # 統計情報・実行計画の推定行数を使う
+    NONE = "none"  # 数えない
+
+
+@dataclass(frozen=True)
+class KeysetPage[T]:
+    """キーセットページネーションで取得した1ページ
+
+    Attributes:
+        items: ページ内の要素
+        next_cursor: 次のページを取得するためのカーソル（最後のページなら None）
+        total_count: 総件数（TotalCountMode.NONE の場合は None）
+        total_is_estimate: total_count が推定値か
+    """
+
+    items: list[T]
+    next_cursor: int | None
+    total_count: int | None = None
+    total_is_estimate: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
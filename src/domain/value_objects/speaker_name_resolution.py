@@ -0,0 +1,15 @@
+"""発言者名の一括解決結果を表すValue Object."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SpeakerNameResolution:
+    """発言者名の一括解決結果のValue Object.
+
+    名前の集合を1回の検索・1回の挿入・1回の読み仮名補完で解決した結果を保持する。
+    """
+
+    speaker_ids: dict[str, int] = field(default_factory=dict)
+    created_count: int = 0
+    yomi_updated_count: int = 0
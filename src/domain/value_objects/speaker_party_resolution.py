@@ -0,0 +1,18 @@
+"""発言者名・政党名の組の一括解決結果を表すValue Object."""
+
+from dataclasses import dataclass, field
+
+
+# (発言者名, 政党名) の組。政党名がNoneの場合は政党を問わず名前で一致させる
+SpeakerPartyKey = tuple[str, str | None]
+
+
+@dataclass(frozen=True)
+class SpeakerPartyResolution:
+    """(発言者名, 政党名) の組の一括解決結果のValue Object.
+
+    組の集合を1回の検索・1回の挿入で解決した結果を保持する。
+    """
+
+    speaker_ids: dict[SpeakerPartyKey, int] = field(default_factory=dict)
+    created_count: int = 0
@@ -11,10 +11,11 @@ from collections.abc import Generator
 from contextlib import contextmanager
 
 from dotenv import load_dotenv
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.infrastructure.config.engine_registry import engine_registry
 from src.infrastructure.config.settings import ENV_FILE_PATH
 from src.infrastructure.exceptions import ConnectionError, DatabaseError
 
@@ -92,12 +93,8 @@ def get_db_engine() -> Engine:
 
     if _engine is None:
         try:
-            _engine = create_engine(
-                DATABASE_URL,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_size=5,
-                max_overflow=10,
-            )
+            # DIコンテナ・アダプターと同じプロセス共有のエンジンを使う
+            _engine = engine_registry.get_sync_engine(DATABASE_URL)
             logger.info("Database engine created successfully")
         except SQLAlchemyError as e:
             raise ConnectionError(
@@ -0,0 +1,364 @@
+"""プロセス全体で共有するデータベースエンジンのレジストリ
+
+RepositoryAdapter・AsyncDatabase・DIコンテナがそれぞれエンジンを作ると、
+Streamlitの1ページ表示だけで複数のコネクションプールが開かれ、同時利用者が
+増えるとPostgreSQLの max_connections を使い切ってしまう。
+
+このモジュールはエンジンを接続URLごと（非同期エンジンはさらにイベントループ
+ごと）に1つだけ作成して共有し、プールの利用状況（貸出中・オーバーフロー・
+待ち時間）を参照できるようにする。プロセス終了時にはすべて破棄する。
+作成したエンジンには遅いSQLの検出とフィンガープリント別の集計を組み込む。
+
+非同期エンジン（asyncpg）は作成したイベントループの外では使えないため、
+イベントループごとに作成する。閉じられたイベントループのエンジンは
+次に非同期エンジンを取得するときに破棄する。
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.monitoring.slow_query_detector import (
+    QueryStatsCollector,
+    SlowQueryDetector,
+    install_sqlalchemy_listener,
+    query_stats,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30.0
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 1000.0
+
+# 非同期エンジンの破棄を待つ上限（秒）
+_ASYNC_DISPOSE_TIMEOUT = 10.0
+
+
+def to_async_url(database_url: str) -> str:
+    """同期用の接続URLをasyncpg用に変換する"""
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if database_url.startswith("postgresql+psycopg2://"):
+        return database_url.replace(
+            "postgresql+psycopg2://", "postgresql+asyncpg://", 1
+        )
+    return database_url
+
+
+def _mask_url(database_url: str) -> str:
+    """ログ・メトリクス用に認証情報を伏せたURL"""
+    if "@" not in database_url:
+        return database_url
+    scheme, _, rest = database_url.partition("://")
+    return f"{scheme}://***@{rest.rsplit('@', 1)[1]}"
+
+
+@dataclass
+class _PoolWaitStats:
+    """コネクション取得の待ち時間の累計"""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float) -> None:
+        with self.lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+
+class _TimedPoolMixin:
+    """プールからのコネクション取得にかかった時間を記録する"""
+
+    _wait_stats: _PoolWaitStats
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if not hasattr(self, "_wait_stats"):
+            self._wait_stats = _PoolWaitStats()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            self._wait_stats.record(time.perf_counter() - started)
+
+    def recreate(self) -> Any:
+        # engine.dispose() でプールが作り直されても累計を引き継ぐ
+        pool = super().recreate()  # type: ignore[misc]
+        if hasattr(self, "_wait_stats"):
+            pool._wait_stats = self._wait_stats
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """待ち時間を記録する同期エンジン用プール"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """待ち時間を記録する非同期エンジン用プール"""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """コネクションプールの利用状況
+
+    Attributes:
+        name: エンジンの識別名（認証情報を伏せたURLとイベントループ）
+        pool_size: 常時保持するコネクション数の上限
+        checked_out: 貸出中のコネクション数
+        overflow: pool_size を超えて開いているコネクション数（負なら未使用枠）
+        wait_count: コネクション取得の回数
+        total_wait_seconds: コネクション取得の待ち時間の合計
+        max_wait_seconds: コネクション取得の待ち時間の最大
+    """
+
+    name: str
+    pool_size: int
+    checked_out: int
+    overflow: int
+    wait_count: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        if self.wait_count == 0:
+            return 0.0
+        return self.total_wait_seconds / self.wait_count
+
+
+@dataclass
+class _AsyncEngineEntry:
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    loop: asyncio.AbstractEventLoop | None
+
+
+class EngineRegistry:
+    """接続URL（とイベントループ）ごとにエンジンを1つだけ作成して共有する"""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT,
+        query_stats: QueryStatsCollector | None = None,
+        slow_query_threshold_ms: float = DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+    ):
+        """初期化
+
+        Args:
+            pool_size: エンジンごとに常時保持するコネクション数
+            max_overflow: 負荷時に pool_size を超えて開けるコネクション数
+            pool_timeout: 空きコネクションを待つ上限（秒）
+            query_stats: 実行したSQLを集計する先（None なら計測しない）
+            slow_query_threshold_ms: 遅いSQLとしてログに出す閾値（ミリ秒）
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.query_stats = query_stats
+        self.slow_query_detector = SlowQueryDetector(
+            threshold_ms=slow_query_threshold_ms, store_history=False
+        )
+        self._lock = threading.Lock()
+        self._sync_engines: dict[str, Engine] = {}
+        self._async_engines: dict[tuple[str, int], _AsyncEngineEntry] = {}
+
+    def _pool_kwargs(self, database_url: str, poolclass: type) -> dict[str, Any]:
+        # SQLiteは専用のプールを使うためプール設定を渡さない
+        if database_url.startswith("sqlite"):
+            return {}
+        return {
+            "poolclass": poolclass,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+        }
+
+    def _install_query_listener(self, engine: Engine | AsyncEngine) -> None:
+        if self.query_stats is None:
+            return
+        install_sqlalchemy_listener(
+            engine,
+            detector=self.slow_query_detector,
+            threshold_ms=self.slow_query_detector.threshold_ms,
+            collector=self.query_stats,
+        )
+
+    def get_sync_engine(self, database_url: str) -> Engine:
+        """接続URLに対応する同期エンジンを取得する（なければ作成する）"""
+        with self._lock:
+            engine = self._sync_engines.get(database_url)
+            if engine is None:
+                engine = create_engine(
+                    database_url,
+                    pool_pre_ping=True,
+                    **self._pool_kwargs(database_url, TimedQueuePool),
+                )
+                self._install_query_listener(engine)
+                self._sync_engines[database_url] = engine
+                logger.info(f"Created shared engine for {_mask_url(database_url)}")
+            return engine
+
+    def _get_async_entry(self, database_url: str) -> _AsyncEngineEntry:
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        async_url = to_async_url(database_url)
+        key = (async_url, id(loop) if loop is not None else 0)
+
+        with self._lock:
+            self._discard_closed_loop_engines()
+            entry = self._async_engines.get(key)
+            if entry is None:
+                engine = create_async_engine(
+                    async_url,
+                    echo=False,
+                    **self._pool_kwargs(async_url, TimedAsyncAdaptedQueuePool),
+                )
+                self._install_query_listener(engine)
+                entry = _AsyncEngineEntry(
+                    engine=engine,
+                    session_maker=async_sessionmaker(
+                        engine, class_=AsyncSession, expire_on_commit=False
+                    ),
+                    loop=loop,
+                )
+                self._async_engines[key] = entry
+                logger.info(f"Created shared async engine for {_mask_url(async_url)}")
+            return entry
+
+    def _discard_closed_loop_engines(self) -> None:
+        """閉じられたイベントループのエンジンを破棄する（ロック保持中に呼ぶ）"""
+        for key, entry in list(self._async_engines.items()):
+            if entry.loop is not None and entry.loop.is_closed():
+                # ループが閉じているためコネクションは閉じずにプールだけ手放す
+                entry.engine.sync_engine.dispose(close=False)
+                del self._async_engines[key]
+
+    def get_async_engine(self, database_url: str) -> AsyncEngine:
+        """現在のイベントループ用の非同期エンジンを取得する（なければ作成する）"""
+        return self._get_async_entry(database_url).engine
+
+    def get_async_session_maker(
+        self, database_url: str
+    ) -> async_sessionmaker[AsyncSession]:
+        """現在のイベントループ用の非同期セッションメーカーを取得する"""
+        return self._get_async_entry(database_url).session_maker
+
+    def pool_stats(self) -> list[PoolStats]:
+        """共有しているすべてのエンジンのプール利用状況"""
+        with self._lock:
+            named_engines: list[tuple[str, Engine]] = [
+                (_mask_url(url), engine) for url, engine in self._sync_engines.items()
+            ]
+            named_engines.extend(
+                (f"{_mask_url(url)} (loop={loop_id:#x})", entry.engine.sync_engine)
+                for (url, loop_id), entry in self._async_engines.items()
+            )
+
+        stats = []
+        for name, engine in named_engines:
+            pool = engine.pool
+            wait_stats = getattr(pool, "_wait_stats", None) or _PoolWaitStats()
+            stats.append(
+                PoolStats(
+                    name=name,
+                    pool_size=pool.size() if hasattr(pool, "size") else 0,
+                    checked_out=(
+                        pool.checkedout() if hasattr(pool, "checkedout") else 0
+                    ),
+                    overflow=pool.overflow() if hasattr(pool, "overflow") else 0,
+                    wait_count=wait_stats.count,
+                    total_wait_seconds=wait_stats.total_seconds,
+                    max_wait_seconds=wait_stats.max_seconds,
+                )
+            )
+        return stats
+
+    def dispose_all(self) -> None:
+        """すべてのエンジンを破棄する（プロセス終了時に呼ぶ）"""
+        with self._lock:
+            sync_engines = list(self._sync_engines.values())
+            async_entries = list(self._async_engines.values())
+            self._sync_engines.clear()
+            self._async_engines.clear()
+
+        for engine in sync_engines:
+            engine.dispose()
+        for entry in async_entries:
+            self._dispose_async_engine(entry)
+
+    @staticmethod
+    def _dispose_async_engine(entry: _AsyncEngineEntry) -> None:
+        loop = entry.loop
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        try:
+            if loop is not None and loop is current_loop:
+                # 同じループ上では完了を待てないため、プールだけ手放す
+                entry.engine.sync_engine.dispose(close=False)
+            elif loop is not None and loop.is_running():
+                # 専用スレッドなどで動いているループ上で破棄する
+                asyncio.run_coroutine_threadsafe(entry.engine.dispose(), loop).result(
+                    _ASYNC_DISPOSE_TIMEOUT
+                )
+            elif loop is not None and not loop.is_closed():
+                loop.run_until_complete(entry.engine.dispose())
+            else:
+                entry.engine.sync_engine.dispose(close=False)
+        except Exception as e:
+            logger.warning(f"Failed to dispose async engine: {e}")
+            entry.engine.sync_engine.dispose(close=False)
+
+
+def _create_registry() -> EngineRegistry:
+    if settings is None:
+        return EngineRegistry(query_stats=query_stats)
+    return EngineRegistry(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        query_stats=query_stats if settings.db_query_stats_enabled else None,
+        slow_query_threshold_ms=settings.db_slow_query_threshold_ms,
+    )
+
+
+# Global instance
+engine_registry = _create_registry()
+
+
+def get_pool_stats() -> list[PoolStats]:
+    """共有エンジンのプール利用状況を取得する"""
+    return engine_registry.pool_stats()
+
+
+def dispose_engines() -> None:
+    """共有エンジンをすべて破棄する"""
+    engine_registry.dispose_all()
+
+
+atexit.register(dispose_engines)
@@ -19,6 +19,7 @@ from src.infrastructure.di.providers import (
     ServiceContainer,
     UseCaseContainer,
 )
+from src.infrastructure.monitoring.query_counter import install_n_plus_one_detection
 
 
 class Environment(Enum):
@@ -322,6 +323,9 @@ def init_container(
     else:
         _container = ApplicationContainer.create_for_environment(environment)
 
+    # Register the N+1 query detector used by detect_n_plus_one
+    install_n_plus_one_detection(settings or get_settings())
+
     return _container
 
 
@@ -0,0 +1,111 @@
+"""BAML呼び出しのスコープ（共有レートリミッターとトークン集計）
+
+複数の会議の議事録を同一プロセスで並行処理する場合に、すべてのBAML呼び出しで
+1つのレートリミッターを共有し、会議ごとに使用トークン数を集計するための仕組み。
+
+スコープは contextvars で保持するため、会議ごとの asyncio タスク内で
+baml_call_scope() に入れば、そのタスクから呼ばれるサービス（議事録分割・
+役職-人名マッピング・発言者名の正規化など）のBAML呼び出しすべてに適用される。
+スコープ外では acquire_baml_client() は渡したクライアントをそのまま返す。
+"""
+
+import contextvars
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from baml_py import Collector
+
+from baml_client.async_client import BamlAsyncClient
+
+from src.infrastructure.resilience.rate_limiter import RateLimiter
+
+
+@dataclass(frozen=True)
+class LLMTokenUsage:
+    """LLMの使用トークン数
+
+    Attributes:
+        input_tokens: 入力トークン数
+        output_tokens: 出力トークン数
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def __add__(self, other: "LLMTokenUsage") -> "LLMTokenUsage":
+        return LLMTokenUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+        )
+
+
+class BamlCallScope:
+    """スコープ内のBAML呼び出しに適用するレートリミッターとトークン集計"""
+
+    def __init__(self, rate_limiter: RateLimiter | None = None):
+        """初期化
+
+        Args:
+            rate_limiter: 呼び出し前に待機するレートリミッター（複数スコープで共有可）
+        """
+        self.rate_limiter = rate_limiter
+        self.collector = Collector(name="baml-call-scope")
+        self.call_count = 0
+
+    @property
+    def usage(self) -> LLMTokenUsage:
+        """スコープ内の呼び出しで使用したトークン数"""
+        usage = self.collector.usage
+        return LLMTokenUsage(
+            input_tokens=usage.input_tokens or 0,
+            output_tokens=usage.output_tokens or 0,
+        )
+
+
+_current_scope: contextvars.ContextVar[BamlCallScope | None] = contextvars.ContextVar(
+    "baml_call_scope", default=None
+)
+
+
+@contextmanager
+def baml_call_scope(rate_limiter: RateLimiter | None = None) -> Iterator[BamlCallScope]:
+    """BAML呼び出しのスコープに入る
+
+    Args:
+        rate_limiter: スコープ内の呼び出しで共有するレートリミッター
+
+    Yields:
+        BamlCallScope: 使用トークン数を参照できるスコープ
+    """
+    scope = BamlCallScope(rate_limiter)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+async def acquire_baml_client(client: BamlAsyncClient) -> BamlAsyncClient:
+    """BAML関数を呼び出す直前に使うクライアントを取得する
+
+    スコープ内ではレートリミッターの許可を待ち、トークン集計付きのクライアントを返す。
+
+    Args:
+        client: モジュールレベルのクライアント（baml_client.async_client.b）
+
+    Returns:
+        BamlAsyncClient: 呼び出しに使うクライアント
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return client
+    if scope.rate_limiter is not None:
+        await scope.rate_limiter.acquire()
+    scope.call_count += 1
+    return client.with_options(collector=scope.collector)
@@ -11,44 +11,12 @@ from src.domain.types.llm import (
     LLMExtractResult,
     LLMMatchResult,
 )
+from src.infrastructure.resilience.rate_limiter import RateLimiter
 
 
 T = TypeVar("T")
 
-
-class RateLimiter:
-    """Rate limiter for API calls."""
-
-    def __init__(self, max_per_second: int = 5, max_concurrent: int = 10):
-        """Initialize rate limiter.
-
-        Args:
-            max_per_second: Maximum requests per second
-            max_concurrent: Maximum concurrent requests
-        """
-        self._max_per_second = max_per_second
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._last_call_times: list[float] = []
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Acquire permission to make a request."""
-        async with self._semaphore:
-            async with self._lock:
-                now = asyncio.get_event_loop().time()
-
-                # Remove old timestamps
-                cutoff = now - 1.0
-                self._last_call_times = [t for t in self._last_call_times if t > cutoff]
-
-                # Check if we need to wait
-                if len(self._last_call_times) >= self._max_per_second:
-                    wait_time = 1.0 - (now - self._last_call_times[0])
-                    if wait_time > 0:
-                        await asyncio.sleep(wait_time)
-                        now = asyncio.get_event_loop().time()
-
-                self._last_call_times.append(now)
+__all__ = ["ConcurrentLLMService", "RateLimiter"]
 
 
 class ConcurrentLLMService(ILLMService):
@@ -1,6 +1,7 @@
 """国会会議録検索システムAPIクライアントパッケージ."""
 
 from .client import KokkaiApiClient
+from .response_store import KokkaiResponseStore
 from .service import KokkaiSpeechServiceImpl
 from .types import (
     MeetingListApiResponse,
@@ -12,6 +13,7 @@ from .types import (
 
 __all__ = [
     "KokkaiApiClient",
+    "KokkaiResponseStore",
     "KokkaiSpeechServiceImpl",
     "MeetingListApiResponse",
     "MeetingRecord",
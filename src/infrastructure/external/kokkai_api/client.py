@@ -2,18 +2,26 @@
 
 httpx asyncベースのHTTPクライアントで、/api/speech と /api/meeting_list
 エンドポイントに対応。ページネーション自動ハンドリング付き。
+max_concurrency > 1 の場合、初回レスポンスの numberOfRecords から残りページの
+startRecord を算出し、レートリミッター配下で並列取得する。
+iter_speech_pages / iter_meeting_pages はページ単位で逐次返すasync generatorで、
+広い日付範囲でも保持するレコード数をページサイズ程度に抑えられる。
+response_store を指定すると生レスポンスをディスクに保存し、再取得時に再利用する。
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
 
 import httpx
 
 from tenacity import RetryError, wait_exponential
 
+from .response_store import KokkaiResponseStore
 from .types import (
     MeetingListApiResponse,
     MeetingRecord,
@@ -21,11 +29,14 @@ from .types import (
     SpeechRecord,
 )
 
+from src.infrastructure.resilience.rate_limiter import RateLimiter
 from src.infrastructure.resilience.retry import RetryPolicy
 
 
 logger = logging.getLogger(__name__)
 
+PageT = TypeVar("PageT", SpeechApiResponse, MeetingListApiResponse)
+
 # APIのキャメルケースとPython側のスネークケースのマッピング
 _SPEECH_PARAM_MAP: dict[str, str] = {
     "name_of_house": "nameOfHouse",
@@ -76,13 +87,42 @@ class KokkaiApiClient:
 
     BASE_URL = "https://kokkai.ndl.go.jp/api"
     MAX_RECORDS_PER_REQUEST = 100
+    # 並列取得時のデフォルト秒間リクエスト上限（NDL APIへの負荷配慮）
+    DEFAULT_MAX_REQUESTS_PER_SECOND = 3
 
     def __init__(
-        self, client: httpx.AsyncClient | None = None, max_retries: int = 3
+        self,
+        client: httpx.AsyncClient | None = None,
+        max_retries: int = 3,
+        max_concurrency: int = 1,
+        rate_limiter: RateLimiter | None = None,
+        response_store: KokkaiResponseStore | None = None,
+        rate_limit_share: float = 1.0,
     ) -> None:
+        """クライアントを初期化.
+
+        Args:
+            client: 外部注入するHTTPクライアント（Noneならリクエスト毎に生成）
+            max_retries: リトライ回数
+            max_concurrency: ページ並列取得の同時実行数（1なら逐次取得）
+            rate_limiter: 全リクエストで共有するレートリミッター。
+                並列取得時に未指定なら既定値で生成する
+            response_store: 生レスポンスのローカル保存ストア
+            rate_limit_share: 既定のレート上限のうちこのクライアントが使う割合
+                （複数プロセスで上限を分け合う場合に 1/プロセス数 を指定）
+        """
         self._external_client = client
         self._owns_client = client is None
         self._max_retries = max_retries
+        self._max_concurrency = max(1, max_concurrency)
+        if rate_limiter is None and self._max_concurrency > 1:
+            rate_limiter = RateLimiter(
+                max_per_second=self.DEFAULT_MAX_REQUESTS_PER_SECOND,
+                max_concurrent=self._max_concurrency,
+                window_seconds=1.0 / rate_limit_share,
+            )
+        self._rate_limiter = rate_limiter
+        self._response_store = response_store
         # リトライポリシーを__init__で1回だけ生成しキャッシュ
         if max_retries > 0:
             self._retry_policy = RetryPolicy.custom(
@@ -147,12 +187,14 @@ class KokkaiApiClient:
         any_keyword: str | None = None,
         issue_id: str | None = None,
     ) -> list[SpeechRecord]:
-        """全件取得（ページネーション自動ハンドリング）."""
-        all_records: list[SpeechRecord] = []
-        start = 1
-
-        while True:
-            response = await self.search_speeches(
+        """全件取得（ページネーション自動ハンドリング）.
+
+        全レコードをメモリに保持するため、広い日付範囲では
+        iter_speech_pages を使うこと。
+        """
+        return [
+            record
+            async for page in self.iter_speech_pages(
                 name_of_house=name_of_house,
                 name_of_meeting=name_of_meeting,
                 from_date=from_date,
@@ -162,24 +204,47 @@ class KokkaiApiClient:
                 speaker=speaker,
                 any_keyword=any_keyword,
                 issue_id=issue_id,
-                start_record=start,
-            )
-            all_records.extend(response.speech_record)
-
-            if (
-                response.next_record_position is None
-                or response.next_record_position == 0
-            ):
-                break
-
-            start = response.next_record_position
-            logger.info(
-                "ページネーション: %d/%d件取得済み",
-                len(all_records),
-                response.number_of_records,
             )
+            for record in page
+        ]
 
-        return all_records
+    async def iter_speech_pages(
+        self,
+        *,
+        name_of_house: str | None = None,
+        name_of_meeting: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+        session_from: int | None = None,
+        session_to: int | None = None,
+        speaker: str | None = None,
+        any_keyword: str | None = None,
+        issue_id: str | None = None,
+    ) -> AsyncIterator[list[SpeechRecord]]:
+        """発言をページ単位で逐次取得する（startRecord順）.
+
+        次のページは呼び出し側が前のページを消費してから取得するため、
+        保持するレコードは最大でページサイズ × max_concurrency 件に収まる。
+        """
+        conditions: dict[str, Any] = {
+            "name_of_house": name_of_house,
+            "name_of_meeting": name_of_meeting,
+            "from_date": from_date,
+            "until_date": until_date,
+            "session_from": session_from,
+            "session_to": session_to,
+            "speaker": speaker,
+            "any_keyword": any_keyword,
+            "issue_id": issue_id,
+        }
+        first = await self.search_speeches(**conditions)
+        yield first.speech_record
+
+        async def _fetch_page(start: int) -> SpeechApiResponse:
+            return await self.search_speeches(**conditions, start_record=start)
+
+        async for response in self._iter_remaining_pages(first, _fetch_page):
+            yield response.speech_record
 
     async def search_meetings(
         self,
@@ -221,37 +286,126 @@ class KokkaiApiClient:
         session_to: int | None = None,
     ) -> list[MeetingRecord]:
         """会議一覧全件取得（ページネーション自動ハンドリング）."""
-        all_records: list[MeetingRecord] = []
-        start = 1
-
-        while True:
-            response = await self.search_meetings(
+        return [
+            record
+            async for page in self.iter_meeting_pages(
                 name_of_house=name_of_house,
                 name_of_meeting=name_of_meeting,
                 from_date=from_date,
                 until_date=until_date,
                 session_from=session_from,
                 session_to=session_to,
-                start_record=start,
             )
-            all_records.extend(response.meeting_record)
-
-            if (
-                response.next_record_position is None
-                or response.next_record_position == 0
-            ):
-                break
+            for record in page
+        ]
 
-            start = response.next_record_position
+    async def iter_meeting_pages(
+        self,
+        *,
+        name_of_house: str | None = None,
+        name_of_meeting: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+        session_from: int | None = None,
+        session_to: int | None = None,
+    ) -> AsyncIterator[list[MeetingRecord]]:
+        """会議一覧をページ単位で逐次取得する（startRecord順）."""
+        conditions: dict[str, Any] = {
+            "name_of_house": name_of_house,
+            "name_of_meeting": name_of_meeting,
+            "from_date": from_date,
+            "until_date": until_date,
+            "session_from": session_from,
+            "session_to": session_to,
+        }
+        first = await self.search_meetings(**conditions)
+        yield first.meeting_record
+
+        async def _fetch_page(start: int) -> MeetingListApiResponse:
+            return await self.search_meetings(**conditions, start_record=start)
+
+        async for response in self._iter_remaining_pages(first, _fetch_page):
+            yield response.meeting_record
+
+    def _remaining_offsets(
+        self,
+        number_of_records: int,
+        next_record_position: int | None,
+        page_size: int,
+    ) -> list[int]:
+        """初回レスポンスから残りページの startRecord 一覧を算出."""
+        if not next_record_position:
+            return []
+        step = page_size if page_size > 0 else self.MAX_RECORDS_PER_REQUEST
+        return list(range(next_record_position, number_of_records + 1, step))
+
+    async def _iter_remaining_pages(
+        self,
+        first: PageT,
+        fetch_page: Callable[[int], Awaitable[PageT]],
+    ) -> AsyncIterator[PageT]:
+        """初回レスポンス以降のページをstartRecord順に逐次返す.
+
+        max_concurrency > 1 の場合は max_concurrency ページずつ並列取得し、
+        取得した窓を順に返してから次の窓に進む（先読みは1窓分まで）。
+        """
+        if self._max_concurrency <= 1:
+            response = first
+            while response.next_record_position:
+                logger.info(
+                    "ページネーション: %d/%d件取得済み",
+                    response.next_record_position - 1,
+                    response.number_of_records,
+                )
+                response = await fetch_page(response.next_record_position)
+                yield response
+            return
+
+        offsets = self._remaining_offsets(
+            first.number_of_records,
+            first.next_record_position,
+            first.number_of_return,
+        )
+        if not offsets:
+            return
 
-        return all_records
+        logger.info(
+            "ページ並列取得: 残り%dページ (同時実行数=%d)",
+            len(offsets),
+            self._max_concurrency,
+        )
+        for i in range(0, len(offsets), self._max_concurrency):
+            window = offsets[i : i + self._max_concurrency]
+            for response in await asyncio.gather(*(fetch_page(s) for s in window)):
+                yield response
 
     async def _request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """APIリクエスト実行（リトライ付き）."""
+        """APIリクエスト実行（保存済みレスポンス優先、リトライ付き）."""
+        store = self._response_store
+        if store is not None:
+            cached = store.get(endpoint, params)
+            if cached is not None:
+                return cached
+            if store.offline:
+                raise KokkaiApiError(
+                    f"オフラインモード: 保存済みレスポンスがありません ({endpoint})"
+                )
+
+        data = await self._request_remote(endpoint, params)
+        if store is not None:
+            store.put(endpoint, params, data)
+        return data
+
+    async def _request_remote(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """APIへのHTTPリクエスト実行（リトライ付き）."""
         url = f"{self.BASE_URL}/{endpoint}"
         client = await self._get_client()
 
         async def _do_request() -> dict[str, Any]:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
             try:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
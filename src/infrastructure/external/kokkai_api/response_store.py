@@ -0,0 +1,226 @@
+"""国会会議録APIレスポンスのローカル保存ストア.
+
+KokkaiApiClient._request が受け取った生レスポンスJSONを、エンドポイントと
+正規化したパラメータのハッシュをキーとして圧縮保存する（コンテンツアドレス方式）。
+zstandard がインストールされていれば zstd、なければ gzip で圧縮する。
+
+- オフラインモード: ストアにあるレスポンスのみを返し、ネットワークには出ない
+- 鮮度ポリシー: 検索期間の終了日（until）が過去のレスポンスは無期限に
+  再利用し、終了日がない・直近のレスポンスは後から会議が追加され得るため
+  TTL経過後に再取得する（ページング情報の件数も変わるため）。
+  1会議（issueID）単位の検索は、保存した結果の開催日が過去なら無期限に
+  再利用する（結果が空・開催日が直近なら公開途中の可能性があるためTTL）
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.config.settings import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+
+_ZSTD_SUFFIX = ".json.zst"
+_GZIP_SUFFIX = ".json.gz"
+
+# 検索期間の終了日・会議IDのパラメータ名（APIのクエリパラメータ）
+_UNTIL_PARAM = "until"
+_ISSUE_ID_PARAM = "issueID"
+# 開催日を持つレコードの一覧（発言・会議単位の各エンドポイント）
+_RECORD_KEYS = ("speechRecord", "meetingRecord")
+
+
+@dataclass(frozen=True)
+class _Codec:
+    """保存ファイルの圧縮形式."""
+
+    suffix: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _load_zstd_codec() -> _Codec | None:
+    """zstandard がインストールされていれば zstd のコーデックを返す."""
+    try:
+        zstandard = importlib.import_module("zstandard")
+    except ImportError:
+        return None
+    return _Codec(
+        suffix=_ZSTD_SUFFIX,
+        # 圧縮器はスレッドセーフではないため呼び出しごとに生成する
+        compress=lambda data: zstandard.ZstdCompressor(level=10).compress(data),
+        decompress=lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+_GZIP_CODEC = _Codec(
+    suffix=_GZIP_SUFFIX, compress=gzip.compress, decompress=gzip.decompress
+)
+_ZSTD_CODEC = _load_zstd_codec()
+# 書き込みに使うコーデック（zstd を優先）
+_WRITE_CODEC = _ZSTD_CODEC or _GZIP_CODEC
+
+
+class KokkaiResponseStore:
+    """国会APIの生レスポンスをディスクに圧縮保存するストア."""
+
+    DEFAULT_RECENT_DAYS = 30
+    DEFAULT_RECENT_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self,
+        root_dir: str | Path,
+        *,
+        offline: bool = False,
+        recent_days: int = DEFAULT_RECENT_DAYS,
+        recent_ttl_seconds: float = DEFAULT_RECENT_TTL_SECONDS,
+    ) -> None:
+        """ストアを初期化.
+
+        Args:
+            root_dir: 保存先ディレクトリ
+            offline: Trueならストアのみから応答する（未保存はエラー）
+            recent_days: 検索の終了日がこの日数以内なら結果が増え得るとみなす
+            recent_ttl_seconds: 結果が増え得るレスポンスの有効期間（秒）
+        """
+        self.root_dir = Path(root_dir)
+        self.offline = offline
+        self.recent_days = recent_days
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings | None = None
+    ) -> KokkaiResponseStore | None:
+        """設定からストアを生成（保存先が未設定ならNone）."""
+        settings = settings or get_settings()
+        if not settings.kokkai_response_store_dir:
+            return None
+        return cls(
+            settings.kokkai_response_store_dir,
+            offline=settings.kokkai_api_offline,
+        )
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any]) -> str:
+        """エンドポイントと正規化パラメータからキーを生成."""
+        canonical = json.dumps(
+            {"endpoint": endpoint, "params": {k: str(v) for k, v in params.items()}},
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """保存済みレスポンスを取得（未保存・期限切れならNone）."""
+        key = self.make_key(endpoint, params)
+        entry = self._read_entry(endpoint, key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if not self.offline and self._is_expired(entry):
+            logger.debug("保存済みレスポンスの期限切れ: %s/%s", endpoint, key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data: dict[str, Any] = entry["data"]
+        return data
+
+    def put(self, endpoint: str, params: dict[str, Any], data: dict[str, Any]) -> None:
+        """レスポンスを保存（書き込み失敗はログのみで握りつぶす）."""
+        key = self.make_key(endpoint, params)
+        entry = {
+            "endpoint": endpoint,
+            "params": params,
+            "stored_at": time.time(),
+            "data": data,
+        }
+        path = self._path_for(endpoint, key, _WRITE_CODEC.suffix)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = _WRITE_CODEC.compress(
+                json.dumps(entry, ensure_ascii=False).encode("utf-8")
+            )
+            # 途中で中断されても壊れたファイルを残さないよう一時ファイル経由で置換
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("APIレスポンスの保存に失敗: %s (%s)", path, e)
+
+    def _read_entry(self, endpoint: str, key: str) -> dict[str, Any] | None:
+        """保存ファイルを読み込み展開する."""
+        for suffix, codec in ((_ZSTD_SUFFIX, _ZSTD_CODEC), (_GZIP_SUFFIX, _GZIP_CODEC)):
+            path = self._path_for(endpoint, key, suffix)
+            if not path.exists():
+                continue
+            if codec is None:
+                logger.warning("zstandard未インストールのため読めません: %s", path)
+                continue
+            try:
+                entry: dict[str, Any] = json.loads(codec.decompress(path.read_bytes()))
+                return entry
+            except Exception as e:
+                logger.warning("保存済みレスポンスの読み込みに失敗: %s (%s)", path, e)
+        return None
+
+    def _is_expired(self, entry: dict[str, Any]) -> bool:
+        """結果が増え得るレスポンスがTTLを超えているか判定."""
+        if not self._may_grow(entry.get("params") or {}, entry.get("data") or {}):
+            return False
+        age = time.time() - float(entry.get("stored_at", 0))
+        return age > self.recent_ttl_seconds
+
+    def _may_grow(self, params: dict[str, Any], data: dict[str, Any]) -> bool:
+        """検索結果に後から会議・発言が追加され得るか判定.
+
+        1会議（issueID）の検索は保存した結果の開催日で判定する。それ以外は
+        終了日（until）がない・読めない・直近の検索を、会議録の公開に伴って
+        件数やページング情報が変わるため「増え得る」とみなす。
+        """
+        if params.get(_ISSUE_ID_PARAM):
+            return self._is_recent(_record_date(data))
+        return self._is_recent(params.get(_UNTIL_PARAM))
+
+    def _is_recent(self, value: Any) -> bool:
+        """日付が直近（recent_days 以内）か判定（ない・読めない場合も直近扱い）."""
+        if not value:
+            return True
+        try:
+            day = date.fromisoformat(str(value))
+        except ValueError:
+            return True
+        return day >= date.today() - timedelta(days=self.recent_days)
+
+    def _path_for(self, endpoint: str, key: str, suffix: str) -> Path:
+        """キーから保存パスを算出（先頭2文字でディレクトリを分散）."""
+        return self.root_dir / endpoint / key[:2] / f"{key}{suffix}"
+
+
+def _record_date(data: dict[str, Any]) -> str | None:
+    """レスポンスの先頭レコードの開催日（レコードがなければNone）."""
+    for records_key in _RECORD_KEYS:
+        records = data.get(records_key)
+        if records:
+            return records[0].get("date")
+    return None
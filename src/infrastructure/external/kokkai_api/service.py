@@ -5,6 +5,8 @@ KokkaiApiClient をラップし、APIレスポンスをApplication DTOに変換
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from src.application.dtos.kokkai_speech_dto import KokkaiMeetingDTO, KokkaiSpeechDTO
 from src.infrastructure.external.kokkai_api.client import KokkaiApiClient
 from src.infrastructure.external.kokkai_api.types import MeetingRecord, SpeechRecord
@@ -38,6 +40,29 @@ class KokkaiSpeechServiceImpl:
 
         return [self._to_dto(r) for r in records]
 
+    async def iter_speeches(
+        self,
+        *,
+        issue_id: str | None = None,
+        name_of_house: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+    ) -> AsyncIterator[list[KokkaiSpeechDTO]]:
+        """発言データをAPIのページ単位でDTOに変換して逐次返す."""
+        if issue_id:
+            pages = self._client.iter_speech_pages(issue_id=issue_id)
+        elif name_of_house and from_date and until_date:
+            pages = self._client.iter_speech_pages(
+                name_of_house=name_of_house,
+                from_date=from_date,
+                until_date=until_date,
+            )
+        else:
+            return
+
+        async for records in pages:
+            yield [self._to_dto(r) for r in records]
+
     async def fetch_meetings(
         self,
         *,
@@ -59,6 +84,27 @@ class KokkaiSpeechServiceImpl:
         )
         return [self._meeting_to_dto(r) for r in records]
 
+    async def iter_meetings(
+        self,
+        *,
+        name_of_house: str | None = None,
+        name_of_meeting: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+        session_from: int | None = None,
+        session_to: int | None = None,
+    ) -> AsyncIterator[list[KokkaiMeetingDTO]]:
+        """会議一覧をAPIのページ単位でDTOに変換して逐次返す."""
+        async for records in self._client.iter_meeting_pages(
+            name_of_house=name_of_house,
+            name_of_meeting=name_of_meeting,
+            from_date=from_date,
+            until_date=until_date,
+            session_from=session_from,
+            session_to=session_to,
+        ):
+            yield [self._meeting_to_dto(r) for r in records]
+
     @staticmethod
     def _meeting_to_dto(record: MeetingRecord) -> KokkaiMeetingDTO:
         """MeetingRecord → KokkaiMeetingDTO 変換."""
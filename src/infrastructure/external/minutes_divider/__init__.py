@@ -2,14 +2,22 @@
 
 このパッケージには、議事録分割サービスの具体的な実装が含まれます：
 - baml_minutes_divider: BAML を使用した実装（BAML専用、Pydantic実装は削除済み）
+- checkpointing_divider: LLM呼び出し結果をチェックポイントするデコレーター
 - factory: BAML実装を提供するファクトリー
+- marker_speech_parser: 発言者マーカーによるルールベースの発言分割
+- section_chunker: 推定トークン数に基づくセクションの再分割
+- section_splitter: キーワードによるセクション分割（正規化位置の対応表付き）
 """
 
 from .baml_minutes_divider import BAMLMinutesDivider
+from .checkpoint_store import MinutesCheckpointStore
+from .checkpointing_divider import CheckpointingMinutesDivider
 from .factory import MinutesDividerFactory
 
 
 __all__ = [
     "BAMLMinutesDivider",
+    "CheckpointingMinutesDivider",
+    "MinutesCheckpointStore",
     "MinutesDividerFactory",
 ]
@@ -16,6 +16,21 @@ from baml_client.async_client import b
 
 from src.domain.exceptions import ExternalServiceException
 from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.baml_call_scope import acquire_baml_client
+from src.infrastructure.external.minutes_divider.marker_speech_parser import (
+    DEFAULT_MIN_CONFIDENCE,
+    has_speaker_marker,
+    parse_marked_speeches,
+)
+from src.infrastructure.external.minutes_divider.section_chunker import (
+    ChunkedSections,
+    SectionChunker,
+    TokenEstimator,
+)
+from src.infrastructure.external.minutes_divider.section_splitter import (
+    split_by_keywords,
+)
 
 # 既存のPydanticモデルを使用（BAML結果をこれに変換）
 from src.minutes_divide_processor.models import (
@@ -49,6 +64,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
         self,
         llm_service: Any | None = None,  # BAML使用時は不要だが互換性のため
         k: int = 5,
+        rule_based_min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        token_budget: int | None = None,
     ):
         """
         Initialize BAMLMinutesDivider
@@ -56,8 +73,18 @@ class BAMLMinutesDivider(IMinutesDividerService):
         Args:
             llm_service: 互換性のためのパラメータ（BAML使用時は不要）
             k: Number of sections (default 5)
+            rule_based_min_confidence: 発言分割でルールベースの結果を採用する
+                信頼度の下限（1より大きくすると常にLLMを使う）
+            token_budget: 発言分割に渡す1セクションの推定トークン数の上限
+                （未指定時は設定値 MINUTES_CHUNK_TOKEN_BUDGET）
         """
         self.k = k
+        self.rule_based_min_confidence = rule_based_min_confidence
+        settings = get_settings()
+        self.chunker = SectionChunker(
+            token_budget=token_budget or settings.minutes_chunk_token_budget,
+            estimator=TokenEstimator.for_model(settings.llm_model),
+        )
         logger.info("BAMLMinutesDivider initialized")
 
     # ========================================
@@ -121,111 +148,29 @@ class BAMLMinutesDivider(IMinutesDividerService):
         else:
             section_info_list_data = section_info_list.section_info_list
 
-        # Unicode正規化（NFKC）と追加の正規化を適用
-        def normalize_text(text: str) -> str:
-            """テキストを正規化する関数"""
-            # NFKC正規化
-            normalized = unicodedata.normalize("NFKC", text)
-            # 議事録特有の記号の正規化
-            normalized = normalized.replace("◯", "○")
-            normalized = normalized.replace("●", "○")
-            # タブ文字をスペースに変換
-            normalized = normalized.replace("\t", " ")
-            # 連続するスペースを1つに統一
-            normalized = re.sub(r" +", " ", normalized)
-            return normalized
-
-        # 議事録全体を正規化
-        normalized_minutes = normalize_text(processed_minutes)
+        # 正規化と全キーワードの検索を1回の走査で行い、元テキスト上の境界を得る
+        keywords = [section_info.keyword for section_info in section_info_list_data]
+        split_result = split_by_keywords(processed_minutes, keywords)
+        if keywords and not split_result.first_keyword_found:
+            logger.warning(
+                f"キーワード '{keywords[0]}' が見つからないため、先頭から開始します"
+            )
+        for keyword_index in split_result.skipped_keyword_indexes:
+            logger.warning(
+                f"キーワード '{keywords[keyword_index]}' が議事録に"
+                "見つかりません。スキップします。"
+            )
 
         split_minutes_list: list[SectionString] = []
-        start_index = 0
-        skipped_keywords: list[str] = []
-        i = 0
-        output_order = 1  # 出現順を記録する変数
-
-        while i < len(section_info_list_data):
-            section_info = section_info_list_data[i]
-            # キーワードも同様に正規化
-            keyword = normalize_text(section_info.keyword)
-
-            # 最初のキーワードの場合、議事録の先頭から検索を開始
-            if i == 0 and start_index == 0:
-                start_index = normalized_minutes.find(keyword)
-                if start_index == -1:
-                    # 部分一致も試す（キーワードが長すぎる場合）
-                    if len(keyword) > 10:
-                        partial_keyword = keyword[:10]
-                        start_index = normalized_minutes.find(partial_keyword)
-                        if start_index != -1:
-                            logger.info(
-                                f"Found keyword using partial match: {partial_keyword}"
-                            )
-
-                    if start_index == -1:
-                        start_index = 0
-                        logger.warning(
-                            f"キーワード '{section_info.keyword}' が"
-                            "見つからないため、先頭から開始します"
-                        )
-            # キーワードが見つからない場合はスキップ
-            if start_index == -1:
-                logger.warning(
-                    f"キーワード '{section_info.keyword}' が"
-                    "見つかりません。スキップします。"
-                )
-                skipped_keywords.append(section_info.keyword)
-                i += 1
-                continue
-            # 次のキーワードの開始位置を検索
-            next_keyword_index = -1
-            j = i + 1
-            while j < len(section_info_list_data):
-                next_section = section_info_list_data[j]
-                # 次のキーワードも正規化
-                next_keyword = normalize_text(next_section.keyword)
-                next_keyword_index = normalized_minutes.find(
-                    next_keyword, start_index + 1
-                )
-                if next_keyword_index == -1 and len(next_keyword) > 10:
-                    # 部分一致も試す
-                    partial_next = next_keyword[:10]
-                    next_keyword_index = normalized_minutes.find(
-                        partial_next, start_index + 1
-                    )
-                    if next_keyword_index != -1:
-                        logger.info(
-                            f"Found next keyword using partial match: {partial_next}"
-                        )
-
-                if next_keyword_index != -1:
-                    break
-                else:
-                    logger.warning(
-                        f"キーワード '{next_section.keyword}' が議事録に"
-                        "見つかりません。スキップします。"
-                    )
-                    skipped_keywords.append(next_section.keyword)
-                    j += 1
-            if next_keyword_index == -1:
-                end_index = len(normalized_minutes)
-            else:
-                end_index = next_keyword_index
-            # 分割された文字列を取得（元のテキストから取得）
-            split_text = processed_minutes[start_index:end_index].strip()
-            # SectionStringインスタンスを作成してlistにappend
+        for span in split_result.spans:
+            section_info = section_info_list_data[span.keyword_index]
             split_minutes_list.append(
                 SectionString(
                     chapter_number=section_info.chapter_number,
                     sub_chapter_number=1,
-                    section_string=split_text,
+                    section_string=processed_minutes[span.start : span.end].strip(),
                 )
             )
-            # 次の検索開始位置を更新
-            start_index = end_index
-            # インデックスと出現順を更新
-            i = j
-            output_order += 1
         return SectionStringList(section_string_list=split_minutes_list)
 
     def check_length(
@@ -233,6 +178,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
     ) -> RedivideSectionStringList:
         """セクションの長さをチェックし、長すぎるセクションを特定する
 
+        推定トークン数が上限（self.chunker.token_budget）を超えるセクションを返す。
+
         Args:
             section_string_list: セクション文字列リスト
 
@@ -241,20 +188,32 @@ class BAMLMinutesDivider(IMinutesDividerService):
         """
         redivide_list: list[RedivideSectionString] = []
         for index, section_string in enumerate(section_string_list.section_string_list):
-            size_in_bytes = len(section_string.section_string.encode("utf-8"))
-            logger.debug(f"size_in_bytes: {size_in_bytes}")
-            if size_in_bytes > 6000:  # 6000文字より多いか確認
+            if self.chunker.exceeds_budget(section_string.section_string):
                 logger.info(
-                    "section_stringの文字数が6000文字を超えています。再分割します。"
+                    "section_stringの推定トークン数が上限"
+                    f"({self.chunker.token_budget})を超えています。"
                 )
                 redivide_dict = RedivideSectionString(
                     original_index=index,
-                    redivide_section_string_bytes=size_in_bytes,
+                    redivide_section_string_bytes=len(
+                        section_string.section_string.encode("utf-8")
+                    ),
                     redivide_section_string=section_string,
                 )
                 redivide_list.append(redivide_dict)
         return RedivideSectionStringList(redivide_section_string_list=redivide_list)
 
+    def chunk_sections(self, section_string_list: SectionStringList) -> ChunkedSections:
+        """推定トークン数の上限を超えるセクションを発言の区切りで再分割する
+
+        Args:
+            section_string_list: セクション文字列リスト
+
+        Returns:
+            再分割後のセクションと統計（チャンク数・平均充填率）
+        """
+        return self.chunker.chunk(section_string_list)
+
     def split_minutes_by_boundary(
         self, minutes_text: str, boundary: MinutesBoundary
     ) -> tuple[str, str]:
@@ -421,7 +380,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
         try:
             # BAMLを呼び出し
             logger.info("Calling BAML DivideMinutesToKeywords")
-            baml_result = await b.DivideMinutesToKeywords(minutes)
+            client = await acquire_baml_client(b)
+            baml_result = await client.DivideMinutesToKeywords(minutes)
 
             # BAML結果をPydanticモデルに変換
             section_info_list = [
@@ -490,7 +450,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
                     f"(divide_counter={divide_counter}, "
                     f"original_index={redivide_section_string.original_index})"
                 )
-                baml_result = await b.RedivideSection(
+                client = await acquire_baml_client(b)
+                baml_result = await client.RedivideSection(
                     redivide_section_string.redivide_section_string.section_string,
                     divide_counter,
                     redivide_section_string.original_index,
@@ -557,7 +518,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
         try:
             # BAMLを呼び出し
             logger.info("Calling BAML DetectBoundary")
-            baml_result = await b.DetectBoundary(minutes_text)
+            client = await acquire_baml_client(b)
+            baml_result = await client.DetectBoundary(minutes_text)
 
             # BAML結果をPydanticモデルに変換
             result = MinutesBoundary(
@@ -624,7 +586,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
         try:
             # BAMLを呼び出し
             logger.info("Calling BAML ExtractAttendees")
-            baml_result = await b.ExtractAttendees(attendees_text)
+            client = await acquire_baml_client(b)
+            baml_result = await client.ExtractAttendees(attendees_text)
 
             # BAML結果をPydanticモデルに変換
             result = AttendeesMapping(
@@ -658,13 +621,37 @@ class BAMLMinutesDivider(IMinutesDividerService):
                 attendees_mapping={}, regular_attendees=[], confidence=0.0
             )
 
+    def rule_based_speech_divide(
+        self, section_string: SectionString
+    ) -> SpeakerAndSpeechContentList | None:
+        """発言者マーカーで分割し、信頼度が十分ならその結果を返す
+
+        Args:
+            section_string: セクション文字列
+
+        Returns:
+            発言者と発言内容のリスト（マーカーがない・信頼度が低い場合はNone）
+        """
+        if not has_speaker_marker(section_string.section_string):
+            return None
+        parsed = parse_marked_speeches(section_string)
+        if parsed.confidence >= self.rule_based_min_confidence:
+            logger.debug(f"ルールベースで発言を分割（信頼度: {parsed.confidence}）")
+            return parsed.speeches
+        logger.debug(
+            "ルールベース分割の信頼度が低いためLLMを使用"
+            f"（信頼度: {parsed.confidence}）"
+        )
+        return None
+
     async def speech_divide_run(
         self, section_string: SectionString
     ) -> SpeakerAndSpeechContentList:
         """発言者と発言内容に分割する（BAML使用）
 
-        セクション全体を直接DivideSpeechに渡す。
-        発言者マーカー（○議長（名前）など）はDivideSpeechプロンプトで認識される。
+        発言者マーカー（○議長（名前）など）でルールベースに分割できる場合は
+        その結果を使い、信頼度が低いセクションのみセクション全体を
+        DivideSpeechに渡す。
 
         Args:
             section_string: セクション文字列
@@ -678,16 +665,21 @@ class BAMLMinutesDivider(IMinutesDividerService):
         section_text = section_string.section_string
 
         # 発言パターンが含まれているかチェック
-        # ○◆◎●などの記号で始まる発言者マーカーがあるか確認
-        has_speech_pattern = bool(re.search(r"[○◆◎●]", section_text))
+        # ○◆◎●◯などの記号で始まる発言者マーカーがあるか確認
+        has_speech_pattern = has_speaker_marker(section_text)
 
         if len(section_text) < 30 and not has_speech_pattern:
             logger.debug("セクションが短く発言パターンもないためスキップ")
             return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
 
+        rule_based = self.rule_based_speech_divide(section_string)
+        if rule_based is not None:
+            return rule_based
+
         try:
             # BAMLを呼び出し（セクション全体を渡す）
-            baml_result = await b.DivideSpeech(section_text)
+            client = await acquire_baml_client(b)
+            baml_result = await client.DivideSpeech(section_text)
 
             # BAML結果をPydanticモデルに変換
             speaker_and_speech_content_list = [
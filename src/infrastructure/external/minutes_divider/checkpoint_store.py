@@ -0,0 +1,94 @@
+"""議事録分割の段階別チェックポイントストア.
+
+境界検出・セクション分割・セクションごとの発言分割といった LLM 呼び出しの
+結果を、入力テキストとプロンプトバージョンのハッシュをキーとしてディスクに
+保存する（コンテンツアドレス方式）。処理が途中で失敗しても、再実行時には
+入力が変わっていない段階・セクションを LLM に送らずに再開できる。
+
+保存先は DB トランザクションの外にあるため、ロールバックされても消えない。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.config.settings import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class MinutesCheckpointStore:
+    """議事録分割の段階別出力をJSONで保存するストア."""
+
+    def __init__(self, root_dir: str | Path) -> None:
+        """ストアを初期化.
+
+        Args:
+            root_dir: 保存先ディレクトリ
+        """
+        self.root_dir = Path(root_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings | None = None
+    ) -> MinutesCheckpointStore | None:
+        """設定からストアを生成（保存先が未設定ならNone）."""
+        settings = settings or get_settings()
+        if not settings.minutes_checkpoint_dir:
+            return None
+        return cls(settings.minutes_checkpoint_dir)
+
+    @staticmethod
+    def make_key(stage: str, prompt_version: str, payload: str) -> str:
+        """段階名・プロンプトバージョン・入力テキストからキーを生成."""
+        digest = hashlib.sha256()
+        for part in (stage, prompt_version, payload):
+            digest.update(part.encode("utf-8"))
+            # 区切りを入れて連結位置の違うペアが同じハッシュにならないようにする
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, stage: str, key: str) -> dict[str, Any] | None:
+        """保存済みの出力を取得（未保存・読み込み失敗ならNone）."""
+        path = self._path_for(stage, key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            entry: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning("チェックポイントの読み込みに失敗: %s (%s)", path, e)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data: dict[str, Any] = entry["data"]
+        return data
+
+    def put(self, stage: str, key: str, data: dict[str, Any]) -> None:
+        """出力を保存（書き込み失敗はログのみで握りつぶす）."""
+        path = self._path_for(stage, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({"stage": stage, "data": data}, ensure_ascii=False)
+            # 途中で中断されても壊れたファイルを残さないよう一時ファイル経由で置換
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("チェックポイントの保存に失敗: %s (%s)", path, e)
+
+    def _path_for(self, stage: str, key: str) -> Path:
+        """キーから保存パスを算出（先頭2文字でディレクトリを分散）."""
+        return self.root_dir / stage / key[:2] / f"{key}.json"
@@ -0,0 +1,145 @@
+"""チェックポイント付きMinutesDivider.
+
+LLM を呼び出す段階（境界検出・セクション分割・セクションごとの発言分割）の
+結果を MinutesCheckpointStore に保存し、同じ入力・同じプロンプトでの再実行時は
+保存済みの結果を返すデコレーター。LLM を使わない処理はそのまま委譲する。
+"""
+
+import hashlib
+import logging
+
+from typing import Any
+
+from baml_client.inlinedbaml import get_baml_files
+
+from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
+from src.infrastructure.external.minutes_divider.checkpoint_store import (
+    MinutesCheckpointStore,
+)
+from src.minutes_divide_processor.models import (
+    AttendeesMapping,
+    MinutesBoundary,
+    SectionInfoList,
+    SectionString,
+    SpeakerAndSpeechContentList,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# プロンプトバージョンの算出対象（プロンプトまたはモデル設定が変われば無効化される）
+_PROMPT_FILES = ("minutes_divider.baml", "clients.baml")
+
+STAGE_ATTENDEE_BOUNDARY = "attendee_boundary"
+STAGE_SECTIONS = "sections"
+STAGE_SECTION_SPEECHES = "section_speeches"
+
+
+def minutes_divider_prompt_version() -> str:
+    """議事録分割プロンプトのバージョン（BAML定義のハッシュ）を返す."""
+    baml_files = get_baml_files()
+    digest = hashlib.sha256()
+    for name in _PROMPT_FILES:
+        digest.update(name.encode("utf-8"))
+        digest.update(baml_files.get(name, "").encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class CheckpointingMinutesDivider(IMinutesDividerService):
+    """LLM呼び出し結果をチェックポイントする議事録分割サービス."""
+
+    def __init__(
+        self,
+        inner: IMinutesDividerService,
+        store: MinutesCheckpointStore,
+        prompt_version: str | None = None,
+    ) -> None:
+        """初期化.
+
+        Args:
+            inner: 実際に分割を行うMinutesDivider
+            store: チェックポイントストア
+            prompt_version: プロンプトバージョン（省略時はBAML定義から算出）
+        """
+        self.inner = inner
+        self.store = store
+        self.prompt_version = prompt_version or minutes_divider_prompt_version()
+
+    def __getattr__(self, name: str) -> Any:
+        # do_divide / check_length など、インターフェース外のメソッドを委譲する
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def pre_process(self, original_minutes: str) -> str:
+        return self.inner.pre_process(original_minutes)
+
+    async def section_divide_run(self, minutes: str) -> SectionInfoList:
+        key = self.store.make_key(STAGE_SECTIONS, self.prompt_version, minutes)
+        cached = self.store.get(STAGE_SECTIONS, key)
+        if cached is not None:
+            logger.info("セクション分割結果をチェックポイントから再利用")
+            return SectionInfoList.model_validate(cached)
+
+        result = await self.inner.section_divide_run(minutes)
+        # 空の結果はLLMの一時的な失敗の可能性があるため保存しない
+        if result.section_info_list:
+            self.store.put(STAGE_SECTIONS, key, result.model_dump())
+        return result
+
+    async def detect_attendee_boundary(self, minutes_text: str) -> MinutesBoundary:
+        key = self.store.make_key(
+            STAGE_ATTENDEE_BOUNDARY, self.prompt_version, minutes_text
+        )
+        cached = self.store.get(STAGE_ATTENDEE_BOUNDARY, key)
+        if cached is not None:
+            logger.info("境界検出結果をチェックポイントから再利用")
+            return MinutesBoundary.model_validate(cached)
+
+        result = await self.inner.detect_attendee_boundary(minutes_text)
+        # 境界なしはエラー時のフォールバックと区別できないため保存しない
+        if result.boundary_found:
+            self.store.put(STAGE_ATTENDEE_BOUNDARY, key, result.model_dump())
+        return result
+
+    async def extract_attendees_mapping(self, attendees_text: str) -> AttendeesMapping:
+        return await self.inner.extract_attendees_mapping(attendees_text)
+
+    def split_minutes_by_boundary(
+        self, minutes_text: str, boundary: MinutesBoundary
+    ) -> tuple[str, str]:
+        return self.inner.split_minutes_by_boundary(minutes_text, boundary)
+
+    def rule_based_speech_divide(
+        self, section_string: SectionString
+    ) -> SpeakerAndSpeechContentList | None:
+        return self.inner.rule_based_speech_divide(section_string)
+
+    async def speech_divide_run(
+        self, section_string: SectionString
+    ) -> SpeakerAndSpeechContentList:
+        # ルールベースで分割できるセクションはLLMを呼ばないため保存しない
+        rule_based = self.inner.rule_based_speech_divide(section_string)
+        if rule_based is not None:
+            return rule_based
+
+        # 発言の分割は本文のみに依存するため、章番号が変わっても同じ本文なら
+        # 再利用し、章番号は今回のセクションのものに付け替える
+        key = self.store.make_key(
+            STAGE_SECTION_SPEECHES,
+            self.prompt_version,
+            section_string.section_string,
+        )
+        cached = self.store.get(STAGE_SECTION_SPEECHES, key)
+        if cached is not None:
+            result = SpeakerAndSpeechContentList.model_validate(cached)
+            for speech in result.speaker_and_speech_content_list:
+                speech.chapter_number = section_string.chapter_number
+                speech.sub_chapter_number = section_string.sub_chapter_number
+            return result
+
+        result = await self.inner.speech_divide_run(section_string)
+        # 空の結果はLLMの一時的な失敗の可能性があるため保存しない
+        if result.speaker_and_speech_content_list:
+            self.store.put(STAGE_SECTION_SPEECHES, key, result.model_dump())
+        return result
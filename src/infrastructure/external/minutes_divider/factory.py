@@ -1,6 +1,7 @@
 """MinutesDivider factory
 
 BAML実装のMinutesDividerを提供します。
+MINUTES_CHECKPOINT_DIR 設定時はチェックポイント付きのデコレーターで包みます。
 Clean Architectureの原則に従い、依存性の注入とファクトリーパターンを使用しています。
 """
 
@@ -30,12 +31,23 @@ class MinutesDividerFactory:
 
         Returns:
             BAMLMinutesDivider: BAML実装のMinutesDivider
+                （チェックポイント有効時はCheckpointingMinutesDividerで包む）
         """
         logger.info("Creating BAML MinutesDivider")
         # fmt: off
         from src.infrastructure.external.minutes_divider.baml_minutes_divider import (  # noqa: E501
             BAMLMinutesDivider,
         )
+        from src.infrastructure.external.minutes_divider.checkpoint_store import (
+            MinutesCheckpointStore,
+        )
+        from src.infrastructure.external.minutes_divider.checkpointing_divider import (  # noqa: E501
+            CheckpointingMinutesDivider,
+        )
         # fmt: on
 
-        return BAMLMinutesDivider(llm_service=llm_service, k=k)
+        divider = BAMLMinutesDivider(llm_service=llm_service, k=k)
+        store = MinutesCheckpointStore.from_settings()
+        if store is None:
+            return divider
+        return CheckpointingMinutesDivider(divider, store)
@@ -0,0 +1,205 @@
+"""発言者マーカーによるルールベースの発言分割
+
+国会や多くの地方議会の議事録では、各発言が「○議長(山田太郎君)」のような
+発言者マーカーで始まる。この形式のセクションは LLM を使わずに発言者と発言内容に
+分割できるため、解析結果と信頼度を返し、信頼度が低いセクションだけを
+LLM（DivideSpeech）に回す。
+
+対応する発言者の書式（前処理で空白・改行が除去されていてもよい）:
+- 役職(人名君)     例: ○議長(山田太郎君)、◎市長(鈴木一郎)
+- 人名+敬称/役職  例: ○山本順三君、◆佐藤花子議員、○田中参考人
+- 役職のみ         例: ○議長、○委員長（区切りが曖昧なため信頼度を低く数える）
+人名のルビ（例: 山田太郎(やまだたろう)）は発言者名から除去する。
+"""
+
+import re
+
+from dataclasses import dataclass
+
+from src.minutes_divide_processor.models import (
+    SectionString,
+    SpeakerAndSpeechContent,
+    SpeakerAndSpeechContentList,
+)
+
+
+# 信頼度がこの値以上ならLLMを呼ばずにルールベースの結果を使う
+DEFAULT_MIN_CONFIDENCE = 0.9
+
+# 役職のみの発言者の重み（人名付きの発言者を1とする）
+_ROLE_ONLY_WEIGHT = 0.5
+
+_MARKER_CHARS = "○◆◎●◯"
+_MARKER_RE = re.compile(f"[{_MARKER_CHARS}]")
+# 人名として認める文字（ひらがな・カタカナ・長音・中黒・々・漢字）
+_KANA_KANJI_CHARS = "\u30a1-\u30fa\u30fc\u30fb\u3005\u4e00-\u9fff"
+_NAME_CHARS = "\u3041-\u3096" + _KANA_KANJI_CHARS
+_RUBY = r"[(（][\u3041-\u3096\u30fc]+[)）]"
+_HONORIFIC = "君|さん|議員|委員|氏|様"
+
+# 役職(人名君)
+_ROLE_AND_NAME_RE = re.compile(
+    rf"[{_MARKER_CHARS}](?P<role>[{_NAME_CHARS}]{{1,20}}?)"
+    rf"[(（](?P<name>(?:[{_NAME_CHARS}]|{_RUBY}){{1,30}}?)(?:{_HONORIFIC})?[)）]"
+)
+# 人名+敬称 / 人名+役職（発言内容との区切りを誤らないよう、ひらがなは含めない）
+_NAME_AND_SUFFIX_RE = re.compile(
+    rf"[{_MARKER_CHARS}](?P<name>(?:[{_KANA_KANJI_CHARS}]|{_RUBY}){{1,10}}?)"
+    r"(?P<suffix>君|議員|委員|参考人|説明員|証人)"
+)
+# 役職のみ（長い役職を先に試す）
+_ROLE_ONLY_RE = re.compile(
+    f"[{_MARKER_CHARS}](?P<role>"
+    + "|".join(
+        [
+            "副委員長",
+            "事務局長",
+            "副議長",
+            "委員長",
+            "副市長",
+            "副町長",
+            "副村長",
+            "副区長",
+            "副知事",
+            "教育長",
+            "議長",
+            "市長",
+            "町長",
+            "村長",
+            "区長",
+            "知事",
+        ]
+    )
+    + ")"
+)
+_RUBY_RE = re.compile(_RUBY)
+
+
+@dataclass(frozen=True)
+class MarkerParseResult:
+    """ルールベース分割の結果
+
+    Attributes:
+        speeches: 解析できた発言のリスト
+        confidence: 解析結果の信頼度（0.0-1.0）
+        marker_count: セクション内の発言者マーカーの数
+        parsed_marker_count: 発言者として解析できたマーカーの数
+    """
+
+    speeches: SpeakerAndSpeechContentList
+    confidence: float
+    marker_count: int
+    parsed_marker_count: int
+
+
+@dataclass(frozen=True)
+class _SpeakerHeader:
+    start: int
+    end: int
+    speaker: str
+    weight: float
+
+
+def _strip_ruby(name: str) -> str:
+    return _RUBY_RE.sub("", name)
+
+
+def _match_header(text: str, position: int) -> _SpeakerHeader | None:
+    """マーカー位置から発言者の書式を解析する"""
+    match = _ROLE_AND_NAME_RE.match(text, position)
+    if match:
+        name = _strip_ruby(match.group("name"))
+        if name:
+            return _SpeakerHeader(
+                start=position,
+                end=match.end(),
+                speaker=f"{match.group('role')}({name})",
+                weight=1.0,
+            )
+
+    match = _NAME_AND_SUFFIX_RE.match(text, position)
+    if match:
+        name = _strip_ruby(match.group("name"))
+        suffix = match.group("suffix")
+        if name:
+            return _SpeakerHeader(
+                start=position,
+                end=match.end(),
+                speaker=name if suffix == "君" else f"{name}{suffix}",
+                weight=1.0,
+            )
+
+    match = _ROLE_ONLY_RE.match(text, position)
+    if match:
+        return _SpeakerHeader(
+            start=position,
+            end=match.end(),
+            speaker=match.group("role"),
+            weight=_ROLE_ONLY_WEIGHT,
+        )
+    return None
+
+
+def has_speaker_marker(text: str) -> bool:
+    """テキストに発言者マーカー（○◆◎●◯）が含まれるか"""
+    return _MARKER_RE.search(text) is not None
+
+
+def parse_marked_speeches(section: SectionString) -> MarkerParseResult:
+    """発言者マーカーに基づいてセクションを発言者と発言内容に分割する
+
+    信頼度は「発言者として解析できたマーカーの割合（役職のみは重みを下げる）」と
+    「最初の発言より前の、発言として扱えなかったテキストの少なさ」の積とする。
+    マーカーがない、または解析できないマーカーが多いセクションは信頼度が低くなる。
+
+    Args:
+        section: 分割対象のセクション
+
+    Returns:
+        MarkerParseResult: 解析結果と信頼度
+    """
+    text = section.section_string
+    headers: list[_SpeakerHeader] = []
+    marker_count = 0
+    for marker in _MARKER_RE.finditer(text):
+        # 直前の発言者の書式の途中にあるマーカーは数えない
+        if headers and marker.start() < headers[-1].end:
+            continue
+        marker_count += 1
+        header = _match_header(text, marker.start())
+        if header is not None:
+            headers.append(header)
+
+    if not headers:
+        return MarkerParseResult(
+            speeches=SpeakerAndSpeechContentList(speaker_and_speech_content_list=[]),
+            confidence=0.0,
+            marker_count=marker_count,
+            parsed_marker_count=0,
+        )
+
+    speeches: list[SpeakerAndSpeechContent] = []
+    ends = [header.start for header in headers[1:]] + [len(text)]
+    for header, end in zip(headers, ends, strict=True):
+        content = text[header.end : end].strip()
+        if not content:
+            continue
+        speeches.append(
+            SpeakerAndSpeechContent(
+                speaker=header.speaker,
+                speech_content=content,
+                chapter_number=section.chapter_number,
+                sub_chapter_number=section.sub_chapter_number,
+                speech_order=len(speeches) + 1,
+            )
+        )
+
+    marker_score = sum(header.weight for header in headers) / marker_count
+    preamble = text[: headers[0].start].strip()
+    coverage = 1.0 - len(preamble) / len(text.strip())
+    return MarkerParseResult(
+        speeches=SpeakerAndSpeechContentList(speaker_and_speech_content_list=speeches),
+        confidence=round(marker_score * coverage, 3),
+        marker_count=marker_count,
+        parsed_marker_count=len(headers),
+    )
@@ -0,0 +1,217 @@
+"""トークン数に基づく議事録セクションの再分割
+
+発言分割（DivideSpeech）は発言内容をそのまま出力させるため、1回のLLM呼び出しに
+渡せるセクションの大きさは出力トークン数の上限で決まる。UTF-8のバイト数で
+判定すると日本語（1文字3バイト）は上限よりかなり小さく切られてしまうため、
+モデルごとの文字あたりトークン数から推定したトークン数で判定する。
+
+上限を超えるセクションは、発言者マーカー → 改行 → 句点 の優先順で区切りを探し、
+どれも見つからない場合のみ上限位置で切る。
+"""
+
+import math
+import re
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+
+from src.minutes_divide_processor.models import SectionString, SectionStringList
+
+
+# 1セクションあたりの推定トークン数の上限（既定値）
+DEFAULT_TOKEN_BUDGET = 4000
+
+# 区切りが上限の何割未満の位置にしかない場合は次の優先度の区切りを使う
+_MIN_FILL_FOR_PREFERRED_CUT = 0.5
+
+# 日本語（かな・漢字・全角記号）として数える文字
+_CJK_RE = re.compile("[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]")
+
+# 区切りの候補（優先度順）。発言者マーカーはその直前、その他は直後で切る
+_SPEAKER_MARKER_RE = re.compile(r"[○◆◎●◯]")
+_PARAGRAPH_RE = re.compile(r"\n+")
+_SENTENCE_RE = re.compile(r"[。！？]")
+
+
+@dataclass(frozen=True)
+class TokenEstimator:
+    """文字種ごとの文字あたりトークン数からトークン数を推定する
+
+    Attributes:
+        cjk_chars_per_token: 日本語1トークンあたりの文字数
+        other_chars_per_token: それ以外（英数字・記号など）1トークンあたりの文字数
+    """
+
+    cjk_chars_per_token: float
+    other_chars_per_token: float
+
+    @classmethod
+    def for_model(cls, model: str) -> "TokenEstimator":
+        """モデル名から推定器を選ぶ（未知のモデルは安全側の値を使う）"""
+        for prefix, estimator in _MODEL_ESTIMATORS.items():
+            if model.startswith(prefix):
+                return estimator
+        return _DEFAULT_ESTIMATOR
+
+    @property
+    def cjk_token_weight(self) -> float:
+        return 1.0 / self.cjk_chars_per_token
+
+    @property
+    def other_token_weight(self) -> float:
+        return 1.0 / self.other_chars_per_token
+
+    def estimate(self, text: str) -> int:
+        """テキストの推定トークン数"""
+        cjk = len(_CJK_RE.findall(text))
+        other = len(text) - cjk
+        return math.ceil(cjk * self.cjk_token_weight + other * self.other_token_weight)
+
+    def cumulative(self, text: str) -> list[float]:
+        """先頭から各文字までの推定トークン数の累積（長さ len(text) + 1）"""
+        cjk_weight = self.cjk_token_weight
+        other_weight = self.other_token_weight
+        cjk_positions = {match.start() for match in _CJK_RE.finditer(text)}
+        weights = (
+            cjk_weight if index in cjk_positions else other_weight
+            for index in range(len(text))
+        )
+        return list(accumulate(weights, initial=0.0))
+
+
+# 日本語は1文字1トークン前後（SentencePiece系は1文字未満になることも多いが安全側）
+_DEFAULT_ESTIMATOR = TokenEstimator(cjk_chars_per_token=1.0, other_chars_per_token=3.5)
+_MODEL_ESTIMATORS: dict[str, TokenEstimator] = {
+    "gemini": TokenEstimator(cjk_chars_per_token=1.2, other_chars_per_token=4.0),
+    "gpt": TokenEstimator(cjk_chars_per_token=1.0, other_chars_per_token=4.0),
+    "claude": TokenEstimator(cjk_chars_per_token=0.9, other_chars_per_token=3.5),
+}
+
+
+@dataclass(frozen=True)
+class ChunkingStats:
+    """再分割の統計
+
+    Attributes:
+        token_budget: 1チャンクあたりの推定トークン数の上限
+        section_count: 入力セクション数
+        chunk_count: 出力チャンク数（= 発言分割のLLM呼び出し数）
+        split_section_count: 上限を超えて分割したセクション数
+        average_fill_ratio: チャンクの推定トークン数 / 上限 の平均
+    """
+
+    token_budget: int
+    section_count: int
+    chunk_count: int
+    split_section_count: int
+    average_fill_ratio: float
+
+
+@dataclass(frozen=True)
+class ChunkedSections:
+    """再分割結果"""
+
+    sections: SectionStringList
+    stats: ChunkingStats
+
+
+class SectionChunker:
+    """推定トークン数の上限に収まるようにセクションを再分割する"""
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        estimator: TokenEstimator | None = None,
+    ):
+        """初期化
+
+        Args:
+            token_budget: 1チャンクあたりの推定トークン数の上限
+            estimator: トークン数推定器（省略時は安全側の既定値）
+        """
+        if token_budget <= 0:
+            raise ValueError("token_budget must be positive")
+        self.token_budget = token_budget
+        self.estimator = estimator or _DEFAULT_ESTIMATOR
+
+    def exceeds_budget(self, text: str) -> bool:
+        return self.estimator.estimate(text) > self.token_budget
+
+    def chunk(self, section_string_list: SectionStringList) -> ChunkedSections:
+        """上限を超えるセクションを再分割する
+
+        分割したセクションは章番号を保ち、sub_chapter_number に1からの連番を振る。
+
+        Args:
+            section_string_list: セクション文字列リスト
+
+        Returns:
+            ChunkedSections: 再分割後のセクションと統計
+        """
+        chunks: list[SectionString] = []
+        split_section_count = 0
+        for section in section_string_list.section_string_list:
+            if not self.exceeds_budget(section.section_string):
+                chunks.append(section)
+                continue
+
+            split_section_count += 1
+            for sub_chapter_number, text in enumerate(
+                self._split_text(section.section_string), start=1
+            ):
+                chunks.append(
+                    SectionString(
+                        chapter_number=section.chapter_number,
+                        sub_chapter_number=sub_chapter_number,
+                        section_string=text,
+                    )
+                )
+
+        fill_ratios = [
+            self.estimator.estimate(chunk.section_string) / self.token_budget
+            for chunk in chunks
+        ]
+        stats = ChunkingStats(
+            token_budget=self.token_budget,
+            section_count=len(section_string_list.section_string_list),
+            chunk_count=len(chunks),
+            split_section_count=split_section_count,
+            average_fill_ratio=(
+                round(sum(fill_ratios) / len(fill_ratios), 3) if fill_ratios else 0.0
+            ),
+        )
+        return ChunkedSections(
+            sections=SectionStringList(section_string_list=chunks), stats=stats
+        )
+
+    def _split_text(self, text: str) -> list[str]:
+        """テキストを上限以下のチャンクに分ける"""
+        cumulative = self.estimator.cumulative(text)
+        cut_candidates = [
+            [match.start() for match in _SPEAKER_MARKER_RE.finditer(text)],
+            [match.end() for match in _PARAGRAPH_RE.finditer(text)],
+            [match.end() for match in _SENTENCE_RE.finditer(text)],
+        ]
+
+        pieces: list[str] = []
+        start = 0
+        while start < len(text):
+            # start から上限トークン数までに収まる最も遠い位置
+            limit = bisect_right(cumulative, cumulative[start] + self.token_budget) - 1
+            if limit >= len(text):
+                pieces.append(text[start:])
+                break
+            limit = max(limit, start + 1)
+            min_end = start + max(1, int((limit - start) * _MIN_FILL_FOR_PREFERRED_CUT))
+
+            end = limit
+            for candidates in cut_candidates:
+                index = bisect_right(candidates, limit) - 1
+                if index >= 0 and candidates[index] >= min_end:
+                    end = candidates[index]
+                    break
+
+            pieces.append(text[start:end])
+            start = end
+        return [piece.strip() for piece in pieces if piece.strip()]
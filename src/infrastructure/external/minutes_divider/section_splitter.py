@@ -0,0 +1,319 @@
+"""キーワードによる議事録のセクション分割
+
+LLM が返したセクション先頭キーワードを議事録中から探し、セクション境界を求める。
+
+- 正規化は全文に対して1回だけ行い、正規化後の位置から元テキストの位置への
+  対応表を同時に作る。NFKC などで文字数が変わっても境界はずれない。
+- キーワードの検索は Aho-Corasick 法で全キーワードを1回の走査でまとめて行い、
+  各キーワードの出現位置から順番どおりの境界を決める。
+"""
+
+import re
+import unicodedata
+
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+# 正規化で変化しないことが分かっている文字（ASCII記号・英数字、かな、漢字、
+# 和文の句読点・括弧、発言者マーカー、改行）。大半の文字はここに該当するため、
+# 連続部分をまとめて扱うことで1文字ずつの処理を避ける
+_STABLE_CHARS = (
+    "\n\x21-\x7e"
+    "\u3001-\u3003\u3005-\u3011\u3014-\u301f"  # 和文の句読点・括弧
+    "\u3041-\u3096\u309d\u309e\u30a1-\u30fe"  # ひらがな・カタカナ
+    "\u3400-\u4dbf\u4e00-\u9fff"  # 漢字
+    "\u25a0\u25a1\u25c6\u25c7\u25cb\u25ce"  # ■□◆◇○◎
+)
+# NFKCで1文字ずつ別の1文字に置き換わる文字（全角英数字・記号、半角カナ）
+_WIDTH_CHARS = "\uff01-\uff5e\uff61-\uff9d"
+# 直前の文字と合成されうる文字（結合文字、ハングル字母、濁点・半濁点）
+_COMBINING_CHARS = "\u0300-\u036f\u1160-\u11ff\u3099\u309a\uff9e\uff9f"
+
+_TOKEN_RE = re.compile(
+    rf"(?P<stable>(?:[{_STABLE_CHARS}](?![{_COMBINING_CHARS}]))+)"
+    rf"|(?P<width>(?:[{_WIDTH_CHARS}](?![{_COMBINING_CHARS}]))+)"
+    r"|(?P<space>[ \t]+)"
+    rf"|(?P<other>.[{_COMBINING_CHARS}]*)",
+    re.DOTALL,
+)
+
+# 部分一致に使うキーワード先頭の文字数（キーワードが長すぎる場合の救済）
+PARTIAL_KEYWORD_LENGTH = 10
+
+
+def _normalize_cluster(cluster: str) -> str:
+    """1文字（と後続の結合文字）を正規化する"""
+    normalized = unicodedata.normalize("NFKC", cluster)
+    # 議事録特有の記号の正規化
+    normalized = normalized.replace("◯", "○").replace("●", "○")
+    # タブ文字をスペースに変換し、連続するスペースを1つに統一
+    return re.sub(r" +", " ", normalized.replace("\t", " "))
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """正規化済みテキストと、元テキストへの位置対応表
+
+    対応表は区間単位で持つ。文字数が変わらない区間は1文字ずつ対応し、
+    文字数が変わった区間内の位置はすべてその区間の元テキスト上の開始位置に対応する。
+    """
+
+    text: str
+    original_length: int
+    segment_starts: list[int]
+    original_starts: list[int]
+    positional: list[bool]
+
+    def to_original(self, index: int) -> int:
+        """正規化後の位置を元テキスト上の位置に変換する"""
+        if index >= len(self.text):
+            return self.original_length
+        segment = bisect_right(self.segment_starts, index) - 1
+        original_start = self.original_starts[segment]
+        if self.positional[segment]:
+            return original_start + (index - self.segment_starts[segment])
+        return original_start
+
+
+def normalize_text(text: str) -> str:
+    """議事録テキストを正規化する（NFKC、記号の統一、連続スペースの圧縮）"""
+    return normalize_with_offsets(text).text
+
+
+def normalize_with_offsets(text: str) -> NormalizedText:
+    """テキストを正規化し、元テキストへの位置対応表を作る
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        NormalizedText: 正規化済みテキストと位置対応表
+    """
+    pieces: list[str] = []
+    segment_starts: list[int] = []
+    original_starts: list[int] = []
+    positional: list[bool] = []
+    length = 0
+    last_is_space = False
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "stable":
+            piece = match.group()
+            is_positional = True
+        elif kind == "width":
+            piece = unicodedata.normalize("NFKC", match.group())
+            is_positional = len(piece) == len(match.group())
+        elif kind == "space":
+            if last_is_space:
+                continue
+            piece = " "
+            is_positional = False
+        else:
+            piece = _normalize_cluster(match.group())
+            if last_is_space:
+                piece = piece.lstrip(" ")
+            if not piece:
+                continue
+            is_positional = False
+
+        pieces.append(piece)
+        segment_starts.append(length)
+        original_starts.append(match.start())
+        positional.append(is_positional)
+        length += len(piece)
+        last_is_space = piece[-1] == " "
+
+    return NormalizedText(
+        text="".join(pieces),
+        original_length=len(text),
+        segment_starts=segment_starts,
+        original_starts=original_starts,
+        positional=positional,
+    )
+
+
+class KeywordMatcher:
+    """複数キーワードを1回の走査で検索する Aho-Corasick オートマトン"""
+
+    def __init__(self, patterns: Sequence[str]):
+        """オートマトンを構築する
+
+        Args:
+            patterns: 検索するキーワード（空文字列は無視する）
+        """
+        self.patterns = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[list[int]] = [[]]
+        for pattern_index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._outputs.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._outputs[state].append(pattern_index)
+        self._fail = self._build_fail_links()
+        # 初期状態ではキーワードの先頭文字まで正規表現で読み飛ばす
+        first_chars = "".join(re.escape(char) for char in self._goto[0])
+        self._first_char_re = re.compile(f"[{first_chars}]") if first_chars else None
+
+    def _build_fail_links(self) -> list[int]:
+        """幅優先で失敗遷移を求め、出力を失敗遷移先から引き継ぐ"""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[fail[next_state]]
+                )
+        return fail
+
+    def find_all(self, text: str) -> list[list[int]]:
+        """各キーワードの出現開始位置を昇順で返す（重なる出現も含む）
+
+        Args:
+            text: 検索対象のテキスト
+
+        Returns:
+            list[list[int]]: キーワードごとの出現開始位置のリスト
+        """
+        occurrences: list[list[int]] = [[] for _ in self.patterns]
+        if self._first_char_re is None:
+            return occurrences
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        search_first_char = self._first_char_re.search
+        state = 0
+        position = 0
+        length = len(text)
+        while position < length:
+            if state == 0:
+                first_char = search_first_char(text, position)
+                if first_char is None:
+                    break
+                position = first_char.start()
+            char = text[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_index in outputs[state]:
+                occurrences[pattern_index].append(
+                    position - len(self.patterns[pattern_index]) + 1
+                )
+            position += 1
+        return occurrences
+
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """キーワードで区切られた1セクションの元テキスト上の範囲"""
+
+    keyword_index: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class SplitResult:
+    """セクション分割の結果"""
+
+    spans: list[SectionSpan]
+    skipped_keyword_indexes: list[int]
+    first_keyword_found: bool = True
+
+
+def split_by_keywords(text: str, keywords: Sequence[str]) -> SplitResult:
+    """先頭キーワードの並びに従ってテキストをセクションに分割する
+
+    キーワードは前のセクションの開始位置より後ろで最初に現れる位置を境界とし、
+    見つからない場合は先頭 PARTIAL_KEYWORD_LENGTH 文字での一致を試す。
+    それでも見つからないキーワードはスキップする。最初のキーワードが
+    見つからない場合は先頭から開始する。
+
+    Args:
+        text: 分割対象のテキスト（正規化前）
+        keywords: セクション先頭キーワード（出現順）
+
+    Returns:
+        SplitResult: 元テキスト上のセクション範囲とスキップしたキーワード
+    """
+    if not text or not keywords:
+        return SplitResult(
+            spans=[], skipped_keyword_indexes=[], first_keyword_found=False
+        )
+
+    normalized = normalize_with_offsets(text)
+    normalized_keywords = [normalize_text(keyword) for keyword in keywords]
+
+    # 完全一致用と部分一致用のパターンをまとめて1回で検索する
+    patterns: list[str] = []
+    pattern_ids: dict[str, int] = {}
+
+    def pattern_id(pattern: str) -> int:
+        if pattern not in pattern_ids:
+            pattern_ids[pattern] = len(patterns)
+            patterns.append(pattern)
+        return pattern_ids[pattern]
+
+    candidates: list[list[int]] = []
+    for keyword in normalized_keywords:
+        ids = [pattern_id(keyword)] if keyword else []
+        if len(keyword) > PARTIAL_KEYWORD_LENGTH:
+            ids.append(pattern_id(keyword[:PARTIAL_KEYWORD_LENGTH]))
+        candidates.append(ids)
+
+    occurrences = KeywordMatcher(patterns).find_all(normalized.text)
+
+    def first_after(keyword_index: int, position: int) -> int:
+        """position より後ろの最初の出現位置（なければ-1）"""
+        for candidate in candidates[keyword_index]:
+            positions = occurrences[candidate]
+            found = bisect_right(positions, position)
+            if found < len(positions):
+                return positions[found]
+        return -1
+
+    # 境界の決定（正規化後の位置）
+    starts: list[tuple[int, int]] = []
+    skipped: list[int] = []
+    first_start = first_after(0, -1)
+    starts.append((0, max(first_start, 0)))
+    for keyword_index in range(1, len(keywords)):
+        found = first_after(keyword_index, starts[-1][1])
+        if found == -1:
+            skipped.append(keyword_index)
+        else:
+            starts.append((keyword_index, found))
+
+    ends = [start for _, start in starts[1:]] + [len(normalized.text)]
+    spans = [
+        SectionSpan(
+            keyword_index=keyword_index,
+            start=normalized.to_original(start),
+            end=normalized.to_original(end),
+        )
+        for (keyword_index, start), end in zip(starts, ends, strict=True)
+    ]
+    return SplitResult(
+        spans=spans,
+        skipped_keyword_indexes=skipped,
+        first_keyword_found=first_start != -1,
+    )
@@ -18,6 +18,7 @@ from src.application.dtos.role_name_mapping_dto import (
     RoleNameMappingResultDTO,
 )
 from src.domain.interfaces.role_name_mapping_service import IRoleNameMappingService
+from src.infrastructure.external.baml_call_scope import acquire_baml_client
 
 
 logger = logging.getLogger(__name__)
@@ -77,7 +78,8 @@ class BAMLRoleNameMappingService(IRoleNameMappingService):
 
             # BAMLを呼び出し
             logger.info("Calling BAML ExtractRoleNameMapping")
-            baml_result = await b.ExtractRoleNameMapping(attendee_text)
+            client = await acquire_baml_client(b)
+            baml_result = await client.ExtractRoleNameMapping(attendee_text)
 
             # BAML結果をDTOに変換
             mappings = [
@@ -0,0 +1,257 @@
+"""処理単位のSQL発行回数の計測とN+1クエリの検出
+
+ユースケースの中でリポジトリを1件ずつループで呼び出すと、同じ形のSQLが
+件数分発行される（N+1クエリ）。件数の少ない開発環境では遅さに気づけない。
+
+count_queries() のブロック内で発行されたSQLをフィンガープリント
+（slow_query_detector.fingerprint_statement）ごとに数え、同じ形のSQLが閾値を
+超えて繰り返された場合に警告する（raise モードでは例外にする）。
+ユースケースには src.common.instrumentation.detect_n_plus_one を付ける。
+共通層はインフラ層に依存しないため、configure_n_plus_one_detection で
+有効にしたときに detect_queries を検出処理として登録する。アプリケーションでは
+init_container が設定（N_PLUS_ONE_DETECTION=warn/raise）に従って
+install_n_plus_one_detection を呼ぶ。検出は既定で無効。
+
+計測は Engine クラスへのイベントリスナーで行うため、共有エンジン・
+テスト用エンジンを問わず、同じタスク（contextvars）内で発行したSQLを数える。
+別スレッドで実行したSQLは数えない。
+"""
+
+import functools
+import logging
+import threading
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, cast
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.common.instrumentation import set_query_detector
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.exceptions import InfrastructureException
+from src.infrastructure.monitoring.slow_query_detector import fingerprint_statement
+
+
+logger = logging.getLogger(__name__)
+
+NPlusOneMode = Literal["off", "warn", "raise"]
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+
+
+class NPlusOneQueryError(InfrastructureException):
+    """同じ形のSQLが閾値を超えて繰り返された（raise モード）"""
+
+    def __init__(self, message: str, count: "QueryCount"):
+        super().__init__(
+            message=message,
+            error_code="INF-N-PLUS-ONE",
+            details={"name": count.name, "total": count.total},
+        )
+        self.count = count
+
+
+@dataclass
+class QueryCount:
+    """1つの処理で発行されたSQLの回数（フィンガープリント別）"""
+
+    name: str
+    by_fingerprint: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_fingerprint.values())
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """閾値を超えて繰り返されたフィンガープリント（回数の多い順）"""
+        return [
+            (fingerprint, calls)
+            for fingerprint, calls in self.by_fingerprint.most_common()
+            if calls > threshold
+        ]
+
+    def format_summary(self, limit: int = 5, max_query_length: int = 120) -> str:
+        """回数の多いSQLを一覧にする"""
+        lines = [f"{self.total} queries in {self.name or '(unnamed)'}:"]
+        for fingerprint, calls in self.by_fingerprint.most_common(limit):
+            if len(fingerprint) > max_query_length:
+                fingerprint = fingerprint[: max_query_length - 3] + "..."
+            lines.append(f"  {calls:>5} x {fingerprint}")
+        return "\n".join(lines)
+
+
+# 実行中の計測（入れ子の場合は外側の計測にも数える）
+_active_counts: ContextVar[tuple[QueryCount, ...]] = ContextVar(
+    "active_query_counts", default=()
+)
+_listener_lock = threading.Lock()
+_listener_installed = False
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_fingerprint(statement: str) -> str:
+    return fingerprint_statement(statement)
+
+
+def _count_statement(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    counts = _active_counts.get()
+    if not counts:
+        return
+    fingerprint = _cached_fingerprint(statement)
+    for count in counts:
+        count.by_fingerprint[fingerprint] += 1
+
+
+def _ensure_listener() -> None:
+    """すべてのエンジンのSQL発行を数えるリスナーを登録する（初回のみ）"""
+    global _listener_installed
+    with _listener_lock:
+        if not _listener_installed:
+            event.listen(Engine, "before_cursor_execute", _count_statement)
+            _listener_installed = True
+
+
+_mode: NPlusOneMode = "off"
+_threshold = DEFAULT_N_PLUS_ONE_THRESHOLD
+
+
+def _register_detector() -> None:
+    """現在の動作に合わせて detect_n_plus_one の検出処理を登録する"""
+    set_query_detector(None if _mode == "off" else detect_queries)
+
+
+def configure_n_plus_one_detection(
+    mode: NPlusOneMode, threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD
+) -> None:
+    """N+1クエリ検出の動作を変更する
+
+    Args:
+        mode: off（検出しない）/ warn（警告ログ）/ raise（NPlusOneQueryError）
+        threshold: 同じ形のSQLを何回まで許容するか
+    """
+    global _mode, _threshold
+    _mode = mode
+    _threshold = threshold
+    _register_detector()
+
+
+def install_n_plus_one_detection(settings: Settings) -> None:
+    """N_PLUS_ONE_DETECTION / N_PLUS_ONE_THRESHOLD の設定に従って検出を有効にする
+
+    off の場合は何もしない（テストなどで有効にした検出は無効にしない）。
+    """
+    mode = settings.n_plus_one_detection
+    if mode == "off":
+        return
+    if mode not in ("warn", "raise"):
+        logger.warning(f"Unknown N_PLUS_ONE_DETECTION={mode!r}, detection disabled")
+        return
+    configure_n_plus_one_detection(
+        cast(NPlusOneMode, mode), settings.n_plus_one_threshold
+    )
+
+
+def get_n_plus_one_mode() -> NPlusOneMode:
+    """現在のN+1クエリ検出の動作"""
+    return _mode
+
+
+def check_n_plus_one(
+    count: QueryCount,
+    threshold: int | None = None,
+    mode: NPlusOneMode | None = None,
+) -> list[tuple[str, int]]:
+    """計測結果にN+1クエリがあれば警告する（raise モードでは例外）
+
+    Returns:
+        閾値を超えて繰り返されたフィンガープリントと回数
+    """
+    mode = mode or _mode
+    threshold = _threshold if threshold is None else threshold
+    repeated = count.repeated(threshold)
+    if mode == "off" or not repeated:
+        return repeated
+
+    message = (
+        f"Possible N+1 queries in {count.name or '(unnamed)'}: "
+        + "; ".join(f"{calls} x {fingerprint}" for fingerprint, calls in repeated)
+        + f" (threshold {threshold})"
+    )
+    if mode == "raise":
+        raise NPlusOneQueryError(message, count)
+    logger.warning(message)
+    return repeated
+
+
+@contextmanager
+def count_queries(name: str = "") -> Iterator[QueryCount]:
+    """ブロック内で発行したSQLを数える
+
+    Usage:
+        with count_queries("GetWorkHistoryUseCase.execute") as count:
+            await usecase.execute()
+        check_n_plus_one(count)
+    """
+    _ensure_listener()
+    count = QueryCount(name)
+    token = _active_counts.set((*_active_counts.get(), count))
+    try:
+        yield count
+    finally:
+        _active_counts.reset(token)
+
+
+@contextmanager
+def detect_queries(
+    name: str,
+    threshold: int | None = None,
+    mode: NPlusOneMode | None = None,
+) -> Iterator[QueryCount]:
+    """ブロック内で発行したSQLを数え、終了時にN+1クエリを検出する
+
+    ブロック内で例外が発生した場合は検出しない（元の例外を優先する）。
+    """
+    with count_queries(name) as count:
+        yield count
+    check_n_plus_one(count, threshold, mode)
+
+
+@contextmanager
+def assert_max_queries(
+    limit: int, max_repeats: int | None = None, name: str = ""
+) -> Iterator[QueryCount]:
+    """ブロック内のSQL発行回数が上限以下であることを検証する（テスト用）
+
+    Args:
+        limit: SQLの合計回数の上限
+        max_repeats: 同じ形のSQLの回数の上限（None なら検証しない）
+        name: 失敗時のメッセージに含める処理名
+
+    Raises:
+        AssertionError: 上限を超えた場合
+    """
+    with count_queries(name) as count:
+        yield count
+
+    if count.total > limit:
+        raise AssertionError(
+            f"Expected at most {limit} queries, got {count.total}\n"
+            + count.format_summary()
+        )
+    if max_repeats is not None and count.repeated(max_repeats):
+        raise AssertionError(
+            f"Expected each query shape at most {max_repeats} times\n"
+            + count.format_summary()
+        )
@@ -0,0 +1,238 @@
+"""重要なリポジトリクエリの実行計画の回帰検出
+
+マイグレーションやクエリの変更で、conversations・speakers・politicians への
+インデックススキャンがシーケンシャルスキャンに変わっても、件数の少ない
+開発環境やテストでは気づけない。
+
+このモジュールはリポジトリのメソッドを実行して発行されたSQLを捕捉し、
+``EXPLAIN (FORMAT JSON)`` の結果を「計画の形」（ノード種別・テーブル・
+インデックスの木）と推定コストに要約する。コミット済みのベースラインと
+比べて形が変わったか、コストが許容範囲を超えて増えた場合に差分を返す。
+
+データの投入と検証対象のメソッドの登録は scripts/check_query_plans.py で行う。
+"""
+
+import difflib
+import json
+import logging
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Connection, event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+# 推定コストの増加をどこまで許容するか（0.5 = 1.5倍まで）
+DEFAULT_COST_TOLERANCE = 0.5
+
+# EXPLAIN の対象にする文（SAVEPOINT や SET などは除く）
+_EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@dataclass(frozen=True)
+class CapturedStatement:
+    """リポジトリのメソッドが発行したSQL（ドライバに渡した形のまま）"""
+
+    statement: str
+    parameters: Any
+
+
+@dataclass(frozen=True)
+class QueryPlanSummary:
+    """実行計画の要約
+
+    Attributes:
+        shape: ノードを深さ順に並べた行（子ノードは2文字ずつ字下げ）
+        total_cost: 最上位ノードの推定コスト
+    """
+
+    shape: tuple[str, ...]
+    total_cost: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"shape": list(self.shape), "total_cost": self.total_cost}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QueryPlanSummary":
+        return cls(shape=tuple(data["shape"]), total_cost=float(data["total_cost"]))
+
+
+@dataclass(frozen=True)
+class QueryPlanCase:
+    """実行計画を検証するリポジトリのメソッド
+
+    Attributes:
+        name: ベースラインのキー（例: ``conversations.get_by_minutes``）
+        run: セッションを受け取り、対象のメソッドを呼び出す関数
+    """
+
+    name: str
+    run: Callable[[Any], Awaitable[Any]]
+
+
+def _node_label(node: dict[str, Any]) -> str:
+    label = node["Node Type"]
+    if node.get("Parallel Aware"):
+        label = f"Parallel {label}"
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+    return label
+
+
+def summarize_plan(explain_result: Any) -> QueryPlanSummary:
+    """``EXPLAIN (FORMAT JSON)`` の結果を要約する
+
+    Args:
+        explain_result: EXPLAIN の結果（JSON文字列またはデコード済みのリスト）
+    """
+    if isinstance(explain_result, str):
+        explain_result = json.loads(explain_result)
+    root = explain_result[0]["Plan"]
+
+    lines: list[str] = []
+
+    def walk(node: dict[str, Any], depth: int) -> None:
+        lines.append("  " * depth + _node_label(node))
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(root, 0)
+    return QueryPlanSummary(shape=tuple(lines), total_cost=float(root["Total Cost"]))
+
+
+def _seq_scanned_tables(summary: QueryPlanSummary) -> set[str]:
+    return {
+        line.strip().rsplit(" on ", 1)[1]
+        for line in summary.shape
+        if "Seq Scan on " in line
+    }
+
+
+def compare_plans(
+    name: str,
+    baseline: QueryPlanSummary,
+    current: QueryPlanSummary,
+    cost_tolerance: float = DEFAULT_COST_TOLERANCE,
+) -> str | None:
+    """ベースラインと比べて計画が悪化していれば差分を返す
+
+    計画の形が変わった場合と、推定コストが ``1 + cost_tolerance`` 倍を
+    超えた場合を回帰とみなす。
+
+    Returns:
+        回帰の内容（問題なければ None）
+    """
+    messages: list[str] = []
+
+    if baseline.shape != current.shape:
+        messages.append("plan shape changed:")
+        messages.extend(
+            difflib.unified_diff(
+                baseline.shape,
+                current.shape,
+                fromfile="baseline",
+                tofile="current",
+                lineterm="",
+            )
+        )
+        for table in sorted(
+            _seq_scanned_tables(current) - _seq_scanned_tables(baseline)
+        ):
+            messages.append(f"new sequential scan on {table}")
+
+    cost_limit = baseline.total_cost * (1 + cost_tolerance)
+    if current.total_cost > cost_limit:
+        increase = (
+            (current.total_cost / baseline.total_cost - 1) * 100
+            if baseline.total_cost > 0
+            else float("inf")
+        )
+        messages.append(
+            f"estimated cost {baseline.total_cost:.2f} -> {current.total_cost:.2f} "
+            f"(+{increase:.0f}%, tolerance +{cost_tolerance * 100:.0f}%)"
+        )
+
+    if not messages:
+        return None
+    return "\n".join([f"{name}:", *(f"  {message}" for message in messages)])
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Iterator[list[CapturedStatement]]:
+    """ブロック内でエンジンが発行したSQLを捕捉する"""
+    captured: list[CapturedStatement] = []
+
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if statement.lstrip().upper().startswith(_EXPLAINABLE_PREFIXES):
+            captured.append(CapturedStatement(statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain_statement(
+    connection: Connection, captured: CapturedStatement
+) -> QueryPlanSummary:
+    """捕捉したSQLを同じパラメータで EXPLAIN する（実行はしない）"""
+    result = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {captured.statement}", captured.parameters
+    )
+    return summarize_plan(result.scalar())
+
+
+def load_baselines(path: Path) -> dict[str, QueryPlanSummary]:
+    """ベースラインを読み込む（ファイルがなければ空）"""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: QueryPlanSummary.from_dict(entry) for name, entry in data.items()}
+
+
+def save_baselines(path: Path, summaries: dict[str, QueryPlanSummary]) -> None:
+    """ベースラインを書き出す（差分を読みやすいようキー順に並べる）"""
+    data = {name: summaries[name].to_dict() for name in sorted(summaries)}
+    path.write_text(
+        json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def find_regressions(
+    baselines: dict[str, QueryPlanSummary],
+    current: dict[str, QueryPlanSummary],
+    cost_tolerance: float = DEFAULT_COST_TOLERANCE,
+) -> list[str]:
+    """すべての計画をベースラインと比べ、回帰の内容を返す
+
+    ベースラインのない計画も回帰として扱う（``--update`` で追加する）。
+    """
+    regressions: list[str] = []
+    for name, summary in current.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            regressions.append(f"{name}:\n  no baseline (run with --update to add)")
+            continue
+        regression = compare_plans(name, baseline, summary, cost_tolerance)
+        if regression is not None:
+            regressions.append(regression)
+
+    for name in sorted(set(baselines) - set(current)):
+        logger.warning(f"Baseline {name} was not produced by any registered case")
+    return regressions
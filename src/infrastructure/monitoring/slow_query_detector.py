@@ -1,20 +1,175 @@
-"""Slow query detection and logging for database operations."""
+"""Slow query detection and logging for database operations.
 
+個々の遅いSQLのログに加えて、リテラルやパラメータを取り除いた「クエリの形」
+（フィンガープリント）ごとに実行回数と所要時間を集計する。集計は
+src/common/metrics.py のヒストグラム・カウンターにも記録する。
+"""
+
+import hashlib
 import logging
+import re
+import threading
 import time
 
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import Session
 
+from src.common.metrics import CommonMetrics, is_metrics_initialized
+
 
 logger = logging.getLogger(__name__)
 
+# フィンガープリントの正規化に使うパターン（適用順）
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+# psycopg2 の %(name)s、asyncpg の $1、sqlite の ?、text() の :name
+_PARAMETER_PATTERN = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):(?!:)\w+")
+_NUMBER_PATTERN = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_ROWS_PATTERN = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 集計するフィンガープリントの上限（超えた分は OTHER_FINGERPRINT にまとめる）
+DEFAULT_MAX_FINGERPRINTS = 1000
+OTHER_FINGERPRINT = "(other)"
+
+
+def fingerprint_statement(statement: str) -> str:
+    """SQLからリテラル・パラメータを取り除き、クエリの形を表す文字列にする
+
+    同じ形で値だけが異なるSQLは同じフィンガープリントになる。IN のリストや
+    VALUES の行は件数によらず1つにまとめる。
+    """
+    fingerprint = _COMMENT_PATTERN.sub(" ", statement)
+    fingerprint = _STRING_PATTERN.sub("?", fingerprint)
+    fingerprint = _PARAMETER_PATTERN.sub("?", fingerprint)
+    fingerprint = _NUMBER_PATTERN.sub("?", fingerprint)
+    fingerprint = _WHITESPACE_PATTERN.sub(" ", fingerprint).strip().rstrip(";")
+    fingerprint = _IN_LIST_PATTERN.sub("(?, ...)", fingerprint)
+    return _REPEATED_ROWS_PATTERN.sub(r"\1, ...", fingerprint)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """メトリクスのラベルに使うフィンガープリントの短いID"""
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class QueryFingerprintStats:
+    """1つのクエリの形の実行回数と所要時間"""
+
+    fingerprint_id: str
+    fingerprint: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class QueryStatsCollector:
+    """SQLをフィンガープリントごとに集計する
+
+    複数のエンジン・スレッドから記録されるためロックで保護する。同じSQL文字列の
+    フィンガープリントはキャッシュし、正規化は文字列ごとに1回だけ行う。
+    """
+
+    def __init__(self, max_fingerprints: int = DEFAULT_MAX_FINGERPRINTS):
+        """Initialize query stats collector.
+
+        Args:
+            max_fingerprints: Maximum number of distinct fingerprints to keep
+        """
+        self.max_fingerprints = max_fingerprints
+        self._lock = threading.Lock()
+        self._stats: dict[str, QueryFingerprintStats] = {}
+        self._fingerprint_cache: dict[str, tuple[str, str]] = {}
+
+    def _fingerprint(self, statement: str) -> tuple[str, str]:
+        cached = self._fingerprint_cache.get(statement)
+        if cached is not None:
+            return cached
+        fingerprint = fingerprint_statement(statement)
+        cached = (fingerprint_id(fingerprint), fingerprint)
+        if len(self._fingerprint_cache) >= self.max_fingerprints * 4:
+            self._fingerprint_cache.clear()
+        self._fingerprint_cache[statement] = cached
+        return cached
+
+    def record(self, statement: str, duration_ms: float) -> QueryFingerprintStats:
+        """Record one execution of a statement.
+
+        Returns:
+            The stats entry the execution was added to
+        """
+        with self._lock:
+            stats_id, fingerprint = self._fingerprint(statement)
+            stats = self._stats.get(stats_id)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    stats_id = fingerprint = OTHER_FINGERPRINT
+                    stats = self._stats.get(stats_id)
+                if stats is None:
+                    stats = QueryFingerprintStats(stats_id, fingerprint)
+                    self._stats[stats_id] = stats
+            stats.calls += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+
+        if is_metrics_initialized():
+            attributes = {
+                "fingerprint": stats.fingerprint_id,
+                "operation": stats.fingerprint.split(" ", 1)[0].upper(),
+            }
+            CommonMetrics.db_query_duration().record(duration_ms, attributes=attributes)
+            CommonMetrics.db_queries_total().add(1, attributes=attributes)
+        return stats
+
+    def get_top(self, limit: int = 10) -> list[QueryFingerprintStats]:
+        """Get the query shapes with the largest total time."""
+        with self._lock:
+            ranked = sorted(
+                self._stats.values(), key=lambda s: s.total_ms, reverse=True
+            )
+            return [replace(stats) for stats in ranked[:limit]]
+
+    def clear(self) -> None:
+        """Clear collected stats."""
+        with self._lock:
+            self._stats.clear()
+
+    def format_report(self, limit: int = 10, max_query_length: int = 120) -> str:
+        """Format the top query shapes by total time as a text table."""
+        top = self.get_top(limit)
+        if not top:
+            return "No queries recorded"
+
+        lines = [
+            f"{'total ms':>12} {'calls':>8} {'avg ms':>10} {'max ms':>10}  query",
+        ]
+        for stats in top:
+            query = stats.fingerprint
+            if len(query) > max_query_length:
+                query = query[: max_query_length - 3] + "..."
+            lines.append(
+                f"{stats.total_ms:>12.1f} {stats.calls:>8} {stats.avg_ms:>10.2f} "
+                f"{stats.max_ms:>10.2f}  {query}"
+            )
+        return "\n".join(lines)
+
+
+# プロセス全体で共有する集計（共有エンジンはこれに記録する）
+query_stats = QueryStatsCollector()
+
 
 @dataclass
 class SlowQueryRecord:
@@ -163,24 +318,26 @@ class SlowQueryDetector:
 
 
 def install_sqlalchemy_listener(
-    engine: Engine,
+    engine: Engine | AsyncEngine,
     detector: SlowQueryDetector | None = None,
     threshold_ms: float = 1000,
+    collector: QueryStatsCollector | None = None,
 ) -> SlowQueryDetector:
     """Install SQLAlchemy event listeners for slow query detection.
 
     Args:
-        engine: SQLAlchemy engine
+        engine: SQLAlchemy engine (async engines are hooked via sync_engine)
         detector: Existing detector or None to create new
         threshold_ms: Threshold for slow queries in milliseconds
+        collector: Collector to record every statement by fingerprint
 
     Returns:
         The slow query detector instance
     """
     if detector is None:
         detector = SlowQueryDetector(threshold_ms=threshold_ms)
-
-    query_start_times: dict[Any, float] = {}
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
 
     @event.listens_for(engine, "before_cursor_execute")
     def before_cursor_execute(
@@ -192,7 +349,8 @@ def install_sqlalchemy_listener(
         executemany: bool,
     ) -> None:
         """Track query start time."""
-        query_start_times[cursor] = time.perf_counter()
+        # 実行ごとに作られる context に保持する（失敗した実行の分が残らない）
+        context._query_start_time = time.perf_counter()
 
     @event.listens_for(engine, "after_cursor_execute")
     def after_cursor_execute(
@@ -204,20 +362,24 @@ def install_sqlalchemy_listener(
         executemany: bool,
     ) -> None:
         """Check query duration and detect slow queries."""
-        if cursor in query_start_times:
-            start_time = query_start_times.pop(cursor)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            if duration_ms >= detector.threshold_ms:
-                # Convert parameters to dict if needed
-                param_dict = None
-                if parameters:
-                    if isinstance(parameters, dict):
-                        param_dict = parameters
-                    elif isinstance(parameters, list | tuple):
-                        param_dict = {f"param_{i}": v for i, v in enumerate(parameters)}
-
-                detector.handle_slow_query(statement, duration_ms, param_dict)
+        start_time = getattr(context, "_query_start_time", None)
+        if start_time is None:
+            return
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        if collector is not None:
+            collector.record(statement, duration_ms)
+
+        if duration_ms >= detector.threshold_ms:
+            # Convert parameters to dict if needed
+            param_dict = None
+            if parameters:
+                if isinstance(parameters, dict):
+                    param_dict = parameters
+                elif isinstance(parameters, list | tuple):
+                    param_dict = {f"param_{i}": v for i, v in enumerate(parameters)}
+
+            detector.handle_slow_query(statement, duration_ms, param_dict)
 
     logger.info(f"Slow query detector installed with threshold {threshold_ms}ms")
     return detector
@@ -0,0 +1,11 @@
+"""PostgreSQL advisory lock の名前空間定義.
+
+pg_advisory_xact_lock(namespace, hashtext(key)) の第1引数として使い、
+用途ごとにロックキーが衝突しないよう分離する。
+"""
+
+# 国会会議録インポート: 会議（issueID）単位の取り込み
+MEETING_IMPORT_LOCK_NAMESPACE = 1001
+
+# 発言者の新規作成: 発言者名単位
+SPEAKER_CREATE_LOCK_NAMESPACE = 1002
@@ -4,6 +4,8 @@ This module provides infrastructure implementations of the domain's
 ISessionAdapter port, following the Dependency Inversion Principle.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from sqlalchemy.engine.result import Result
@@ -50,6 +52,11 @@ class NoOpSessionAdapter(ISessionAdapter):
         """No-op: RepositoryAdapter handles adding."""
         pass
 
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        """No-op: RepositoryAdapter commits each operation itself."""
+        yield
+
     async def flush(self) -> None:
         """No-op: RepositoryAdapter handles flushing."""
         pass
@@ -117,6 +124,12 @@ class AsyncSessionAdapter(ISessionAdapter):
         """Add multiple instances to session."""
         self._sync_session.add_all(instances)
 
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        """Start a SAVEPOINT synchronously but expose it as an async block."""
+        with self._sync_session.begin_nested():
+            yield
+
     async def flush(self) -> None:
         """Flush synchronously but return as if async."""
         self._sync_session.flush()
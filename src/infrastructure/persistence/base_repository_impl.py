@@ -1,9 +1,17 @@
 """Base repository implementation for infrastructure layer."""
 
-from collections.abc import Callable
+import json
+import re
+
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
 from functools import cached_property
 from typing import Any
+from uuid import UUID
 
+from pydantic import BaseModel as PydanticBaseModel
 from sqlalchemy import func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -13,6 +21,20 @@ from src.domain.repositories.base import BaseRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
 
 
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _json_default(value: Any) -> Any:
+    """一括書き込み用にPython値をJSONへ変換する."""
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class BaseRepositoryImpl[T: BaseEntity](BaseRepository[T]):
     """Base repository implementation using ISessionAdapter.
 
@@ -168,6 +190,165 @@ class BaseRepositoryImpl[T: BaseEntity](BaseRepository[T]):
         count = result.scalar()
         return count if count is not None else 0
 
+    async def bulk_update_fields(
+        self, entities: list[T], fields: Sequence[str]
+    ) -> list[int]:
+        """Update the given fields of many entities in a single statement.
+
+        ``UPDATE ... FROM jsonb_populate_recordset(NULL::<table>, :rows)`` で
+        全件を1文で更新する。行をテーブルの行型で展開するため、値の型は
+        テーブル定義に従って変換される（ORM/非ORMどちらのモデルでも使える）。
+        同じIDが複数あれば後のものを使う。
+
+        Args:
+            entities: 更新するエンティティ（IDが必須）
+            fields: 更新するカラム名
+
+        Returns:
+            更新された行のID（順序は保証しない）
+        """
+        if not entities:
+            return []
+        if not fields:
+            raise ValueError("bulk_update_fields requires at least one field")
+        columns = self._validate_columns(fields)
+        if "id" in columns:
+            raise ValueError("bulk_update_fields cannot update the id column")
+
+        rows: dict[int, dict[str, Any]] = {}
+        for entity in entities:
+            if not entity.id:
+                raise ValueError("Entity must have an ID to update")
+            values = self._model_values(entity)
+            missing = [column for column in columns if column not in values]
+            if missing:
+                raise ValueError(
+                    f"{self.__class__.__name__}: unknown fields {missing} "
+                    "for bulk_update_fields"
+                )
+            rows[entity.id] = {
+                "id": entity.id,
+                **{column: values[column] for column in columns},
+            }
+
+        table = self._bulk_table_name
+        assignments = ", ".join(f"{column} = v.{column}" for column in columns)
+        query = text(f"""
+            UPDATE {table} AS t
+            SET {assignments}
+            FROM jsonb_populate_recordset(NULL::{table}, CAST(:rows AS jsonb)) AS v
+            WHERE t.id = v.id
+            RETURNING t.id
+        """)
+        result = await self.session.execute(
+            query, {"rows": json.dumps(list(rows.values()), default=_json_default)}
+        )
+        return [row[0] for row in result.fetchall()]
+
+    async def bulk_upsert_on(
+        self, entities: list[T], conflict_keys: Sequence[str]
+    ) -> list[int]:
+        """Insert many entities, updating existing rows on conflict.
+
+        ``INSERT ... ON CONFLICT (conflict_keys) DO UPDATE`` で全件を1文で
+        書き込む。書き込むカラムは _to_model で設定されたもので、IDは全件に
+        ある場合のみ含める。conflict_keys には一意制約（一意インデックス）の
+        あるカラムを指定すること。同じキーが複数あれば後のものを使う。
+        jsonb_populate_recordset は欠けたカラムを DEFAULT ではなく NULL に
+        するため、全件で書き込むカラムが揃っている必要がある。
+
+        Args:
+            entities: 書き込むエンティティ
+            conflict_keys: 既存行の判定に使うカラム名
+
+        Returns:
+            挿入・更新された行のID（順序は保証しない）
+
+        Raises:
+            ValueError: エンティティごとに書き込むカラムが異なる場合
+        """
+        if not entities:
+            return []
+        if not conflict_keys:
+            raise ValueError("bulk_upsert_on requires at least one conflict key")
+        keys = self._validate_columns(conflict_keys)
+
+        include_id = all(entity.id for entity in entities)
+        rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+        columns: list[str] | None = None
+        for entity in entities:
+            values = self._model_values(entity)
+            values.pop("id", None)
+            if include_id:
+                values = {"id": entity.id, **values}
+            missing = [key for key in keys if key not in values]
+            if missing:
+                raise ValueError(
+                    f"{self.__class__.__name__}: unknown conflict keys {missing} "
+                    "for bulk_upsert_on"
+                )
+            if columns is None:
+                columns = list(values)
+            elif set(values) != set(columns):
+                raise ValueError(
+                    f"{self.__class__.__name__}: bulk_upsert_on requires the same "
+                    f"columns for every entity (got {sorted(values)}, "
+                    f"expected {sorted(columns)})"
+                )
+            rows[tuple(values[key] for key in keys)] = values
+        column_list = self._validate_columns(columns or [])
+
+        table = self._bulk_table_name
+        update_columns = [column for column in column_list if column not in keys]
+        if update_columns:
+            assignments = ", ".join(
+                f"{column} = EXCLUDED.{column}" for column in update_columns
+            )
+        else:
+            # DO NOTHING では既存行のIDが返らないため、キーを同じ値で更新する
+            assignments = f"{keys[0]} = EXCLUDED.{keys[0]}"
+        column_sql = ", ".join(column_list)
+        query = text(f"""
+            INSERT INTO {table} ({column_sql})
+            SELECT {column_sql}
+            FROM jsonb_populate_recordset(NULL::{table}, CAST(:rows AS jsonb))
+            ON CONFLICT ({", ".join(keys)}) DO UPDATE SET {assignments}
+            RETURNING id
+        """)
+        result = await self.session.execute(
+            query, {"rows": json.dumps(list(rows.values()), default=_json_default)}
+        )
+        return [row[0] for row in result.fetchall()]
+
+    @property
+    def _bulk_table_name(self) -> str:
+        """一括書き込みSQLに埋め込むテーブル名."""
+        return self._validate_columns([self._table_name])[0]
+
+    def _validate_columns(self, names: Sequence[str]) -> list[str]:
+        """SQLに埋め込むカラム名が識別子として安全か検証する."""
+        invalid = [name for name in names if not _IDENTIFIER_PATTERN.match(name)]
+        if invalid:
+            raise ValueError(
+                f"{self.__class__.__name__}: invalid column names {invalid}"
+            )
+        return list(names)
+
+    def _model_values(self, entity: T) -> dict[str, Any]:
+        """_to_model で設定されたカラムの値を取得する."""
+        model = self._to_model(entity)
+        if isinstance(model, PydanticBaseModel):
+            values = model.model_dump(exclude_unset=True)
+        else:
+            values = {
+                key: value
+                for key, value in vars(model).items()
+                if not key.startswith("_")
+            }
+        if values.get("id") is None:
+            values.pop("id", None)
+        return values
+
     def _to_entity(self, model: Any) -> T:
         """Convert database model to domain entity."""
         raise NotImplementedError("Subclass must implement _to_entity")
@@ -18,6 +18,11 @@ from src.infrastructure.exceptions import (
     UpdateError,
 )
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.reference_data_cache import (
+    CONFERENCES,
+    GOVERNING_BODIES,
+    ReferenceDataCacheMixin,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -38,8 +43,19 @@ class ConferenceModel(PydanticBaseModel):
         arbitrary_types_allowed = True
 
 
-class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceRepository):
-    """Conference repository implementation using SQLAlchemy."""
+class ConferenceRepositoryImpl(
+    ReferenceDataCacheMixin[Conference],
+    BaseRepositoryImpl[Conference],
+    ConferenceRepository,
+):
+    """Conference repository implementation using SQLAlchemy.
+
+    全件・ID・名前での取得は参照データキャッシュを経由する。
+    """
+
+    _reference_table = CONFERENCES
+    # 会議体数を含めて返しているキャッシュ
+    _dependent_reference_tables = (GOVERNING_BODIES,)
 
     def __init__(self, session: AsyncSession | ISessionAdapter):
         """Initialize repository with database session.
@@ -70,6 +86,16 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
         Returns:
             Conference entity or None if not found
         """
+        cache = self._reference_cache
+        if cache is not None:
+            for conference in await cache.get_by_name(name, self._fetch_all):
+                if (
+                    conference.governing_body_id == governing_body_id
+                    and conference.term == term
+                ):
+                    return conference
+            return None
+
         try:
             if term is not None:
                 query = text("""
@@ -193,6 +219,14 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
         Returns:
             List of Conference entities
         """
+        cache = self._reference_cache
+        if cache is not None and limit is None and not offset:
+            return await cache.get_all(self._fetch_all)
+        return await self._fetch_all(limit, offset)
+
+    async def _fetch_all(
+        self, limit: int | None = None, offset: int | None = 0
+    ) -> list[Conference]:
         try:
             query_text = """
                 SELECT
@@ -244,6 +278,10 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
         Returns:
             Conference entity or None if not found
         """
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_id(entity_id, self._fetch_all)
+
         try:
             query = text("""
                 SELECT
@@ -288,6 +326,10 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
         """
         if not entity_ids:
             return []
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_ids(entity_ids, self._fetch_all)
+
         try:
             # プレースホルダを動的に生成
             placeholders = ", ".join(f":id_{i}" for i in range(len(entity_ids)))
@@ -362,6 +404,7 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
             }
 
             result = await self.session.execute(query, params)
+            self._invalidate_reference_cache()
 
             row = result.first()
             if row:
@@ -413,6 +456,7 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
             }
 
             result = await self.session.execute(query, params)
+            self._invalidate_reference_cache()
 
             row = result.first()
             if row:
@@ -456,6 +500,7 @@ class ConferenceRepositoryImpl(BaseRepositoryImpl[Conference], ConferenceReposit
             # Delete the conference
             query = text("DELETE FROM conferences WHERE id = :id")
             result = await self.session.execute(query, {"id": entity_id})
+            self._invalidate_reference_cache()
 
             return result.rowcount > 0  # type: ignore[attr-defined]
 
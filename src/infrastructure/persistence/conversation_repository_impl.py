@@ -1,8 +1,10 @@
 """Conversation repository implementation."""
 
+import json
 import logging
+import unicodedata
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, TypedDict
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text, text
@@ -12,12 +14,45 @@ from sqlalchemy.orm import Session, registry
 from src.domain.entities.conversation import Conversation
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
+from src.domain.value_objects.conversation_search_hit import ConversationSearchHit
+from src.domain.value_objects.keyset_page import KeysetPage, TotalCountMode
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 from src.minutes_divide_processor.models import SpeakerAndSpeechContent
 
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement in bulk_create (bounds statement/parameter size)
+BULK_INSERT_CHUNK_SIZE = 5000
+
+# Maximum number of search words used in search_by_text
+MAX_SEARCH_TERMS = 10
+
+
+def _search_terms(query: str) -> list[str]:
+    """検索語を ja_search_normalize と同じ規則（NFKC・小文字）で正規化して分割する."""
+    normalized = unicodedata.normalize("NFKC", query).lower()
+    return list(dict.fromkeys(normalized.split()))[:MAX_SEARCH_TERMS]
+
+
+def _to_bigram_tsquery(terms: list[str]) -> str:
+    """検索語を ja_bigram_tsvector のN-gramに分けたANDのtsqueryにする.
+
+    1文字の語はそのまま、2文字以上の語は隣り合う2文字ずつに分ける。
+    N-gramがすべて含まれても語そのものを含むとは限らないため、呼び出し側で
+    本文に語が含まれるかを確認すること。
+    """
+    grams: dict[str, None] = {}
+    for term in terms:
+        if len(term) == 1:
+            grams[term] = None
+        else:
+            grams.update(dict.fromkeys(term[i : i + 2] for i in range(len(term) - 1)))
+    return " & ".join(
+        "'" + gram.replace("\\", "\\\\").replace("'", "''") + "'" for gram in grams
+    )
+
+
 # Create a mapper registry for this table
 mapper_registry = registry()
 
@@ -264,59 +299,154 @@ class ConversationRepositoryImpl(
     async def bulk_create(
         self, conversations: list[Conversation]
     ) -> list[Conversation]:
-        """Create multiple conversations at once using ORM."""
+        """Create multiple conversations with set-based INSERT statements.
+
+        IDs are reserved from the conversations sequence up front so that the
+        returned entities carry their IDs in input order, then each chunk is
+        inserted with a single ``INSERT ... SELECT FROM unnest(...)``.
+        The number of round-trips is ``1 + ceil(n / BULK_INSERT_CHUNK_SIZE)``
+        regardless of how many conversations are passed.
+        """
         if not conversations:
             return []
 
-        if self.async_session is not None:
-            # Use ORM add_all for proper transaction handling
-            models = [self._to_model(conv) for conv in conversations]
-            self.async_session.add_all(models)
+        session = self.async_session or self.sync_session
+        if session is None:
+            # This should never happen
+            return []
 
-            # Flush to assign IDs without committing
-            await self.async_session.flush()
+        # Reserve IDs in one round-trip (nextval is monotonic per call order)
+        id_result = await session.execute(
+            text("""
+                SELECT nextval(pg_get_serial_sequence('conversations', 'id'))
+                FROM generate_series(1, :count)
+            """),
+            {"count": len(conversations)},
+        )
+        ids = [row[0] for row in id_result.fetchall()]
+
+        insert_query = text("""
+            INSERT INTO conversations
+            (id, minutes_id, speaker_id, speaker_name, comment, sequence_number,
+             chapter_number, sub_chapter_number, is_manually_verified,
+             latest_extraction_log_id)
+            SELECT * FROM unnest(
+                CAST(:ids AS integer[]),
+                CAST(:minutes_ids AS integer[]),
+                CAST(:speaker_ids AS integer[]),
+                CAST(:speaker_names AS varchar[]),
+                CAST(:comments AS text[]),
+                CAST(:sequence_numbers AS integer[]),
+                CAST(:chapter_numbers AS integer[]),
+                CAST(:sub_chapter_numbers AS integer[]),
+                CAST(:verified AS boolean[]),
+                CAST(:extraction_log_ids AS integer[])
+            )
+        """)
+        for start in range(0, len(conversations), BULK_INSERT_CHUNK_SIZE):
+            chunk = conversations[start : start + BULK_INSERT_CHUNK_SIZE]
+            await session.execute(
+                insert_query,
+                {
+                    "ids": ids[start : start + len(chunk)],
+                    "minutes_ids": [c.minutes_id for c in chunk],
+                    "speaker_ids": [c.speaker_id for c in chunk],
+                    "speaker_names": [c.speaker_name for c in chunk],
+                    "comments": [c.comment for c in chunk],
+                    "sequence_numbers": [c.sequence_number for c in chunk],
+                    "chapter_numbers": [c.chapter_number for c in chunk],
+                    "sub_chapter_numbers": [c.sub_chapter_number for c in chunk],
+                    "verified": [bool(c.is_manually_verified) for c in chunk],
+                    "extraction_log_ids": [c.latest_extraction_log_id for c in chunk],
+                },
+            )
 
-            # Refresh to get assigned IDs
-            for model in models:
-                await self.async_session.refresh(model)
+        for conv, conv_id in zip(conversations, ids, strict=True):
+            conv.id = conv_id
 
-            # Convert back to entities with IDs
-            created = [self._to_entity(model) for model in models]
-            return created
-        elif self.sync_session is not None:
-            # Sync implementation (may be wrapped by AsyncSessionAdapter)
-            created: list[Conversation] = []
-            for conv in conversations:
-                query = text("""
-                    INSERT INTO conversations
-                    (minutes_id, speaker_id, speaker_name, comment, sequence_number,
-                     chapter_number, sub_chapter_number)
-                    VALUES
-                    (:minutes_id, :speaker_id, :speaker_name, :comment,
-                     :sequence_number, :chapter_number, :sub_chapter_number)
-                    RETURNING id
-                """)
-                result = await self.sync_session.execute(
-                    query,
-                    {
-                        "minutes_id": conv.minutes_id,
-                        "speaker_id": conv.speaker_id,
-                        "speaker_name": conv.speaker_name,
-                        "comment": conv.comment,
-                        "sequence_number": conv.sequence_number,
-                        "chapter_number": conv.chapter_number,
-                        "sub_chapter_number": conv.sub_chapter_number,
-                    },
-                )
-                conv_id = result.scalar()
-                conv.id = conv_id
-                created.append(conv)
+        # Do not commit here - let UseCase manage transaction
+        return conversations
 
-            # Do not commit here - let UseCase manage transaction
-            return created
-        else:
+    async def delete_by_minutes(self, minutes_id: int) -> int:
+        """Delete all conversations of a minutes record with a single DELETE."""
+        session = self.async_session or self.sync_session
+        if session is None:
             # This should never happen
-            return []
+            return 0
+
+        result = await session.execute(
+            text("DELETE FROM conversations WHERE minutes_id = :minutes_id"),
+            {"minutes_id": minutes_id},
+        )
+        # Do not commit here - let UseCase manage transaction
+        return result.rowcount or 0
+
+    async def bulk_update_from_extraction(
+        self, conversations: list[Conversation]
+    ) -> int:
+        """Write extraction-derived fields with set-based UPDATE statements.
+
+        Each chunk is applied with a single ``UPDATE ... FROM unnest(...)`` that
+        also links ``latest_extraction_log_id``. Rows that were manually verified
+        are skipped in SQL as well, so a concurrent manual fix is never overwritten.
+        """
+        targets = [c for c in conversations if c.id is not None]
+        if not targets:
+            return 0
+
+        session = self.async_session or self.sync_session
+        if session is None:
+            # This should never happen
+            return 0
+
+        update_query = text("""
+            UPDATE conversations c
+            SET comment = v.comment,
+                sequence_number = v.sequence_number,
+                minutes_id = v.minutes_id,
+                speaker_id = v.speaker_id,
+                speaker_name = v.speaker_name,
+                chapter_number = v.chapter_number,
+                sub_chapter_number = v.sub_chapter_number,
+                latest_extraction_log_id = v.extraction_log_id,
+                updated_at = CURRENT_TIMESTAMP
+            FROM unnest(
+                CAST(:ids AS integer[]),
+                CAST(:comments AS text[]),
+                CAST(:sequence_numbers AS integer[]),
+                CAST(:minutes_ids AS integer[]),
+                CAST(:speaker_ids AS integer[]),
+                CAST(:speaker_names AS varchar[]),
+                CAST(:chapter_numbers AS integer[]),
+                CAST(:sub_chapter_numbers AS integer[]),
+                CAST(:extraction_log_ids AS integer[])
+            ) AS v(id, comment, sequence_number, minutes_id, speaker_id,
+                   speaker_name, chapter_number, sub_chapter_number,
+                   extraction_log_id)
+            WHERE c.id = v.id
+            AND c.is_manually_verified IS NOT TRUE
+        """)
+        updated = 0
+        for start in range(0, len(targets), BULK_INSERT_CHUNK_SIZE):
+            chunk = targets[start : start + BULK_INSERT_CHUNK_SIZE]
+            result = await session.execute(
+                update_query,
+                {
+                    "ids": [c.id for c in chunk],
+                    "comments": [c.comment for c in chunk],
+                    "sequence_numbers": [c.sequence_number for c in chunk],
+                    "minutes_ids": [c.minutes_id for c in chunk],
+                    "speaker_ids": [c.speaker_id for c in chunk],
+                    "speaker_names": [c.speaker_name for c in chunk],
+                    "chapter_numbers": [c.chapter_number for c in chunk],
+                    "sub_chapter_numbers": [c.sub_chapter_number for c in chunk],
+                    "extraction_log_ids": [c.latest_extraction_log_id for c in chunk],
+                },
+            )
+            updated += result.rowcount or 0
+
+        # Do not commit here - let UseCase manage transaction
+        return updated
 
     async def save_speaker_and_speech_content_list(
         self, speaker_and_speech_content_list: list[Any], minutes_id: int | None = None
@@ -538,149 +668,208 @@ class ConversationRepositoryImpl(
                 "linking_rate": 0,
             }
 
-    async def get_conversations_with_pagination(
+    async def get_keyset_page(
         self,
-        page: int = 1,
-        page_size: int = 10,
-        speaker_name: str | None = None,
+        page_size: int = 50,
+        after_id: int | None = None,
         meeting_id: int | None = None,
-        has_speaker_id: bool | None = None,
-    ) -> dict[str, Any]:
-        """Get conversations with pagination and filters."""
-        # Build WHERE conditions
-        conditions: list[str] = []
-        params: dict[str, Any] = {"limit": page_size, "offset": (page - 1) * page_size}
+        speaker_name: str | None = None,
+        is_manually_verified: bool | None = None,
+        descending: bool = True,
+        total_count_mode: TotalCountMode = TotalCountMode.NONE,
+    ) -> KeysetPage[Conversation]:
+        """Get a page of conversations ordered by ID using keyset pagination.
+
+        ``c.id`` より先の行を ``ORDER BY c.id LIMIT`` で読むだけなので、
+        主キー（会議で絞る場合は (minutes_id, id) のインデックス）を辿って
+        ページサイズ分で読み終わる。次ページの有無は1行多く読んで判定する。
+        """
+        session = self.async_session or self.sync_session
+        if session is None:
+            # This should never happen
+            return KeysetPage(items=[], next_cursor=None)
 
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        if meeting_id is not None:
+            conditions.append(
+                "c.minutes_id IN "
+                "(SELECT id FROM minutes WHERE meeting_id = :meeting_id)"
+            )
+            params["meeting_id"] = meeting_id
         if speaker_name:
             conditions.append("c.speaker_name ILIKE :speaker_name")
             params["speaker_name"] = f"%{speaker_name}%"
+        if is_manually_verified is not None:
+            conditions.append("COALESCE(c.is_manually_verified, FALSE) = :verified")
+            params["verified"] = is_manually_verified
+        filter_clause = " AND ".join(conditions) if conditions else "TRUE"
+
+        page_conditions = list(conditions)
+        if after_id is not None:
+            page_conditions.append(
+                "c.id < :after_id" if descending else "c.id > :after_id"
+            )
+        page_query = text(f"""
+            SELECT c.* FROM conversations c
+            WHERE {" AND ".join(page_conditions) if page_conditions else "TRUE"}
+            ORDER BY c.id {"DESC" if descending else "ASC"}
+            LIMIT :limit
+        """)
+        result = await session.execute(
+            page_query, {**params, "after_id": after_id, "limit": page_size + 1}
+        )
+        rows = result.fetchall()
+        items = [self._to_entity(row) for row in rows[:page_size]]
+        next_cursor = items[-1].id if len(rows) > page_size and items else None
+
+        total_count: int | None = None
+        if total_count_mode is TotalCountMode.EXACT:
+            count_result = await session.execute(
+                text(f"SELECT COUNT(*) FROM conversations c WHERE {filter_clause}"),
+                params,
+            )
+            total_count = count_result.scalar() or 0
+        elif total_count_mode is TotalCountMode.ESTIMATED:
+            total_count = await self._estimate_count(
+                session, filter_clause, params, has_filters=bool(conditions)
+            )
 
-        if meeting_id:
-            conditions.append("m.id = :meeting_id")
-            params["meeting_id"] = meeting_id
+        return KeysetPage(
+            items=items,
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_is_estimate=total_count_mode is TotalCountMode.ESTIMATED,
+        )
 
-        if has_speaker_id is not None:
-            if has_speaker_id:
-                conditions.append("c.speaker_id IS NOT NULL")
-            else:
-                conditions.append("c.speaker_id IS NULL")
+    @staticmethod
+    async def _estimate_count(
+        session: Any,
+        filter_clause: str,
+        params: dict[str, Any],
+        has_filters: bool,
+    ) -> int:
+        """Estimate the number of matching conversations without scanning them.
+
+        絞り込みがなければ pg_class.reltuples（ANALYZE時点の行数）を、
+        絞り込みがあれば実行計画の推定行数を使う。
+        """
+        if not has_filters:
+            result = await session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'conversations'::regclass"
+                )
+            )
+            reltuples = result.scalar()
+            # 一度もANALYZEされていないテーブルは -1 になる
+            if reltuples is not None and reltuples >= 0:
+                return int(reltuples)
+
+        result = await session.execute(
+            text(
+                "EXPLAIN (FORMAT JSON) "
+                f"SELECT 1 FROM conversations c WHERE {filter_clause}"
+            ),
+            params,
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+    async def search_by_text(
+        self,
+        query: str,
+        speaker_id: int | None = None,
+        speaker_name: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        governing_body_id: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[ConversationSearchHit]:
+        """Search conversation text with the full-text index, ranked by relevance.
+
+        ja_bigram_tsvector(comment) のGINインデックスで候補を絞り込み、
+        正規化した本文に検索語が含まれるかを確認する。関連度は検索語の
+        出現回数を本文の長さの対数で割った値で、長い発言ほど割り引かれる。
+        """
+        terms = _search_terms(query)
+        if not terms:
+            return []
 
-        # Count query
-        count_query = text(f"""
-            SELECT COUNT(*)
-            FROM conversations c
-            LEFT JOIN minutes mi ON c.minutes_id = mi.id
-            LEFT JOIN meetings m ON mi.meeting_id = m.id
-            WHERE {where_clause}
-        """)
+        session = self.async_session or self.sync_session
+        if session is None:
+            # This should never happen
+            return []
 
-        # Data query
-        data_query = text(f"""
+        params: dict[str, Any] = {
+            "tsquery": _to_bigram_tsquery(terms),
+            "limit": limit,
+            "offset": offset,
+        }
+        conditions = [
+            "ja_bigram_tsvector(c.comment) @@ CAST(:tsquery AS tsquery)",
+        ]
+        occurrences: list[str] = []
+        for i, term in enumerate(terms):
+            params[f"term_{i}"] = term
+            conditions.append(f"strpos(n.body, CAST(:term_{i} AS text)) > 0")
+            occurrences.append(
+                f"(char_length(n.body) - char_length("
+                f"replace(n.body, CAST(:term_{i} AS text), ''))) / {len(term)}"
+            )
+        if speaker_id is not None:
+            conditions.append("c.speaker_id = :speaker_id")
+            params["speaker_id"] = speaker_id
+        if speaker_name:
+            conditions.append("c.speaker_name ILIKE :speaker_name")
+            params["speaker_name"] = f"%{speaker_name}%"
+        if start_date is not None:
+            conditions.append("m.date >= :start_date")
+            params["start_date"] = start_date
+        if end_date is not None:
+            conditions.append("m.date <= :end_date")
+            params["end_date"] = end_date
+        if governing_body_id is not None:
+            conditions.append("conf.governing_body_id = :governing_body_id")
+            params["governing_body_id"] = governing_body_id
+
+        search_query = text(f"""
             SELECT
-                c.id,
-                c.speaker_name,
-                c.comment,
-                c.sequence_number,
-                c.chapter_number,
-                c.sub_chapter_number,
-                c.speaker_id,
-                c.minutes_id,
-                m.name as meeting_title,
-                m.date as meeting_date,
-                s.name as linked_speaker_name,
-                s.type as speaker_type,
-                s.political_party_name as speaker_party_name,
-                gb.name as governing_body_name,
-                gb.organization_type as governing_body_type,
-                conf.name as conference_name,
-                p.id as politician_id,
-                p.name as politician_name,
-                pp.name as politician_party_name,
-                p.position as politician_position,
-                CASE WHEN p.id IS NOT NULL THEN TRUE ELSE FALSE END
-                    as speaker_is_politician
+                c.*,
+                m.id AS meeting_id,
+                m.date AS meeting_date,
+                m.name AS meeting_name,
+                gb.id AS governing_body_id,
+                gb.name AS governing_body_name,
+                ({" + ".join(occurrences)})::float
+                    / (1 + ln(1 + char_length(n.body))) AS score
             FROM conversations c
+            CROSS JOIN LATERAL (SELECT ja_search_normalize(c.comment) AS body) n
             LEFT JOIN minutes mi ON c.minutes_id = mi.id
             LEFT JOIN meetings m ON mi.meeting_id = m.id
-            LEFT JOIN speakers s ON c.speaker_id = s.id
             LEFT JOIN conferences conf ON m.conference_id = conf.id
             LEFT JOIN governing_bodies gb ON conf.governing_body_id = gb.id
-            LEFT JOIN politicians p ON s.id = p.speaker_id
-            LEFT JOIN party_membership_history pmh
-                ON p.id = pmh.politician_id AND pmh.end_date IS NULL
-            LEFT JOIN political_parties pp ON pmh.political_party_id = pp.id
-            WHERE {where_clause}
-            ORDER BY c.id DESC
+            WHERE {" AND ".join(conditions)}
+            ORDER BY score DESC, m.date DESC NULLS LAST, c.id
             LIMIT :limit OFFSET :offset
         """)
-
-        if self.async_session is not None:
-            # Get total count
-            count_result = await self.async_session.execute(count_query, params)
-            total_count = count_result.scalar() or 0
-
-            # Get data
-            data_result = await self.async_session.execute(data_query, params)
-            rows = data_result.fetchall()
-        elif self.sync_session is not None:
-            # Sync implementation
-            count_result = self.sync_session.execute(count_query, params)
-            total_count = count_result.scalar() or 0
-
-            data_result = self.sync_session.execute(data_query, params)
-            rows = data_result.fetchall()
-        else:
-            # This should never happen
-            return {
-                "conversations": [],
-                "total_count": 0,
-                "total_pages": 0,
-                "current_page": page,
-                "page_size": page_size,
-            }
-
-        # Format results
-        conversations = []
-        for row in rows:
-            conversations.append(
-                {
-                    "id": row.id,
-                    "speaker_name": row.speaker_name,
-                    "comment": row.comment[:100] + "..."
-                    if len(row.comment) > 100
-                    else row.comment,
-                    "sequence_number": row.sequence_number,
-                    "chapter_number": row.chapter_number,
-                    "sub_chapter_number": row.sub_chapter_number,
-                    "speaker_id": row.speaker_id,
-                    "minutes_id": row.minutes_id,
-                    "meeting_title": row.meeting_title,
-                    "meeting_date": row.meeting_date,
-                    "linked_speaker_name": row.linked_speaker_name,
-                    "speaker_type": row.speaker_type,
-                    "speaker_party_name": row.speaker_party_name,
-                    "governing_body_name": row.governing_body_name,
-                    "governing_body_type": row.governing_body_type,
-                    "conference_name": row.conference_name,
-                    "politician_id": row.politician_id,
-                    "politician_name": row.politician_name,
-                    "politician_party_name": row.politician_party_name,
-                    "politician_position": row.politician_position,
-                    "speaker_is_politician": row.speaker_is_politician,
-                }
+        result = await session.execute(search_query, params)
+
+        return [
+            ConversationSearchHit(
+                conversation=self._to_entity(row),
+                score=float(row.score),
+                meeting_id=row.meeting_id,
+                meeting_date=row.meeting_date,
+                meeting_name=row.meeting_name,
+                governing_body_id=row.governing_body_id,
+                governing_body_name=row.governing_body_name,
             )
-
-        total_pages = (total_count + page_size - 1) // page_size
-
-        return {
-            "conversations": conversations,
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "page_size": page_size,
-        }
+            for row in result.fetchall()
+        ]
 
     async def update_speaker_links(self) -> int:
         """Update speaker links for conversations."""
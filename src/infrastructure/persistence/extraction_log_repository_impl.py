@@ -1,11 +1,22 @@
 """ExtractionLog repository implementation using SQLAlchemy."""
 
+import json
 import logging
 
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, and_, cast, func
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    and_,
+    cast,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +35,9 @@ from src.infrastructure.persistence.base_repository_impl import BaseRepositoryIm
 
 logger = logging.getLogger(__name__)
 
+# bulk_createで1回のINSERTに含める行数（文・パラメータサイズの上限）
+BULK_INSERT_CHUNK_SIZE = 5000
+
 Base = declarative_base()
 
 
@@ -112,6 +126,86 @@ class ExtractionLogRepositoryImpl(
                 f"Failed to retrieve extraction logs for {entity_type.value}"
             ) from e
 
+    async def bulk_create(self, logs: list[ExtractionLog]) -> list[ExtractionLog]:
+        """Create extraction logs with set-based INSERT statements.
+
+        IDs are reserved from the extraction_logs sequence up front so that the
+        returned entities carry their IDs in input order, then each chunk is
+        inserted with a single ``INSERT ... SELECT FROM unnest(...)``.
+
+        Args:
+            logs: Extraction logs to create
+
+        Returns:
+            The same logs with IDs assigned, in input order
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not logs:
+            return []
+
+        try:
+            id_result = await self.session.execute(
+                text("""
+                    SELECT nextval(pg_get_serial_sequence('extraction_logs', 'id'))
+                    FROM generate_series(1, :count)
+                """),
+                {"count": len(logs)},
+            )
+            ids = [row[0] for row in id_result.fetchall()]
+
+            insert_query = text("""
+                INSERT INTO extraction_logs
+                (id, entity_type, entity_id, pipeline_version, extracted_data,
+                 confidence_score, extraction_metadata, created_at, updated_at)
+                SELECT v.id, CAST(v.entity_type AS entity_type), v.entity_id,
+                       v.pipeline_version, CAST(v.extracted_data AS jsonb),
+                       v.confidence_score, CAST(v.extraction_metadata AS jsonb),
+                       :now, :now
+                FROM unnest(
+                    CAST(:ids AS integer[]),
+                    CAST(:entity_types AS text[]),
+                    CAST(:entity_ids AS integer[]),
+                    CAST(:pipeline_versions AS varchar[]),
+                    CAST(:extracted_data AS text[]),
+                    CAST(:confidence_scores AS float8[]),
+                    CAST(:extraction_metadata AS text[])
+                ) AS v(id, entity_type, entity_id, pipeline_version, extracted_data,
+                       confidence_score, extraction_metadata)
+            """)
+            now = datetime.utcnow()
+            for start in range(0, len(logs), BULK_INSERT_CHUNK_SIZE):
+                chunk = logs[start : start + BULK_INSERT_CHUNK_SIZE]
+                await self.session.execute(
+                    insert_query,
+                    {
+                        "ids": ids[start : start + len(chunk)],
+                        "entity_types": [log.entity_type.value for log in chunk],
+                        "entity_ids": [log.entity_id for log in chunk],
+                        "pipeline_versions": [log.pipeline_version for log in chunk],
+                        "extracted_data": [
+                            json.dumps(log.extracted_data, ensure_ascii=False)
+                            for log in chunk
+                        ],
+                        "confidence_scores": [log.confidence_score for log in chunk],
+                        "extraction_metadata": [
+                            json.dumps(log.extraction_metadata, ensure_ascii=False)
+                            for log in chunk
+                        ],
+                        "now": now,
+                    },
+                )
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to bulk create {len(logs)} extraction logs: {e}")
+            raise DatabaseError("Failed to bulk create extraction logs") from e
+
+        for log, log_id in zip(logs, ids, strict=True):
+            log.id = log_id
+            log.created_at = now
+            log.updated_at = now
+        return logs
+
     async def get_by_pipeline_version(
         self,
         version: str,
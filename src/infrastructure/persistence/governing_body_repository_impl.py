@@ -11,13 +11,28 @@ from src.domain.repositories.governing_body_repository import (
 )
 from src.domain.repositories.session_adapter import ISessionAdapter
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.reference_data_cache import (
+    CONFERENCES,
+    GOVERNING_BODIES,
+    PARLIAMENTARY_GROUPS,
+    ReferenceDataCacheMixin,
+)
 from src.infrastructure.persistence.sqlalchemy_models import GoverningBodyModel
 
 
 class GoverningBodyRepositoryImpl(
-    BaseRepositoryImpl[GoverningBody], IGoverningBodyRepository
+    ReferenceDataCacheMixin[GoverningBody],
+    BaseRepositoryImpl[GoverningBody],
+    IGoverningBodyRepository,
 ):
-    """Implementation of GoverningBodyRepository using SQLAlchemy ORM."""
+    """Implementation of GoverningBodyRepository using SQLAlchemy ORM.
+
+    全件・IDでの取得は参照データキャッシュを経由する。
+    """
+
+    _reference_table = GOVERNING_BODIES
+    # 開催主体名をJOINして返しているキャッシュ
+    _dependent_reference_tables = (CONFERENCES, PARLIAMENTARY_GROUPS)
 
     def __init__(self, session: AsyncSession | ISessionAdapter):
         super().__init__(session, GoverningBody, GoverningBodyModel)
@@ -26,6 +41,14 @@ class GoverningBodyRepositoryImpl(
         self, limit: int | None = None, offset: int | None = None
     ) -> list[GoverningBody]:
         """Get all governing bodies with conference count."""
+        cache = self._reference_cache
+        if cache is not None and not limit and not offset:
+            return await cache.get_all(self._fetch_all)
+        return await self._fetch_all(limit, offset)
+
+    async def _fetch_all(
+        self, limit: int | None = None, offset: int | None = None
+    ) -> list[GoverningBody]:
         query = text("""
             SELECT gb.*,
                    COUNT(c.id) as conference_count
@@ -55,6 +78,10 @@ class GoverningBodyRepositoryImpl(
 
     async def get_by_id(self, entity_id: int) -> GoverningBody | None:
         """Get governing body by ID with conference count."""
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_id(entity_id, self._fetch_all)
+
         query = text("""
             SELECT gb.*,
                    COUNT(c.id) as conference_count
@@ -77,6 +104,10 @@ class GoverningBodyRepositoryImpl(
         """Get governing bodies by their IDs."""
         if not entity_ids:
             return []
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_ids(entity_ids, self._fetch_all)
+
         placeholders = ", ".join(f":id_{i}" for i in range(len(entity_ids)))
         query = text(f"""
             SELECT gb.*,
@@ -96,6 +127,13 @@ class GoverningBodyRepositoryImpl(
         self, name: str, type: str | None = None
     ) -> GoverningBody | None:
         """Get governing body by name and type."""
+        cache = self._reference_cache
+        if cache is not None:
+            for governing_body in await cache.get_by_name(name, self._fetch_all):
+                if type is None or governing_body.type == type:
+                    return governing_body
+            return None
+
         conditions = ["name = :name"]
         params: dict[str, Any] = {"name": name}
 
@@ -191,6 +229,7 @@ class GoverningBodyRepositoryImpl(
 
         result = await self.session.execute(query, params)
         await self.session.commit()
+        self._invalidate_reference_cache()
 
         row = result.first()
         if row:
@@ -223,6 +262,7 @@ class GoverningBodyRepositoryImpl(
 
         result = await self.session.execute(query, params)
         await self.session.commit()
+        self._invalidate_reference_cache()
 
         row = result.first()
         if row:
@@ -246,6 +286,7 @@ class GoverningBodyRepositoryImpl(
         query = text("DELETE FROM governing_bodies WHERE id = :id")
         result = await self.session.execute(query, {"id": entity_id})
         await self.session.commit()
+        self._invalidate_reference_cache()
 
         return result.rowcount > 0  # type: ignore[attr-defined]
 
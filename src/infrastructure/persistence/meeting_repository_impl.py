@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.entities.meeting import Meeting
 from src.domain.repositories.meeting_repository import MeetingRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
+from src.infrastructure.persistence.advisory_locks import MEETING_IMPORT_LOCK_NAMESPACE
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 from src.infrastructure.persistence.sqlalchemy_models import MeetingModel
 
@@ -207,6 +208,47 @@ class MeetingRepositoryImpl(BaseRepositoryImpl[Meeting], MeetingRepository):
             return self._to_entity(row)
         return None
 
+    async def get_urls_with_conversations(self, urls: list[str]) -> set[str]:
+        """指定URLのうち、発言（Conversation）が1件以上ある会議のURLを取得する."""
+        if not urls:
+            return set()
+        sql = text(
+            "SELECT DISTINCT m.url FROM meetings m "
+            "JOIN minutes min ON min.meeting_id = m.id "
+            "WHERE m.url = ANY(:urls) "
+            "AND EXISTS (SELECT 1 FROM conversations c WHERE c.minutes_id = min.id)"
+        )
+        result = await self.session.execute(sql, {"urls": list(urls)})
+        return {row[0] for row in result.fetchall()}
+
+    async def get_pending_minutes_processing(
+        self, limit: int | None = None
+    ) -> list[Meeting]:
+        """議事録テキストがあり、発言（Conversation）がまだない会議を取得する."""
+        sql = """
+            SELECT m.* FROM meetings m
+            WHERE m.gcs_text_uri IS NOT NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM minutes min
+                JOIN conversations c ON c.minutes_id = min.id
+                WHERE min.meeting_id = m.id
+            )
+            ORDER BY m.date DESC, m.id
+        """
+        params: dict[str, Any] = {}
+        if limit:
+            sql += " LIMIT :limit"
+            params["limit"] = limit
+        result = await self.session.execute(text(sql), params if params else None)
+        return [self._to_entity(row) for row in result.fetchall()]
+
+    async def lock_for_import(self, key: str) -> None:
+        """会議の取り込みを直列化するadvisory lockを取得する（コミットまで保持）."""
+        sql = text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:key))")
+        await self.session.execute(
+            sql, {"namespace": MEETING_IMPORT_LOCK_NAMESPACE, "key": key}
+        )
+
     async def get_by_chamber_and_date_range(
         self, chamber: str, date_from: date, date_to: date
     ) -> list[Meeting]:
@@ -1,4 +1,9 @@
-"""Monitoring repository implementation for Clean Architecture."""
+"""Monitoring repository implementation for Clean Architecture.
+
+件数・カバレッジの集計はマテリアライズドビュー（alembic 047）から読み込む。
+ビューは refresh_aggregates（`sagebase refresh-monitoring`）で更新し、
+各結果の refreshed_at に最後に更新した時刻を含める。
+"""
 
 from typing import Any, TypedDict
 
@@ -8,6 +13,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.repositories.session_adapter import ISessionAdapter
 
 
+# 集計を保持するマテリアライズドビュー（更新順）
+MONITORING_MATERIALIZED_VIEWS = (
+    "mv_monitoring_overall",
+    "mv_conference_coverage",
+    "mv_governing_body_coverage",
+    "mv_party_coverage",
+)
+
+
+def _isoformat(value: Any) -> str | None:
+    """日付・日時をISO形式の文字列にする（文字列・Noneはそのまま）."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
 class ActivityDetails(TypedDict, total=False):
     """Type definition for activity details."""
 
@@ -37,6 +58,7 @@ class ConferenceCoverage(TypedDict):
     politicians: int
     conversations: int
     period: dict[str, str | None]
+    refreshed_at: str | None
 
 
 class TimelineEntry(TypedDict):
@@ -54,6 +76,7 @@ class PartyCoverage(TypedDict):
     politicians: int
     speakers: int
     conversations: int
+    refreshed_at: str | None
 
 
 class PrefectureCoverage(TypedDict):
@@ -70,6 +93,7 @@ class PrefectureCoverage(TypedDict):
     politicians: int
     conversations: int
     period: dict[str, str | None]
+    refreshed_at: str | None
 
 
 class PrefectureSummary(TypedDict):
@@ -87,6 +111,7 @@ class CommitteeType(TypedDict):
     conferences: int
     meetings: int
     governing_bodies: int
+    refreshed_at: str | None
 
 
 class MonitoringRepositoryImpl:
@@ -97,35 +122,7 @@ class MonitoringRepositoryImpl:
 
     async def get_overall_metrics(self) -> dict[str, Any]:
         """Get overall system metrics."""
-        query = text("""
-            WITH metrics AS (
-                SELECT
-                    (SELECT COUNT(*) FROM governing_bodies) as total_governing_bodies,
-                    (SELECT COUNT(DISTINCT governing_body_id) FROM conferences)
-                        as active_governing_bodies,
-                    (SELECT COUNT(*) FROM conferences) as total_conferences,
-                    (SELECT COUNT(DISTINCT conference_id) FROM meetings)
-                        as active_conferences,
-                    (SELECT COUNT(*) FROM meetings) as total_meetings,
-                    (SELECT COUNT(*) FROM politicians) as total_politicians,
-                    (SELECT COUNT(DISTINCT p.id)
-                     FROM politicians p
-                     JOIN conference_members cm ON p.id = cm.politician_id)
-                        as active_politicians,
-                    (SELECT COUNT(*) FROM political_parties) as total_parties,
-                    (SELECT COUNT(DISTINCT pmh.political_party_id)
-                     FROM party_membership_history pmh
-                     WHERE pmh.end_date IS NULL) as active_parties,
-                    (SELECT COUNT(*) FROM conversations) as total_conversations,
-                    (SELECT COUNT(DISTINCT speaker_id) FROM conversations
-                     WHERE speaker_id IS NOT NULL) as linked_conversations,
-                    (SELECT COUNT(*) FROM speakers) as total_speakers,
-                    (SELECT COUNT(*) FROM speakers
-                     WHERE type = 'politician' OR type = '政治家')
-                        as linked_speakers
-            )
-            SELECT * FROM metrics
-        """)
+        query = text("SELECT * FROM mv_monitoring_overall")
 
         result = await self.session.execute(query)
         row = result.fetchone()
@@ -139,6 +136,7 @@ class MonitoringRepositoryImpl:
                 "parties": {"total": 0, "active": 0, "coverage": 0.0},
                 "conversations": {"total": 0, "linked": 0, "linkage_rate": 0.0},
                 "speakers": {"total": 0, "linked": 0, "linkage_rate": 0.0},
+                "refreshed_at": None,
             }
 
         return {
@@ -197,6 +195,7 @@ class MonitoringRepositoryImpl:
                     else 0.0
                 ),
             },
+            "refreshed_at": _isoformat(row.refreshed_at),
         }
 
     async def get_recent_activities(self, limit: int = 10) -> list[Activity]:
@@ -276,22 +275,7 @@ class MonitoringRepositoryImpl:
     async def get_conference_coverage(self) -> list[ConferenceCoverage]:
         """Get coverage statistics by conference."""
         query = text("""
-            SELECT
-                c.id,
-                c.name,
-                gb.name as governing_body_name,
-                COUNT(DISTINCT m.id) as meeting_count,
-                COUNT(DISTINCT cm.politician_id) as politician_count,
-                COUNT(DISTINCT conv.id) as conversation_count,
-                MIN(m.date) as first_meeting_date,
-                MAX(m.date) as last_meeting_date
-            FROM conferences c
-            JOIN governing_bodies gb ON c.governing_body_id = gb.id
-            LEFT JOIN meetings m ON c.id = m.conference_id
-            LEFT JOIN conference_members cm ON c.id = cm.conference_id
-            LEFT JOIN minutes min ON m.id = min.meeting_id
-            LEFT JOIN conversations conv ON min.id = conv.minutes_id
-            GROUP BY c.id, c.name, gb.name
+            SELECT * FROM mv_conference_coverage
             ORDER BY meeting_count DESC
         """)
 
@@ -308,22 +292,46 @@ class MonitoringRepositoryImpl:
                     "politicians": row.politician_count,
                     "conversations": row.conversation_count,
                     "period": {
-                        "start": (
-                            row.first_meeting_date.isoformat()
-                            if row.first_meeting_date
-                            else None
-                        ),
-                        "end": (
-                            row.last_meeting_date.isoformat()
-                            if row.last_meeting_date
-                            else None
-                        ),
+                        "start": _isoformat(row.first_meeting_date),
+                        "end": _isoformat(row.last_meeting_date),
                     },
+                    "refreshed_at": _isoformat(row.refreshed_at),
                 }
             )
 
         return coverage_data
 
+    async def refresh_aggregates(self, concurrently: bool = True) -> list[str]:
+        """Refresh the monitoring materialized views.
+
+        CONCURRENTLY で更新すると、更新中も画面から古い集計を読み込める。
+        コミットは呼び出し側で行う。
+
+        Args:
+            concurrently: 読み込みをブロックせずに更新するか
+
+        Returns:
+            更新したビュー名
+        """
+        option = "CONCURRENTLY " if concurrently else ""
+        for view_name in MONITORING_MATERIALIZED_VIEWS:
+            await self.session.execute(
+                text(f"REFRESH MATERIALIZED VIEW {option}{view_name}")
+            )
+        return list(MONITORING_MATERIALIZED_VIEWS)
+
+    async def get_aggregates_refreshed_at(self) -> dict[str, str | None]:
+        """Get the last refresh time of each monitoring materialized view."""
+        query = text(
+            " UNION ALL ".join(
+                f"SELECT '{view_name}' as view_name, MAX(refreshed_at) as refreshed_at "
+                f"FROM {view_name}"
+                for view_name in MONITORING_MATERIALIZED_VIEWS
+            )
+        )
+        result = await self.session.execute(query)
+        return {row.view_name: _isoformat(row.refreshed_at) for row in result}
+
     async def get_timeline_data(
         self, period_days: int = 30
     ) -> dict[str, list[TimelineEntry]]:
@@ -447,19 +455,7 @@ class MonitoringRepositoryImpl:
     async def get_party_coverage(self) -> list[PartyCoverage]:
         """Get coverage statistics by political party."""
         query = text("""
-            SELECT
-                pp.id,
-                pp.name,
-                COUNT(DISTINCT p.id) as politician_count,
-                COUNT(DISTINCT s.id) as speaker_count,
-                COUNT(DISTINCT c.id) as conversation_count
-            FROM political_parties pp
-            LEFT JOIN party_membership_history pmh
-                ON pp.id = pmh.political_party_id AND pmh.end_date IS NULL
-            LEFT JOIN politicians p ON pmh.politician_id = p.id
-            LEFT JOIN speakers s ON pp.name = s.political_party_name
-            LEFT JOIN conversations c ON s.id = c.speaker_id
-            GROUP BY pp.id, pp.name
+            SELECT * FROM mv_party_coverage
             ORDER BY politician_count DESC
         """)
 
@@ -474,6 +470,7 @@ class MonitoringRepositoryImpl:
                     "politicians": row.politician_count,
                     "speakers": row.speaker_count,
                     "conversations": row.conversation_count,
+                    "refreshed_at": _isoformat(row.refreshed_at),
                 }
             )
 
@@ -482,38 +479,16 @@ class MonitoringRepositoryImpl:
     async def get_prefecture_detailed_coverage(self) -> list[PrefectureCoverage]:
         """Get detailed coverage statistics by prefecture."""
         query = text("""
-            WITH prefecture_stats AS (
-                SELECT
-                    gb.id,
-                    gb.name,
-                    gb.type,
-                    gb.organization_code,
-                    gb.organization_type,
-                    COUNT(DISTINCT c.id) as conference_count,
-                    COUNT(DISTINCT m.id) as meeting_count,
-                    COUNT(DISTINCT cm.politician_id) as politician_count,
-                    COUNT(DISTINCT conv.id) as conversation_count,
-                    MIN(m.date) as first_meeting_date,
-                    MAX(m.date) as last_meeting_date
-                FROM governing_bodies gb
-                LEFT JOIN conferences c ON gb.id = c.governing_body_id
-                LEFT JOIN meetings m ON c.id = m.conference_id
-                LEFT JOIN conference_members cm ON c.id = cm.conference_id
-                LEFT JOIN minutes min ON m.id = min.meeting_id
-                LEFT JOIN conversations conv ON min.id = conv.minutes_id
-                WHERE gb.type IN ('都道府県', '市町村')
-                GROUP BY gb.id, gb.name, gb.type,
-                    gb.organization_code, gb.organization_type
-            )
             SELECT
-                ps.*,
+                gbc.*,
                 CASE
-                    WHEN ps.meeting_count > 0 THEN 'active'
-                    WHEN ps.conference_count > 0 THEN 'partial'
+                    WHEN gbc.meeting_count > 0 THEN 'active'
+                    WHEN gbc.conference_count > 0 THEN 'partial'
                     ELSE 'inactive'
                 END as status
-            FROM prefecture_stats ps
-            ORDER BY ps.type, ps.name
+            FROM mv_governing_body_coverage gbc
+            WHERE gbc.type IN ('都道府県', '市町村')
+            ORDER BY gbc.type, gbc.name
         """)
 
         result = await self.session.execute(query)
@@ -533,17 +508,10 @@ class MonitoringRepositoryImpl:
                     "politicians": row.politician_count,
                     "conversations": row.conversation_count,
                     "period": {
-                        "start": (
-                            row.first_meeting_date.isoformat()
-                            if row.first_meeting_date
-                            else None
-                        ),
-                        "end": (
-                            row.last_meeting_date.isoformat()
-                            if row.last_meeting_date
-                            else None
-                        ),
+                        "start": _isoformat(row.first_meeting_date),
+                        "end": _isoformat(row.last_meeting_date),
                     },
+                    "refreshed_at": _isoformat(row.refreshed_at),
                 }
             )
 
@@ -552,31 +520,32 @@ class MonitoringRepositoryImpl:
     async def get_prefecture_coverage(self) -> dict[str, Any]:
         """Get summary of prefecture coverage."""
         query = text("""
-            WITH coverage AS (
-                SELECT
-                    gb.type,
-                    COUNT(DISTINCT gb.id) as total,
-                    COUNT(DISTINCT CASE
-                        WHEN m.id IS NOT NULL THEN gb.id END) as with_data
-                FROM governing_bodies gb
-                LEFT JOIN conferences c ON gb.id = c.governing_body_id
-                LEFT JOIN meetings m ON c.id = m.conference_id
-                WHERE gb.type IN ('都道府県', '市町村')
-                GROUP BY gb.type
-            )
             SELECT
                 type,
-                total,
-                with_data,
-                ROUND(CAST(CAST(with_data AS REAL) / total * 100 AS NUMERIC), 2)
-                    as coverage_percentage
-            FROM coverage
+                COUNT(*) as total,
+                COUNT(*) FILTER (WHERE meeting_count > 0) as with_data,
+                ROUND(
+                    CAST(
+                        CAST(COUNT(*) FILTER (WHERE meeting_count > 0) AS REAL)
+                        / COUNT(*) * 100 AS NUMERIC
+                    ),
+                    2
+                ) as coverage_percentage,
+                MAX(refreshed_at) as refreshed_at
+            FROM mv_governing_body_coverage
+            WHERE type IN ('都道府県', '市町村')
+            GROUP BY type
         """)
 
         result = await self.session.execute(query)
-        summary: dict[str, Any] = {"prefectures": {}, "municipalities": {}}
+        summary: dict[str, Any] = {
+            "prefectures": {},
+            "municipalities": {},
+            "refreshed_at": None,
+        }
 
         for row in result:
+            summary["refreshed_at"] = _isoformat(row.refreshed_at)
             data: PrefectureSummary = {
                 "total": row.total,
                 "with_data": row.with_data,
@@ -594,14 +563,14 @@ class MonitoringRepositoryImpl:
         """Get coverage by committee type."""
         query = text("""
             SELECT
-                gb.type as committee_type,
-                COUNT(DISTINCT c.id) as conference_count,
-                COUNT(DISTINCT m.id) as meeting_count,
-                COUNT(DISTINCT gb.id) as governing_body_count
-            FROM conferences c
-            LEFT JOIN meetings m ON c.id = m.conference_id
-            LEFT JOIN governing_bodies gb ON c.governing_body_id = gb.id
-            GROUP BY gb.type
+                type as committee_type,
+                SUM(conference_count) as conference_count,
+                SUM(meeting_count) as meeting_count,
+                COUNT(*) as governing_body_count,
+                MAX(refreshed_at) as refreshed_at
+            FROM mv_governing_body_coverage
+            WHERE conference_count > 0
+            GROUP BY type
             ORDER BY conference_count DESC
         """)
 
@@ -612,9 +581,10 @@ class MonitoringRepositoryImpl:
             committee_data.append(
                 {
                     "type": row.committee_type or "未分類",
-                    "conferences": row.conference_count,
-                    "meetings": row.meeting_count,
+                    "conferences": int(row.conference_count),
+                    "meetings": int(row.meeting_count),
                     "governing_bodies": row.governing_body_count,
+                    "refreshed_at": _isoformat(row.refreshed_at),
                 }
             )
 
@@ -16,17 +16,42 @@ from src.domain.repositories.parliamentary_group_repository import (
 )
 from src.domain.repositories.session_adapter import ISessionAdapter
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.reference_data_cache import (
+    PARLIAMENTARY_GROUPS,
+    ReferenceDataCacheMixin,
+)
 from src.infrastructure.persistence.sqlalchemy_models import ParliamentaryGroupModel
 
 
 class ParliamentaryGroupRepositoryImpl(
-    BaseRepositoryImpl[ParliamentaryGroup], IParliamentaryGroupRepository
+    ReferenceDataCacheMixin[ParliamentaryGroup],
+    BaseRepositoryImpl[ParliamentaryGroup],
+    IParliamentaryGroupRepository,
 ):
-    """Implementation of ParliamentaryGroupRepository using SQLAlchemy ORM."""
+    """Implementation of ParliamentaryGroupRepository using SQLAlchemy ORM.
+
+    全件・ID・名前での取得は参照データキャッシュを経由する。
+    """
+
+    _reference_table = PARLIAMENTARY_GROUPS
 
     def __init__(self, session: AsyncSession | ISessionAdapter):
         super().__init__(session, ParliamentaryGroup, ParliamentaryGroupModel)
 
+    async def get_by_id(self, entity_id: int) -> ParliamentaryGroup | None:
+        """Get parliamentary group by ID."""
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_id(entity_id, self._fetch_all)
+        return await super().get_by_id(entity_id)
+
+    async def get_by_ids(self, entity_ids: list[int]) -> list[ParliamentaryGroup]:
+        """Get parliamentary groups by their IDs."""
+        cache = self._reference_cache
+        if cache is not None and entity_ids:
+            return await cache.get_by_ids(entity_ids, self._fetch_all)
+        return await super().get_by_ids(entity_ids)
+
     async def create(self, entity: ParliamentaryGroup) -> ParliamentaryGroup:
         """Create a new parliamentary group using raw SQL."""
         query = text(
@@ -61,6 +86,7 @@ class ParliamentaryGroupRepositoryImpl(
             },
         )
         row = result.fetchone()
+        self._invalidate_reference_cache()
 
         if row:
             return self._to_entity(row)
@@ -102,15 +128,31 @@ class ParliamentaryGroupRepositoryImpl(
             },
         )
         row = result.fetchone()
+        self._invalidate_reference_cache()
 
         if row:
             return self._to_entity(row)
         raise ValueError(f"Parliamentary group with ID {entity.id} not found")
 
+    async def delete(self, entity_id: int) -> bool:
+        """Delete a parliamentary group by ID."""
+        deleted = await super().delete(entity_id)
+        self._invalidate_reference_cache()
+        return deleted
+
     async def get_by_name_and_governing_body(
         self, name: str, governing_body_id: int, chamber: str = ""
     ) -> ParliamentaryGroup | None:
         """Get parliamentary group by name and governing body."""
+        cache = self._reference_cache
+        if cache is not None:
+            for group in await cache.get_by_name(name, self._fetch_all):
+                if group.governing_body_id == governing_body_id and (
+                    group.chamber == chamber
+                ):
+                    return group
+            return None
+
         query = text("""
             SELECT * FROM parliamentary_groups
             WHERE name = :name AND governing_body_id = :gb_id
@@ -177,6 +219,14 @@ class ParliamentaryGroupRepositoryImpl(
         self, limit: int | None = None, offset: int | None = 0
     ) -> list[ParliamentaryGroup]:
         """Get all parliamentary groups."""
+        cache = self._reference_cache
+        if cache is not None and limit is None and not offset:
+            return await cache.get_all(self._fetch_all)
+        return await self._fetch_all(limit, offset)
+
+    async def _fetch_all(
+        self, limit: int | None = None, offset: int | None = 0
+    ) -> list[ParliamentaryGroup]:
         query_text = """
             SELECT pg.*, gb.name as governing_body_name
             FROM parliamentary_groups pg
@@ -11,19 +11,49 @@ from src.domain.repositories.political_party_repository import (
 )
 from src.domain.repositories.session_adapter import ISessionAdapter
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.reference_data_cache import (
+    POLITICAL_PARTIES,
+    ReferenceDataCacheMixin,
+)
 from src.infrastructure.persistence.sqlalchemy_models import PoliticalPartyModel
 
 
 class PoliticalPartyRepositoryImpl(
-    BaseRepositoryImpl[PoliticalParty], IPoliticalPartyRepository
+    ReferenceDataCacheMixin[PoliticalParty],
+    BaseRepositoryImpl[PoliticalParty],
+    IPoliticalPartyRepository,
 ):
-    """Implementation of PoliticalPartyRepository using SQLAlchemy ORM."""
+    """Implementation of PoliticalPartyRepository using SQLAlchemy ORM.
+
+    全件・ID・名前での取得は参照データキャッシュを経由する。
+    """
+
+    _reference_table = POLITICAL_PARTIES
 
     def __init__(self, session: AsyncSession | ISessionAdapter):
         super().__init__(session, PoliticalParty, PoliticalPartyModel)
 
+    async def get_by_id(self, entity_id: int) -> PoliticalParty | None:
+        """Get political party by ID."""
+        cache = self._reference_cache
+        if cache is not None:
+            return await cache.get_by_id(entity_id, self._fetch_all)
+        return await super().get_by_id(entity_id)
+
+    async def get_by_ids(self, entity_ids: list[int]) -> list[PoliticalParty]:
+        """Get political parties by their IDs."""
+        cache = self._reference_cache
+        if cache is not None and entity_ids:
+            return await cache.get_by_ids(entity_ids, self._fetch_all)
+        return await super().get_by_ids(entity_ids)
+
     async def get_by_name(self, name: str) -> PoliticalParty | None:
         """Get political party by name."""
+        cache = self._reference_cache
+        if cache is not None:
+            parties = await cache.get_by_name(name, self._fetch_all)
+            return parties[0] if parties else None
+
         query = (
             select(PoliticalPartyModel).where(PoliticalPartyModel.name == name).limit(1)
         )
@@ -59,6 +89,14 @@ class PoliticalPartyRepositoryImpl(
         self, limit: int | None = None, offset: int | None = 0
     ) -> list[PoliticalParty]:
         """Get all political parties."""
+        cache = self._reference_cache
+        if cache is not None and limit is None and not offset:
+            return await cache.get_all(self._fetch_all)
+        return await self._fetch_all(limit, offset)
+
+    async def _fetch_all(
+        self, limit: int | None = None, offset: int | None = 0
+    ) -> list[PoliticalParty]:
         query = select(PoliticalPartyModel).order_by(PoliticalPartyModel.name)
         if offset:
             query = query.offset(offset)
@@ -68,6 +106,24 @@ class PoliticalPartyRepositoryImpl(
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def create(self, entity: PoliticalParty) -> PoliticalParty:
+        """Create a new political party."""
+        created = await super().create(entity)
+        self._invalidate_reference_cache()
+        return created
+
+    async def update(self, entity: PoliticalParty) -> PoliticalParty:
+        """Update an existing political party."""
+        updated = await super().update(entity)
+        self._invalidate_reference_cache()
+        return updated
+
+    async def delete(self, entity_id: int) -> bool:
+        """Delete a political party by ID."""
+        deleted = await super().delete(entity_id)
+        self._invalidate_reference_cache()
+        return deleted
+
     def _to_entity(self, model: Any) -> PoliticalParty:
         """Convert database model to domain entity."""
         if model is None:
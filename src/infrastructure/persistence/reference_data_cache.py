@@ -0,0 +1,252 @@
+"""参照データ（開催主体・会議体・政党・会派）の読み込みキャッシュ
+
+これらのテーブルは年に数回しか変わらないが、Streamlitの画面描画・マッチング・
+インポートのたびに get_all などで何度も読み込まれる。テーブル全体をプロセス内に
+TTL付きで保持し、全件・ID・名前での参照をデータベースに問い合わせずに返す。
+
+キャッシュは同じリポジトリ経由の書き込みで破棄する。書き込んだリポジトリは
+以降キャッシュを使わずに読み込むため、未コミットの変更を他のセッションへ
+見せることはない。書き込んだセッションのコミット・ロールバック時にも破棄
+するので、その間に他のセッションが古い内容を読み込んでもすぐに入れ替わる。
+リポジトリを経由しない変更（SQLの直接実行など）はTTLが切れるまで反映されない。
+"""
+
+import copy
+import logging
+import threading
+import time
+
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.domain.entities.base import BaseEntity
+from src.infrastructure.config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+
+# キャッシュ対象のテーブル
+GOVERNING_BODIES = "governing_bodies"
+CONFERENCES = "conferences"
+POLITICAL_PARTIES = "political_parties"
+PARLIAMENTARY_GROUPS = "parliamentary_groups"
+
+
+@dataclass(frozen=True)
+class _Snapshot[T: BaseEntity]:
+    entities: tuple[T, ...]
+    by_id: dict[int, T]
+    by_name: dict[str, tuple[T, ...]]
+    loaded_at: float
+
+
+class ReferenceDataCache[T: BaseEntity]:
+    """1テーブル分の参照データをTTL付きで保持する
+
+    参照時にキャッシュが空か期限切れなら loader でテーブル全体を読み込む。
+    返すエンティティは呼び出し側が変更してもキャッシュに影響しないよう複製する。
+    """
+
+    def __init__(self, name: str, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """初期化
+
+        Args:
+            name: テーブル名（ログ用）
+            ttl_seconds: 保持する秒数（0以下ならキャッシュしない）
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshot: _Snapshot[T] | None = None
+        # 読み込み中に破棄された場合に古い結果を保存しないための世代番号
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄する"""
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+    async def _get_snapshot(
+        self, loader: Callable[[], Awaitable[list[T]]]
+    ) -> _Snapshot[T]:
+        with self._lock:
+            snapshot = self._snapshot
+            generation = self._generation
+        if snapshot is not None and (
+            time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+        ):
+            return snapshot
+
+        entities = tuple(await loader())
+        by_name: dict[str, list[T]] = {}
+        for entity in entities:
+            name = getattr(entity, "name", None)
+            if name is not None:
+                by_name.setdefault(name, []).append(entity)
+        snapshot = _Snapshot(
+            entities=entities,
+            by_id={entity.id: entity for entity in entities if entity.id is not None},
+            by_name={name: tuple(items) for name, items in by_name.items()},
+            loaded_at=time.monotonic(),
+        )
+        with self._lock:
+            if self._generation == generation:
+                self._snapshot = snapshot
+        logger.debug(f"Loaded {len(entities)} rows into {self.name} cache")
+        return snapshot
+
+    async def get_all(self, loader: Callable[[], Awaitable[list[T]]]) -> list[T]:
+        """全件を取得する（loader の並び順を保つ）"""
+        snapshot = await self._get_snapshot(loader)
+        return [copy.copy(entity) for entity in snapshot.entities]
+
+    async def get_by_id(
+        self, entity_id: int, loader: Callable[[], Awaitable[list[T]]]
+    ) -> T | None:
+        """IDで取得する"""
+        snapshot = await self._get_snapshot(loader)
+        entity = snapshot.by_id.get(entity_id)
+        return copy.copy(entity) if entity is not None else None
+
+    async def get_by_ids(
+        self, entity_ids: Iterable[int], loader: Callable[[], Awaitable[list[T]]]
+    ) -> list[T]:
+        """IDの並び順で取得する（存在しないIDは含めない）"""
+        snapshot = await self._get_snapshot(loader)
+        return [
+            copy.copy(snapshot.by_id[entity_id])
+            for entity_id in dict.fromkeys(entity_ids)
+            if entity_id in snapshot.by_id
+        ]
+
+    async def get_by_name(
+        self, name: str, loader: Callable[[], Awaitable[list[T]]]
+    ) -> list[T]:
+        """名前が完全一致するものを取得する（名前は一意とは限らない）"""
+        snapshot = await self._get_snapshot(loader)
+        return [copy.copy(entity) for entity in snapshot.by_name.get(name, ())]
+
+
+def _default_ttl_seconds() -> float:
+    if settings is None:
+        return DEFAULT_TTL_SECONDS
+    return settings.reference_data_cache_ttl_seconds
+
+
+_ttl_seconds = _default_ttl_seconds()
+_caches: dict[str, ReferenceDataCache[Any]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_reference_data_cache(name: str) -> ReferenceDataCache[Any]:
+    """テーブル名に対応するプロセス共有のキャッシュを取得する"""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = ReferenceDataCache(name, ttl_seconds=_ttl_seconds)
+            _caches[name] = cache
+        return cache
+
+
+def invalidate_reference_data(*names: str) -> None:
+    """指定したテーブルのキャッシュを破棄する（省略時はすべて）"""
+    with _caches_lock:
+        caches = (
+            [_caches[name] for name in names if name in _caches]
+            if names
+            else (list(_caches.values()))
+        )
+    for cache in caches:
+        cache.invalidate()
+
+
+def configure_reference_data_cache(ttl_seconds: float) -> None:
+    """TTLを変更し、保持しているキャッシュをすべて破棄する（0以下で無効化）"""
+    global _ttl_seconds
+    with _caches_lock:
+        _ttl_seconds = ttl_seconds
+        _caches.clear()
+
+
+def _orm_session(session: Any) -> Session | None:
+    """リポジトリのセッションから同期ORMセッションを取り出す"""
+    for candidate in (
+        getattr(session, "sync_session", None),  # AsyncSession
+        getattr(session, "_sync_session", None),  # AsyncSessionAdapter
+        session,
+    ):
+        if isinstance(candidate, Session):
+            return candidate
+    return None
+
+
+class ReferenceDataCacheMixin[T: BaseEntity]:
+    """参照データのリポジトリ実装にキャッシュを組み込む
+
+    サブクラスは _reference_table にキャッシュ対象のテーブル名を、
+    _dependent_reference_tables に自テーブルの変更で内容が変わる他の
+    キャッシュ（JOINして件数や名前を含めているもの）を指定する。
+    BaseRepositoryImpl の一括書き込みはこのクラスでキャッシュを破棄する。
+    """
+
+    _reference_table: ClassVar[str]
+    _dependent_reference_tables: ClassVar[tuple[str, ...]] = ()
+
+    session: Any
+    _reference_cache_bypassed: bool = False
+
+    @property
+    def _reference_cache(self) -> ReferenceDataCache[T] | None:
+        """使えるキャッシュ（無効化中・このリポジトリで書き込み済みなら None）"""
+        if self._reference_cache_bypassed:
+            return None
+        cache = get_reference_data_cache(self._reference_table)
+        return cache if cache.enabled else None
+
+    async def bulk_update_fields(
+        self, entities: list[T], fields: Sequence[str]
+    ) -> list[int]:
+        """一括更新し、関連するキャッシュを破棄する"""
+        updated_ids = await super().bulk_update_fields(entities, fields)  # type: ignore[misc]
+        self._invalidate_reference_cache()
+        return updated_ids
+
+    async def bulk_upsert_on(
+        self, entities: list[T], conflict_keys: Sequence[str]
+    ) -> list[int]:
+        """一括登録・更新し、関連するキャッシュを破棄する"""
+        upserted_ids = await super().bulk_upsert_on(entities, conflict_keys)  # type: ignore[misc]
+        self._invalidate_reference_cache()
+        return upserted_ids
+
+    def _invalidate_reference_cache(self) -> None:
+        """書き込み後に呼び出し、関連するキャッシュを破棄する"""
+        tables = (self._reference_table, *self._dependent_reference_tables)
+        invalidate_reference_data(*tables)
+        # 未コミットの内容をキャッシュに載せないよう、このリポジトリは以降
+        # データベースから直接読み込む
+        self._reference_cache_bypassed = True
+
+        orm_session = _orm_session(self.session)
+        if orm_session is None:
+            return
+        for event_name in ("after_commit", "after_rollback"):
+            if not event.contains(
+                orm_session, event_name, _invalidate_all_reference_data
+            ):
+                event.listen(orm_session, event_name, _invalidate_all_reference_data)
+
+
+def _invalidate_all_reference_data(session: Session) -> None:
+    invalidate_reference_data()
@@ -25,10 +25,11 @@ from collections.abc import Coroutine
 from contextlib import asynccontextmanager
 from typing import Any, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
 from src.infrastructure.config.database import DATABASE_URL
+from src.infrastructure.config.engine_registry import engine_registry
 
 
 T = TypeVar("T")
@@ -73,39 +74,15 @@ class RepositoryAdapter:
             sync_session: Optional sync session (for context)
         """
         self.async_repository_class = async_repository_class
-        # Cache engines per event loop to avoid asyncpg event loop errors
-        self._engines: dict[int, Any] = {}
-        self._session_factories: dict[int, Any] = {}
         self._shared_session: AsyncSession | None = None
 
-    def get_async_session_factory(self):
-        """Get or create an async session factory for the current event loop."""
-        try:
-            loop = asyncio.get_running_loop()
-            loop_id = id(loop)
-        except RuntimeError:
-            # No running loop, use a sentinel value
-            loop_id = 0
-
-        if loop_id not in self._session_factories:
-            # Convert sync database URL to async
-            db_url = DATABASE_URL
-            if db_url.startswith("postgresql://"):
-                async_db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-            elif db_url.startswith("postgresql+psycopg2://"):
-                async_db_url = db_url.replace(
-                    "postgresql+psycopg2://", "postgresql+asyncpg://"
-                )
-            else:
-                async_db_url = db_url
-
-            engine = create_async_engine(async_db_url, echo=False)
-            self._engines[loop_id] = engine
-            self._session_factories[loop_id] = async_sessionmaker(
-                engine, expire_on_commit=False
-            )
+    def get_async_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get the shared async session factory for the current event loop.
 
-        return self._session_factories[loop_id]
+        エンジンはプロセス共有のレジストリから取得するため、アダプターを
+        いくつ作ってもコネクションプールはイベントループごとに1つになる。
+        """
+        return engine_registry.get_async_session_maker(DATABASE_URL)
 
     def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
         """Run an async coroutine from sync context.
@@ -241,17 +218,12 @@ class RepositoryAdapter:
         return sync_or_async_wrapper
 
     def close(self):
-        """Close all async engines."""
-        for engine in self._engines.values():
-            try:
-                asyncio.get_running_loop()
-                # イベントループ内から呼ばれた場合は専用スレッドで実行
-                self._run_async(engine.dispose())
-            except RuntimeError:
-                # イベントループ外の場合はasyncio.runで実行
-                asyncio.run(engine.dispose())
-        self._engines.clear()
-        self._session_factories.clear()
+        """Release adapter resources.
+
+        エンジンは他のアダプターと共有しているためここでは破棄しない。
+        プロセス終了時に engine_registry がまとめて破棄する。
+        """
+        self._shared_session = None
 
     def __enter__(self):
         """Context manager entry."""
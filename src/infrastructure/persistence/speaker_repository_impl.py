@@ -13,10 +13,18 @@ from src.domain.repositories.speaker_repository import SpeakerRepository
 from src.domain.value_objects.speaker_classification_stats import (
     SpeakerClassificationStats,
 )
+from src.domain.value_objects.speaker_name_resolution import SpeakerNameResolution
+from src.domain.value_objects.speaker_party_resolution import (
+    SpeakerPartyKey,
+    SpeakerPartyResolution,
+)
 from src.domain.value_objects.speaker_with_conversation_count import (
     SpeakerWithConversationCount,
 )
 from src.domain.value_objects.speaker_with_politician import SpeakerWithPolitician
+from src.infrastructure.persistence.advisory_locks import (
+    SPEAKER_CREATE_LOCK_NAMESPACE,
+)
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 from src.infrastructure.persistence.sqlalchemy_models import SpeakerModel
 
@@ -296,6 +304,207 @@ class SpeakerRepositoryImpl(BaseRepositoryImpl[Speaker], SpeakerRepository):
             return self._to_entity(row)
         return None
 
+    async def resolve_by_names(
+        self, name_yomi_map: dict[str, str | None]
+    ) -> SpeakerNameResolution:
+        """発言者名の集合を一括で解決する（存在しなければ作成）."""
+        if not name_yomi_map:
+            return SpeakerNameResolution()
+
+        names = list(name_yomi_map)
+
+        # 1. 既存Speakerを一括取得（同名が複数あれば find_by_name 同様に1件へ絞る）
+        select_query = text("""
+            SELECT DISTINCT ON (name) id, name, name_yomi
+            FROM speakers
+            WHERE name = ANY(:names)
+            ORDER BY name, id
+        """)
+        result = await self.session.execute(select_query, {"names": names})
+        existing_rows = result.fetchall()
+        speaker_ids: dict[str, int] = {row.name: row.id for row in existing_rows}
+
+        # 2. 未登録の名前を1文で作成
+        missing = [name for name in names if name not in speaker_ids]
+        created_count = 0
+        if missing:
+            # 並行インポートでの重複作成を防ぐため、未登録名だけをトランザクション
+            # 終了まで名前順にロックし、ロック待ちの間に作成された分を引き直す
+            lock_query = text("""
+                SELECT pg_advisory_xact_lock(:namespace, hashtext(t.name))
+                FROM (
+                    SELECT DISTINCT name
+                    FROM unnest(CAST(:names AS text[])) AS name
+                    ORDER BY name
+                ) AS t
+            """)
+            await self.session.execute(
+                lock_query,
+                {"namespace": SPEAKER_CREATE_LOCK_NAMESPACE, "names": missing},
+            )
+            result = await self.session.execute(select_query, {"names": missing})
+            speaker_ids.update({row.name: row.id for row in result.fetchall()})
+            missing = [name for name in missing if name not in speaker_ids]
+
+        if missing:
+            insert_query = text("""
+                INSERT INTO speakers (name, name_yomi, is_politician)
+                SELECT v.name, v.name_yomi, FALSE
+                FROM unnest(
+                    CAST(:names AS text[]), CAST(:yomis AS text[])
+                ) AS v(name, name_yomi)
+                ON CONFLICT DO NOTHING
+                RETURNING id, name
+            """)
+            result = await self.session.execute(
+                insert_query,
+                {"names": missing, "yomis": [name_yomi_map[n] for n in missing]},
+            )
+            created_rows = result.fetchall()
+            created_count = len(created_rows)
+            speaker_ids.update({row.name: row.id for row in created_rows})
+
+            # 競合でスキップされた名前は既存行を引き直す
+            conflicted = [name for name in missing if name not in speaker_ids]
+            if conflicted:
+                result = await self.session.execute(select_query, {"names": conflicted})
+                speaker_ids.update({row.name: row.id for row in result.fetchall()})
+
+        # 3. name_yomi 未設定の既存Speakerを1文で補完
+        backfill = [
+            (row.id, name_yomi_map[row.name])
+            for row in existing_rows
+            if not row.name_yomi and name_yomi_map.get(row.name)
+        ]
+        yomi_updated_count = 0
+        if backfill:
+            update_query = text("""
+                UPDATE speakers AS s
+                SET name_yomi = v.name_yomi, updated_at = CURRENT_TIMESTAMP
+                FROM unnest(
+                    CAST(:ids AS integer[]), CAST(:yomis AS text[])
+                ) AS v(id, name_yomi)
+                WHERE s.id = v.id
+                  AND (s.name_yomi IS NULL OR s.name_yomi = '')
+            """)
+            result = await self.session.execute(
+                update_query,
+                {
+                    "ids": [speaker_id for speaker_id, _ in backfill],
+                    "yomis": [yomi for _, yomi in backfill],
+                },
+            )
+            yomi_updated_count = result.rowcount
+
+        await self.session.flush()
+
+        return SpeakerNameResolution(
+            speaker_ids=speaker_ids,
+            created_count=created_count,
+            yomi_updated_count=yomi_updated_count,
+        )
+
+    async def find_ids_by_name_party(
+        self, keys: list[SpeakerPartyKey]
+    ) -> dict[SpeakerPartyKey, int]:
+        """(発言者名, 政党名) の組に一致する既存Speakerを1クエリで取得する."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        query = text("""
+            SELECT DISTINCT ON (k.idx) k.idx, s.id
+            FROM unnest(
+                CAST(:names AS text[]), CAST(:parties AS text[])
+            ) WITH ORDINALITY AS k(name, party, idx)
+            JOIN speakers s
+              ON s.name = k.name
+             AND (k.party IS NULL OR s.political_party_name = k.party)
+            ORDER BY k.idx, s.id
+        """)
+        result = await self.session.execute(
+            query,
+            {
+                "names": [name for name, _ in unique_keys],
+                "parties": [party for _, party in unique_keys],
+            },
+        )
+        return {unique_keys[row.idx - 1]: row.id for row in result.fetchall()}
+
+    async def resolve_by_name_party(
+        self, keys: list[SpeakerPartyKey]
+    ) -> SpeakerPartyResolution:
+        """(発言者名, 政党名) の組の集合を一括で解決する（存在しなければ作成）."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return SpeakerPartyResolution()
+
+        # 1. 既存Speakerを一括取得
+        speaker_ids = await self.find_ids_by_name_party(unique_keys)
+
+        # 2. 未登録の組を1文で作成
+        missing = [key for key in unique_keys if key not in speaker_ids]
+        created_count = 0
+        if missing:
+            # 並行処理での重複作成を防ぐため、未登録の名前だけをトランザクション
+            # 終了まで名前順にロックし（resolve_by_namesと同じロック）、
+            # ロック待ちの間に作成された分を引き直す
+            lock_query = text("""
+                SELECT pg_advisory_xact_lock(:namespace, hashtext(t.name))
+                FROM (
+                    SELECT DISTINCT name
+                    FROM unnest(CAST(:names AS text[])) AS name
+                    ORDER BY name
+                ) AS t
+            """)
+            await self.session.execute(
+                lock_query,
+                {
+                    "namespace": SPEAKER_CREATE_LOCK_NAMESPACE,
+                    "names": [name for name, _ in missing],
+                },
+            )
+            speaker_ids.update(await self.find_ids_by_name_party(missing))
+            missing = [key for key in missing if key not in speaker_ids]
+
+        if missing:
+            insert_query = text("""
+                INSERT INTO speakers (name, political_party_name, is_politician)
+                SELECT v.name, v.party, v.is_politician
+                FROM unnest(
+                    CAST(:names AS text[]),
+                    CAST(:parties AS text[]),
+                    CAST(:is_politicians AS boolean[])
+                ) AS v(name, party, is_politician)
+                ON CONFLICT DO NOTHING
+                RETURNING id, name, political_party_name
+            """)
+            result = await self.session.execute(
+                insert_query,
+                {
+                    "names": [name for name, _ in missing],
+                    "parties": [party for _, party in missing],
+                    # 政党があれば政治家と仮定
+                    "is_politicians": [bool(party) for _, party in missing],
+                },
+            )
+            created_rows = result.fetchall()
+            created_count = len(created_rows)
+            speaker_ids.update(
+                {(row.name, row.political_party_name): row.id for row in created_rows}
+            )
+
+            # 競合でスキップされた組は既存行を引き直す
+            conflicted = [key for key in missing if key not in speaker_ids]
+            if conflicted:
+                speaker_ids.update(await self.find_ids_by_name_party(conflicted))
+
+        await self.session.flush()
+
+        return SpeakerPartyResolution(
+            speaker_ids=speaker_ids, created_count=created_count
+        )
+
     async def get_speakers_not_linked_to_politicians(self) -> list[Speaker]:
         """Get speakers who are not linked to politicians (is_politician=False)."""
         query = text("""
@@ -4,6 +4,8 @@ This module provides an adapter to wrap SQLAlchemy's AsyncSession
 so it can be used with the domain's ISessionAdapter interface.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from sqlalchemy.engine.result import Result
@@ -55,6 +57,12 @@ class SQLAlchemySessionAdapter(ISessionAdapter):
         """Add multiple instances to session."""
         self._session.add_all(instances)
 
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        """Start a SAVEPOINT for the duration of the block."""
+        async with self._session.begin_nested():
+            yield
+
     async def flush(self) -> None:
         """Flush changes to database."""
         await self._session.flush()
@@ -4,6 +4,8 @@ This implementation provides transaction management for multiple repositories
 using SQLAlchemy's session, ensuring all operations share the same transaction.
 """
 
+from contextlib import AbstractAsyncContextManager
+
 from src.domain.repositories.conference_repository import ConferenceRepository
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.governing_body_repository import GoverningBodyRepository
@@ -87,6 +89,10 @@ class UnitOfWorkImpl(IUnitOfWork):
         """Rollback the current transaction."""
         await self._session.rollback()
 
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """Start a SAVEPOINT on the shared session."""
+        return self._session.begin_nested()
+
     async def flush(self) -> None:
         """Flush changes to database without committing.
 
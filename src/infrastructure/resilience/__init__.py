@@ -1,9 +1,10 @@
 """レジリエンスモジュール
 
-リトライポリシーとサーキットブレーカーをエクスポート
+リトライポリシー・サーキットブレーカー・レートリミッターをエクスポート
 """
 
 from .circuit_breaker import CircuitBreaker, CircuitState
+from .rate_limiter import RateLimiter
 from .retry import RetryableError, RetryPolicy, with_retry
 
 
@@ -13,4 +14,5 @@ __all__ = [
     "with_retry",
     "CircuitBreaker",
     "CircuitState",
+    "RateLimiter",
 ]
@@ -0,0 +1,49 @@
+"""レートリミッターの実装
+
+外部APIへのリクエスト数を秒間上限・同時実行数で制限する
+"""
+
+import asyncio
+
+
+class RateLimiter:
+    """Rate limiter for API calls."""
+
+    def __init__(
+        self,
+        max_per_second: int = 5,
+        max_concurrent: int = 10,
+        window_seconds: float = 1.0,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_per_second: Maximum requests per window
+            max_concurrent: Maximum concurrent requests
+            window_seconds: Length of the rate window in seconds
+                (複数プロセスで上限を分け合う場合に伸ばす)
+        """
+        self._max_per_second = max_per_second
+        self._window_seconds = window_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._last_call_times: list[float] = []
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request."""
+        async with self._semaphore:
+            async with self._lock:
+                now = asyncio.get_event_loop().time()
+
+                # Remove old timestamps
+                cutoff = now - self._window_seconds
+                self._last_call_times = [t for t in self._last_call_times if t > cutoff]
+
+                # Check if we need to wait
+                if len(self._last_call_times) >= self._max_per_second:
+                    wait_time = self._window_seconds - (now - self._last_call_times[0])
+                    if wait_time > 0:
+                        await asyncio.sleep(wait_time)
+                        now = asyncio.get_event_loop().time()
+
+                self._last_call_times.append(now)
@@ -10,6 +10,7 @@ import click
 from src.common.logging import setup_logging
 from src.infrastructure.config.sentry import init_sentry
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.monitoring.slow_query_detector import query_stats
 from src.interfaces.cli.commands.coverage_commands import get_coverage_commands
 from src.interfaces.cli.commands.data_validation_commands import (
     get_data_validation_commands,
@@ -43,12 +44,31 @@ logger = logging.getLogger(__name__)
 
 
 @click.group()
-def cli():
+@click.option(
+    "--query-report",
+    "query_report_limit",
+    type=int,
+    default=0,
+    metavar="N",
+    help="Print the top N query shapes by total time when the command finishes",
+)
+@click.pass_context
+def cli(ctx: click.Context, query_report_limit: int):
     """Sagebase - Political Activity Tracking Application.
 
     政治活動追跡アプリケーション
     """
-    pass
+    if query_report_limit > 0:
+        ctx.call_on_close(lambda: _print_query_report(query_report_limit))
+
+
+def _print_query_report(limit: int) -> None:
+    """Print the query shapes that took the most time during this run."""
+    click.echo(f"\n=== Top {limit} queries by total time ===", err=True)
+    if not settings.db_query_stats_enabled:
+        click.echo("Query stats are disabled (DB_QUERY_STATS_ENABLED=false)", err=True)
+        return
+    click.echo(query_stats.format_report(limit), err=True)
 
 
 def register_clean_architecture_commands(cli_group: click.Group) -> None:
@@ -1,12 +1,17 @@
 """Coverage reporting commands for Polibase"""
 
 import asyncio
+import time
 
 import click
 
 from sqlalchemy import text
 
 from src.domain.services.data_coverage_domain_service import DataCoverageDomainService
+from src.infrastructure.persistence.monitoring_repository_impl import (
+    MonitoringRepositoryImpl,
+)
+from src.infrastructure.persistence.repository_adapter import RepositoryAdapter
 from src.interfaces.cli.base import ensure_container
 
 
@@ -16,7 +21,7 @@ def get_coverage_commands() -> list[click.Command]:
     Returns:
         List of Click commands
     """
-    return [coverage, coverage_stats]
+    return [coverage, coverage_stats, refresh_monitoring]
 
 
 @click.command()
@@ -216,3 +221,34 @@ def coverage_stats():
         click.echo("\n" + "=" * 70)
 
     asyncio.run(run_stats())
+
+
+@click.command("refresh-monitoring")
+@click.option(
+    "--interval",
+    type=int,
+    default=0,
+    help="Refresh repeatedly every N seconds (0 = refresh once)",
+)
+@click.option(
+    "--no-concurrently",
+    is_flag=True,
+    help="Lock the views while refreshing (required for the first refresh)",
+)
+def refresh_monitoring(interval: int, no_concurrently: bool):
+    """Refresh the materialized views read by the monitoring pages."""
+    monitoring_repo = RepositoryAdapter(MonitoringRepositoryImpl)
+
+    while True:
+        started = time.perf_counter()
+        refreshed = monitoring_repo.refresh_aggregates(concurrently=not no_concurrently)
+        elapsed = time.perf_counter() - started
+        refreshed_at = monitoring_repo.get_aggregates_refreshed_at()
+
+        click.echo(f"Refreshed {len(refreshed)} views in {elapsed:.1f}s")
+        for view_name in refreshed:
+            click.echo(f"  {view_name}: {refreshed_at.get(view_name) or '-'}")
+
+        if interval <= 0:
+            break
+        time.sleep(interval)
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import sys
 import time
 
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import click
@@ -14,6 +18,7 @@ from src.interfaces.cli.base import ensure_container, with_error_handling
 
 if TYPE_CHECKING:
     from src.application.dtos.kokkai_speech_dto import (
+        BatchImportKokkaiSpeechesInputDTO,
         BatchImportKokkaiSpeechesOutputDTO,
     )
 
@@ -40,6 +45,18 @@ if TYPE_CHECKING:
     default=2.0,
     help="APIコール間のスリープ秒数",
 )
+@click.option(
+    "--queue-depth",
+    type=int,
+    default=2,
+    help="取得済みで書き込み待ちにできる会議数（先読み数）",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="並列ワーカープロセス数（会議をissueIDで分担）",
+)
 @click.option(
     "--dry-run", is_flag=True, help="対象会議一覧のみ表示（インポートしない）"
 )
@@ -50,9 +67,29 @@ def import_speeches(
     name_of_house: str | None,
     name_of_meeting: str | None,
     sleep_interval: float,
+    queue_depth: int,
+    workers: int,
     dry_run: bool,
 ):
-    """国会発言データをバッチインポートする."""
+    """国会発言データをバッチインポートする.
+
+    --workers を2以上にすると、会議一覧をissueIDのハッシュで分割し
+    ワーカープロセスごとに並列インポートする。会議単位でDBのadvisory lockを
+    取得するため、並列実行や他のインポートとの重複実行でも同じ会議が
+    二重に取り込まれることはない。
+    """
+    if workers > 1 and not dry_run:
+        _run_workers(
+            session_from,
+            session_to,
+            name_of_house,
+            name_of_meeting,
+            sleep_interval,
+            queue_depth,
+            workers,
+        )
+        return
+
     asyncio.run(
         _run_import(
             session_from,
@@ -60,6 +97,7 @@ def import_speeches(
             name_of_house,
             name_of_meeting,
             sleep_interval,
+            queue_depth,
             dry_run,
         )
     )
@@ -71,6 +109,7 @@ async def _run_import(
     name_of_house: str | None,
     name_of_meeting: str | None,
     sleep_interval: float,
+    queue_depth: int,
     dry_run: bool,
 ) -> None:
     from src.application.dtos.kokkai_speech_dto import (
@@ -87,6 +126,7 @@ async def _run_import(
         session_from=session_from,
         session_to=session_to,
         sleep_interval=sleep_interval,
+        queue_depth=queue_depth,
     )
 
     if dry_run:
@@ -119,6 +159,141 @@ async def _run_import(
     _show_summary(result, elapsed)
 
 
+def _make_executor(workers: int) -> Executor:
+    # 親プロセスのDB接続やイベントループを引き継がないよう spawn で起動する
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _run_workers(
+    session_from: int | None,
+    session_to: int | None,
+    name_of_house: str | None,
+    name_of_meeting: str | None,
+    sleep_interval: float,
+    queue_depth: int,
+    workers: int,
+) -> None:
+    """会議一覧を1回だけ取得し、シャードに分けてワーカープロセスで取り込む.
+
+    APIへの負荷が単一プロセスと変わらないよう、会議間のスリープと
+    ページ取得のレート上限はワーカー数で分け合う。
+    """
+    from src.application.dtos.kokkai_speech_dto import (
+        BatchImportKokkaiSpeechesInputDTO,
+        BatchImportKokkaiSpeechesOutputDTO,
+    )
+    from src.application.usecases.batch_import_kokkai_speeches_usecase import (
+        BatchImportKokkaiSpeechesUseCase,
+    )
+
+    base_dto = BatchImportKokkaiSpeechesInputDTO(
+        name_of_house=name_of_house,
+        name_of_meeting=name_of_meeting,
+        session_from=session_from,
+        session_to=session_to,
+        sleep_interval=sleep_interval,
+        queue_depth=queue_depth,
+    )
+
+    click.echo(f"=== 国会発言バッチインポート開始（{workers}ワーカー） ===")
+    _show_params(
+        session_from, session_to, name_of_house, name_of_meeting, sleep_interval
+    )
+
+    start_time = time.monotonic()
+    usecase = ensure_container().use_cases.batch_import_kokkai_speeches_usecase()
+    meetings = asyncio.run(usecase.fetch_target_meetings(base_dto))
+    shards = BatchImportKokkaiSpeechesUseCase.partition_meetings(meetings, workers)
+
+    results: list[BatchImportKokkaiSpeechesOutputDTO] = []
+    failed_workers: list[str] = []
+    with _make_executor(workers) as executor:
+        futures = {
+            i: executor.submit(
+                _run_shard,
+                replace(
+                    base_dto,
+                    shard_index=i,
+                    shard_count=workers,
+                    meetings=shard,
+                    sleep_interval=sleep_interval * workers,
+                ),
+            )
+            for i, shard in enumerate(shards)
+            if shard
+        }
+        # 1つのワーカーが異常終了しても、他のワーカーの結果は集計する
+        for i, future in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                message = f"ワーカー {i + 1}/{workers} が異常終了しました: {e}"
+                failed_workers.append(message)
+                results.append(
+                    BatchImportKokkaiSpeechesOutputDTO(
+                        total_meetings_found=len(shards[i]), errors=[message]
+                    )
+                )
+
+    elapsed = time.monotonic() - start_time
+    _show_summary(_merge_results(results), elapsed)
+    if failed_workers:
+        for message in failed_workers:
+            click.echo(message, err=True)
+        sys.exit(1)
+
+
+def _run_shard(
+    input_dto: BatchImportKokkaiSpeechesInputDTO,
+) -> BatchImportKokkaiSpeechesOutputDTO:
+    """ワーカープロセスで1シャード分をインポートする."""
+    container = ensure_container()
+    # ページ取得のレート上限もワーカー数で分け合う
+    container.services.kokkai_api_client.add_kwargs(
+        rate_limit_share=1 / input_dto.shard_count
+    )
+    usecase = container.use_cases.batch_import_kokkai_speeches_usecase()
+    prefix = f"[worker {input_dto.shard_index + 1}/{input_dto.shard_count}]"
+
+    def progress_callback(current: int, total: int, label: str) -> None:
+        click.echo(f"  {prefix} [{current + 1}/{total}] {label}")
+
+    return asyncio.run(usecase.execute(input_dto, progress_callback=progress_callback))
+
+
+def _merge_results(
+    results: list[BatchImportKokkaiSpeechesOutputDTO],
+) -> BatchImportKokkaiSpeechesOutputDTO:
+    """ワーカーごとの結果を1つに集計する."""
+    from src.application.dtos.kokkai_speech_dto import (
+        BatchImportKokkaiSpeechesOutputDTO,
+        SessionProgress,
+    )
+
+    merged = BatchImportKokkaiSpeechesOutputDTO()
+    sessions: dict[int, SessionProgress] = {}
+    for r in results:
+        merged.total_meetings_found += r.total_meetings_found
+        merged.total_meetings_processed += r.total_meetings_processed
+        merged.total_meetings_skipped += r.total_meetings_skipped
+        merged.total_speeches_imported += r.total_speeches_imported
+        merged.total_speeches_skipped += r.total_speeches_skipped
+        merged.total_speakers_created += r.total_speakers_created
+        merged.errors.extend(r.errors)
+        merged.failed_meetings.extend(r.failed_meetings)
+        # 同じ回次は複数ワーカーに分散するため回次ごとに合算する
+        for sp in r.session_progress:
+            total = sessions.setdefault(sp.session, SessionProgress(session=sp.session))
+            total.meetings_processed += sp.meetings_processed
+            total.meetings_skipped += sp.meetings_skipped
+            total.speeches_imported += sp.speeches_imported
+            total.speeches_skipped += sp.speeches_skipped
+    merged.session_progress = [sessions[k] for k in sorted(sessions)]
+    return merged
+
+
 def _show_params(
     session_from: int | None,
     session_to: int | None,
@@ -1,43 +1,112 @@
 """CLI commands for processing meeting minutes"""
 
 import asyncio
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
 import click
 
 from ..base import BaseCommand, ensure_container, with_error_handling
 
+from src.application.usecases.execute_minutes_processing_usecase import (
+    ExecuteMinutesProcessingDTO,
+    ExecuteMinutesProcessingUseCase,
+)
+from src.infrastructure.external.baml_call_scope import LLMTokenUsage, baml_call_scope
+from src.infrastructure.resilience.rate_limiter import RateLimiter
+
+
+# 全ワーカーで共有するLLM呼び出しの秒間上限（既定値）
+DEFAULT_LLM_REQUESTS_PER_SECOND = 5
+
+
+@dataclass
+class MinutesBatchSummary:
+    """複数会議の議事録処理結果サマリー"""
+
+    total_meetings: int = 0
+    succeeded_meetings: int = 0
+    total_conversations: int = 0
+    token_usage: LLMTokenUsage = field(default_factory=LLMTokenUsage)
+    failures: list[tuple[int, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def meetings_per_minute(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_meetings / self.elapsed_seconds * 60
+
 
 class MinutesCommands(BaseCommand):
     """Commands for processing meeting minutes"""
 
     @staticmethod
     @click.command()
+    @click.option("--meeting-id", type=int, default=None, help="処理する会議ID")
+    @click.option(
+        "--all-pending",
+        is_flag=True,
+        help="議事録テキストがあり発言が未抽出の会議をすべて処理する",
+    )
+    @click.option(
+        "--limit",
+        type=click.IntRange(min=1),
+        default=None,
+        help="--all-pending で処理する会議数の上限",
+    )
     @click.option(
-        "--pdf",
-        default="data/minutes.pdf",
-        help="Path to the PDF file containing meeting minutes",
+        "--workers",
+        type=click.IntRange(min=1),
+        default=1,
+        help="同時に処理する会議数",
     )
     @click.option(
-        "--output",
-        default="data/output/meeting_output.csv",
-        help="Output CSV file path",
+        "--llm-requests-per-second",
+        type=click.IntRange(min=1),
+        default=DEFAULT_LLM_REQUESTS_PER_SECOND,
+        help="全ワーカーで共有するLLM呼び出しの秒間上限",
     )
+    @click.option("--force", is_flag=True, help="発言がある会議も再処理する")
     @with_error_handling
-    def process_minutes(pdf: str, output: str):
+    def process_minutes(
+        meeting_id: int | None,
+        all_pending: bool,
+        limit: int | None,
+        workers: int,
+        llm_requests_per_second: int,
+        force: bool,
+    ):
         """Process meeting minutes to extract conversations (議事録分割処理)
 
-        This command reads a PDF file containing meeting minutes and extracts
-        individual speeches/conversations using LLM processing.
-
-        Note: This command has been deprecated. Please use the DI
-        container-based process-minutes command with specific options like
-        --meeting-id or --process-all-gcs.
+        --meeting-id で1件、--all-pending で未処理の会議をまとめて処理する。
+        --workers を2以上にすると、1プロセス内で複数の会議を並行処理する。
+        DIコンテナ（DB接続プール・LLMクライアント）はワーカー間で共有し、
+        LLM呼び出しは --llm-requests-per-second の上限を全ワーカーで共有する。
+        1件の失敗は他の会議の処理に影響しない。
         """
-        MinutesCommands.error(
-            "This command is deprecated. Please use 'sagebase process-minutes --help' "
-            "for the updated command options.",
-            exit_code=1,
+        if (meeting_id is None) == (not all_pending):
+            MinutesCommands.error(
+                "--meeting-id と --all-pending のどちらか一方を指定してください",
+                exit_code=1,
+            )
+
+        summary = asyncio.run(
+            _run_process_minutes(
+                meeting_id=meeting_id,
+                all_pending=all_pending,
+                limit=limit,
+                workers=workers,
+                llm_requests_per_second=llm_requests_per_second,
+                force=force,
+            )
         )
+        if summary.failures:
+            MinutesCommands.error(
+                f"{len(summary.failures)}件の会議の処理に失敗しました", exit_code=1
+            )
 
     @staticmethod
     @click.command()
@@ -107,6 +176,129 @@ class MinutesCommands(BaseCommand):
         MinutesCommands.success("Speaker分類が完了しました")
 
 
+async def _run_process_minutes(
+    meeting_id: int | None,
+    all_pending: bool,
+    limit: int | None,
+    workers: int,
+    llm_requests_per_second: int,
+    force: bool,
+) -> MinutesBatchSummary:
+    container = ensure_container()
+
+    if all_pending:
+        meeting_repo = container.repositories.meeting_repository()
+        meetings = await meeting_repo.get_pending_minutes_processing(limit)
+        meeting_ids = [m.id for m in meetings if m.id is not None]
+    else:
+        assert meeting_id is not None
+        meeting_ids = [meeting_id]
+
+    if not meeting_ids:
+        click.echo("処理対象の会議がありません。")
+        return MinutesBatchSummary()
+
+    click.echo("=== 議事録処理開始 ===")
+    click.echo(f"  対象会議数: {len(meeting_ids)}")
+    click.echo(f"  ワーカー数: {workers}")
+    click.echo(f"  LLM呼び出し上限: {llm_requests_per_second}回/秒")
+
+    rate_limiter = RateLimiter(
+        max_per_second=llm_requests_per_second,
+        max_concurrent=llm_requests_per_second,
+    )
+    summary = await process_meetings_concurrently(
+        meeting_ids,
+        usecase_factory=container.use_cases.minutes_processing_usecase,
+        workers=workers,
+        rate_limiter=rate_limiter,
+        force_reprocess=force,
+    )
+    _show_summary(summary)
+    return summary
+
+
+async def process_meetings_concurrently(
+    meeting_ids: list[int],
+    usecase_factory: Callable[[], ExecuteMinutesProcessingUseCase],
+    workers: int,
+    rate_limiter: RateLimiter | None = None,
+    force_reprocess: bool = False,
+) -> MinutesBatchSummary:
+    """複数の会議の議事録を並行処理する
+
+    会議ごとにユースケース（Unit of Work・DBセッション）を作り直すため、
+    1件の失敗はその会議のロールバックだけで済み、他の会議の処理は続行する。
+    BAML呼び出しは会議ごとのスコープで実行し、rate_limiter を全ワーカーで共有する。
+
+    Args:
+        meeting_ids: 処理する会議IDのリスト
+        usecase_factory: 会議ごとにユースケースを生成する関数
+        workers: 同時に処理する会議数
+        rate_limiter: 全ワーカーで共有するLLM呼び出しのレートリミッター
+        force_reprocess: 発言がある会議も再処理するか
+
+    Returns:
+        MinutesBatchSummary: 処理結果サマリー
+    """
+    summary = MinutesBatchSummary(total_meetings=len(meeting_ids))
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for meeting_id in meeting_ids:
+        queue.put_nowait(meeting_id)
+    start_time = time.monotonic()
+
+    async def worker() -> None:
+        while not queue.empty():
+            meeting_id = queue.get_nowait()
+            with baml_call_scope(rate_limiter) as scope:
+                try:
+                    result = await usecase_factory().execute(
+                        ExecuteMinutesProcessingDTO(
+                            meeting_id=meeting_id, force_reprocess=force_reprocess
+                        )
+                    )
+                except Exception as e:
+                    summary.failures.append((meeting_id, str(e)))
+                    click.echo(f"  ✗ meeting_id={meeting_id}: {e}")
+                else:
+                    summary.succeeded_meetings += 1
+                    summary.total_conversations += result.total_conversations
+                    click.echo(
+                        f"  ✓ meeting_id={meeting_id}: "
+                        f"{result.total_conversations}発言, "
+                        f"{result.processing_time_seconds:.1f}秒"
+                    )
+                finally:
+                    summary.token_usage += scope.usage
+
+    await asyncio.gather(*(worker() for _ in range(min(workers, len(meeting_ids)))))
+    summary.elapsed_seconds = time.monotonic() - start_time
+    return summary
+
+
+def _show_summary(summary: MinutesBatchSummary) -> None:
+    usage = summary.token_usage
+    click.echo()
+    click.echo("=== 議事録処理結果 ===")
+    click.echo(f"  処理会議数: {summary.total_meetings}")
+    click.echo(f"  成功: {summary.succeeded_meetings}")
+    click.echo(f"  失敗: {len(summary.failures)}")
+    click.echo(f"  抽出発言数: {summary.total_conversations}")
+    click.echo(
+        f"  所要時間: {summary.elapsed_seconds:.1f}秒 "
+        f"({summary.meetings_per_minute:.2f}会議/分)"
+    )
+    click.echo(
+        f"  LLMトークン: 入力 {usage.input_tokens:,} / 出力 {usage.output_tokens:,} "
+        f"(合計 {usage.total_tokens:,})"
+    )
+    if summary.failures:
+        click.echo()
+        click.echo("失敗した会議:")
+        for meeting_id, message in summary.failures:
+            click.echo(f"  - meeting_id={meeting_id}: {message}")
+
+
 def get_minutes_commands():
     """Get all minutes-related commands"""
     from src.interfaces.cli.commands.analyze_matching_history import (
@@ -5,7 +5,7 @@
 
 import asyncio
 
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
 import streamlit as st
@@ -15,6 +15,7 @@ from src.application.usecases.mark_entity_as_verified_usecase import (
     MarkEntityAsVerifiedInputDto,
     MarkEntityAsVerifiedUseCase,
 )
+from src.domain.value_objects.keyset_page import TotalCountMode
 from src.infrastructure.persistence.conversation_repository_impl import (
     ConversationRepositoryImpl,
 )
@@ -65,32 +66,38 @@ def render_conversations_list_tab() -> None:
     with col4:
         verification_filter = render_verification_filter(key="conv_verification")
 
+    # Keyset pagination: 表示中ページの開始カーソルを積み上げて「前へ」に使う
+    filters = (meeting_id, search_text, int(limit), verification_filter)
+    if st.session_state.get("conv_page_filters") != filters:
+        st.session_state.conv_page_filters = filters
+        st.session_state.conv_page_cursors = [None]
+    cursors = cast(list[int | None], st.session_state.conv_page_cursors)
+
     # Load conversations
-    if meeting_id:
-        conversations = conversation_repo.get_by_meeting(meeting_id, limit=limit)
-    else:
-        conversations = conversation_repo.get_all(limit=limit)
-
-    # Filter by speaker name
-    if search_text:
-        conversations = [
-            c
-            for c in conversations
-            if c.speaker_name and search_text.lower() in c.speaker_name.lower()
-        ]
-
-    # Filter by verification status
-    if verification_filter is not None:
-        conversations = [
-            c for c in conversations if c.is_manually_verified == verification_filter
-        ]
+    # 会議で絞り込む場合は発言順（ID昇順）、全体は新しい順に表示する
+    page = conversation_repo.get_keyset_page(
+        page_size=int(limit),
+        after_id=cursors[-1],
+        meeting_id=meeting_id,
+        speaker_name=search_text or None,
+        is_manually_verified=verification_filter,
+        descending=meeting_id is None,
+        total_count_mode=TotalCountMode.ESTIMATED,
+    )
+    conversations = page.items
 
     if not conversations:
         st.info("該当する発言レコードがありません")
         return
 
     # Statistics
-    st.markdown(f"### 検索結果: {len(conversations)}件")
+    total_text = (
+        f"約{page.total_count:,}件"
+        if page.total_is_estimate
+        else f"{page.total_count:,}件"
+    )
+    st.markdown(f"### 検索結果: {total_text}（{len(cursors)}ページ目）")
+    _render_page_navigation(page.next_cursor, cursors)
 
     verified_count = sum(1 for c in conversations if c.is_manually_verified)
     col1, col2 = st.columns(2)
@@ -125,6 +132,24 @@ def render_conversations_list_tab() -> None:
     _render_detail_section(conversations, verify_use_case)
 
 
+def _render_page_navigation(next_cursor: int | None, cursors: list[int | None]) -> None:
+    """Render previous/next page buttons.
+
+    Args:
+        next_cursor: 次ページの開始カーソル（次ページがなければNone）
+        cursors: これまでに表示したページの開始カーソル
+    """
+    col1, col2, _ = st.columns([1, 1, 4])
+    with col1:
+        if st.button("← 前へ", key="conv_prev_page", disabled=len(cursors) <= 1):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        if st.button("次へ →", key="conv_next_page", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
+
+
 def _render_detail_section(conversations: list[Any], verify_use_case: Any) -> None:
     """Render conversation detail and verification section.
 
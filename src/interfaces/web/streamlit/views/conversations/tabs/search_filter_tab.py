@@ -3,36 +3,111 @@
 発言の検索・フィルタタブのUI実装を提供します。
 """
 
+from datetime import date
+
+import pandas as pd
 import streamlit as st
 
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationRepositoryImpl,
+)
+from src.infrastructure.persistence.governing_body_repository_impl import (
+    GoverningBodyRepositoryImpl,
+)
+from src.infrastructure.persistence.repository_adapter import RepositoryAdapter
+
+
+SEARCH_RESULT_LIMIT = 100
+
 
 def render_search_filter_tab() -> None:
     """Render the search and filter tab.
 
     発言の検索・フィルタタブをレンダリングします。
-    キーワード検索、詳細フィルタなどの機能を提供します。
+    発言内容の全文検索と、発言者・開催日・開催主体での絞り込みを提供します。
     """
     st.subheader("検索・フィルタ")
 
     # Search box
-    st.text_input(
+    keyword = st.text_input(
         "キーワード検索",
-        placeholder="発言内容を検索...",
+        placeholder="発言内容を検索...（空白区切りですべてを含む発言を検索）",
+        key="conv_fulltext_query",
     )
 
     # Advanced filters
     st.markdown("### 詳細フィルタ")
 
+    governing_body_repo = RepositoryAdapter(GoverningBodyRepositoryImpl)
+    governing_bodies = governing_body_repo.get_all()
+    governing_body_options: dict[str, int | None] = {"すべて": None}
+    governing_body_options.update({gb.name: gb.id for gb in governing_bodies})
+
     col1, col2 = st.columns(2)
 
     with col1:
-        st.multiselect("政党", ["自民党", "立憲民主党", "公明党"], key="party_filter")
-        st.multiselect("会議体", ["本会議", "委員会"], key="conference_filter")
+        speaker_name = st.text_input("発言者名", key="conv_fulltext_speaker")
+        selected_governing_body = st.selectbox(
+            "開催主体",
+            list(governing_body_options.keys()),
+            key="conv_fulltext_governing_body",
+        )
 
     with col2:
-        st.slider("発言文字数", 0, 1000, (0, 500), key="length_filter")
-        st.multiselect("タグ", ["重要", "質問", "答弁"], key="tag_filter")
+        use_date_range = st.checkbox("開催日で絞り込む", key="conv_fulltext_use_date")
+        date_range = st.date_input(
+            "開催日",
+            value=(date(date.today().year - 1, 1, 1), date.today()),
+            disabled=not use_date_range,
+            key="conv_fulltext_date_range",
+        )
+
+    if not st.button("検索実行", type="primary"):
+        return
+
+    if not keyword.strip():
+        st.warning("キーワードを入力してください")
+        return
+
+    start_date: date | None = None
+    end_date: date | None = None
+    if use_date_range and isinstance(date_range, tuple) and len(date_range) == 2:
+        start_date, end_date = date_range
+
+    conversation_repo = RepositoryAdapter(ConversationRepositoryImpl)
+    with st.spinner("検索中..."):
+        hits = conversation_repo.search_by_text(
+            keyword,
+            speaker_name=speaker_name or None,
+            start_date=start_date,
+            end_date=end_date,
+            governing_body_id=governing_body_options[selected_governing_body],
+            limit=SEARCH_RESULT_LIMIT,
+        )
+
+    if not hits:
+        st.info("該当する発言がありません")
+        return
+
+    suffix = (
+        "（関連度の高い順に上位のみ表示）" if len(hits) >= SEARCH_RESULT_LIMIT else ""
+    )
+    st.markdown(f"### 検索結果: {len(hits)}件{suffix}")
+
+    data = []
+    for hit in hits:
+        comment = hit.conversation.comment
+        data.append(
+            {
+                "関連度": round(hit.score, 3),
+                "開催日": hit.meeting_date,
+                "開催主体": hit.governing_body_name or "-",
+                "会議": hit.meeting_name or "-",
+                "発言者": hit.conversation.speaker_name or "-",
+                "発言内容": comment[:100] + "..." if len(comment) > 100 else comment,
+                "ID": hit.conversation.id,
+            }
+        )
 
-    if st.button("検索実行", type="primary"):
-        with st.spinner("検索中..."):
-            st.info("検索機能は実装中です")
+    df = pd.DataFrame(data)
+    st.dataframe(df, use_container_width=True, hide_index=True)
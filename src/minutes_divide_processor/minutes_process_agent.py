@@ -1,3 +1,4 @@
+import asyncio
 import re
 import uuid
 
@@ -13,14 +14,18 @@ from langgraph.store.memory import InMemoryStore
 from .models import (
     MinutesBoundary,
     MinutesProcessState,
+    SectionString,
     SectionStringList,
     SpeakerAndSpeechContent,
+    SpeakerAndSpeechContentList,
 )
 
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.baml_call_scope import acquire_baml_client
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
 from src.infrastructure.external.minutes_divider.factory import MinutesDividerFactory
+from src.infrastructure.external.minutes_divider.section_chunker import ChunkingStats
 
 
 logger = structlog.get_logger(__name__)
@@ -36,6 +41,7 @@ class MinutesProcessAgent:
         self,
         llm_service: ILLMService | InstrumentedLLMService | None = None,
         k: int | None = None,
+        speech_divide_concurrency: int | None = None,
     ):
         """
         Initialize MinutesProcessAgent
@@ -44,7 +50,13 @@ class MinutesProcessAgent:
             llm_service: LLMService instance (creates default if not provided)
                 Can be ILLMService or InstrumentedLLMService
             k: Number of sections
+            speech_divide_concurrency: 発言分割でセクションを同時処理する上限
+                （未指定時は設定値 SPEECH_DIVIDE_CONCURRENCY）
         """
+        self.speech_divide_concurrency = max(
+            1,
+            speech_divide_concurrency or get_settings().speech_divide_concurrency,
+        )
         # 各種ジェネレータの初期化（Factoryパターンで実装を切り替え）
         self.minutes_divider = MinutesDividerFactory.create(
             llm_service=llm_service, k=k or 5
@@ -61,6 +73,9 @@ class MinutesProcessAgent:
         llm = ChatGoogleGenerativeAI(model=get_settings().llm_model)
         self.speech_extraction_agent = SpeechExtractionAgent(llm)
 
+        # 直近に処理した議事録のセクション再分割の統計
+        self.last_chunking_stats: ChunkingStats | None = None
+
         self.in_memory_store = InMemoryStore()
         self.graph = self._create_graph()
 
@@ -69,9 +84,13 @@ class MinutesProcessAgent:
 
         新しいフロー:
         process_minutes → extract_speech_boundary → divide_minutes_to_keyword
-        → divide_minutes_to_string → check_length → divide_speech (loop)
+        → divide_minutes_to_string → check_length → divide_speech
         → normalize_speaker_names → END
 
+        check_lengthノードは推定トークン数の上限を超えるセクションを発言の区切りで
+        再分割します。divide_speechノードは全セクションを同時実行数の上限付きで
+        並列に分割し、セクション順に結合します。
+
         extract_speech_boundaryノードでSpeechExtractionAgentサブグラフを実行し、
         議事録から出席者部分と発言部分を分離します。
         normalize_speaker_namesノードでLLMを使用して発言者名を正規化します
@@ -99,15 +118,7 @@ class MinutesProcessAgent:
         workflow.add_edge("divide_minutes_to_keyword", "divide_minutes_to_string")
         workflow.add_edge("divide_minutes_to_string", "check_length")
         workflow.add_edge("check_length", "divide_speech")
-        workflow.add_conditional_edges(
-            "divide_speech",
-            # indexは1から始まるので、<= で比較する必要がある
-            lambda state: state.index <= state.section_list_length,  # type: ignore[arg-type, no-any-return]
-            {
-                True: "divide_speech",
-                False: "normalize_speaker_names",
-            },  # ENDの代わりに正規化ノードへ
-        )
+        workflow.add_edge("divide_speech", "normalize_speaker_names")
         # 発言者名正規化後に終了
         workflow.add_edge("normalize_speaker_names", END)
 
@@ -293,6 +304,7 @@ class MinutesProcessAgent:
         return {"section_string_list_memory_id": memory_id}
 
     def _check_length(self, state: MinutesProcessState) -> dict[str, str]:
+        """推定トークン数の上限を超えるセクションを再分割する."""
         memory_id = state.section_string_list_memory_id
         memory_data = self._get_from_memory("section_string_list", memory_id)
         if memory_data is None or "section_string_list" not in memory_data:
@@ -302,18 +314,22 @@ class MinutesProcessAgent:
         if not isinstance(section_string_list, SectionStringList):
             raise TypeError("section_string_list must be a SectionStringList instance")
 
-        # 文字列のバイト数をチェックする
-        redivide_section_string_list = self.minutes_divider.check_length(
-            section_string_list
-        )
-        memory = {"redivide_section_string_list": redivide_section_string_list}
-        memory_id = self._put_to_memory(
-            namespace="redivide_section_string_list", memory=memory
+        chunked = self.minutes_divider.chunk_sections(section_string_list)
+        self.last_chunking_stats = chunked.stats
+        memory = {"section_string_list": chunked.sections}
+        memory_id = self._put_to_memory(namespace="section_string_list", memory=memory)
+        logger.info(
+            "セクション再分割完了",
+            section_count=chunked.stats.section_count,
+            chunk_count=chunked.stats.chunk_count,
+            split_section_count=chunked.stats.split_section_count,
+            average_fill_ratio=chunked.stats.average_fill_ratio,
+            token_budget=chunked.stats.token_budget,
         )
-        logger.debug("セクション長チェック完了")
-        return {"redivide_section_string_list_memory_id": memory_id}
+        return {"section_string_list_memory_id": memory_id}
 
     async def _divide_speech(self, state: MinutesProcessState) -> dict[str, Any]:
+        """全セクションを並列に発言者・発言内容へ分割し、セクション順に結合する."""
         memory_id = state.section_string_list_memory_id
         memory_data = self._get_from_memory("section_string_list", memory_id)
         if memory_data is None or "section_string_list" not in memory_data:
@@ -323,66 +339,38 @@ class MinutesProcessAgent:
         if not isinstance(section_string_list, SectionStringList):
             raise TypeError("section_string_list must be a SectionStringList instance")
 
-        if state.index - 1 < len(section_string_list.section_string_list):
-            # すべてのセクションを処理する（0, 1, 2, 3の制限を削除）
-            # 発言者と発言内容に分割する
-            speaker_and_speech_content_list = (
-                await self.minutes_divider.speech_divide_run(
-                    section_string_list.section_string_list[state.index - 1]
-                )
-            )
-        else:
-            logger.warning(
-                "インデックスが範囲外",
-                index=state.index - 1,
-                section_count=len(section_string_list.section_string_list),
-            )
-            speaker_and_speech_content_list = None
+        sections = section_string_list.section_string_list
         logger.debug(
-            "発言分割処理中",
-            current_index=state.index,
-            total_sections=state.section_list_length,
+            "発言分割開始",
+            total_sections=len(sections),
+            concurrency=self.speech_divide_concurrency,
         )
-        # 現在のdivide_speech_listを取得
-        memory_id = state.divided_speech_list_memory_id
-        memory_data = self._get_from_memory("divided_speech_list", memory_id)
+        semaphore = asyncio.Semaphore(self.speech_divide_concurrency)
 
-        # 初回はNULLなのでその場合は空配列を作成
-        if memory_data is None or "divided_speech_list" not in memory_data:
-            divided_speech_list: list[SpeakerAndSpeechContent] = []
-        else:
-            divided_speech_list = memory_data["divided_speech_list"]
-            if not isinstance(divided_speech_list, list):
-                raise TypeError("divided_speech_list must be a list")
-            # Cast to proper type after type check
-            divided_speech_list = divided_speech_list
-
-        # もしspeaker_and_speech_content_listがNoneの場合は、
-        # 現在のリストを更新用リストとして返す
-        if speaker_and_speech_content_list is None:
-            logger.warning("発言リストがNullのためスキップ", index=state.index)
-            updated_speaker_and_speech_content_list = divided_speech_list
-            memory: dict[str, list[SpeakerAndSpeechContent]] = {
-                "divided_speech_list": updated_speaker_and_speech_content_list
-            }
-            memory_id = self._put_to_memory(
-                namespace="divided_speech_list", memory=memory
-            )
-        else:
-            # すべてのセクションの結果を追加
-            updated_speaker_and_speech_content_list: list[SpeakerAndSpeechContent] = (
-                divided_speech_list
-                + speaker_and_speech_content_list.speaker_and_speech_content_list
-            )
-            memory: dict[str, list[SpeakerAndSpeechContent]] = {
-                "divided_speech_list": updated_speaker_and_speech_content_list
-            }
-            memory_id = self._put_to_memory(
-                namespace="divided_speech_list", memory=memory
-            )
-        incremented_index = state.index + 1
-        logger.debug("発言分割インデックス更新", next_index=incremented_index)
-        return {"divided_speech_list_memory_id": memory_id, "index": incremented_index}
+        async def _divide_section(
+            section: SectionString,
+        ) -> SpeakerAndSpeechContentList | None:
+            async with semaphore:
+                return await self.minutes_divider.speech_divide_run(section)
+
+        results = await asyncio.gather(*(_divide_section(s) for s in sections))
+
+        divided_speech_list: list[SpeakerAndSpeechContent] = []
+        for index, result in enumerate(results, start=1):
+            if result is None:
+                logger.warning("発言リストがNullのためスキップ", index=index)
+                continue
+            divided_speech_list.extend(result.speaker_and_speech_content_list)
+
+        memory: dict[str, list[SpeakerAndSpeechContent]] = {
+            "divided_speech_list": divided_speech_list
+        }
+        memory_id = self._put_to_memory(namespace="divided_speech_list", memory=memory)
+        logger.debug("発言分割完了", speech_count=len(divided_speech_list))
+        return {
+            "divided_speech_list_memory_id": memory_id,
+            "index": len(sections) + 1,
+        }
 
     def _normalize_speaker_name_rule_based(
         self,
@@ -548,7 +536,8 @@ class MinutesProcessAgent:
         # まずLLMで正規化を試みる
         try:
             logger.debug("LLMベース正規化を試行")
-            normalized_results = await b.NormalizeSpeakerNames(
+            client = await acquire_baml_client(b)
+            normalized_results = await client.NormalizeSpeakerNames(
                 speakers=unique_speakers,
                 role_name_mappings=state.role_name_mappings,
             )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
@@ -42,7 +44,9 @@ def mock_speech_service() -> AsyncMock:
 
 @pytest.fixture()
 def mock_import_usecase() -> AsyncMock:
-    return AsyncMock(spec=ImportKokkaiSpeechesUseCase)
+    mock = AsyncMock(spec=ImportKokkaiSpeechesUseCase)
+    mock.find_imported_meeting_urls.return_value = set()
+    return mock
 
 
 @pytest.fixture()
@@ -100,6 +104,49 @@ class TestFetchTargetMeetings:
 
         assert result == []
 
+    @pytest.mark.asyncio()
+    async def test_shards_partition_meetings(
+        self,
+        usecase: BatchImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+    ) -> None:
+        """シャードごとの会議は重複せず、合わせると全会議になる."""
+        meetings = [_make_meeting(issue_id=f"ISSUE{i:03d}") for i in range(20)]
+        mock_speech_service.fetch_meetings.return_value = meetings
+
+        shards = [
+            await usecase.fetch_target_meetings(
+                BatchImportKokkaiSpeechesInputDTO(shard_index=i, shard_count=3)
+            )
+            for i in range(3)
+        ]
+
+        issue_ids = [m.issue_id for shard in shards for m in shard]
+        assert sorted(issue_ids) == sorted(m.issue_id for m in meetings)
+        assert len(set(issue_ids)) == len(meetings)
+        for i, shard in enumerate(shards):
+            assert all(usecase.shard_of(m.issue_id, 3) == i for m in shard)
+
+    @pytest.mark.asyncio()
+    async def test_given_meetings_skip_meeting_list_api(
+        self,
+        usecase: BatchImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+    ) -> None:
+        """列挙済みの会議が渡されればmeeting_list APIを呼ばない."""
+        meetings = [_make_meeting(issue_id=f"ISSUE{i:03d}") for i in range(20)]
+        shards = usecase.partition_meetings(meetings, 3)
+
+        result = await usecase.fetch_target_meetings(
+            BatchImportKokkaiSpeechesInputDTO(
+                shard_index=1, shard_count=3, meetings=shards[1]
+            )
+        )
+
+        assert result == shards[1]
+        assert sum(len(shard) for shard in shards) == len(meetings)
+        mock_speech_service.fetch_meetings.assert_not_called()
+
 
 class TestExecute:
     """execute のテスト."""
@@ -117,7 +164,7 @@ class TestExecute:
             _make_meeting(issue_id="issue2", date="2025-04-02"),
         ]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.side_effect = [
+        mock_import_usecase.import_speeches.side_effect = [
             ImportKokkaiSpeechesOutputDTO(
                 total_speeches_imported=10,
                 total_meetings_created=1,
@@ -151,9 +198,11 @@ class TestExecute:
         """既存会議がスキップされる場合のカウント."""
         meetings = [_make_meeting()]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.return_value = ImportKokkaiSpeechesOutputDTO(
-            total_speeches_imported=0,
-            total_speeches_skipped=15,
+        mock_import_usecase.import_speeches.return_value = (
+            ImportKokkaiSpeechesOutputDTO(
+                total_speeches_imported=0,
+                total_speeches_skipped=15,
+            )
         )
 
         input_dto = BatchImportKokkaiSpeechesInputDTO(
@@ -179,7 +228,7 @@ class TestExecute:
             _make_meeting(issue_id="ok2"),
         ]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.side_effect = [
+        mock_import_usecase.import_speeches.side_effect = [
             ImportKokkaiSpeechesOutputDTO(total_speeches_imported=5),
             RuntimeError("API接続エラー"),
             ImportKokkaiSpeechesOutputDTO(total_speeches_imported=3),
@@ -194,8 +243,8 @@ class TestExecute:
         assert result.total_meetings_processed == 2
         assert len(result.errors) == 1
         assert "API接続エラー" in result.errors[0]
-        # 全3件が処理された（import_usecase.executeが3回呼ばれた）
-        assert mock_import_usecase.execute.call_count == 3
+        # 全3件が処理された（import_usecase.import_speechesが3回呼ばれた）
+        assert mock_import_usecase.import_speeches.call_count == 3
 
     @pytest.mark.asyncio()
     async def test_empty_meetings_returns_immediately(
@@ -212,7 +261,7 @@ class TestExecute:
 
         assert result.total_meetings_found == 0
         assert result.total_meetings_processed == 0
-        mock_import_usecase.execute.assert_not_called()
+        mock_import_usecase.import_speeches.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_progress_callback_called(
@@ -227,8 +276,10 @@ class TestExecute:
             _make_meeting(issue_id="m2"),
         ]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.return_value = ImportKokkaiSpeechesOutputDTO(
-            total_speeches_imported=5,
+        mock_import_usecase.import_speeches.return_value = (
+            ImportKokkaiSpeechesOutputDTO(
+                total_speeches_imported=5,
+            )
         )
         callback = MagicMock()
 
@@ -258,9 +309,11 @@ class TestExecute:
         """ImportUseCaseからのエラーが集約される."""
         meetings = [_make_meeting()]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.return_value = ImportKokkaiSpeechesOutputDTO(
-            total_speeches_imported=3,
-            errors=["Conference 解決に失敗"],
+        mock_import_usecase.import_speeches.return_value = (
+            ImportKokkaiSpeechesOutputDTO(
+                total_speeches_imported=3,
+                errors=["Conference 解決に失敗"],
+            )
         )
 
         input_dto = BatchImportKokkaiSpeechesInputDTO(
@@ -287,7 +340,7 @@ class TestExecute:
         ]
         mock_speech_service.fetch_meetings.return_value = meetings
         # ソート後の順序: s212_m1, s212_m2, s213_m1
-        mock_import_usecase.execute.side_effect = [
+        mock_import_usecase.import_speeches.side_effect = [
             ImportKokkaiSpeechesOutputDTO(total_speeches_imported=10),
             ImportKokkaiSpeechesOutputDTO(
                 total_speeches_imported=0, total_speeches_skipped=5
@@ -331,7 +384,7 @@ class TestExecute:
             _make_meeting(issue_id="ok2", date="2025-04-03"),
         ]
         mock_speech_service.fetch_meetings.return_value = meetings
-        mock_import_usecase.execute.side_effect = [
+        mock_import_usecase.import_speeches.side_effect = [
             ImportKokkaiSpeechesOutputDTO(total_speeches_imported=5),
             RuntimeError("API接続エラー"),
             ImportKokkaiSpeechesOutputDTO(total_speeches_imported=3),
@@ -355,3 +408,112 @@ class TestExecute:
         assert result.total_meetings_processed == 2
         sp = result.session_progress[0]
         assert sp.meetings_processed == 2  # エラー会議は除外
+
+
+class TestPipeline:
+    """取得ステージと書き込みステージのパイプライン処理のテスト."""
+
+    @pytest.mark.asyncio()
+    async def test_fetch_failure_isolated_per_meeting(
+        self,
+        usecase: BatchImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_import_usecase: AsyncMock,
+    ) -> None:
+        """発言取得のエラーは該当会議のみ失敗として記録される."""
+        meetings = [
+            _make_meeting(issue_id="ok1"),
+            _make_meeting(issue_id="fail1"),
+            _make_meeting(issue_id="ok2"),
+        ]
+        mock_speech_service.fetch_meetings.return_value = meetings
+
+        async def fetch_speeches(*, issue_id: str) -> list:
+            if issue_id == "fail1":
+                raise RuntimeError("タイムアウト")
+            return [MagicMock()]
+
+        mock_speech_service.fetch_speeches.side_effect = fetch_speeches
+        mock_import_usecase.import_speeches.return_value = (
+            ImportKokkaiSpeechesOutputDTO(total_speeches_imported=4)
+        )
+
+        input_dto = BatchImportKokkaiSpeechesInputDTO(sleep_interval=0.0)
+        result = await usecase.execute(input_dto)
+
+        assert result.total_meetings_processed == 2
+        assert result.total_speeches_imported == 8
+        assert [f.issue_id for f in result.failed_meetings] == ["fail1"]
+        assert "タイムアウト" in result.errors[0]
+        assert mock_import_usecase.import_speeches.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_fetch_overlaps_with_write(
+        self,
+        usecase: BatchImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_import_usecase: AsyncMock,
+    ) -> None:
+        """書き込み中に次の会議の取得が進み、書き込みは会議順を保つ."""
+        meetings = [_make_meeting(issue_id=f"m{i}") for i in range(3)]
+        mock_speech_service.fetch_meetings.return_value = meetings
+        events: list[str] = []
+
+        async def fetch_speeches(*, issue_id: str) -> list:
+            events.append(f"fetch:{issue_id}")
+            return [issue_id]
+
+        async def import_speeches(speeches: list) -> ImportKokkaiSpeechesOutputDTO:
+            events.append(f"write-start:{speeches[0]}")
+            await asyncio.sleep(0.01)
+            events.append(f"write-end:{speeches[0]}")
+            return ImportKokkaiSpeechesOutputDTO(total_speeches_imported=1)
+
+        mock_speech_service.fetch_speeches.side_effect = fetch_speeches
+        mock_import_usecase.import_speeches.side_effect = import_speeches
+
+        input_dto = BatchImportKokkaiSpeechesInputDTO(sleep_interval=0.0, queue_depth=2)
+        result = await usecase.execute(input_dto)
+
+        assert result.total_speeches_imported == 3
+        writes = [e for e in events if e.startswith("write-start")]
+        assert writes == ["write-start:m0", "write-start:m1", "write-start:m2"]
+        # m1の取得はm0の書き込み完了を待たない
+        assert events.index("fetch:m1") < events.index("write-end:m0")
+
+
+class TestSkipImportedMeetings:
+    """インポート済み会議の事前スキップのテスト."""
+
+    @pytest.mark.asyncio()
+    async def test_imported_meetings_skip_api_fetch(
+        self,
+        usecase: BatchImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_import_usecase: AsyncMock,
+    ) -> None:
+        """インポート済み会議は発言APIもDB書き込みも呼ばれない."""
+        meetings = [
+            _make_meeting(issue_id="done", meeting_url="https://kokkai/done"),
+            _make_meeting(issue_id="new", meeting_url="https://kokkai/new"),
+        ]
+        mock_speech_service.fetch_meetings.return_value = meetings
+        mock_import_usecase.find_imported_meeting_urls.return_value = {
+            "https://kokkai/done"
+        }
+        mock_import_usecase.import_speeches.return_value = (
+            ImportKokkaiSpeechesOutputDTO(total_speeches_imported=7)
+        )
+
+        input_dto = BatchImportKokkaiSpeechesInputDTO(sleep_interval=0.0)
+        result = await usecase.execute(input_dto)
+
+        mock_import_usecase.find_imported_meeting_urls.assert_awaited_once_with(
+            ["https://kokkai/done", "https://kokkai/new"]
+        )
+        mock_speech_service.fetch_speeches.assert_awaited_once_with(issue_id="new")
+        assert mock_import_usecase.import_speeches.call_count == 1
+        assert result.total_meetings_processed == 2
+        assert result.total_meetings_skipped == 1
+        assert result.total_speeches_imported == 7
+        assert result.session_progress[0].meetings_skipped == 1
@@ -67,7 +67,7 @@ async def test_basic_match(
     assert len(result.details) == 1
     assert result.details[0].government_official_id == 1
     assert result.details[0].speaker_id == 10
-    speaker_repo.update.assert_called_once()
+    speaker_repo.bulk_update_fields.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -103,7 +103,7 @@ async def test_already_linked_skipped(
 
     assert result.linked_count == 0
     assert result.skipped_count == 0
-    speaker_repo.update.assert_not_called()
+    speaker_repo.bulk_update_fields.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -122,7 +122,7 @@ async def test_dry_run_no_write(
 
     assert result.linked_count == 1
     assert len(result.details) == 1
-    speaker_repo.update.assert_not_called()
+    speaker_repo.bulk_update_fields.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -198,7 +198,7 @@ async def test_empty_officials_and_speakers(
     assert result.linked_count == 0
     assert result.skipped_count == 0
     assert result.details == []
-    speaker_repo.update.assert_not_called()
+    speaker_repo.bulk_update_fields.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -216,6 +216,11 @@ async def test_update_called_with_correct_government_official_id(
 
     await usecase.execute(dry_run=False)
 
-    speaker_repo.update.assert_called_once()
-    updated_speaker = speaker_repo.update.call_args[0][0]
-    assert updated_speaker.government_official_id == 1
+    speaker_repo.bulk_update_fields.assert_awaited_once()
+    (updated_speakers,) = speaker_repo.bulk_update_fields.call_args.args
+    assert [s.government_official_id for s in updated_speakers] == [1]
+    assert speaker_repo.bulk_update_fields.call_args.kwargs["fields"] == [
+        "government_official_id",
+        "is_politician",
+        "skip_reason",
+    ]
@@ -1,7 +1,7 @@
 """ExecuteMinutesProcessingUseCaseのテスト"""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,6 +16,7 @@ from src.application.usecases.execute_minutes_processing_usecase import (
 from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
+from src.domain.value_objects.speaker_party_resolution import SpeakerPartyResolution
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 from src.infrastructure.exceptions import APIKeyError
 from src.minutes_divide_processor.models import MinutesBoundary
@@ -32,6 +33,7 @@ def mock_unit_of_work():
     uow.commit = AsyncMock()
     uow.rollback = AsyncMock()
     uow.flush = AsyncMock()
+    uow.savepoint = MagicMock()
     return uow
 
 
@@ -139,8 +141,13 @@ async def test_execute_success(
         ("田中太郎", "自民党"),  # _extract_and_create_speakers 1回目
         ("山田花子", "立憲民主党"),  # _extract_and_create_speakers 2回目
     ]
-    mock_unit_of_work.speaker_repository.get_by_name_party_position.return_value = None
-    mock_unit_of_work.speaker_repository.create.return_value = Mock()
+    mock_unit_of_work.speaker_repository.find_ids_by_name_party.return_value = {}
+    mock_unit_of_work.speaker_repository.resolve_by_name_party.return_value = (
+        SpeakerPartyResolution(
+            speaker_ids={("田中太郎", "自民党"): 10, ("山田花子", "立憲民主党"): 11},
+            created_count=2,
+        )
+    )
 
     # 実行
     request = ExecuteMinutesProcessingDTO(meeting_id=1)
@@ -158,12 +165,51 @@ async def test_execute_success(
     mock_unit_of_work.meeting_repository.get_by_id.assert_called_once_with(1)
     mock_unit_of_work.minutes_repository.create.assert_called_once()
     mock_unit_of_work.conversation_repository.bulk_create.assert_called_once()
-    assert mock_unit_of_work.speaker_repository.create.call_count == 2
-    # Unit of Workのcommitが呼ばれたことを確認
-    mock_unit_of_work.commit.assert_called_once()
+    mock_unit_of_work.speaker_repository.resolve_by_name_party.assert_awaited_once()
+    # 抽出ログを含めて最後に1回だけコミットする
+    mock_unit_of_work.commit.assert_awaited_once()
     mock_unit_of_work.flush.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_save_conversations_falls_back_to_per_conversation_logs(
+    use_case, mock_unit_of_work
+):
+    """抽出ログの一括記録に失敗した場合は発言ごとに記録し直す"""
+    mock_unit_of_work.conversation_repository.bulk_create.return_value = [
+        Conversation(id=i, minutes_id=1, comment=f"発言{i}", sequence_number=i)
+        for i in (1, 2, 3)
+    ]
+    mock_unit_of_work.speaker_repository.find_ids_by_name_party.return_value = {}
+    update_statement = use_case.update_statement_usecase
+    update_statement.execute_batch.side_effect = RuntimeError("batch failed")
+    update_statement.execute.side_effect = [None, RuntimeError("row failed"), None]
+
+    saved = await use_case._save_conversations(
+        [
+            SpeakerSpeech(speaker="田中太郎", speech_content=f"発言{i}")
+            for i in (1, 2, 3)
+        ],
+        minutes_id=1,
+    )
+
+    assert len(saved) == 3
+    # 抽出ログは議事録処理のトランザクション内で記録し、コミットしない
+    mock_unit_of_work.commit.assert_not_awaited()
+    update_statement.execute_batch.assert_awaited_once()
+    assert update_statement.execute_batch.await_args.kwargs["commit"] is False
+    assert [call.args[0] for call in update_statement.execute.await_args_list] == [
+        1,
+        2,
+        3,
+    ]
+    # 一括記録と1件ごとの記録はセーブポイント内で行い、
+    # 失敗した1件の書き込みだけを破棄して残りを続ける
+    assert mock_unit_of_work.savepoint.call_count == 4
+    assert mock_unit_of_work.savepoint.return_value.__aexit__.await_count == 4
+    mock_unit_of_work.rollback.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_execute_meeting_not_found(use_case, mock_unit_of_work):
     """会議が見つからない場合のエラーテスト"""
@@ -235,6 +281,11 @@ async def test_execute_force_reprocess(
     # 検証
     assert result.meeting_id == 1
     assert result.total_conversations == 0
+    # 既存のConversationsは議事録IDで一括削除する
+    mock_unit_of_work.conversation_repository.delete_by_minutes.assert_awaited_once_with(
+        1
+    )
+    mock_unit_of_work.conversation_repository.delete.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -313,20 +364,28 @@ async def test_extract_and_create_speakers(use_case, mock_unit_of_work, mock_ser
         ),
     ]
 
-    # モックの設定
+    # モックの設定（同じ発言者名は1回だけ解析される）
     mock_services["speaker_service"].extract_party_from_name.side_effect = [
         ("田中太郎", "自民党"),
         ("山田花子", None),
-        ("田中太郎", "自民党"),  # 重複
     ]
-    mock_unit_of_work.speaker_repository.get_by_name_party_position.return_value = None
+    mock_unit_of_work.speaker_repository.resolve_by_name_party.return_value = (
+        SpeakerPartyResolution(
+            speaker_ids={("田中太郎", "自民党"): 10, ("山田花子", None): 11},
+            created_count=2,
+        )
+    )
 
     # 実行
     created_count = await use_case._extract_and_create_speakers(conversations)
 
     # 検証
     assert created_count == 2  # 重複を除いた数
-    assert mock_unit_of_work.speaker_repository.create.call_count == 2
+    # 重複を除いたキーで1回だけ解決する
+    mock_unit_of_work.speaker_repository.resolve_by_name_party.assert_awaited_once_with(
+        [("田中太郎", "自民党"), ("山田花子", None)]
+    )
+    mock_unit_of_work.speaker_repository.create.assert_not_called()
 
 
 @pytest.fixture
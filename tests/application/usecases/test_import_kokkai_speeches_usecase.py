@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,12 +15,13 @@ from src.application.usecases.import_kokkai_speeches_usecase import (
     ImportKokkaiSpeechesUseCase,
 )
 from src.domain.entities.conference import Conference
+from src.domain.entities.conversation import Conversation
 from src.domain.entities.governing_body import GoverningBody
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
-from src.domain.entities.speaker import Speaker
 from src.domain.services.interfaces.kokkai_speech_service import IKokkaiSpeechService
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
+from src.domain.value_objects.speaker_name_resolution import SpeakerNameResolution
 
 
 def _make_speech(**overrides: object) -> KokkaiSpeechDTO:
@@ -77,6 +79,18 @@ def usecase(
     )
 
 
+def _setup_speech_pages(
+    mock_speech_service: AsyncMock, *pages: list[KokkaiSpeechDTO]
+) -> None:
+    """iter_speeches がページ単位で発言を返すようセットアップ."""
+
+    async def iter_speeches(**kwargs: object) -> AsyncIterator[list[KokkaiSpeechDTO]]:
+        for page in pages:
+            yield page
+
+    mock_speech_service.iter_speeches = MagicMock(side_effect=iter_speeches)
+
+
 def _setup_governing_body(mock_uow: AsyncMock) -> None:
     """GoverningBody "国会" のモックをセットアップ."""
     gb = GoverningBody(name="国会", type="国", id=1)
@@ -104,9 +118,17 @@ def _setup_no_existing_minutes(mock_uow: AsyncMock) -> None:
 
 
 def _setup_speaker_not_found(mock_uow: AsyncMock) -> None:
-    """Speakerが未登録の状態をセットアップ."""
-    mock_uow.speaker_repository.find_by_name.return_value = None
-    mock_uow.speaker_repository.create.return_value = Speaker(name="岸田文雄", id=50)
+    """Speakerが未登録の状態をセットアップ（一括解決で新規作成される）."""
+
+    async def resolve_by_names(
+        name_yomi_map: dict[str, str | None],
+    ) -> SpeakerNameResolution:
+        return SpeakerNameResolution(
+            speaker_ids={name: 50 + i for i, name in enumerate(name_yomi_map)},
+            created_count=len(name_yomi_map),
+        )
+
+    mock_uow.speaker_repository.resolve_by_names.side_effect = resolve_by_names
 
 
 class TestExecute:
@@ -123,7 +145,7 @@ class TestExecute:
             _make_speech(speech_order=1, speaker="岸田文雄君"),
             _make_speech(speech_order=2, speaker="河野太郎君"),
         ]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
         _setup_conference(mock_uow)
         _setup_no_existing_meeting(mock_uow)
@@ -162,7 +184,7 @@ class TestExecute:
         mock_uow: AsyncMock,
     ) -> None:
         speeches = [_make_speech()]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
 
         existing_meeting = Meeting(
@@ -207,7 +229,7 @@ class TestExecute:
                 meeting_url="https://kokkai.ndl.go.jp/meeting/B",
             ),
         ]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
         _setup_conference(mock_uow)
         _setup_speaker_not_found(mock_uow)
@@ -250,7 +272,7 @@ class TestExecute:
         usecase: ImportKokkaiSpeechesUseCase,
         mock_speech_service: AsyncMock,
     ) -> None:
-        mock_speech_service.fetch_speeches.return_value = []
+        _setup_speech_pages(mock_speech_service, [])
 
         input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
         result = await usecase.execute(input_dto)
@@ -265,7 +287,7 @@ class TestExecute:
         mock_speech_service: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
-        mock_speech_service.fetch_speeches.return_value = [_make_speech()]
+        _setup_speech_pages(mock_speech_service, [_make_speech()])
         mock_uow.governing_body_repository.get_by_name_and_type.return_value = None
 
         input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
@@ -274,53 +296,41 @@ class TestExecute:
         assert len(result.errors) == 1
 
     @pytest.mark.asyncio
-    async def test_update_speaker_name_yomi(
-        self,
-        usecase: ImportKokkaiSpeechesUseCase,
-        mock_speech_service: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-        speeches = [_make_speech()]
-        mock_speech_service.fetch_speeches.return_value = speeches
-        _setup_governing_body(mock_uow)
-        _setup_conference(mock_uow)
-        _setup_no_existing_meeting(mock_uow)
-        _setup_no_existing_minutes(mock_uow)
-        mock_uow.conversation_repository.bulk_create.return_value = [MagicMock(id=1)]
-
-        existing_speaker = Speaker(name="岸田文雄", id=50, name_yomi=None)
-        mock_uow.speaker_repository.find_by_name.return_value = existing_speaker
-        mock_uow.speaker_repository.update.return_value = existing_speaker
-
-        input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
-        await usecase.execute(input_dto)
-
-        mock_uow.speaker_repository.update.assert_called_once()
-        updated = mock_uow.speaker_repository.update.call_args[0][0]
-        assert updated.name_yomi == "きしだふみお"
-
-    @pytest.mark.asyncio
-    async def test_no_update_when_name_yomi_exists(
+    async def test_resolve_speakers_in_one_call(
         self,
         usecase: ImportKokkaiSpeechesUseCase,
         mock_speech_service: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
-        speeches = [_make_speech()]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        """会議内の発言者は重複を除いて1回の一括解決に渡される."""
+        speeches = [
+            _make_speech(speech_order=1, speaker="岸田文雄君", speaker_yomi=""),
+            _make_speech(speech_order=2, speaker="河野太郎君", speaker_yomi="こうの"),
+            _make_speech(speech_order=3, speaker="岸田文雄君"),
+            _make_speech(speech_order=4, speaker="", speaker_yomi=""),
+        ]
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
         _setup_conference(mock_uow)
         _setup_no_existing_meeting(mock_uow)
         _setup_no_existing_minutes(mock_uow)
-        mock_uow.conversation_repository.bulk_create.return_value = [MagicMock(id=1)]
-
-        existing_speaker = Speaker(name="岸田文雄", id=50, name_yomi="きしだふみお")
-        mock_uow.speaker_repository.find_by_name.return_value = existing_speaker
+        mock_uow.speaker_repository.resolve_by_names.return_value = (
+            SpeakerNameResolution(
+                speaker_ids={"岸田文雄": 50, "河野太郎": 51}, created_count=1
+            )
+        )
+        mock_uow.conversation_repository.bulk_create.side_effect = lambda c: c
 
         input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
-        await usecase.execute(input_dto)
+        result = await usecase.execute(input_dto)
 
-        mock_uow.speaker_repository.update.assert_not_called()
+        mock_uow.speaker_repository.resolve_by_names.assert_awaited_once_with(
+            {"岸田文雄": "きしだふみお", "河野太郎": "こうの"}
+        )
+        mock_uow.speaker_repository.find_by_name.assert_not_called()
+        assert result.total_speakers_created == 1
+        conversations = mock_uow.conversation_repository.bulk_create.call_args[0][0]
+        assert [c.speaker_id for c in conversations] == [50, 51, 50, None]
 
     @pytest.mark.asyncio
     async def test_create_new_conference(
@@ -330,7 +340,7 @@ class TestExecute:
         mock_uow: AsyncMock,
     ) -> None:
         speeches = [_make_speech(name_of_meeting="特別委員会")]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
         _setup_no_existing_meeting(mock_uow)
         _setup_no_existing_minutes(mock_uow)
@@ -355,7 +365,7 @@ class TestExecute:
         usecase: ImportKokkaiSpeechesUseCase,
         mock_speech_service: AsyncMock,
     ) -> None:
-        mock_speech_service.fetch_speeches.return_value = []
+        _setup_speech_pages(mock_speech_service, [])
 
         input_dto = ImportKokkaiSpeechesInputDTO()
         result = await usecase.execute(input_dto)
@@ -370,7 +380,7 @@ class TestExecute:
         mock_uow: AsyncMock,
     ) -> None:
         speeches = [_make_speech()]
-        mock_speech_service.fetch_speeches.return_value = speeches
+        _setup_speech_pages(mock_speech_service, speeches)
         _setup_governing_body(mock_uow)
         _setup_conference(mock_uow)
         _setup_no_existing_meeting(mock_uow)
@@ -385,17 +395,316 @@ class TestExecute:
         mock_uow.rollback.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_rollback_called_on_error(
+    async def test_api_error_is_raised_without_commit(
         self,
         usecase: ImportKokkaiSpeechesUseCase,
         mock_speech_service: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
-        mock_speech_service.fetch_speeches.side_effect = RuntimeError("API error")
+        async def failing_pages(**kwargs: object) -> AsyncIterator[list]:
+            raise RuntimeError("API error")
+            yield []
+
+        mock_speech_service.iter_speeches = MagicMock(side_effect=failing_pages)
 
         input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
         with pytest.raises(RuntimeError, match="API error"):
             await usecase.execute(input_dto)
 
+        mock_uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rollback_called_on_commit_error(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        _setup_speech_pages(mock_speech_service, [_make_speech()])
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_meeting(mock_uow)
+        _setup_no_existing_minutes(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        mock_uow.conversation_repository.bulk_create.return_value = [MagicMock(id=1)]
+        mock_uow.commit.side_effect = RuntimeError("DB error")
+
+        input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
+        with pytest.raises(RuntimeError, match="DB error"):
+            await usecase.execute(input_dto)
+
+        mock_uow.rollback.assert_called_once()
+
+
+class TestImportLock:
+    """会議単位の取り込みロックのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_lock_meeting_before_duplicate_check(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        _setup_speech_pages(mock_speech_service, [_make_speech()])
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_meeting(mock_uow)
+        _setup_no_existing_minutes(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        mock_uow.conversation_repository.bulk_create.side_effect = lambda c: c
+        calls: list[str] = []
+        mock_uow.meeting_repository.lock_for_import.side_effect = lambda key: (
+            calls.append(f"lock:{key}")
+        )
+        mock_uow.meeting_repository.get_by_url.side_effect = lambda url: calls.append(
+            "get_by_url"
+        )
+
+        input_dto = ImportKokkaiSpeechesInputDTO(issue_id="121705253X00320250423")
+        await usecase.execute(input_dto)
+
+        assert calls[:2] == ["lock:121705253X00320250423", "get_by_url"]
+
+
+class TestStreamingExecute:
+    """ページ単位の逐次インポートのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_commit_each_meeting_when_complete(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        """ページ境界をまたぐ会議も出揃ってから1回で保存される."""
+        meeting_a = {"issue_id": "A", "meeting_url": "https://kokkai.ndl.go.jp/a"}
+        meeting_b = {"issue_id": "B", "meeting_url": "https://kokkai.ndl.go.jp/b"}
+        _setup_speech_pages(
+            mock_speech_service,
+            [_make_speech(speech_order=1, **meeting_a)],
+            [
+                _make_speech(speech_order=2, **meeting_a),
+                _make_speech(speech_order=1, **meeting_b),
+            ],
+        )
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_meeting(mock_uow)
+        _setup_no_existing_minutes(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        committed: list[int] = []
+        saved_batches: list[list[int]] = []
+
+        async def bulk_create(conversations: list) -> list:
+            saved_batches.append([c.sequence_number for c in conversations])
+            return conversations
+
+        mock_uow.conversation_repository.bulk_create.side_effect = bulk_create
+        mock_uow.commit.side_effect = lambda: committed.append(len(saved_batches))
+
+        input_dto = ImportKokkaiSpeechesInputDTO(
+            name_of_house="衆議院", from_date="2025-04-01", until_date="2025-04-30"
+        )
+        result = await usecase.execute(input_dto)
+
+        assert saved_batches == [[1, 2], [1]]
+        # 会議Aは会議Bの保存前にコミットされる
+        assert committed == [1, 2]
+        assert result.total_speeches_imported == 3
+
+    @pytest.mark.asyncio
+    async def test_late_speeches_are_merged_into_saved_meeting(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        """保存済み会議の発言が後から届いた場合は既存の議事録に追加する."""
+        meeting_a = {"issue_id": "A", "meeting_url": "https://kokkai.ndl.go.jp/a"}
+        meeting_b = {"issue_id": "B", "meeting_url": "https://kokkai.ndl.go.jp/b"}
+        _setup_speech_pages(
+            mock_speech_service,
+            [
+                _make_speech(speech_order=1, **meeting_a),
+                _make_speech(speech_order=1, **meeting_b),
+            ],
+            [
+                _make_speech(speech_order=2, **meeting_a),
+                _make_speech(speech_order=1, **meeting_a),
+            ],
+        )
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_minutes(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        saved_meeting = Meeting(conference_id=10, date=None, url="", name="", id=100)
+        mock_uow.meeting_repository.create.return_value = saved_meeting
+        # 会議A・Bの保存時は未登録、追加時は会議Aの保存結果が見つかる
+        mock_uow.meeting_repository.get_by_url.side_effect = [
+            None,
+            None,
+            saved_meeting,
+        ]
+        mock_uow.minutes_repository.get_by_meeting.side_effect = [
+            None,
+            None,
+            Minutes(meeting_id=100, id=200),
+        ]
+        mock_uow.conversation_repository.get_by_minutes.return_value = [
+            Conversation(comment="保存済み", sequence_number=1, minutes_id=200)
+        ]
+        saved_batches: list[list[int]] = []
+
+        async def bulk_create(conversations: list) -> list:
+            saved_batches.append([c.sequence_number for c in conversations])
+            return conversations
+
+        mock_uow.conversation_repository.bulk_create.side_effect = bulk_create
+
+        input_dto = ImportKokkaiSpeechesInputDTO(
+            name_of_house="衆議院", from_date="2025-04-01", until_date="2025-04-30"
+        )
+        result = await usecase.execute(input_dto)
+
+        # 会議Aの発言2のみ追加し、保存済みの発言1はスキップする
+        assert saved_batches == [[1], [1], [2]]
+        assert mock_uow.commit.call_count == 3
+        assert mock_uow.meeting_repository.create.call_count == 2
+        assert result.total_speeches_imported == 3
+        assert result.total_speeches_skipped == 1
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_late_speeches_without_saved_minutes_are_imported(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        """先の保存で議事録がない場合は、後から届いた発言を通常どおり保存する."""
+        _setup_speech_pages(
+            mock_speech_service,
+            [
+                _make_speech(issue_id="A", speech_order=1),
+                _make_speech(issue_id="B", speech_order=1),
+                _make_speech(issue_id="A", speech_order=2),
+            ],
+        )
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_meeting(mock_uow)
+        _setup_no_existing_minutes(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        mock_uow.conversation_repository.bulk_create.side_effect = lambda c: c
+
+        input_dto = ImportKokkaiSpeechesInputDTO(
+            name_of_house="衆議院", from_date="2025-04-01", until_date="2025-04-30"
+        )
+        result = await usecase.execute(input_dto)
+
+        assert mock_uow.commit.call_count == 3
+        assert result.total_speeches_imported == 3
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_failed_merge_is_rolled_back_and_reported(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_speech_service: AsyncMock,
+        mock_uow: AsyncMock,
+    ) -> None:
+        """後から届いた発言の追加に失敗した場合はロールバックして記録する."""
+        _setup_speech_pages(
+            mock_speech_service,
+            [
+                _make_speech(issue_id="A", speech_order=1),
+                _make_speech(issue_id="B", speech_order=1),
+                _make_speech(issue_id="A", speech_order=2),
+            ],
+        )
+        _setup_governing_body(mock_uow)
+        _setup_conference(mock_uow)
+        _setup_no_existing_meeting(mock_uow)
+        _setup_speaker_not_found(mock_uow)
+        mock_uow.minutes_repository.get_by_meeting.side_effect = [
+            None,
+            None,
+            Minutes(meeting_id=100, id=200),
+        ]
+        mock_uow.minutes_repository.create.return_value = Minutes(
+            meeting_id=100, id=200
+        )
+        mock_uow.meeting_repository.get_by_url.side_effect = [
+            None,
+            None,
+            Meeting(conference_id=10, date=None, url="", name="", id=100),
+        ]
+        mock_uow.conversation_repository.get_by_minutes.return_value = []
+        mock_uow.conversation_repository.bulk_create.side_effect = [
+            [object()],
+            [object()],
+            RuntimeError("db error"),
+        ]
+
+        input_dto = ImportKokkaiSpeechesInputDTO(
+            name_of_house="衆議院", from_date="2025-04-01", until_date="2025-04-30"
+        )
+        result = await usecase.execute(input_dto)
+
+        assert mock_uow.commit.call_count == 2
         mock_uow.rollback.assert_called_once()
+        assert result.total_speeches_imported == 2
+        assert len(result.errors) == 1
+        assert "A" in result.errors[0]
+
+
+class TestFindImportedMeetingUrls:
+    """find_imported_meeting_urls のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_delegates_to_repository(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_uow: AsyncMock,
+    ) -> None:
+        mock_uow.meeting_repository.get_urls_with_conversations.return_value = {
+            "https://kokkai.ndl.go.jp/meeting/1"
+        }
+
+        result = await usecase.find_imported_meeting_urls(
+            ["https://kokkai.ndl.go.jp/meeting/1", "https://kokkai.ndl.go.jp/meeting/2"]
+        )
+
+        assert result == {"https://kokkai.ndl.go.jp/meeting/1"}
+        mock_uow.meeting_repository.get_urls_with_conversations.assert_awaited_once()
+        mock_uow.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_uow: AsyncMock,
+    ) -> None:
+        mock_uow.meeting_repository.get_urls_with_conversations.side_effect = (
+            RuntimeError("DB error")
+        )
+
+        with pytest.raises(RuntimeError):
+            await usecase.find_imported_meeting_urls(
+                ["https://kokkai.ndl.go.jp/meeting/1"]
+            )
+
+        mock_uow.rollback.assert_awaited_once()
         mock_uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_urls_skips_query(
+        self,
+        usecase: ImportKokkaiSpeechesUseCase,
+        mock_uow: AsyncMock,
+    ) -> None:
+        result = await usecase.find_imported_meeting_urls([])
+
+        assert result == set()
+        mock_uow.meeting_repository.get_urls_with_conversations.assert_not_called()
@@ -154,3 +154,108 @@ class TestUpdateConversationFromExtractionUseCase:
 
         mock_conversation_repo.update.assert_not_called()
         mock_session_adapter.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_writes_logs_and_links_in_bulk(
+        self,
+        use_case,
+        mock_conversation_repo,
+        mock_extraction_log_repo,
+        mock_session_adapter,
+    ):
+        """一括更新は抽出ログ作成・取得・保存をそれぞれ1回で行う。"""
+        conversations = [
+            Conversation(id=1, comment="発言1", sequence_number=1),
+            Conversation(
+                id=2, comment="検証済み", sequence_number=2, is_manually_verified=True
+            ),
+        ]
+
+        async def bulk_create(logs: list[ExtractionLog]) -> list[ExtractionLog]:
+            for log_id, log in enumerate(logs, start=300):
+                log.id = log_id
+            return logs
+
+        mock_extraction_log_repo.bulk_create.side_effect = bulk_create
+        mock_conversation_repo.get_by_ids.return_value = conversations
+
+        results = await use_case.execute_batch(
+            [
+                (1, ConversationExtractionResult(comment="新1", sequence_number=1)),
+                (2, ConversationExtractionResult(comment="新2", sequence_number=2)),
+                (3, ConversationExtractionResult(comment="新3", sequence_number=3)),
+            ],
+            pipeline_version="v1.0",
+        )
+
+        assert [(r.updated, r.reason, r.extraction_log_id) for r in results] == [
+            (True, None, 300),
+            (False, "manually_verified", 301),
+            (False, "entity_not_found", 302),
+        ]
+        logs = mock_extraction_log_repo.bulk_create.call_args[0][0]
+        assert [log.entity_id for log in logs] == [1, 2, 3]
+        assert all(log.entity_type == EntityType.STATEMENT for log in logs)
+        mock_conversation_repo.get_by_ids.assert_awaited_once_with([1, 2, 3])
+        mock_conversation_repo.bulk_update_from_extraction.assert_awaited_once_with(
+            [conversations[0]]
+        )
+        assert conversations[0].latest_extraction_log_id == 300
+        assert conversations[1].comment == "検証済み"
+        mock_extraction_log_repo.create.assert_not_called()
+        mock_session_adapter.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_rolls_back_when_log_creation_fails(
+        self,
+        use_case,
+        mock_conversation_repo,
+        mock_extraction_log_repo,
+        mock_session_adapter,
+    ):
+        """抽出ログの一括作成に失敗した場合もロールバックして例外を伝える。"""
+        mock_extraction_log_repo.bulk_create.side_effect = RuntimeError("DB error")
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute_batch(
+                [(1, ConversationExtractionResult(comment="新1", sequence_number=1))],
+                pipeline_version="v1.0",
+            )
+
+        mock_session_adapter.rollback.assert_awaited_once()
+        mock_session_adapter.commit.assert_not_called()
+        mock_conversation_repo.get_by_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_without_commit_leaves_transaction_to_caller(
+        self,
+        use_case,
+        mock_conversation_repo,
+        mock_extraction_log_repo,
+        mock_session_adapter,
+    ):
+        """commit=False ならフラッシュのみ行い、失敗してもロールバックしない。"""
+
+        async def bulk_create(logs: list[ExtractionLog]) -> list[ExtractionLog]:
+            for log in logs:
+                log.id = 300
+            return logs
+
+        mock_extraction_log_repo.bulk_create.side_effect = bulk_create
+        mock_conversation_repo.get_by_ids.return_value = [
+            Conversation(id=1, comment="発言1", sequence_number=1)
+        ]
+        items = [(1, ConversationExtractionResult(comment="新1", sequence_number=1))]
+
+        await use_case.execute_batch(items, pipeline_version="v1.0", commit=False)
+
+        mock_session_adapter.flush.assert_awaited_once()
+        mock_session_adapter.commit.assert_not_called()
+
+        mock_conversation_repo.bulk_update_from_extraction.side_effect = RuntimeError(
+            "DB error"
+        )
+        with pytest.raises(RuntimeError):
+            await use_case.execute_batch(items, pipeline_version="v1.0", commit=False)
+
+        mock_session_adapter.rollback.assert_not_called()
@@ -71,6 +71,64 @@ def setup_test_metrics():
     yield
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_reference_data_cache():
+    """Disable the process-wide reference data cache for tests.
+
+    Repository tests mock the session per test, so cached rows must not leak
+    between tests. Cache tests enable it explicitly.
+    """
+    from src.infrastructure.persistence.reference_data_cache import (
+        configure_reference_data_cache,
+    )
+
+    configure_reference_data_cache(0)
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fail_on_n_plus_one_queries():
+    """Fail use cases decorated with detect_n_plus_one on repeated queries.
+
+    Only statements actually sent to a database are counted, so use case
+    tests with mocked repositories are unaffected.
+    """
+    from src.infrastructure.monitoring.query_counter import (
+        configure_n_plus_one_detection,
+    )
+
+    configure_n_plus_one_detection("raise")
+    yield
+    configure_n_plus_one_detection("off")
+
+
+@pytest.fixture
+def max_queries():
+    """Assert the number of SQL statements issued in a block.
+
+    Usage:
+        def test_list(max_queries):
+            with max_queries(2, max_repeats=1):
+                await usecase.list_by_proposal(1)
+    """
+    from src.infrastructure.monitoring.query_counter import assert_max_queries
+
+    return assert_max_queries
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dispose_shared_engines():
+    """Dispose engines shared through engine_registry after the test session.
+
+    Disposing here (instead of at interpreter exit) keeps pool shutdown logs
+    from being written to pytest's already-closed capture streams.
+    """
+    yield
+    from src.infrastructure.config.engine_registry import dispose_engines
+
+    dispose_engines()
+
+
 # Entity fixtures
 @pytest.fixture
 def sample_governing_body():
@@ -219,6 +219,7 @@ class TestGlobalContainer:
         mock_settings.gcs_project_id = "test-project"
         mock_settings.web_scraper_timeout = 30
         mock_settings.page_load_timeout = 10
+        mock_settings.n_plus_one_detection = "off"
 
         container = init_container(settings=mock_settings)
 
@@ -1,5 +1,7 @@
 """KokkaiApiClient のユニットテスト."""
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -8,6 +10,7 @@ from src.infrastructure.external.kokkai_api.client import (
     KokkaiApiError,
     _is_retryable,
 )
+from src.infrastructure.resilience.rate_limiter import RateLimiter
 
 
 def _make_speech_response(
@@ -234,6 +237,160 @@ class TestGetAllSpeeches:
         assert call_count == 1
 
 
+class TestGetAllSpeechesConcurrent:
+    """get_all_speeches 並列ページ取得モードのテスト."""
+
+    @staticmethod
+    def _paged_handler(total: int, page_size: int, requested: list[int]):
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params.get("startRecord", "1"))
+            requested.append(start)
+            end = min(start + page_size - 1, total)
+            next_pos = end + 1 if end < total else None
+            return httpx.Response(
+                200,
+                json=_make_speech_response(
+                    [_make_speech_record(speechOrder=i) for i in range(start, end + 1)],
+                    total=total,
+                    next_pos=next_pos,
+                ),
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_fetch_remaining_pages_in_order(self) -> None:
+        requested: list[int] = []
+        transport = httpx.MockTransport(self._paged_handler(250, 100, requested))
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, max_concurrency=3)
+            records = await api.get_all_speeches(name_of_house="衆議院")
+
+        assert [r.speech_order for r in records] == list(range(1, 251))
+        assert sorted(requested) == [1, 101, 201]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            start = int(request.url.params.get("startRecord", "1"))
+            return httpx.Response(
+                200,
+                json=_make_speech_response(
+                    [_make_speech_record(speechOrder=start)],
+                    total=8,
+                    next_pos=start + 1 if start < 8 else None,
+                ),
+            )
+
+        transport = httpx.MockTransport(handler)
+        limiter = RateLimiter(max_per_second=100, max_concurrent=10)
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(
+                client=client, max_concurrency=2, rate_limiter=limiter
+            )
+            records = await api.get_all_speeches(name_of_house="衆議院")
+
+        assert [r.speech_order for r in records] == list(range(1, 9))
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_single_page_no_extra_requests(self) -> None:
+        requested: list[int] = []
+        transport = httpx.MockTransport(self._paged_handler(5, 100, requested))
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, max_concurrency=4)
+            records = await api.get_all_speeches(issue_id="121705253X00320250423")
+
+        assert len(records) == 5
+        assert requested == [1]
+
+    @pytest.mark.asyncio
+    async def test_get_all_meetings_concurrent(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params.get("startRecord", "1"))
+            return httpx.Response(
+                200,
+                json=_make_meeting_response(
+                    [_make_meeting_record(issueID=f"ID{start:03d}")],
+                    total=3,
+                    next_pos=start + 1 if start < 3 else None,
+                ),
+            )
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, max_concurrency=3)
+            records = await api.get_all_meetings(name_of_house="衆議院")
+
+        assert [r.issue_id for r in records] == ["ID001", "ID002", "ID003"]
+
+
+class TestIterSpeechPages:
+    """iter_speech_pages 逐次ページ取得のテスト."""
+
+    @staticmethod
+    def _paged_handler(total: int, page_size: int, requested: list[int]):
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params.get("startRecord", "1"))
+            requested.append(start)
+            end = min(start + page_size - 1, total)
+            next_pos = end + 1 if end < total else None
+            return httpx.Response(
+                200,
+                json=_make_speech_response(
+                    [_make_speech_record(speechOrder=i) for i in range(start, end + 1)],
+                    total=total,
+                    next_pos=next_pos,
+                ),
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_yields_pages_lazily(self) -> None:
+        requested: list[int] = []
+        transport = httpx.MockTransport(self._paged_handler(300, 100, requested))
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client)
+            pages = api.iter_speech_pages(name_of_house="衆議院")
+
+            first = await anext(pages)
+            assert [r.speech_order for r in first] == list(range(1, 101))
+            # 次のページは消費されるまで取得しない
+            assert requested == [1]
+
+            rest = [page async for page in pages]
+
+        assert [len(page) for page in rest] == [100, 100]
+        assert requested == [1, 101, 201]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_read_ahead_is_one_window(self) -> None:
+        requested: list[int] = []
+        transport = httpx.MockTransport(self._paged_handler(500, 100, requested))
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, max_concurrency=2)
+            pages = api.iter_speech_pages(name_of_house="衆議院")
+
+            await anext(pages)
+            second = await anext(pages)
+            # 先読みは max_concurrency ページ（1窓）まで
+            assert sorted(requested) == [1, 101, 201]
+            assert second[0].speech_order == 101
+
+            rest = [page async for page in pages]
+
+        assert [page[0].speech_order for page in rest] == [201, 301, 401]
+
+
 class TestSearchMeetings:
     """search_meetings メソッドのテスト."""
 
@@ -0,0 +1,152 @@
+"""KokkaiResponseStore のユニットテスト."""
+
+import time
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.infrastructure.external.kokkai_api.client import (
+    KokkaiApiClient,
+    KokkaiApiError,
+)
+from src.infrastructure.external.kokkai_api.response_store import (
+    KokkaiResponseStore,
+)
+
+
+def _speech_response(record_date: str) -> dict:
+    return {
+        "numberOfRecords": 1,
+        "numberOfReturn": 1,
+        "startRecord": 1,
+        "nextRecordPosition": None,
+        "speechRecord": [
+            {
+                "speechID": "S001",
+                "issueID": "I001",
+                "session": 150,
+                "nameOfHouse": "衆議院",
+                "nameOfMeeting": "本会議",
+                "issue": "第1号",
+                "date": record_date,
+                "speechOrder": 1,
+                "speaker": "議長",
+                "speech": "開会します。",
+            }
+        ],
+    }
+
+
+class TestKokkaiResponseStore:
+    """保存・取得と鮮度ポリシーのテスト."""
+
+    def test_key_is_independent_of_param_order(self) -> None:
+        key1 = KokkaiResponseStore.make_key("speech", {"a": 1, "b": "x"})
+        key2 = KokkaiResponseStore.make_key("speech", {"b": "x", "a": "1"})
+        assert key1 == key2
+        assert key1 != KokkaiResponseStore.make_key("meeting_list", {"a": 1})
+
+    def test_put_and_get_roundtrip(self, tmp_path: Path) -> None:
+        store = KokkaiResponseStore(tmp_path)
+        data = _speech_response("2001-01-01")
+        store.put("speech", {"issueID": "I001"}, data)
+
+        assert store.get("speech", {"issueID": "I001"}) == data
+        assert store.get("speech", {"issueID": "I002"}) is None
+        assert store.hits == 1
+        assert store.misses == 1
+
+    def test_closed_range_never_expires(self, tmp_path: Path) -> None:
+        store = KokkaiResponseStore(tmp_path, recent_ttl_seconds=0)
+        params = {"from": "2001-01-01", "until": "2001-12-31"}
+        store.put("speech", params, _speech_response("2001-01-01"))
+        time.sleep(0.01)
+
+        assert store.get("speech", params) is not None
+
+    def test_recent_range_expires_after_ttl(self, tmp_path: Path) -> None:
+        store = KokkaiResponseStore(tmp_path, recent_ttl_seconds=0)
+        params = {"from": "2001-01-01", "until": date.today().isoformat()}
+        store.put("speech", params, _speech_response("2001-01-01"))
+        time.sleep(0.01)
+
+        assert store.get("speech", params) is None
+
+    def test_open_ended_range_expires_even_with_old_records(
+        self, tmp_path: Path
+    ) -> None:
+        """終了日のない検索は、過去の会議しか含まなくても件数が増え得る."""
+        store = KokkaiResponseStore(tmp_path, recent_ttl_seconds=0)
+        params = {"from": "2001-01-01", "startRecord": 1}
+        store.put("speech", params, _speech_response("2001-01-01"))
+        time.sleep(0.01)
+
+        assert store.get("speech", params) is None
+
+    def test_past_meeting_by_issue_id_never_expires(self, tmp_path: Path) -> None:
+        """1会議分の検索は、終了日がなくても開催日が過去なら再利用する."""
+        store = KokkaiResponseStore(tmp_path, recent_ttl_seconds=0)
+        params = {"issueID": "I001", "startRecord": 1}
+        store.put("speech", params, _speech_response("1947-05-20"))
+        time.sleep(0.01)
+
+        assert store.get("speech", params) is not None
+
+    def test_recent_or_empty_meeting_by_issue_id_expires(self, tmp_path: Path) -> None:
+        store = KokkaiResponseStore(tmp_path, recent_ttl_seconds=0)
+        recent = (date.today() - timedelta(days=1)).isoformat()
+        store.put("speech", {"issueID": "I001"}, _speech_response(recent))
+        empty = {**_speech_response("1947-05-20"), "speechRecord": []}
+        store.put("speech", {"issueID": "I002"}, empty)
+        time.sleep(0.01)
+
+        assert store.get("speech", {"issueID": "I001"}) is None
+        assert store.get("speech", {"issueID": "I002"}) is None
+
+    def test_offline_serves_expired_response(self, tmp_path: Path) -> None:
+        recent = (date.today() - timedelta(days=1)).isoformat()
+        KokkaiResponseStore(tmp_path).put(
+            "speech", {"issueID": "I001"}, _speech_response(recent)
+        )
+        store = KokkaiResponseStore(tmp_path, offline=True, recent_ttl_seconds=0)
+        time.sleep(0.01)
+
+        assert store.get("speech", {"issueID": "I001"}) is not None
+
+
+class TestClientWithResponseStore:
+    """KokkaiApiClient と保存ストアの連携テスト."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_served_from_store(self, tmp_path: Path) -> None:
+        call_count = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal call_count
+            call_count += 1
+            return httpx.Response(200, json=_speech_response("2001-01-01"))
+
+        store = KokkaiResponseStore(tmp_path)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, response_store=store)
+            first = await api.search_speeches(issue_id="I001")
+            second = await api.search_speeches(issue_id="I001")
+
+        assert call_count == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_offline_miss_raises_without_network(self, tmp_path: Path) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("オフラインモードでネットワークアクセスが発生")
+
+        store = KokkaiResponseStore(tmp_path, offline=True)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = KokkaiApiClient(client=client, response_store=store)
+            with pytest.raises(KokkaiApiError):
+                await api.search_speeches(issue_id="I001")
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.infrastructure.external.kokkai_api.client import KokkaiApiClient
 from src.infrastructure.external.kokkai_api.service import KokkaiSpeechServiceImpl
-from src.infrastructure.external.kokkai_api.types import MeetingRecord
+from src.infrastructure.external.kokkai_api.types import MeetingRecord, SpeechRecord
 
 
 class TestFetchMeetings:
@@ -88,3 +88,61 @@ class TestFetchMeetings:
         result = await service.fetch_meetings(session_from=999, session_to=999)
 
         assert result == []
+
+
+class TestIterSpeeches:
+    """iter_speeches のテスト."""
+
+    @staticmethod
+    def _record(order: int) -> SpeechRecord:
+        return SpeechRecord(
+            speech_id=f"S{order:03d}",
+            issue_id="I001",
+            session=213,
+            name_of_house="衆議院",
+            name_of_meeting="本会議",
+            issue="第1号",
+            date="2025-01-01",
+            speech_order=order,
+            speaker="議長",
+            speaker_yomi="ぎちょう",
+            speech="発言",
+            speech_url="",
+            meeting_url="",
+            pdf_url="",
+        )
+
+    @pytest.mark.asyncio()
+    async def test_yields_dto_pages(self) -> None:
+        """クライアントのページ単位でDTOに変換して返す."""
+        pages = [[self._record(1), self._record(2)], [self._record(3)]]
+
+        async def iter_speech_pages(**kwargs: object):
+            for page in pages:
+                yield page
+
+        mock_client = AsyncMock(spec=KokkaiApiClient)
+        mock_client.iter_speech_pages = MagicMock(side_effect=iter_speech_pages)
+        service = KokkaiSpeechServiceImpl(client=mock_client)
+
+        result = [
+            [dto.speech_order for dto in page]
+            async for page in service.iter_speeches(
+                name_of_house="衆議院", from_date="2025-01-01", until_date="2025-01-31"
+            )
+        ]
+
+        assert result == [[1, 2], [3]]
+        mock_client.iter_speech_pages.assert_called_once_with(
+            name_of_house="衆議院", from_date="2025-01-01", until_date="2025-01-31"
+        )
+
+    @pytest.mark.asyncio()
+    async def test_missing_conditions_yields_nothing(self) -> None:
+        """条件不足の場合は何も返さない."""
+        mock_client = AsyncMock(spec=KokkaiApiClient)
+        service = KokkaiSpeechServiceImpl(client=mock_client)
+
+        result = [page async for page in service.iter_speeches()]
+
+        assert result == []
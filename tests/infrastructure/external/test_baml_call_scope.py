@@ -0,0 +1,70 @@
+"""baml_call_scope（BAML呼び出しのスコープ）のテスト."""
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.baml_call_scope import (
+    LLMTokenUsage,
+    acquire_baml_client,
+    baml_call_scope,
+)
+
+
+class TestAcquireBamlClient:
+    """acquire_baml_client のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_returns_client_as_is_outside_scope(self) -> None:
+        client = MagicMock()
+
+        assert await acquire_baml_client(client) is client
+        client.with_options.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scope_attaches_collector_and_waits_for_rate_limiter(self) -> None:
+        client = MagicMock()
+        rate_limiter = MagicMock()
+        rate_limiter.acquire = AsyncMock()
+
+        with baml_call_scope(rate_limiter) as scope:
+            scoped = await acquire_baml_client(client)
+
+        assert scoped is client.with_options.return_value
+        client.with_options.assert_called_once_with(collector=scope.collector)
+        rate_limiter.acquire.assert_awaited_once()
+        assert scope.call_count == 1
+        # スコープを抜けると元に戻る
+        assert await acquire_baml_client(client) is client
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_isolated_per_task(self) -> None:
+        client = MagicMock()
+        scopes = []
+
+        async def run(calls: int) -> None:
+            with baml_call_scope() as scope:
+                scopes.append(scope)
+                for _ in range(calls):
+                    await acquire_baml_client(client)
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(run(1), run(3))
+
+        assert sorted(scope.call_count for scope in scopes) == [1, 3]
+
+
+class TestLLMTokenUsage:
+    """LLMTokenUsage のテスト."""
+
+    def test_add(self) -> None:
+        usage = LLMTokenUsage(10, 5) + LLMTokenUsage(input_tokens=3, output_tokens=2)
+
+        assert usage == LLMTokenUsage(input_tokens=13, output_tokens=7)
+        assert usage.total_tokens == 20
+
+    def test_empty_scope_usage_is_zero(self) -> None:
+        with baml_call_scope() as scope:
+            assert scope.usage == LLMTokenUsage()
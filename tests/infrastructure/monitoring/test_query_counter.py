@@ -0,0 +1,138 @@
+"""query_counter（SQL発行回数の計測とN+1クエリの検出）のテスト."""
+
+import logging
+
+import pytest
+
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.common import instrumentation
+from src.common.instrumentation import detect_n_plus_one
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.monitoring.query_counter import (
+    NPlusOneQueryError,
+    check_n_plus_one,
+    configure_n_plus_one_detection,
+    count_queries,
+    get_n_plus_one_mode,
+    install_n_plus_one_detection,
+)
+
+
+@pytest.fixture
+def engine():  # type: ignore[no-untyped-def]
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    yield engine
+    engine.dispose()
+
+
+def _select_items(engine: Engine, ids: list[int]) -> None:
+    with engine.connect() as conn:
+        for item_id in ids:
+            conn.execute(text("SELECT * FROM items WHERE id = :id"), {"id": item_id})
+
+
+class TestCountQueries:
+    def test_counts_by_fingerprint_including_nested_scopes(self, engine) -> None:  # type: ignore[no-untyped-def]
+        _select_items(engine, [0])
+
+        with count_queries("outer") as outer:
+            _select_items(engine, [1, 2])
+            with count_queries("inner") as inner:
+                _select_items(engine, [3])
+        _select_items(engine, [4])
+
+        assert dict(outer.by_fingerprint) == {"SELECT * FROM items WHERE id = ?": 3}
+        assert inner.total == 1
+        assert "3 x SELECT * FROM items WHERE id = ?" in outer.format_summary()
+
+    @pytest.mark.asyncio
+    async def test_counts_async_engine(self) -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+
+        with count_queries() as count:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        assert count.total == 1
+
+
+class TestCheckNPlusOne:
+    def test_warn_and_raise(self, engine, caplog) -> None:  # type: ignore[no-untyped-def]
+        with count_queries("ListItems") as count:
+            _select_items(engine, [1, 2, 3])
+
+        assert check_n_plus_one(count, threshold=3, mode="raise") == []
+        with caplog.at_level(logging.WARNING):
+            repeated = check_n_plus_one(count, threshold=2, mode="warn")
+        assert repeated == [("SELECT * FROM items WHERE id = ?", 3)]
+        assert "Possible N+1 queries in ListItems" in caplog.text
+        with pytest.raises(NPlusOneQueryError, match="3 x SELECT"):
+            check_n_plus_one(count, threshold=2, mode="raise")
+
+
+class TestDetectNPlusOne:
+    @pytest.mark.asyncio
+    async def test_decorated_use_case_fails_on_repeated_queries(self, engine) -> None:  # type: ignore[no-untyped-def]
+        class ListItemsUseCase:
+            @detect_n_plus_one(threshold=2)
+            async def execute(self, ids: list[int]) -> int:
+                _select_items(engine, ids)
+                return len(ids)
+
+        use_case = ListItemsUseCase()
+
+        assert await use_case.execute([1, 2]) == 2
+        with pytest.raises(NPlusOneQueryError, match="ListItemsUseCase.execute"):
+            await use_case.execute([1, 2, 3])
+
+    def test_disabled_when_off(self, engine) -> None:  # type: ignore[no-untyped-def]
+        @detect_n_plus_one(threshold=0)
+        def list_items() -> None:
+            _select_items(engine, [1, 2])
+
+        configure_n_plus_one_detection("off")
+        try:
+            assert instrumentation._query_detector is None
+            list_items()
+        finally:
+            configure_n_plus_one_detection("raise")
+        assert instrumentation._query_detector is not None
+
+    def test_install_from_settings(self) -> None:
+        settings = Settings()
+        settings.n_plus_one_detection = "warn"
+        settings.n_plus_one_threshold = 3
+        try:
+            install_n_plus_one_detection(settings)
+            assert get_n_plus_one_mode() == "warn"
+            assert instrumentation._query_detector is not None
+        finally:
+            configure_n_plus_one_detection("raise")
+
+    def test_install_off_keeps_current_mode(self) -> None:
+        settings = Settings()
+        settings.n_plus_one_detection = "off"
+
+        install_n_plus_one_detection(settings)
+
+        assert get_n_plus_one_mode() == "raise"
+
+
+class TestMaxQueriesFixture:
+    def test_passes_within_limit(self, engine, max_queries) -> None:  # type: ignore[no-untyped-def]
+        with max_queries(2, max_repeats=2):
+            _select_items(engine, [1, 2])
+
+    def test_fails_over_limit(self, engine, max_queries) -> None:  # type: ignore[no-untyped-def]
+        with pytest.raises(AssertionError, match="at most 1 queries, got 2"):
+            with max_queries(1):
+                _select_items(engine, [1, 2])
+
+        with pytest.raises(AssertionError, match="each query shape at most 1 times"):
+            with max_queries(5, max_repeats=1):
+                _select_items(engine, [1, 2])
@@ -0,0 +1,144 @@
+"""query_plan_regression（実行計画の回帰検出）のテスト."""
+
+import json
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.monitoring.query_plan_regression import (
+    QueryPlanSummary,
+    capture_statements,
+    compare_plans,
+    find_regressions,
+    load_baselines,
+    save_baselines,
+    summarize_plan,
+)
+
+
+def _explain(plan: dict) -> str:
+    return json.dumps([{"Plan": plan}])
+
+
+INDEX_PLAN = _explain(
+    {
+        "Node Type": "Limit",
+        "Total Cost": 12.5,
+        "Plans": [
+            {
+                "Node Type": "Index Scan",
+                "Index Name": "idx_conversations_minutes_id_id",
+                "Relation Name": "conversations",
+                "Total Cost": 12.0,
+            }
+        ],
+    }
+)
+
+SEQ_PLAN = _explain(
+    {
+        "Node Type": "Limit",
+        "Total Cost": 9000.0,
+        "Plans": [
+            {
+                "Node Type": "Sort",
+                "Total Cost": 8990.0,
+                "Plans": [
+                    {
+                        "Node Type": "Seq Scan",
+                        "Parallel Aware": True,
+                        "Relation Name": "conversations",
+                        "Total Cost": 8000.0,
+                    }
+                ],
+            }
+        ],
+    }
+)
+
+
+class TestSummarizePlan:
+    def test_shape_and_cost(self) -> None:
+        summary = summarize_plan(SEQ_PLAN)
+
+        assert summary.shape == (
+            "Limit",
+            "  Sort",
+            "    Parallel Seq Scan on conversations",
+        )
+        assert summary.total_cost == 9000.0
+
+    def test_accepts_decoded_json(self) -> None:
+        summary = summarize_plan(json.loads(INDEX_PLAN))
+
+        assert summary.shape[1] == (
+            "  Index Scan using idx_conversations_minutes_id_id on conversations"
+        )
+
+
+class TestComparePlans:
+    def test_same_plan_passes(self) -> None:
+        baseline = summarize_plan(INDEX_PLAN)
+        current = QueryPlanSummary(shape=baseline.shape, total_cost=18.0)
+
+        assert compare_plans("conversations.get_by_minutes", baseline, current) is None
+
+    def test_shape_change_reports_diff(self) -> None:
+        regression = compare_plans(
+            "conversations.get_by_minutes",
+            summarize_plan(INDEX_PLAN),
+            summarize_plan(SEQ_PLAN),
+        )
+
+        assert regression is not None
+        assert regression.startswith("conversations.get_by_minutes:\n")
+        assert (
+            "-  Index Scan using idx_conversations_minutes_id_id on conversations"
+            in regression
+        )
+        assert "+    Parallel Seq Scan on conversations" in regression
+        assert "new sequential scan on conversations" in regression
+        assert "estimated cost 12.50 -> 9000.00" in regression
+
+    def test_cost_increase_beyond_tolerance(self) -> None:
+        baseline = summarize_plan(INDEX_PLAN)
+        current = QueryPlanSummary(shape=baseline.shape, total_cost=25.0)
+
+        assert compare_plans("q", baseline, current, cost_tolerance=1.0) is None
+        regression = compare_plans("q", baseline, current, cost_tolerance=0.5)
+        assert regression is not None
+        assert "(+100%, tolerance +50%)" in regression
+
+
+def test_find_regressions_reports_missing_baseline() -> None:
+    plan = summarize_plan(INDEX_PLAN)
+
+    regressions = find_regressions({"old": plan}, {"old": plan, "new": plan})
+
+    assert regressions == ["new:\n  no baseline (run with --update to add)"]
+
+
+def test_baselines_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "baselines.json"
+    plans = {"b": summarize_plan(SEQ_PLAN), "a": summarize_plan(INDEX_PLAN)}
+
+    save_baselines(path, plans)
+
+    assert load_baselines(path) == plans
+    assert list(json.loads(path.read_text(encoding="utf-8"))) == ["a", "b"]
+    assert load_baselines(tmp_path / "missing.json") == {}
+
+
+def test_capture_statements() -> None:
+    engine = create_engine("sqlite://")
+
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE t (id INTEGER)"))
+        with capture_statements(engine) as captured:
+            connection.execute(text("SELECT id FROM t WHERE id = :id"), {"id": 1})
+            connection.execute(text("SAVEPOINT sp"))
+        connection.execute(text("SELECT 1"))
+
+    assert [c.statement for c in captured] == ["SELECT id FROM t WHERE id = ?"]
+    assert captured[0].parameters == (1,)
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.async_session_adapter import AsyncSessionAdapter
@@ -131,3 +132,27 @@ async def test_delete(async_session_adapter, mock_sync_session):
     instance = Mock()
     await async_session_adapter.delete(instance)
     mock_sync_session.delete.assert_called_once_with(instance)
+
+
+@pytest.mark.asyncio
+async def test_begin_nested_rolls_back_only_the_block():
+    """Test begin_nested discards the block's changes and keeps the rest."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (name TEXT)"))
+    adapter = AsyncSessionAdapter(Session(engine))
+    insert = text("INSERT INTO items (name) VALUES (:name)")
+
+    await adapter.execute(insert, {"name": "kept"})
+    with pytest.raises(RuntimeError):
+        async with adapter.begin_nested():
+            await adapter.execute(insert, {"name": "discarded"})
+            raise RuntimeError("failed")
+    async with adapter.begin_nested():
+        await adapter.execute(insert, {"name": "released"})
+    await adapter.commit()
+
+    result = await adapter.execute(text("SELECT name FROM items ORDER BY name"))
+    assert [row[0] for row in result] == ["kept", "released"]
+    await adapter.close()
+    engine.dispose()
@@ -1,13 +1,21 @@
 """Tests for BaseRepositoryImpl."""
 
+import json
+
+from datetime import date, datetime
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
 
 import pytest
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.base import BaseEntity
-from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.base_repository_impl import (
+    BaseRepositoryImpl,
+    _json_default,
+)
 
 
 # --- ORM用モック ---
@@ -490,3 +498,143 @@ class TestRowConverter:
         converter1 = repo._row_converter
         converter2 = repo._row_converter
         assert converter1 is converter2
+
+
+# --- 一括書き込みテスト ---
+
+
+class TestBulkWrite:
+    """bulk_update_fields / bulk_upsert_on のテスト."""
+
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock(spec=AsyncSession)
+        result = MagicMock()
+        result.fetchall.return_value = [(1,), (2,)]
+        session.execute.return_value = result
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        return NonOrmMockRepositoryImpl(mock_session, MockEntity, NonOrmMockModel)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_single_statement(self, repository, mock_session):
+        """1文のUPDATE ... FROMで更新し、IDを返すことを確認."""
+        entities = [
+            MockEntity(id=1, name="古い名前"),
+            MockEntity(id=2, name="B"),
+            MockEntity(id=1, name="A"),
+        ]
+
+        updated_ids = await repository.bulk_update_fields(entities, fields=["name"])
+
+        assert updated_ids == [1, 2]
+        mock_session.execute.assert_awaited_once()
+        query, params = mock_session.execute.call_args[0]
+        sql = str(query)
+        assert "UPDATE mock_entities AS t" in sql
+        assert "SET name = v.name" in sql
+        assert "jsonb_populate_recordset(NULL::mock_entities" in sql
+        assert "RETURNING t.id" in sql
+        # 同じIDは後のものを使う
+        assert json.loads(params["rows"]) == [
+            {"id": 1, "name": "A"},
+            {"id": 2, "name": "B"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_empty(self, repository, mock_session):
+        """空のリストではSQLを実行しないことを確認."""
+        assert await repository.bulk_update_fields([], fields=["name"]) == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "entities, fields",
+        [
+            ([MockEntity(name="A")], ["name"]),
+            ([MockEntity(id=1, name="A")], ["unknown"]),
+            ([MockEntity(id=1, name="A")], ["name; DROP TABLE x"]),
+            ([MockEntity(id=1, name="A")], ["id"]),
+        ],
+    )
+    async def test_bulk_update_invalid(self, repository, entities, fields):
+        """IDなし・不明なカラム・不正なカラム名・idの更新はエラーになることを確認."""
+        with pytest.raises(ValueError):
+            await repository.bulk_update_fields(entities, fields=fields)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_without_ids(self, repository, mock_session):
+        """IDのないエンティティはIDを含めずにINSERT ... ON CONFLICTすることを確認."""
+        entities = [
+            MockEntity(name="A"),
+            MockEntity(name="B"),
+            MockEntity(name="A"),
+        ]
+
+        upserted_ids = await repository.bulk_upsert_on(entities, conflict_keys=["name"])
+
+        assert upserted_ids == [1, 2]
+        query, params = mock_session.execute.call_args[0]
+        sql = str(query)
+        assert "INSERT INTO mock_entities (name)" in sql
+        # 更新するカラムがなくても既存行のIDを返す
+        assert "ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name" in sql
+        assert "RETURNING id" in sql
+        assert json.loads(params["rows"]) == [{"name": "A"}, {"name": "B"}]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_with_ids(self, repository, mock_session):
+        """全件にIDがあればIDで競合判定して他のカラムを更新することを確認."""
+        entities = [MockEntity(id=1, name="A"), MockEntity(id=2, name="B")]
+
+        await repository.bulk_upsert_on(entities, conflict_keys=["id"])
+
+        query, params = mock_session.execute.call_args[0]
+        sql = str(query)
+        assert "INSERT INTO mock_entities (id, name)" in sql
+        assert "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name" in sql
+        assert json.loads(params["rows"]) == [
+            {"id": 1, "name": "A"},
+            {"id": 2, "name": "B"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_unknown_conflict_key(self, repository):
+        """_to_modelにないカラムを競合キーにするとエラーになることを確認."""
+        with pytest.raises(ValueError):
+            await repository.bulk_upsert_on(
+                [MockEntity(name="A")], conflict_keys=["id"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_mixed_columns(self, repository, mock_session):
+        """エンティティごとにカラムが異なるとエラーになることを確認（NULLで上書きしない）."""
+        repository._to_model = lambda entity: (
+            NonOrmMockModel(id=entity.id, name=entity.name)
+            if entity.name
+            else NonOrmMockModel(id=entity.id)
+        )
+
+        with pytest.raises(ValueError, match="same columns"):
+            await repository.bulk_upsert_on(
+                [MockEntity(id=1, name="A"), MockEntity(id=2)], conflict_keys=["id"]
+            )
+        mock_session.execute.assert_not_called()
+
+    def test_json_encodes_non_json_values(self):
+        """日時・Decimal・UUIDなどをJSONに変換できることを確認."""
+        value = {
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+            "on": date(2024, 1, 2),
+            "amount": Decimal("1.50"),
+            "user_id": UUID("12345678-1234-5678-1234-567812345678"),
+        }
+
+        assert json.loads(json.dumps(value, default=_json_default)) == {
+            "at": "2024-01-02T03:04:05",
+            "on": "2024-01-02",
+            "amount": "1.50",
+            "user_id": "12345678-1234-5678-1234-567812345678",
+        }
@@ -2,6 +2,7 @@
 
 import asyncio
 
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -10,9 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.domain.entities.conversation import Conversation
+from src.domain.value_objects.keyset_page import TotalCountMode
 from src.infrastructure.persistence.conversation_repository_impl import (
     ConversationModel,
     ConversationRepositoryImpl,
+    _search_terms,
+    _to_bigram_tsquery,
 )
 from src.minutes_divide_processor.models import SpeakerAndSpeechContent
 
@@ -131,9 +135,24 @@ async def test_get_unlinked_async(conversation_repo_async, mock_async_session):
     mock_async_session.execute.assert_called_once()
 
 
+def _bulk_insert_execute(executed):
+    """Build an execute() stub that reserves sequential IDs for bulk_create."""
+
+    async def mock_execute(query, params=None):
+        executed.append((str(query), params))
+        result = MagicMock()
+        if "nextval" in str(query):
+            result.fetchall.return_value = [
+                (i,) for i in range(101, 101 + params["count"])
+            ]
+        return result
+
+    return mock_execute
+
+
 @pytest.mark.asyncio
 async def test_bulk_create_async(conversation_repo_async, mock_async_session):
-    """Test bulk_create with async session (ORM version with flush)."""
+    """Test bulk_create reserves IDs and inserts with a single statement."""
     # Setup
     conversations = [
         Conversation(
@@ -149,38 +168,101 @@ async def test_bulk_create_async(conversation_repo_async, mock_async_session):
             speaker_name="Speaker 2",
         ),
     ]
+    executed = []
+    mock_async_session.execute = _bulk_insert_execute(executed)
 
-    # Mock add_all to track added models
-    added_models = []
+    # Execute
+    created = await conversation_repo_async.bulk_create(conversations)
 
-    def mock_add_all(models):
-        added_models.extend(models)
+    # Verify: IDs are assigned in input order
+    assert [c.id for c in created] == [101, 102]
+    assert [c.comment for c in created] == ["Comment 1", "Comment 2"]
+    assert len(executed) == 2
+    insert_sql, insert_params = executed[1]
+    assert "unnest" in insert_sql
+    assert insert_params["ids"] == [101, 102]
+    assert insert_params["comments"] == ["Comment 1", "Comment 2"]
+    assert insert_params["sequence_numbers"] == [1, 2]
+    mock_async_session.add_all.assert_not_called()
+    mock_async_session.refresh.assert_not_called()
+    # Note: commit() should NOT be called - UseCase manages transaction
+    mock_async_session.commit.assert_not_called()
 
-    mock_async_session.add_all.side_effect = mock_add_all
 
-    # Mock flush to assign IDs to models
-    async def mock_flush():
-        for i, model in enumerate(added_models, start=1):
-            model.id = i
+@pytest.mark.asyncio
+async def test_bulk_create_chunks_large_input(
+    conversation_repo_async, mock_async_session
+):
+    """Test bulk_create splits large input into chunked INSERT statements."""
+    conversations = [
+        Conversation(comment=f"Comment {i}", sequence_number=i, minutes_id=100)
+        for i in range(5)
+    ]
+    executed = []
+    mock_async_session.execute = _bulk_insert_execute(executed)
+
+    with patch(
+        "src.infrastructure.persistence.conversation_repository_impl."
+        "BULK_INSERT_CHUNK_SIZE",
+        2,
+    ):
+        created = await conversation_repo_async.bulk_create(conversations)
+
+    assert [c.id for c in created] == [101, 102, 103, 104, 105]
+    # 1 ID reservation + 3 INSERT chunks (2 + 2 + 1)
+    assert len(executed) == 4
+    assert [params["ids"] for _, params in executed[1:]] == [
+        [101, 102],
+        [103, 104],
+        [105],
+    ]
+
 
-    mock_async_session.flush.side_effect = mock_flush
+@pytest.mark.asyncio
+async def test_bulk_update_from_extraction(conversation_repo_async, mock_async_session):
+    """Test bulk_update_from_extraction links logs with a single UPDATE."""
+    conversations = [
+        Conversation(
+            id=1,
+            comment="Comment 1",
+            sequence_number=1,
+            speaker_id=10,
+            latest_extraction_log_id=501,
+        ),
+        Conversation(id=2, comment="Comment 2", sequence_number=2),
+        Conversation(comment="Not saved", sequence_number=3),
+    ]
+    mock_result = MagicMock()
+    mock_result.rowcount = 2
+    mock_async_session.execute = AsyncMock(return_value=mock_result)
+
+    updated = await conversation_repo_async.bulk_update_from_extraction(conversations)
+
+    assert updated == 2
+    mock_async_session.execute.assert_awaited_once()
+    sql, params = mock_async_session.execute.call_args[0]
+    assert "unnest" in str(sql)
+    assert "is_manually_verified IS NOT TRUE" in str(sql)
+    assert params["ids"] == [1, 2]
+    assert params["speaker_ids"] == [10, None]
+    assert params["extraction_log_ids"] == [501, None]
+    mock_async_session.commit.assert_not_called()
 
-    # Mock refresh to simulate database refresh (no-op in test)
-    async def mock_refresh(model):
-        pass
 
-    mock_async_session.refresh.side_effect = mock_refresh
+@pytest.mark.asyncio
+async def test_delete_by_minutes(conversation_repo_async, mock_async_session):
+    """Test delete_by_minutes removes all conversations with a single DELETE."""
+    mock_result = MagicMock()
+    mock_result.rowcount = 120
+    mock_async_session.execute = AsyncMock(return_value=mock_result)
 
-    # Execute
-    created = await conversation_repo_async.bulk_create(conversations)
+    deleted = await conversation_repo_async.delete_by_minutes(7)
 
-    # Verify
-    assert len(created) == 2
-    assert created[0].id == 1
-    assert created[1].id == 2
-    mock_async_session.add_all.assert_called_once()
-    mock_async_session.flush.assert_called_once()
-    # Note: commit() should NOT be called - UseCase manages transaction
+    assert deleted == 120
+    mock_async_session.execute.assert_awaited_once()
+    sql, params = mock_async_session.execute.call_args[0]
+    assert "DELETE FROM conversations" in str(sql)
+    assert params == {"minutes_id": 7}
     mock_async_session.commit.assert_not_called()
 
 
@@ -282,45 +364,174 @@ async def test_get_speaker_linking_stats_async(
     assert mock_async_session.execute.call_count == 2
 
 
+def _conversation_row(conversation_id: int) -> MagicMock:
+    row = MagicMock()
+    row.id = conversation_id
+    row.comment = f"発言{conversation_id}"
+    row.sequence_number = conversation_id
+    row.minutes_id = 100
+    row.speaker_id = None
+    row.speaker_name = "山田太郎"
+    row.chapter_number = None
+    row.sub_chapter_number = None
+    row.is_manually_verified = False
+    row.latest_extraction_log_id = None
+    return row
+
+
 @pytest.mark.asyncio
-async def test_get_conversations_with_pagination_async(
+async def test_get_keyset_page_reads_one_extra_row_for_next_cursor(
     conversation_repo_async, mock_async_session
 ):
-    """Test get_conversations_with_pagination with async session."""
-    # Setup mock data
+    """Test get_keyset_page returns next_cursor when more rows exist."""
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [_conversation_row(i) for i in (9, 8, 7)]
+    mock_async_session.execute.return_value = mock_result
+
+    page = await conversation_repo_async.get_keyset_page(
+        page_size=2, after_id=10, speaker_name="山田"
+    )
+
+    assert [c.id for c in page.items] == [9, 8]
+    assert page.next_cursor == 8
+    assert page.has_next
+    assert page.total_count is None
+    query, params = mock_async_session.execute.call_args.args
+    assert "c.id < :after_id" in str(query)
+    assert "ORDER BY c.id DESC" in str(query)
+    assert params["limit"] == 3
+    assert params["speaker_name"] == "%山田%"
+    mock_async_session.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_keyset_page_last_page_ascending_with_exact_count(
+    conversation_repo_async, mock_async_session
+):
+    """Test get_keyset_page on the last page with an exact total count."""
+    mock_page_result = MagicMock()
+    mock_page_result.fetchall.return_value = [_conversation_row(11)]
     mock_count_result = MagicMock()
-    mock_count_result.scalar.return_value = 50
+    mock_count_result.scalar.return_value = 11
+    mock_async_session.execute.side_effect = [mock_page_result, mock_count_result]
+
+    page = await conversation_repo_async.get_keyset_page(
+        page_size=10,
+        after_id=10,
+        meeting_id=1,
+        descending=False,
+        total_count_mode=TotalCountMode.EXACT,
+    )
 
-    mock_row = MagicMock()
-    mock_row.id = 1
-    mock_row.speaker_name = "Test Speaker"
-    mock_row.comment = "Test comment"
-    mock_row.sequence_number = 1
-    mock_row.chapter_number = 1
-    mock_row.sub_chapter_number = None
-    mock_row.speaker_id = 10
-    mock_row.minutes_id = 100
-    mock_row.meeting_title = "Test Meeting"
-    mock_row.meeting_date = "2024-01-01"
-    mock_row.linked_speaker_name = "Linked Speaker"
+    assert [c.id for c in page.items] == [11]
+    assert page.next_cursor is None
+    assert page.total_count == 11
+    assert not page.total_is_estimate
+    page_query = str(mock_async_session.execute.call_args_list[0].args[0])
+    assert "c.id > :after_id" in page_query
+    assert "ORDER BY c.id ASC" in page_query
+    count_query = str(mock_async_session.execute.call_args_list[1].args[0])
+    assert "COUNT(*)" in count_query
+    assert ":after_id" not in count_query
 
-    mock_data_result = MagicMock()
-    mock_data_result.fetchall.return_value = [mock_row]
 
-    mock_async_session.execute.side_effect = [mock_count_result, mock_data_result]
+@pytest.mark.asyncio
+async def test_get_keyset_page_estimated_count_uses_reltuples_without_filters(
+    conversation_repo_async, mock_async_session
+):
+    """Test estimated count reads pg_class.reltuples when unfiltered."""
+    mock_page_result = MagicMock()
+    mock_page_result.fetchall.return_value = []
+    mock_estimate_result = MagicMock()
+    mock_estimate_result.scalar.return_value = 123456
+    mock_async_session.execute.side_effect = [mock_page_result, mock_estimate_result]
+
+    page = await conversation_repo_async.get_keyset_page(
+        total_count_mode=TotalCountMode.ESTIMATED
+    )
 
-    # Execute
-    result = await conversation_repo_async.get_conversations_with_pagination(
-        page=1, page_size=10, speaker_name="Test", meeting_id=100
+    assert page.total_count == 123456
+    assert page.total_is_estimate
+    assert "reltuples" in str(mock_async_session.execute.call_args_list[1].args[0])
+
+
+@pytest.mark.asyncio
+async def test_get_keyset_page_estimated_count_uses_plan_rows_with_filters(
+    conversation_repo_async, mock_async_session
+):
+    """Test estimated count reads the planner's row estimate when filtered."""
+    mock_page_result = MagicMock()
+    mock_page_result.fetchall.return_value = []
+    mock_explain_result = MagicMock()
+    mock_explain_result.scalar.return_value = '[{"Plan": {"Plan Rows": 42}}]'
+    mock_async_session.execute.side_effect = [mock_page_result, mock_explain_result]
+
+    page = await conversation_repo_async.get_keyset_page(
+        is_manually_verified=True, total_count_mode=TotalCountMode.ESTIMATED
     )
 
-    # Verify
-    assert result["total_count"] == 50
-    assert result["total_pages"] == 5
-    assert result["current_page"] == 1
-    assert len(result["conversations"]) == 1
-    assert result["conversations"][0]["speaker_name"] == "Test Speaker"
-    assert mock_async_session.execute.call_count == 2
+    assert page.total_count == 42
+    explain_call = mock_async_session.execute.call_args_list[1]
+    assert str(explain_call.args[0]).startswith("EXPLAIN (FORMAT JSON)")
+    assert explain_call.args[1] == {"verified": True}
+
+
+def test_to_bigram_tsquery_splits_terms_into_grams():
+    """Test search words are normalized and split into quoted bigrams."""
+    terms = _search_terms("ＡＩ　予算案 予算案 党")
+
+    assert terms == ["ai", "予算案", "党"]
+    assert _to_bigram_tsquery(terms) == "'ai' & '予算' & '算案' & '党'"
+    assert _to_bigram_tsquery(["it's"]) == "'it' & 't''' & '''s'"
+
+
+@pytest.mark.asyncio
+async def test_search_by_text_uses_bigram_index_and_filters(
+    conversation_repo_async, mock_async_session
+):
+    """Test search_by_text builds a ranked full-text query with filters."""
+    mock_row = _conversation_row(5)
+    mock_row.meeting_id = 20
+    mock_row.meeting_date = date(2024, 6, 1)
+    mock_row.meeting_name = "本会議"
+    mock_row.governing_body_id = 1
+    mock_row.governing_body_name = "東京都"
+    mock_row.score = 0.5
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [mock_row]
+    mock_async_session.execute.return_value = mock_result
+
+    hits = await conversation_repo_async.search_by_text(
+        "防衛 予算",
+        speaker_name="山田",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        governing_body_id=1,
+        limit=10,
+    )
+
+    assert len(hits) == 1
+    assert hits[0].conversation.id == 5
+    assert hits[0].score == 0.5
+    assert hits[0].meeting_date == date(2024, 6, 1)
+    assert hits[0].governing_body_name == "東京都"
+    query, params = mock_async_session.execute.call_args.args
+    sql = str(query)
+    assert "ja_bigram_tsvector(c.comment) @@ CAST(:tsquery AS tsquery)" in sql
+    assert "ORDER BY score DESC" in sql
+    assert "conf.governing_body_id = :governing_body_id" in sql
+    assert params["tsquery"] == "'防衛' & '予算'"
+    assert params["term_0"] == "防衛"
+    assert params["term_1"] == "予算"
+    assert params["start_date"] == date(2024, 1, 1)
+    assert params["limit"] == 10
+
+
+@pytest.mark.asyncio
+async def test_search_by_text_blank_query(conversation_repo_async, mock_async_session):
+    """Test search_by_text returns nothing for a blank query."""
+    assert await conversation_repo_async.search_by_text("　 ") == []
+    mock_async_session.execute.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -386,15 +597,9 @@ def test_bulk_create_sync(conversation_repo_sync, mock_sync_session):
         ),
     ]
 
-    # Mock the insert operation
-    mock_result = MagicMock()
-    mock_result.scalar.return_value = 1
-
-    # Make execute return an awaitable (async coroutine)
-    async def mock_execute(*args, **kwargs):
-        return mock_result
-
-    mock_sync_session.execute = mock_execute
+    # Make execute return an awaitable (AsyncSessionAdapter behaviour)
+    executed = []
+    mock_sync_session.execute = _bulk_insert_execute(executed)
 
     # Execute
     loop = asyncio.new_event_loop()
@@ -403,9 +608,8 @@ def test_bulk_create_sync(conversation_repo_sync, mock_sync_session):
 
     # Verify
     assert len(created) == 1
-    assert created[0].id == 1
-    # Note: execute is now a plain async function, not a Mock,
-    # so we can't assert call count
+    assert created[0].id == 101
+    assert len(executed) == 2
     # Note: commit() should NOT be called - UseCase manages transaction
     mock_sync_session.commit.assert_not_called()
 
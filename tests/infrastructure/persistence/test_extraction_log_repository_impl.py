@@ -106,6 +106,56 @@ class TestExtractionLogRepositoryImpl:
         assert model.confidence_score == sample_entity.confidence_score
         assert model.extraction_metadata == sample_entity.extraction_metadata
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_reserves_ids_and_inserts_once(
+        self,
+        repository: ExtractionLogRepositoryImpl,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test bulk_create inserts all logs with one statement in input order."""
+        executed: list[tuple[str, dict]] = []
+
+        async def mock_execute(query, params=None):
+            executed.append((str(query), params))
+            result = MagicMock()
+            if "nextval" in str(query):
+                result.fetchall.return_value = [
+                    (i,) for i in range(501, 501 + params["count"])
+                ]
+            return result
+
+        mock_session.execute = mock_execute
+        logs = [
+            ExtractionLog(
+                entity_type=EntityType.STATEMENT,
+                entity_id=entity_id,
+                pipeline_version="minutes-divider-v1",
+                extracted_data={"comment": f"発言{entity_id}"},
+            )
+            for entity_id in (10, 11, 12)
+        ]
+
+        created = await repository.bulk_create(logs)
+
+        assert [log.id for log in created] == [501, 502, 503]
+        assert len(executed) == 2
+        insert_sql, params = executed[1]
+        assert "unnest" in insert_sql
+        assert params["entity_types"] == ["statement"] * 3
+        assert params["entity_ids"] == [10, 11, 12]
+        assert params["extracted_data"][0] == '{"comment": "発言10"}'
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_empty(
+        self,
+        repository: ExtractionLogRepositoryImpl,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test bulk_create issues no query for an empty list."""
+        assert await repository.bulk_create([]) == []
+        mock_session.execute.assert_not_called()
+
     def test_update_model_raises_not_implemented(
         self,
         repository: ExtractionLogRepositoryImpl,
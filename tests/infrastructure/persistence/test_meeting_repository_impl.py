@@ -666,6 +666,77 @@ class TestMeetingRepositoryImpl:
         assert result[0].id == 1
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_pending_minutes_processing(
+        self,
+        repository: MeetingRepositoryImpl,
+        mock_session: MagicMock,
+        sample_meeting_dict: dict[str, Any],
+    ) -> None:
+        """議事録テキストがあり発言がない会議を上限付きで取得する."""
+        mock_row = MagicMock()
+        mock_row._mapping = sample_meeting_dict
+        mock_result = MagicMock()
+        mock_result.fetchall = MagicMock(return_value=[mock_row])
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_pending_minutes_processing(limit=10)
+
+        assert [m.id for m in result] == [1]
+        sql, params = mock_session.execute.call_args[0]
+        assert "gcs_text_uri IS NOT NULL" in str(sql)
+        assert "NOT EXISTS" in str(sql)
+        assert params == {"limit": 10}
+
+    @pytest.mark.asyncio
+    async def test_get_urls_with_conversations(
+        self,
+        repository: MeetingRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """発言のある会議URLを1クエリで取得する."""
+        mock_result = MagicMock()
+        mock_result.fetchall = MagicMock(
+            return_value=[("https://example.com/a",), ("https://example.com/b",)]
+        )
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_urls_with_conversations(
+            ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+        )
+
+        assert result == {"https://example.com/a", "https://example.com/b"}
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args[0][1]
+        assert len(params["urls"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_urls_with_conversations_empty(
+        self,
+        repository: MeetingRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """空リストではクエリを発行しない."""
+        result = await repository.get_urls_with_conversations([])
+
+        assert result == set()
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lock_for_import(
+        self,
+        repository: MeetingRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """issueIDをキーにトランザクションスコープのadvisory lockを取得する."""
+        await repository.lock_for_import("121705253X00320250423")
+
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0])
+        params = mock_session.execute.call_args[0][1]
+        assert "pg_advisory_xact_lock" in sql
+        assert params["key"] == "121705253X00320250423"
+
     @pytest.mark.asyncio
     async def test_get_by_chamber_and_date_range_empty(
         self, repository: MeetingRepositoryImpl, mock_session: MagicMock
@@ -1,6 +1,7 @@
 """Tests for MonitoringRepositoryImpl."""
 
 from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -9,6 +10,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.infrastructure.persistence.monitoring_repository_impl import (
+    MONITORING_MATERIALIZED_VIEWS,
     MonitoringRepositoryImpl,
 )
 
@@ -118,6 +120,73 @@ async def async_session() -> AsyncGenerator[AsyncSession]:
             )
         """)
         )
+        # マテリアライズドビュー（alembic 047）の代わりに同じカラムのテーブルを作る
+        await conn.execute(
+            text("""
+            CREATE TABLE mv_monitoring_overall (
+                id INTEGER PRIMARY KEY,
+                total_governing_bodies INTEGER,
+                active_governing_bodies INTEGER,
+                total_conferences INTEGER,
+                active_conferences INTEGER,
+                total_meetings INTEGER,
+                total_politicians INTEGER,
+                active_politicians INTEGER,
+                total_parties INTEGER,
+                active_parties INTEGER,
+                total_conversations INTEGER,
+                linked_conversations INTEGER,
+                total_speakers INTEGER,
+                linked_speakers INTEGER,
+                refreshed_at TEXT
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE mv_conference_coverage (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                governing_body_name TEXT,
+                meeting_count INTEGER,
+                politician_count INTEGER,
+                conversation_count INTEGER,
+                first_meeting_date TEXT,
+                last_meeting_date TEXT,
+                refreshed_at TEXT
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE mv_governing_body_coverage (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                type TEXT,
+                organization_code TEXT,
+                organization_type TEXT,
+                conference_count INTEGER,
+                meeting_count INTEGER,
+                politician_count INTEGER,
+                conversation_count INTEGER,
+                first_meeting_date TEXT,
+                last_meeting_date TEXT,
+                refreshed_at TEXT
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE mv_party_coverage (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                politician_count INTEGER,
+                speaker_count INTEGER,
+                conversation_count INTEGER,
+                refreshed_at TEXT
+            )
+        """)
+        )
 
     async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -188,3 +257,102 @@ async def test_get_prefecture_coverage_empty(async_session: AsyncSession) -> Non
     assert isinstance(coverage, dict)
     assert "prefectures" in coverage
     assert "municipalities" in coverage
+
+
+REFRESHED_AT = "2026-01-01T03:00:00+09:00"
+
+
+@pytest.mark.asyncio
+async def test_get_overall_metrics_reads_aggregates(
+    async_session: AsyncSession,
+) -> None:
+    """Test overall metrics are read from the aggregate with its refresh time."""
+    await async_session.execute(
+        text("""
+        INSERT INTO mv_monitoring_overall VALUES
+            (1, 10, 4, 8, 6, 100, 50, 25, 5, 3, 1000, 40, 80, 60, :refreshed_at)
+    """),
+        {"refreshed_at": REFRESHED_AT},
+    )
+    repo = MonitoringRepositoryImpl(async_session)
+
+    metrics = await repo.get_overall_metrics()
+
+    assert metrics["governing_bodies"] == {"total": 10, "active": 4, "coverage": 40.0}
+    assert metrics["speakers"]["linkage_rate"] == 75.0
+    assert metrics["refreshed_at"] == REFRESHED_AT
+
+
+@pytest.mark.asyncio
+async def test_governing_body_coverage_reads_aggregates(
+    async_session: AsyncSession,
+) -> None:
+    """Test prefecture and committee type coverage derive from one aggregate."""
+    await async_session.execute(
+        text("""
+        INSERT INTO mv_governing_body_coverage VALUES
+            (1, '東京都', '都道府県', '130001', '都', 3, 12, 5, 300,
+             '2024-01-10', '2024-06-01', :refreshed_at),
+            (2, '大阪府', '都道府県', '270008', '府', 1, 0, 0, 0,
+             NULL, NULL, :refreshed_at),
+            (3, '新宿区', '市町村', NULL, NULL, 0, 0, 0, 0,
+             NULL, NULL, :refreshed_at)
+    """),
+        {"refreshed_at": REFRESHED_AT},
+    )
+    repo = MonitoringRepositoryImpl(async_session)
+
+    detailed = await repo.get_prefecture_detailed_coverage()
+    summary = await repo.get_prefecture_coverage()
+    committee_types = await repo.get_committee_type_coverage()
+
+    assert [(c["name"], c["status"]) for c in detailed] == [
+        ("新宿区", "inactive"),
+        ("大阪府", "partial"),
+        ("東京都", "active"),
+    ]
+    assert detailed[2]["period"] == {"start": "2024-01-10", "end": "2024-06-01"}
+    assert summary["prefectures"] == {"total": 2, "with_data": 1, "coverage": 50.0}
+    assert summary["refreshed_at"] == REFRESHED_AT
+    assert committee_types == [
+        {
+            "type": "都道府県",
+            "conferences": 4,
+            "meetings": 12,
+            "governing_bodies": 2,
+            "refreshed_at": REFRESHED_AT,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_aggregates() -> None:
+    """Test every aggregate view is refreshed concurrently by default."""
+    session = AsyncMock(spec=AsyncSession)
+    repo = MonitoringRepositoryImpl(session)
+
+    refreshed = await repo.refresh_aggregates()
+    await repo.refresh_aggregates(concurrently=False)
+
+    assert refreshed == list(MONITORING_MATERIALIZED_VIEWS)
+    statements = [str(call.args[0]) for call in session.execute.call_args_list]
+    assert (
+        statements[0] == "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_monitoring_overall"
+    )
+    assert statements[-1] == "REFRESH MATERIALIZED VIEW mv_party_coverage"
+    session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_refreshed_at(async_session: AsyncSession) -> None:
+    """Test the refresh time is reported per view (None when empty)."""
+    await async_session.execute(
+        text("INSERT INTO mv_party_coverage VALUES (1, '自民党', 1, 1, 1, :at)"),
+        {"at": REFRESHED_AT},
+    )
+    repo = MonitoringRepositoryImpl(async_session)
+
+    refreshed_at = await repo.get_aggregates_refreshed_at()
+
+    assert refreshed_at["mv_party_coverage"] == REFRESHED_AT
+    assert refreshed_at["mv_monitoring_overall"] is None
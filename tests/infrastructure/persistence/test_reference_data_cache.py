@@ -0,0 +1,183 @@
+"""reference_data_cache（参照データの読み込みキャッシュ）のテスト."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.entities.political_party import PoliticalParty
+from src.infrastructure.persistence import reference_data_cache
+from src.infrastructure.persistence.political_party_repository_impl import (
+    PoliticalPartyModel,
+    PoliticalPartyRepositoryImpl,
+)
+from src.infrastructure.persistence.reference_data_cache import (
+    POLITICAL_PARTIES,
+    ReferenceDataCache,
+    ReferenceDataCacheMixin,
+    configure_reference_data_cache,
+    get_reference_data_cache,
+)
+
+
+def _parties() -> list[PoliticalParty]:
+    return [
+        PoliticalParty(id=1, name="自由民主党"),
+        PoliticalParty(id=2, name="立憲民主党"),
+    ]
+
+
+@pytest.fixture
+def enabled_cache():  # type: ignore[no-untyped-def]
+    configure_reference_data_cache(60)
+    yield
+    configure_reference_data_cache(0)
+
+
+class TestReferenceDataCache:
+    """ReferenceDataCache のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_loads_once_and_serves_typed_lookups(self) -> None:
+        cache: ReferenceDataCache[PoliticalParty] = ReferenceDataCache("parties", 60)
+        loader = AsyncMock(side_effect=_parties)
+
+        assert [p.id for p in await cache.get_all(loader)] == [1, 2]
+        assert (await cache.get_by_id(2, loader)).name == "立憲民主党"
+        assert await cache.get_by_id(99, loader) is None
+        assert [p.id for p in await cache.get_by_ids([2, 99, 1, 2], loader)] == [2, 1]
+        assert [p.id for p in await cache.get_by_name("自由民主党", loader)] == [1]
+        loader.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_copies(self) -> None:
+        cache: ReferenceDataCache[PoliticalParty] = ReferenceDataCache("parties", 60)
+        loader = AsyncMock(side_effect=_parties)
+
+        party = await cache.get_by_id(1, loader)
+        party.name = "変更"
+
+        assert (await cache.get_by_id(1, loader)).name == "自由民主党"
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_invalidate_or_ttl(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        now = [1000.0]
+        monkeypatch.setattr(reference_data_cache.time, "monotonic", lambda: now[0])
+        cache: ReferenceDataCache[PoliticalParty] = ReferenceDataCache("parties", 60)
+        loader = AsyncMock(side_effect=_parties)
+
+        await cache.get_all(loader)
+        cache.invalidate()
+        await cache.get_all(loader)
+        now[0] += 61
+        await cache.get_all(loader)
+
+        assert loader.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_result_loaded_before_invalidate_is_not_stored(self) -> None:
+        cache: ReferenceDataCache[PoliticalParty] = ReferenceDataCache("parties", 60)
+
+        async def loader_invalidated_midway() -> list[PoliticalParty]:
+            cache.invalidate()
+            return _parties()
+
+        await cache.get_all(loader_invalidated_midway)
+        loader = AsyncMock(side_effect=_parties)
+        await cache.get_all(loader)
+
+        loader.assert_awaited_once()
+
+
+class TestCachedRepository:
+    """リポジトリ経由のキャッシュ利用のテスト."""
+
+    @staticmethod
+    def _session() -> MagicMock:
+        session = MagicMock(spec=AsyncSession)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            PoliticalPartyModel(id=1, name="自由民主党"),
+            PoliticalPartyModel(id=2, name="立憲民主党"),
+        ]
+        session.execute = AsyncMock(return_value=result)
+        session.get = AsyncMock(
+            return_value=PoliticalPartyModel(id=1, name="自由民主党")
+        )
+        session.flush = AsyncMock()
+        session.delete = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_reads_are_shared_across_repositories(self, enabled_cache) -> None:  # type: ignore[no-untyped-def]
+        first_session = self._session()
+        second_session = self._session()
+
+        await PoliticalPartyRepositoryImpl(first_session).get_all()
+        repo = PoliticalPartyRepositoryImpl(second_session)
+        party = await repo.get_by_name("立憲民主党")
+        by_id = await repo.get_by_id(1)
+
+        assert party is not None and party.id == 2
+        assert by_id is not None and by_id.name == "自由民主党"
+        first_session.execute.assert_awaited_once()
+        second_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_paginated_get_all_bypasses_cache(self, enabled_cache) -> None:  # type: ignore[no-untyped-def]
+        session = self._session()
+        repo = PoliticalPartyRepositoryImpl(session)
+
+        await repo.get_all(limit=1)
+        await repo.get_all(limit=1)
+
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_and_writer_reads_from_database(
+        self,
+        enabled_cache,  # type: ignore[no-untyped-def]
+    ) -> None:
+        reader = PoliticalPartyRepositoryImpl(self._session())
+        await reader.get_all()
+        writer_session = self._session()
+        writer = PoliticalPartyRepositoryImpl(writer_session)
+
+        await writer.delete(1)
+        await writer.get_all()
+        await writer.get_all()
+
+        # 書き込んだリポジトリは未コミットの内容をキャッシュしない
+        assert writer_session.execute.await_count == 2
+        assert get_reference_data_cache(POLITICAL_PARTIES)._snapshot is None
+
+    def test_session_commit_invalidates(self, enabled_cache) -> None:  # type: ignore[no-untyped-def]
+        class _Repository(ReferenceDataCacheMixin[PoliticalParty]):
+            _reference_table = POLITICAL_PARTIES
+
+            def __init__(self, session: Session):
+                self.session = session
+
+        cache = get_reference_data_cache(POLITICAL_PARTIES)
+        session = Session(bind=create_engine("sqlite://"))
+        _Repository(session)._invalidate_reference_cache()
+        cache._snapshot = MagicMock()
+
+        session.commit()
+
+        assert cache._snapshot is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_invalidates(self, enabled_cache) -> None:  # type: ignore[no-untyped-def]
+        await PoliticalPartyRepositoryImpl(self._session()).get_all()
+        writer = PoliticalPartyRepositoryImpl(self._session())
+
+        await writer.bulk_update_fields(
+            [PoliticalParty(id=1, name="新党")], fields=["name"]
+        )
+
+        assert get_reference_data_cache(POLITICAL_PARTIES)._snapshot is None
+        assert writer._reference_cache is None
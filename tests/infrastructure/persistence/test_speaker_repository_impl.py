@@ -1110,3 +1110,273 @@ class TestClassifyIsPoliticianBulk:
         # 全クエリにis_manually_verified = FALSE条件が含まれる
         for query_str, _params in execute_calls:
             assert "is_manually_verified = FALSE" in query_str
+
+
+class TestResolveByNames:
+    """resolve_by_names()のテスト."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create mock session."""
+        session = MagicMock(spec=AsyncSession)
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create speaker repository."""
+        return SpeakerRepositoryImpl(mock_session)
+
+    @staticmethod
+    def _row(**values):
+        row = MagicMock()
+        for key, value in values.items():
+            setattr(row, key, value)
+        return row
+
+    @pytest.mark.asyncio
+    async def test_select_insert_and_backfill_once(self, repository, mock_session):
+        """検索・挿入・読み仮名補完がそれぞれ1文で発行される."""
+        execute_calls = []
+        results = iter(
+            [
+                MagicMock(
+                    fetchall=MagicMock(
+                        return_value=[
+                            self._row(id=1, name="岸田文雄", name_yomi=None),
+                            self._row(id=2, name="河野太郎", name_yomi="こうの"),
+                        ]
+                    )
+                ),
+                MagicMock(),
+                MagicMock(fetchall=MagicMock(return_value=[])),
+                MagicMock(
+                    fetchall=MagicMock(
+                        return_value=[self._row(id=3, name="石破茂")],
+                    )
+                ),
+                MagicMock(rowcount=1),
+            ]
+        )
+
+        async def async_execute(query, params=None):
+            execute_calls.append((str(query), params))
+            return next(results)
+
+        async def async_flush():
+            pass
+
+        mock_session.execute = async_execute
+        mock_session.flush = async_flush
+
+        result = await repository.resolve_by_names(
+            {"岸田文雄": "きしだふみお", "河野太郎": "こうのたろう", "石破茂": None}
+        )
+
+        assert result.speaker_ids == {"岸田文雄": 1, "河野太郎": 2, "石破茂": 3}
+        assert result.created_count == 1
+        assert result.yomi_updated_count == 1
+        assert len(execute_calls) == 5
+        assert "ANY(:names)" in execute_calls[0][0]
+        # 未登録名のみロックしてから引き直す
+        assert "pg_advisory_xact_lock" in execute_calls[1][0]
+        assert execute_calls[1][1]["names"] == ["石破茂"]
+        assert execute_calls[2][1] == {"names": ["石破茂"]}
+        assert "ON CONFLICT DO NOTHING" in execute_calls[3][0]
+        assert execute_calls[3][1] == {"names": ["石破茂"], "yomis": [None]}
+        # name_yomi が既にある河野太郎は補完対象外
+        assert execute_calls[4][1] == {"ids": [1], "yomis": ["きしだふみお"]}
+
+    @pytest.mark.asyncio
+    async def test_name_created_while_waiting_for_lock(self, repository, mock_session):
+        """ロック待ちの間に他プロセスが作成した名前はINSERTしない."""
+        execute_calls = []
+        results = iter(
+            [
+                MagicMock(fetchall=MagicMock(return_value=[])),
+                MagicMock(),
+                MagicMock(
+                    fetchall=MagicMock(
+                        return_value=[self._row(id=7, name="新人議員", name_yomi="")]
+                    )
+                ),
+            ]
+        )
+
+        async def async_execute(query, params=None):
+            execute_calls.append(str(query))
+            return next(results)
+
+        async def async_flush():
+            pass
+
+        mock_session.execute = async_execute
+        mock_session.flush = async_flush
+
+        result = await repository.resolve_by_names({"新人議員": None})
+
+        assert result.speaker_ids == {"新人議員": 7}
+        assert result.created_count == 0
+        assert len(execute_calls) == 3
+        assert not any("INSERT" in q for q in execute_calls)
+
+    @pytest.mark.asyncio
+    async def test_all_existing_skips_insert(self, repository, mock_session):
+        """全員登録済みならINSERTを発行しない."""
+        execute_calls = []
+
+        async def async_execute(query, params=None):
+            execute_calls.append(str(query))
+            return MagicMock(
+                fetchall=MagicMock(
+                    return_value=[self._row(id=1, name="議長", name_yomi="ぎちょう")]
+                )
+            )
+
+        async def async_flush():
+            pass
+
+        mock_session.execute = async_execute
+        mock_session.flush = async_flush
+
+        result = await repository.resolve_by_names({"議長": "ぎちょう"})
+
+        assert result.speaker_ids == {"議長": 1}
+        assert result.created_count == 0
+        assert len(execute_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, repository, mock_session):
+        """空入力ではクエリを発行しない."""
+        result = await repository.resolve_by_names({})
+
+        assert result.speaker_ids == {}
+        mock_session.execute.assert_not_called()
+
+
+class TestResolveByNameParty:
+    """find_ids_by_name_party() / resolve_by_name_party()のテスト."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create mock session."""
+        session = MagicMock(spec=AsyncSession)
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create speaker repository."""
+        return SpeakerRepositoryImpl(mock_session)
+
+    @staticmethod
+    def _row(**values):
+        row = MagicMock()
+        for key, value in values.items():
+            setattr(row, key, value)
+        return row
+
+    @pytest.mark.asyncio
+    async def test_find_ids_in_single_query(self, repository, mock_session):
+        """重複を除いた組を1クエリで照合し、入力順の位置で対応付ける."""
+        execute_calls = []
+
+        async def async_execute(query, params=None):
+            execute_calls.append((str(query), params))
+            return MagicMock(fetchall=MagicMock(return_value=[self._row(idx=2, id=5)]))
+
+        mock_session.execute = async_execute
+
+        result = await repository.find_ids_by_name_party(
+            [("田中太郎", "自民党"), ("山田花子", None), ("田中太郎", "自民党")]
+        )
+
+        assert result == {("山田花子", None): 5}
+        assert len(execute_calls) == 1
+        assert "WITH ORDINALITY" in execute_calls[0][0]
+        assert execute_calls[0][1] == {
+            "names": ["田中太郎", "山田花子"],
+            "parties": ["自民党", None],
+        }
+
+    @pytest.mark.asyncio
+    async def test_resolve_inserts_missing_in_one_statement(
+        self, repository, mock_session
+    ):
+        """未登録の組はロック後に1文のINSERTでまとめて作成する."""
+        execute_calls = []
+        results = iter(
+            [
+                MagicMock(fetchall=MagicMock(return_value=[self._row(idx=1, id=1)])),
+                MagicMock(),
+                MagicMock(fetchall=MagicMock(return_value=[])),
+                MagicMock(
+                    fetchall=MagicMock(
+                        return_value=[
+                            self._row(id=2, name="山田花子", political_party_name=None),
+                            self._row(
+                                id=3, name="佐藤一郎", political_party_name="公明党"
+                            ),
+                        ]
+                    )
+                ),
+            ]
+        )
+
+        async def async_execute(query, params=None):
+            execute_calls.append((str(query), params))
+            return next(results)
+
+        async def async_flush():
+            pass
+
+        mock_session.execute = async_execute
+        mock_session.flush = async_flush
+
+        result = await repository.resolve_by_name_party(
+            [("田中太郎", "自民党"), ("山田花子", None), ("佐藤一郎", "公明党")]
+        )
+
+        assert result.speaker_ids == {
+            ("田中太郎", "自民党"): 1,
+            ("山田花子", None): 2,
+            ("佐藤一郎", "公明党"): 3,
+        }
+        assert result.created_count == 2
+        assert len(execute_calls) == 4
+        assert "pg_advisory_xact_lock" in execute_calls[1][0]
+        assert execute_calls[1][1]["names"] == ["山田花子", "佐藤一郎"]
+        assert "ON CONFLICT DO NOTHING" in execute_calls[3][0]
+        assert execute_calls[3][1] == {
+            "names": ["山田花子", "佐藤一郎"],
+            "parties": [None, "公明党"],
+            "is_politicians": [False, True],
+        }
+
+    @pytest.mark.asyncio
+    async def test_resolve_all_existing_skips_insert(self, repository, mock_session):
+        """全組が登録済みならロックもINSERTも発行しない."""
+        execute_calls = []
+
+        async def async_execute(query, params=None):
+            execute_calls.append(str(query))
+            return MagicMock(fetchall=MagicMock(return_value=[self._row(idx=1, id=9)]))
+
+        async def async_flush():
+            pass
+
+        mock_session.execute = async_execute
+        mock_session.flush = async_flush
+
+        result = await repository.resolve_by_name_party([("議長", None)])
+
+        assert result.speaker_ids == {("議長", None): 9}
+        assert result.created_count == 0
+        assert len(execute_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, repository, mock_session):
+        """空入力ではクエリを発行しない."""
+        result = await repository.resolve_by_name_party([])
+
+        assert result.speaker_ids == {}
+        assert result.created_count == 0
+        mock_session.execute.assert_not_called()
@@ -9,6 +9,9 @@ from sqlalchemy.orm import sessionmaker
 
 from src.infrastructure.config.database import DATABASE_URL
 from src.infrastructure.persistence.async_session_adapter import AsyncSessionAdapter
+from src.infrastructure.persistence.monitoring_repository_impl import (
+    MONITORING_MATERIALIZED_VIEWS,
+)
 from src.infrastructure.persistence.monitoring_repository_impl import (
     MonitoringRepositoryImpl as MonitoringRepository,
 )
@@ -129,8 +132,12 @@ def setup_test_data(db_session):
 
 
 @pytest.fixture
-def repository(db_session):
+def repository(db_session, setup_test_data):
     """Create MonitoringRepository instance with test session"""
+    # 集計はマテリアライズドビューから読むため、テストデータ投入後に更新する
+    for view_name in MONITORING_MATERIALIZED_VIEWS:
+        db_session.execute(text(f"REFRESH MATERIALIZED VIEW {view_name}"))
+    db_session.commit()
     async_session = AsyncSessionAdapter(db_session)
     return MonitoringRepository(session=async_session)
 
@@ -48,6 +48,7 @@ class TestMinutesProcessingWithExtractionLog:
         uow.commit = AsyncMock()
         uow.rollback = AsyncMock()
         uow.flush = AsyncMock()
+        uow.savepoint = MagicMock()
         return uow
 
     @pytest.fixture
@@ -60,7 +61,13 @@ class TestMinutesProcessingWithExtractionLog:
             log.id = 1  # Simulate ID generation
             return log
 
+        async def bulk_create_logs(logs: list[ExtractionLog]) -> list[ExtractionLog]:
+            for log_id, log in enumerate(logs, start=1):
+                log.id = log_id
+            return logs
+
         repo.create = AsyncMock(side_effect=create_log)
+        repo.bulk_create = AsyncMock(side_effect=bulk_create_logs)
         repo.get_by_entity = AsyncMock(return_value=None)
         return repo
 
@@ -109,6 +116,22 @@ class TestMinutesProcessingWithExtractionLog:
             sequence_number=1,
         )
         mock_conversation_repo.update = AsyncMock()
+        mock_conversation_repo.get_by_ids.return_value = [
+            Conversation(
+                id=1,
+                minutes_id=1,
+                speaker_name="田中太郎",
+                comment="発言内容1",
+                sequence_number=1,
+            ),
+            Conversation(
+                id=2,
+                minutes_id=1,
+                speaker_name="山田花子",
+                comment="発言内容2",
+                sequence_number=2,
+            ),
+        ]
 
         return UpdateConversationFromExtractionUseCase(
             conversation_repo=mock_conversation_repo,
@@ -141,6 +164,7 @@ class TestMinutesProcessingWithExtractionLog:
     async def test_minutes_processing_creates_extraction_logs(
         self,
         mock_unit_of_work,
+        mock_extraction_log_repository,
         mock_speaker_service,
         mock_minutes_processing_service,
         mock_storage_service,
@@ -206,8 +230,13 @@ class TestMinutesProcessingWithExtractionLog:
         assert result.minutes_id == 1
         assert result.total_conversations == 2
 
-        # Verify extraction log UseCase was called
-        # (Actual verification depends on mock_extraction_log_repository.create calls)
+        # Verify extraction logs were written in one batch and linked in bulk
+        mock_extraction_log_repository.bulk_create.assert_awaited_once()
+        logs = mock_extraction_log_repository.bulk_create.call_args[0][0]
+        assert [log.entity_id for log in logs] == [1, 2]
+        mock_extraction_log_repository.create.assert_not_called()
+        conversation_repo = update_statement_usecase._conversation_repo
+        conversation_repo.bulk_update_from_extraction.assert_awaited_once()
         assert mock_unit_of_work.commit.called
 
 
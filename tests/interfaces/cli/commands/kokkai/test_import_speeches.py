@@ -1,6 +1,7 @@
 """kokkai import コマンドのテスト."""
 
-from unittest.mock import AsyncMock, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from click.testing import CliRunner
 
@@ -156,3 +157,83 @@ class TestImportSpeechesCommand:
         assert result.exit_code == 0
         assert "エラー" in result.output
         assert "テストエラー1" in result.output
+
+
+class TestImportSpeechesWorkers:
+    def test_workers_shard_and_merge_results(self, mock_container: MagicMock) -> None:
+        mock_usecase = _setup_usecase_mock(mock_container)
+        meetings = [_make_meeting(1, f"第{i}号") for i in range(1, 9)]
+        mock_usecase.fetch_target_meetings = AsyncMock(return_value=meetings)
+        mock_usecase.execute = AsyncMock(
+            side_effect=[
+                _make_output(meetings_found=2, speeches_imported=40),
+                _make_output(meetings_found=3, speeches_imported=60),
+            ]
+        )
+
+        runner = CliRunner()
+        with patch(
+            "src.interfaces.cli.commands.kokkai.import_speeches._make_executor",
+            side_effect=lambda workers: ThreadPoolExecutor(max_workers=1),
+        ):
+            result = runner.invoke(
+                import_speeches, ["--workers", "2", "--sleep", "1.5"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "2ワーカー" in result.output
+        # 会議一覧は親プロセスで1回だけ取得し、シャードごとに渡す
+        mock_usecase.fetch_target_meetings.assert_awaited_once()
+        dtos = [call.args[0] for call in mock_usecase.execute.call_args_list]
+        assert [(d.shard_index, d.shard_count) for d in dtos] == [(0, 2), (1, 2)]
+        assert sorted(m.issue_id for d in dtos for m in d.meetings) == sorted(
+            m.issue_id for m in meetings
+        )
+        for d in dtos:
+            assert all(
+                BatchImportKokkaiSpeechesUseCase.shard_of(m.issue_id, 2)
+                == d.shard_index
+                for m in d.meetings
+            )
+            # スリープとレート上限はワーカー数で分け合う
+            assert d.sleep_interval == 3.0
+        mock_container.services.kokkai_api_client.add_kwargs.assert_called_with(
+            rate_limit_share=0.5
+        )
+        # 両ワーカーの結果が合算される
+        assert "検出会議数:     5" in result.output
+        assert "インポート発言数: 100" in result.output
+        assert "第1回: 10処理 / 0スキップ / 100件インポート" in result.output
+
+    def test_failed_worker_keeps_other_results(self, mock_container: MagicMock) -> None:
+        mock_usecase = _setup_usecase_mock(mock_container)
+        meetings = [_make_meeting(1, f"第{i}号") for i in range(1, 9)]
+        mock_usecase.fetch_target_meetings = AsyncMock(return_value=meetings)
+        mock_usecase.execute = AsyncMock(
+            side_effect=[
+                RuntimeError("接続断"),
+                _make_output(meetings_found=3, speeches_imported=60),
+            ]
+        )
+
+        runner = CliRunner()
+        with patch(
+            "src.interfaces.cli.commands.kokkai.import_speeches._make_executor",
+            side_effect=lambda workers: ThreadPoolExecutor(max_workers=1),
+        ):
+            result = runner.invoke(import_speeches, ["--workers", "2"])
+
+        assert result.exit_code == 1
+        assert "インポート発言数: 60" in result.output
+        assert "ワーカー 1/2 が異常終了しました: 接続断" in result.output
+
+    def test_dry_run_ignores_workers(self, mock_container: MagicMock) -> None:
+        mock_usecase = _setup_usecase_mock(mock_container)
+        mock_usecase.fetch_target_meetings = AsyncMock(return_value=[_make_meeting()])
+
+        runner = CliRunner()
+        result = runner.invoke(import_speeches, ["--workers", "4", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "合計: 1 件" in result.output
+        mock_usecase.execute.assert_not_called()
@@ -0,0 +1,140 @@
+"""process-minutes コマンドのテスト."""
+
+import asyncio
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from click.testing import CliRunner
+
+from src.application.dtos.minutes_processing_dto import MinutesProcessingResultDTO
+from src.domain.entities.meeting import Meeting
+from src.interfaces.cli.commands.minutes_commands import (
+    MinutesCommands,
+    process_meetings_concurrently,
+)
+
+
+def _make_result(meeting_id: int, conversations: int = 3) -> MinutesProcessingResultDTO:
+    return MinutesProcessingResultDTO(
+        minutes_id=meeting_id * 10,
+        meeting_id=meeting_id,
+        total_conversations=conversations,
+        unique_speakers=1,
+        processing_time_seconds=0.1,
+        processed_at=datetime(2024, 1, 1),
+    )
+
+
+def _make_usecase_factory(failing_ids: set[int] | None = None) -> MagicMock:
+    async def execute(request):  # type: ignore[no-untyped-def]
+        await asyncio.sleep(0)
+        if request.meeting_id in (failing_ids or set()):
+            raise ValueError(f"Meeting {request.meeting_id} not found")
+        return _make_result(request.meeting_id)
+
+    def factory() -> MagicMock:
+        usecase = MagicMock()
+        usecase.execute = AsyncMock(side_effect=execute)
+        return usecase
+
+    return MagicMock(side_effect=factory)
+
+
+@pytest.fixture
+def mock_container() -> MagicMock:  # type: ignore[misc]
+    with patch("src.interfaces.cli.base.get_container") as mock_get:
+        container = MagicMock()
+        mock_get.return_value = container
+        yield container
+
+
+class TestProcessMeetingsConcurrently:
+    """process_meetings_concurrently のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_per_meeting(self) -> None:
+        usecase_factory = _make_usecase_factory(failing_ids={2})
+
+        summary = await process_meetings_concurrently(
+            [1, 2, 3], usecase_factory=usecase_factory, workers=2
+        )
+
+        assert summary.total_meetings == 3
+        assert summary.succeeded_meetings == 2
+        assert summary.total_conversations == 6
+        assert summary.failures == [(2, "Meeting 2 not found")]
+        # 会議ごとにユースケース（Unit of Work）を作り直す
+        assert usecase_factory.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_workers_run_meetings_concurrently(self) -> None:
+        running = 0
+        max_running = 0
+
+        async def execute(request):  # type: ignore[no-untyped-def]
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _make_result(request.meeting_id)
+
+        usecase = MagicMock()
+        usecase.execute = AsyncMock(side_effect=execute)
+
+        summary = await process_meetings_concurrently(
+            list(range(1, 7)), usecase_factory=lambda: usecase, workers=3
+        )
+
+        assert summary.succeeded_meetings == 6
+        assert max_running == 3
+
+
+class TestProcessMinutesCommand:
+    """process-minutes コマンドのテスト."""
+
+    def test_requires_meeting_id_or_all_pending(
+        self, mock_container: MagicMock
+    ) -> None:
+        result = CliRunner().invoke(MinutesCommands.process_minutes, [])
+
+        assert result.exit_code == 1
+        mock_container.use_cases.minutes_processing_usecase.assert_not_called()
+
+    def test_all_pending_processes_pending_meetings(
+        self, mock_container: MagicMock
+    ) -> None:
+        meetings = [
+            Meeting(id=i, conference_id=1, date=date(2024, 1, i)) for i in (1, 2)
+        ]
+        meeting_repo = AsyncMock()
+        meeting_repo.get_pending_minutes_processing = AsyncMock(return_value=meetings)
+        mock_container.repositories.meeting_repository.return_value = meeting_repo
+        mock_container.use_cases.minutes_processing_usecase = _make_usecase_factory()
+
+        result = CliRunner().invoke(
+            MinutesCommands.process_minutes,
+            ["--all-pending", "--workers", "2", "--limit", "5"],
+        )
+
+        assert result.exit_code == 0, result.output
+        meeting_repo.get_pending_minutes_processing.assert_awaited_once_with(5)
+        assert "成功: 2" in result.output
+        assert "LLMトークン" in result.output
+
+    def test_exit_code_is_nonzero_when_a_meeting_fails(
+        self, mock_container: MagicMock
+    ) -> None:
+        mock_container.use_cases.minutes_processing_usecase = _make_usecase_factory(
+            failing_ids={7}
+        )
+
+        result = CliRunner().invoke(
+            MinutesCommands.process_minutes, ["--meeting-id", "7"]
+        )
+
+        assert result.exit_code == 1
+        assert "meeting_id=7: Meeting 7 not found" in result.output
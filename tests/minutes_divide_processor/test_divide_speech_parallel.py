@@ -0,0 +1,179 @@
+"""MinutesProcessAgentの発言分割（セクション再分割・並列処理）のテスト。"""
+
+import asyncio
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.section_chunker import (
+    SectionChunker,
+    TokenEstimator,
+)
+from src.minutes_divide_processor.minutes_process_agent import MinutesProcessAgent
+from src.minutes_divide_processor.models import (
+    MinutesProcessState,
+    SectionString,
+    SectionStringList,
+    SpeakerAndSpeechContent,
+    SpeakerAndSpeechContentList,
+)
+
+
+def _make_agent(concurrency: int) -> MinutesProcessAgent:
+    """LLM依存をモックしたAgentを作成。"""
+    with (
+        patch("langchain_google_genai.ChatGoogleGenerativeAI"),
+        patch(
+            "src.infrastructure.external.langgraph_speech_extraction_agent"
+            ".SpeechExtractionAgent"
+        ),
+        patch(
+            "src.infrastructure.external.minutes_divider.factory.MinutesDividerFactory"
+        ) as mock_factory,
+    ):
+        mock_factory.create.return_value = MagicMock()
+        return MinutesProcessAgent(speech_divide_concurrency=concurrency)
+
+
+def _store_sections(agent: MinutesProcessAgent, count: int) -> MinutesProcessState:
+    sections = SectionStringList(
+        section_string_list=[
+            SectionString(
+                chapter_number=i, sub_chapter_number=1, section_string=f"S{i}"
+            )
+            for i in range(1, count + 1)
+        ]
+    )
+    memory_id = agent._put_to_memory(
+        "section_string_list", {"section_string_list": sections}
+    )
+    return MinutesProcessState(
+        original_minutes="", section_string_list_memory_id=memory_id
+    )
+
+
+class TestDivideSpeechParallel:
+    """_divide_speechノードのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_results_merged_in_section_order(self) -> None:
+        """完了順に関わらずセクション順に結合される。"""
+        agent = _make_agent(concurrency=4)
+        state = _store_sections(agent, 4)
+
+        async def speech_divide_run(section: SectionString):
+            # 後ろのセクションほど先に完了させる
+            await asyncio.sleep(0.01 * (5 - section.chapter_number))
+            return SpeakerAndSpeechContentList(
+                speaker_and_speech_content_list=[
+                    SpeakerAndSpeechContent(
+                        speaker=f"発言者{section.chapter_number}",
+                        speech_content=section.section_string,
+                        chapter_number=section.chapter_number,
+                        sub_chapter_number=1,
+                        speech_order=1,
+                    )
+                ]
+            )
+
+        agent.minutes_divider.speech_divide_run = speech_divide_run
+
+        result = await agent._divide_speech(state)
+
+        memory = agent._get_from_memory(
+            "divided_speech_list", result["divided_speech_list_memory_id"]
+        )
+        assert memory is not None
+        speeches = memory["divided_speech_list"]
+        assert [s.speech_content for s in speeches] == ["S1", "S2", "S3", "S4"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """同時実行数が上限を超えない。"""
+        agent = _make_agent(concurrency=3)
+        state = _store_sections(agent, 10)
+        in_flight = 0
+        peak = 0
+
+        async def speech_divide_run(section: SectionString):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+
+        agent.minutes_divider.speech_divide_run = speech_divide_run
+
+        await agent._divide_speech(state)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_none_result_is_skipped(self) -> None:
+        """Noneを返したセクションはスキップされる。"""
+        agent = _make_agent(concurrency=2)
+        state = _store_sections(agent, 2)
+
+        async def speech_divide_run(section: SectionString):
+            if section.chapter_number == 1:
+                return None
+            return SpeakerAndSpeechContentList(
+                speaker_and_speech_content_list=[
+                    SpeakerAndSpeechContent(
+                        speaker="議長",
+                        speech_content="開会します。",
+                        chapter_number=2,
+                        sub_chapter_number=1,
+                        speech_order=1,
+                    )
+                ]
+            )
+
+        agent.minutes_divider.speech_divide_run = speech_divide_run
+
+        result = await agent._divide_speech(state)
+
+        memory = agent._get_from_memory(
+            "divided_speech_list", result["divided_speech_list_memory_id"]
+        )
+        assert memory is not None
+        assert len(memory["divided_speech_list"]) == 1
+        assert result["index"] == 3
+
+    def test_graph_has_no_divide_speech_loop(self) -> None:
+        """divide_speechはループせずに正規化ノードへ進む。"""
+        agent = _make_agent(concurrency=2)
+        edges = [(e.source, e.target) for e in agent.graph.get_graph().edges]
+
+        assert ("divide_speech", "normalize_speaker_names") in edges
+        assert ("divide_speech", "divide_speech") not in edges
+
+
+class TestCheckLengthChunking:
+    """_check_lengthノード（トークン数に基づく再分割）のテスト。"""
+
+    def test_long_sections_are_replaced_by_chunks(self) -> None:
+        agent = _make_agent(concurrency=2)
+        state = _store_sections(agent, 2)
+        estimator = TokenEstimator(cjk_chars_per_token=1.0, other_chars_per_token=1.0)
+        agent.minutes_divider.chunk_sections = SectionChunker(
+            token_budget=1, estimator=estimator
+        ).chunk
+
+        result = agent._check_length(state)
+
+        memory = agent._get_from_memory(
+            "section_string_list", result["section_string_list_memory_id"]
+        )
+        assert memory is not None
+        chunks = memory["section_string_list"].section_string_list
+        assert [(c.chapter_number, c.sub_chapter_number) for c in chunks] == [
+            (1, 1),
+            (1, 2),
+            (2, 1),
+            (2, 2),
+        ]
+        assert agent.last_chunking_stats is not None
+        assert agent.last_chunking_stats.chunk_count == 4
@@ -2,10 +2,13 @@
 
 import asyncio
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
 from src.domain.pagination import PaginatedResult, PaginationParams
 from src.infrastructure.external.cached_llm_service import CachedLLMService, LLMCache
 from src.infrastructure.external.concurrent_llm_service import (
@@ -13,7 +16,15 @@ from src.infrastructure.external.concurrent_llm_service import (
     RateLimiter,
 )
 from src.infrastructure.monitoring.performance_metrics import PerformanceMonitor
-from src.infrastructure.monitoring.slow_query_detector import SlowQueryDetector
+from src.infrastructure.monitoring.slow_query_detector import (
+    QueryStatsCollector,
+    SlowQueryDetector,
+    fingerprint_statement,
+    install_sqlalchemy_listener,
+)
+
+
+DETECTOR_MODULE = "src.infrastructure.monitoring.slow_query_detector"
 
 
 class TestPagination:
@@ -182,6 +193,17 @@ class TestConcurrentLLMService:
         elapsed = asyncio.get_event_loop().time() - start
         assert elapsed >= 0.5  # Should wait for rate limit
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_window(self):
+        """Test that the rate window can be shorter or longer than a second."""
+        limiter = RateLimiter(max_per_second=1, max_concurrent=1, window_seconds=0.2)
+
+        start = asyncio.get_event_loop().time()
+        await limiter.acquire()
+        await limiter.acquire()
+        elapsed = asyncio.get_event_loop().time() - start
+        assert 0.15 <= elapsed < 0.9
+
     @pytest.mark.asyncio
     async def test_concurrent_processing(self):
         """Test concurrent processing with limits."""
@@ -351,3 +373,95 @@ class TestSlowQueryDetector:
         history = detector.get_history()
         assert len(history) == 1
         assert history[0].duration_ms >= 60
+
+
+class TestQueryFingerprinting:
+    """Tests for query fingerprint aggregation."""
+
+    def test_fingerprint_strips_literals_and_parameters(self):
+        """Test statements differing only in values share a fingerprint."""
+        first = fingerprint_statement(
+            "SELECT * FROM speakers WHERE name = 'x' AND id IN (%(id_1)s, %(id_2)s)"
+            " -- comment\n LIMIT 10;"
+        )
+        second = fingerprint_statement(
+            "select * from speakers where name = 'y''z' and id in ($1)  LIMIT 500"
+        )
+
+        assert (
+            first == "SELECT * FROM speakers WHERE name = ? AND id IN (?, ...) LIMIT ?"
+        )
+        assert fingerprint_statement("SELECT CAST(:rows AS jsonb)::text, t1.id") == (
+            "SELECT CAST(? AS jsonb)::text, t1.id"
+        )
+        assert second == "select * from speakers where name = ? and id in (?) LIMIT ?"
+
+    def test_collector_aggregates_and_ranks_by_total_time(self):
+        """Test stats are grouped by fingerprint and ranked by total time."""
+        collector = QueryStatsCollector()
+        collector.record("SELECT * FROM t WHERE id = 1", 5.0)
+        collector.record("SELECT * FROM t WHERE id = 2", 15.0)
+        collector.record("SELECT * FROM u", 12.0)
+
+        top = collector.get_top(2)
+
+        assert [(s.fingerprint, s.calls) for s in top] == [
+            ("SELECT * FROM t WHERE id = ?", 2),
+            ("SELECT * FROM u", 1),
+        ]
+        assert top[0].total_ms == 20.0
+        assert top[0].avg_ms == 10.0
+        assert top[0].max_ms == 15.0
+        report = collector.format_report(1)
+        assert "SELECT * FROM t WHERE id = ?" in report
+        assert "SELECT * FROM u" not in report
+
+    def test_collector_limits_distinct_fingerprints(self):
+        """Test fingerprints beyond the limit are grouped together."""
+        collector = QueryStatsCollector(max_fingerprints=1)
+        collector.record("SELECT * FROM t", 1.0)
+        collector.record("SELECT * FROM u", 1.0)
+        collector.record("SELECT * FROM v", 1.0)
+
+        assert {s.fingerprint: s.calls for s in collector.get_top()} == {
+            "SELECT * FROM t": 1,
+            "(other)": 2,
+        }
+
+    def test_collector_exports_metrics(self):
+        """Test each execution is exported as a histogram and a counter."""
+        collector = QueryStatsCollector()
+        histogram, counter = MagicMock(), MagicMock()
+
+        with (
+            patch(f"{DETECTOR_MODULE}.is_metrics_initialized", return_value=True),
+            patch(
+                f"{DETECTOR_MODULE}.CommonMetrics.db_query_duration",
+                return_value=histogram,
+            ),
+            patch(
+                f"{DETECTOR_MODULE}.CommonMetrics.db_queries_total",
+                return_value=counter,
+            ),
+        ):
+            stats = collector.record("select 1", 3.0)
+
+        attributes = {"fingerprint": stats.fingerprint_id, "operation": "SELECT"}
+        histogram.record.assert_called_once_with(3.0, attributes=attributes)
+        counter.add.assert_called_once_with(1, attributes=attributes)
+
+    @pytest.mark.asyncio
+    async def test_listener_records_async_engine_statements(self):
+        """Test the listener can be installed on an async engine."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        collector = QueryStatsCollector()
+        install_sqlalchemy_listener(engine, threshold_ms=10_000, collector=collector)
+
+        async with engine.connect() as conn:
+            for value in range(3):
+                await conn.execute(text("SELECT :value"), {"value": value})
+        await engine.dispose()
+
+        assert [(s.fingerprint, s.calls) for s in collector.get_top()] == [
+            ("SELECT ?", 3)
+        ]
@@ -574,8 +574,8 @@ class TestBAMLMinutesDivider:
         """Test length checking of sections"""
         from src.minutes_divide_processor.models import SectionStringList
 
-        # Create a section with long text (>6000 bytes)
-        long_text = "あ" * 3000  # 日本語文字は複数バイト
+        # 推定トークン数の上限を超える長さ（日本語は1文字1トークン以下で推定）
+        long_text = "あ" * (divider.chunker.token_budget * 2)
         section_list = SectionStringList(
             section_string_list=[
                 SectionString(
@@ -0,0 +1,175 @@
+"""CheckpointingMinutesDivider / MinutesCheckpointStore のテスト."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.checkpoint_store import (
+    MinutesCheckpointStore,
+)
+from src.infrastructure.external.minutes_divider.checkpointing_divider import (
+    CheckpointingMinutesDivider,
+)
+from src.minutes_divide_processor.models import (
+    MinutesBoundary,
+    SectionInfo,
+    SectionInfoList,
+    SectionString,
+    SpeakerAndSpeechContent,
+    SpeakerAndSpeechContentList,
+)
+
+
+def _speeches(speaker: str) -> SpeakerAndSpeechContentList:
+    return SpeakerAndSpeechContentList(
+        speaker_and_speech_content_list=[
+            SpeakerAndSpeechContent(
+                speaker=speaker,
+                speech_content="開会します。",
+                chapter_number=1,
+                sub_chapter_number=1,
+                speech_order=1,
+            )
+        ]
+    )
+
+
+def _make_divider(
+    tmp_path: Path, prompt_version: str = "v1"
+) -> tuple[CheckpointingMinutesDivider, MagicMock]:
+    inner = MagicMock()
+    inner.rule_based_speech_divide.return_value = None
+    inner.speech_divide_run = AsyncMock(return_value=_speeches("議長"))
+    inner.section_divide_run = AsyncMock(
+        return_value=SectionInfoList(
+            section_info_list=[SectionInfo(chapter_number=1, keyword="○議長")]
+        )
+    )
+    inner.detect_attendee_boundary = AsyncMock(
+        return_value=MinutesBoundary(
+            boundary_found=True,
+            boundary_text="出席者｜境界｜○議長",
+            boundary_type="speech_start",
+            confidence=0.9,
+            reason="発言開始",
+        )
+    )
+    store = MinutesCheckpointStore(tmp_path)
+    return CheckpointingMinutesDivider(inner, store, prompt_version), inner
+
+
+class TestMinutesCheckpointStore:
+    """保存・取得のテスト."""
+
+    def test_key_depends_on_stage_version_and_payload(self) -> None:
+        key = MinutesCheckpointStore.make_key("sections", "v1", "本文")
+        assert key == MinutesCheckpointStore.make_key("sections", "v1", "本文")
+        assert key != MinutesCheckpointStore.make_key("sections", "v2", "本文")
+        assert key != MinutesCheckpointStore.make_key("section_speeches", "v1", "本文")
+        assert key != MinutesCheckpointStore.make_key("sections", "v1", "本文2")
+
+    def test_put_and_get_roundtrip(self, tmp_path: Path) -> None:
+        store = MinutesCheckpointStore(tmp_path)
+        store.put("sections", "abc", {"section_info_list": []})
+
+        assert store.get("sections", "abc") == {"section_info_list": []}
+        assert store.get("sections", "def") is None
+        assert store.hits == 1
+        assert store.misses == 1
+
+    def test_corrupted_file_is_treated_as_miss(self, tmp_path: Path) -> None:
+        store = MinutesCheckpointStore(tmp_path)
+        store.put("sections", "abc", {"section_info_list": []})
+        (tmp_path / "sections" / "ab" / "abc.json").write_text("{", encoding="utf-8")
+
+        assert store.get("sections", "abc") is None
+
+
+class TestCheckpointingMinutesDivider:
+    """段階別チェックポイントのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_section_is_not_sent_to_llm_again(
+        self, tmp_path: Path
+    ) -> None:
+        divider, inner = _make_divider(tmp_path)
+        section = SectionString(chapter_number=1, section_string="○議長 開会します。")
+
+        first = await divider.speech_divide_run(section)
+        # 章番号が変わっても本文が同じなら再利用し、章番号は付け替える
+        second = await divider.speech_divide_run(
+            SectionString(
+                chapter_number=3,
+                sub_chapter_number=2,
+                section_string="○議長 開会します。",
+            )
+        )
+
+        assert inner.speech_divide_run.await_count == 1
+        reused = second.speaker_and_speech_content_list[0]
+        original = first.speaker_and_speech_content_list[0]
+        assert (reused.chapter_number, reused.sub_chapter_number) == (3, 2)
+        assert (reused.speaker, reused.speech_content) == (
+            original.speaker,
+            original.speech_content,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rule_based_result_is_not_stored(self, tmp_path: Path) -> None:
+        """マーカーで分割できたセクションはLLMもチェックポイントも使わない."""
+        divider, inner = _make_divider(tmp_path)
+        inner.rule_based_speech_divide.return_value = _speeches("市長")
+        section = SectionString(chapter_number=1, section_string="○市長 答弁します。")
+
+        result = await divider.speech_divide_run(section)
+
+        assert result.speaker_and_speech_content_list[0].speaker == "市長"
+        inner.speech_divide_run.assert_not_awaited()
+        assert not (tmp_path / "section_speeches").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_across_instances(self, tmp_path: Path) -> None:
+        """別プロセスでの再実行を想定し、新しいインスタンスでも再利用される."""
+        divider, _ = _make_divider(tmp_path)
+        await divider.section_divide_run("議事録全文")
+        await divider.detect_attendee_boundary("議事録全文")
+
+        resumed, inner = _make_divider(tmp_path)
+        sections = await resumed.section_divide_run("議事録全文")
+        boundary = await resumed.detect_attendee_boundary("議事録全文")
+
+        inner.section_divide_run.assert_not_awaited()
+        inner.detect_attendee_boundary.assert_not_awaited()
+        assert sections.section_info_list[0].keyword == "○議長"
+        assert boundary.boundary_type == "speech_start"
+
+    @pytest.mark.asyncio
+    async def test_prompt_version_change_invalidates(self, tmp_path: Path) -> None:
+        divider, _ = _make_divider(tmp_path, prompt_version="v1")
+        section = SectionString(chapter_number=1, section_string="○議長 開会します。")
+        await divider.speech_divide_run(section)
+
+        updated, inner = _make_divider(tmp_path, prompt_version="v2")
+        await updated.speech_divide_run(section)
+
+        inner.speech_divide_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_stored(self, tmp_path: Path) -> None:
+        divider, inner = _make_divider(tmp_path)
+        inner.speech_divide_run.return_value = SpeakerAndSpeechContentList(
+            speaker_and_speech_content_list=[]
+        )
+        section = SectionString(chapter_number=1, section_string="○議長 開会します。")
+
+        await divider.speech_divide_run(section)
+        await divider.speech_divide_run(section)
+
+        assert inner.speech_divide_run.await_count == 2
+
+    def test_non_llm_methods_are_delegated(self, tmp_path: Path) -> None:
+        divider, inner = _make_divider(tmp_path)
+        inner.check_length.return_value = "checked"
+
+        assert divider.check_length([]) == "checked"
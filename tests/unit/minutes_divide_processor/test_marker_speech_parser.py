@@ -0,0 +1,127 @@
+"""marker_speech_parser（発言者マーカーによるルールベース分割）のテスト."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.baml_minutes_divider import (
+    BAMLMinutesDivider,
+)
+from src.infrastructure.external.minutes_divider.marker_speech_parser import (
+    parse_marked_speeches,
+)
+from src.minutes_divide_processor.models import SectionString
+
+
+def _section(text: str) -> SectionString:
+    return SectionString(chapter_number=3, sub_chapter_number=2, section_string=text)
+
+
+class TestParseMarkedSpeeches:
+    """書式ごとの解析と信頼度のテスト."""
+
+    def test_role_and_name_format(self) -> None:
+        result = parse_marked_speeches(
+            _section(
+                "○議長(山田太郎君)ただいまから会議を開きます。"
+                "◆委員(佐藤花子君)質問します。"
+                "◎市長(鈴木一郎)お答えします。"
+            )
+        )
+
+        speeches = result.speeches.speaker_and_speech_content_list
+        assert [s.speaker for s in speeches] == [
+            "議長(山田太郎)",
+            "委員(佐藤花子)",
+            "市長(鈴木一郎)",
+        ]
+        assert speeches[0].speech_content == "ただいまから会議を開きます。"
+        assert [s.speech_order for s in speeches] == [1, 2, 3]
+        assert speeches[0].chapter_number == 3
+        assert speeches[0].sub_chapter_number == 2
+        assert result.confidence == 1.0
+
+    def test_name_with_honorific_or_role_suffix(self) -> None:
+        result = parse_marked_speeches(
+            _section("○山本順三君これより会議を開きます。○田中参考人お答えします。")
+        )
+
+        speeches = result.speeches.speaker_and_speech_content_list
+        assert [s.speaker for s in speeches] == ["山本順三", "田中参考人"]
+        assert speeches[1].speech_content == "お答えします。"
+        assert result.confidence == 1.0
+
+    def test_ruby_is_removed_from_speaker(self) -> None:
+        result = parse_marked_speeches(
+            _section("○議長(山田太郎(やまだたろう)君)開会します。")
+        )
+
+        speech = result.speeches.speaker_and_speech_content_list[0]
+        assert speech.speaker == "議長(山田太郎)"
+        assert speech.speech_content == "開会します。"
+
+    def test_role_only_speaker_lowers_confidence(self) -> None:
+        result = parse_marked_speeches(
+            _section("○議長ただいまから会議を開きます。◆委員(佐藤花子君)質問します。")
+        )
+
+        assert result.speeches.speaker_and_speech_content_list[0].speaker == "議長"
+        assert result.confidence == 0.75
+
+    def test_unparsable_marker_lowers_confidence(self) -> None:
+        result = parse_marked_speeches(
+            _section("○議長(山田太郎君)日程に入ります。○議案第1号について説明します。")
+        )
+
+        assert result.marker_count == 2
+        assert result.parsed_marker_count == 1
+        assert result.confidence == 0.5
+
+    def test_no_marker(self) -> None:
+        result = parse_marked_speeches(_section("発言者マーカーのない文章です。"))
+
+        assert result.confidence == 0.0
+        assert result.speeches.speaker_and_speech_content_list == []
+
+
+class TestSpeechDivideRunFastPath:
+    """BAMLMinutesDivider.speech_divide_run のルールベース分岐のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_well_formed_section_skips_llm(self) -> None:
+        divider = BAMLMinutesDivider()
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            result = await divider.speech_divide_run(
+                _section("○議長(山田太郎君)開会します。◆委員(佐藤花子君)質問します。")
+            )
+
+        mock_speech.assert_not_called()
+        assert len(result.speaker_and_speech_content_list) == 2
+
+    def test_large_circle_marker_uses_rule_based_path(self) -> None:
+        divider = BAMLMinutesDivider()
+
+        result = divider.rule_based_speech_divide(
+            _section("◯議長(山田太郎君)開会します。◯委員(佐藤花子君)質問します。")
+        )
+
+        assert result is not None
+        assert [s.speaker for s in result.speaker_and_speech_content_list] == [
+            "議長(山田太郎)",
+            "委員(佐藤花子)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_section_falls_back_to_llm(self) -> None:
+        divider = BAMLMinutesDivider()
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            mock_speech.return_value = []
+            await divider.speech_divide_run(
+                _section("○議長ただいまから会議を開きます。○日程第1を議題とします。")
+            )
+
+        mock_speech.assert_called_once()
@@ -0,0 +1,99 @@
+"""section_chunker（トークン数に基づくセクション再分割）のテスト."""
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.section_chunker import (
+    SectionChunker,
+    TokenEstimator,
+)
+from src.minutes_divide_processor.models import SectionString, SectionStringList
+
+
+# 1文字1トークンで数える推定器（テストで境界を計算しやすくする）
+ONE_PER_CHAR = TokenEstimator(cjk_chars_per_token=1.0, other_chars_per_token=1.0)
+
+
+def _sections(*texts: str) -> SectionStringList:
+    return SectionStringList(
+        section_string_list=[
+            SectionString(chapter_number=i, sub_chapter_number=1, section_string=t)
+            for i, t in enumerate(texts, start=1)
+        ]
+    )
+
+
+class TestTokenEstimator:
+    """トークン数推定のテスト."""
+
+    def test_japanese_counts_more_tokens_per_char_than_ascii(self) -> None:
+        estimator = TokenEstimator.for_model("gemini-2.0-flash")
+        assert estimator.estimate("あ" * 120) == 100
+        assert estimator.estimate("a" * 120) == 30
+
+    def test_unknown_model_uses_default(self) -> None:
+        estimator = TokenEstimator.for_model("unknown-model")
+        assert estimator.estimate("議事録") == 3
+
+    def test_cumulative_matches_estimate(self) -> None:
+        estimator = TokenEstimator.for_model("gemini-2.0-flash")
+        text = "議長abc開会"
+        cumulative = estimator.cumulative(text)
+        assert len(cumulative) == len(text) + 1
+        assert cumulative[-1] == pytest.approx(4 / 1.2 + 3 / 4.0)
+
+
+class TestSectionChunker:
+    """再分割のテスト."""
+
+    def test_sections_within_budget_are_kept(self) -> None:
+        chunker = SectionChunker(token_budget=100, estimator=ONE_PER_CHAR)
+        result = chunker.chunk(_sections("○議長 開会します。", "◆委員 質問します。"))
+
+        assert [s.section_string for s in result.sections.section_string_list] == [
+            "○議長 開会します。",
+            "◆委員 質問します。",
+        ]
+        assert result.stats.chunk_count == 2
+        assert result.stats.split_section_count == 0
+
+    def test_prefers_speaker_marker_boundaries(self) -> None:
+        utterances = ["○議長" + "あ" * 20, "◆委員" + "い" * 20, "◎市長" + "う" * 20]
+        chunker = SectionChunker(token_budget=50, estimator=ONE_PER_CHAR)
+
+        result = chunker.chunk(_sections("".join(utterances)))
+
+        chunks = result.sections.section_string_list
+        assert [c.section_string for c in chunks] == [
+            utterances[0] + utterances[1],
+            utterances[2],
+        ]
+        assert [c.sub_chapter_number for c in chunks] == [1, 2]
+        assert all(c.chapter_number == 1 for c in chunks)
+
+    def test_falls_back_to_sentence_then_hard_cut(self) -> None:
+        chunker = SectionChunker(token_budget=10, estimator=ONE_PER_CHAR)
+
+        sentence = chunker.chunk(_sections("あいうえおかき。さしすせそ"))
+        hard = chunker.chunk(_sections("あ" * 25))
+
+        assert [c.section_string for c in sentence.sections.section_string_list] == [
+            "あいうえおかき。",
+            "さしすせそ",
+        ]
+        assert [len(c.section_string) for c in hard.sections.section_string_list] == [
+            10,
+            10,
+            5,
+        ]
+
+    def test_stats_report_fill_ratio(self) -> None:
+        chunker = SectionChunker(token_budget=10, estimator=ONE_PER_CHAR)
+        result = chunker.chunk(_sections("あ" * 10, "い" * 5))
+
+        assert result.stats.section_count == 2
+        assert result.stats.chunk_count == 2
+        assert result.stats.average_fill_ratio == 0.75
+
+    def test_invalid_budget(self) -> None:
+        with pytest.raises(ValueError):
+            SectionChunker(token_budget=0)
@@ -0,0 +1,106 @@
+"""section_splitter（キーワードによるセクション分割）のテスト."""
+
+import re
+import unicodedata
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.section_splitter import (
+    KeywordMatcher,
+    normalize_with_offsets,
+    split_by_keywords,
+)
+
+
+def _reference_normalize(text: str) -> str:
+    """全文に対して一括で正規化した結果（期待値）."""
+    normalized = unicodedata.normalize("NFKC", text)
+    normalized = normalized.replace("◯", "○").replace("●", "○")
+    normalized = normalized.replace("\t", " ")
+    return re.sub(r" +", " ", normalized)
+
+
+class TestNormalizeWithOffsets:
+    """正規化と位置対応表のテスト."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "○議長(山田太郎君)ただいまから会議を開きます。",
+            "令和５年度ＤＸ推進計画について",
+            "ｺﾐｭﾆﾃｨﾊﾞｽとﾊﾟｰｸ",
+            "がぎ゚",
+            "◯委員\t\t●部長　 答弁  します",
+            "ｶ゛ギョウ",
+            "",
+        ],
+    )
+    def test_text_matches_whole_string_normalization(self, text: str) -> None:
+        assert normalize_with_offsets(text).text == _reference_normalize(text)
+
+    def test_offsets_point_to_original_characters(self) -> None:
+        text = "ＡＢＣ１２３ｶﾞｲﾄﾞ\t\t○議長 開会"
+        normalized = normalize_with_offsets(text)
+
+        index = normalized.text.index("○議長")
+        assert text[normalized.to_original(index) :].startswith("○議長")
+        assert normalized.to_original(len(normalized.text)) == len(text)
+
+
+class TestKeywordMatcher:
+    """Aho-Corasick検索のテスト."""
+
+    def test_finds_all_occurrences_including_overlaps(self) -> None:
+        matcher = KeywordMatcher(["○議長", "議長", "長で"])
+        occurrences = matcher.find_all("○議長です。○議長で")
+
+        assert occurrences == [[0, 6], [1, 7], [2, 8]]
+
+    def test_empty_patterns(self) -> None:
+        assert KeywordMatcher([]).find_all("議事録") == []
+        assert KeywordMatcher([""]).find_all("議事録") == [[]]
+
+
+class TestSplitByKeywords:
+    """キーワードによる分割のテスト."""
+
+    def test_boundaries_are_exact_after_width_normalization(self) -> None:
+        # 全角英数字・半角カナ・タブは正規化で文字数が変わる
+        text = "ＤＸ推進\t\tｶﾞｲﾄﾞﾗｲﾝ○議長 開会します。◆委員 質問します。"
+        result = split_by_keywords(text, ["ＤＸ推進", "○議長", "◆委員"])
+
+        sections = [text[span.start : span.end] for span in result.spans]
+        assert sections == [
+            "ＤＸ推進\t\tｶﾞｲﾄﾞﾗｲﾝ",
+            "○議長 開会します。",
+            "◆委員 質問します。",
+        ]
+
+    def test_missing_keyword_is_skipped(self) -> None:
+        text = "○議長 開会します。◆委員 質問します。"
+        result = split_by_keywords(text, ["○議長", "存在しない", "◆委員"])
+
+        assert [span.keyword_index for span in result.spans] == [0, 2]
+        assert result.skipped_keyword_indexes == [1]
+
+    def test_partial_match_for_long_keyword(self) -> None:
+        text = "○議長 開会します。◆委員(佐藤花子君) 質問します。"
+        keyword = "◆委員(佐藤花子君) LLMが改変した続き"
+        result = split_by_keywords(text, ["○議長", keyword])
+
+        assert text[result.spans[1].start :].startswith("◆委員")
+
+    def test_first_keyword_not_found_starts_from_beginning(self) -> None:
+        text = "前文 ○議長 開会します。"
+        result = split_by_keywords(text, ["存在しない", "○議長"])
+
+        assert not result.first_keyword_found
+        assert result.spans[0].start == 0
+        assert text[result.spans[1].start :].startswith("○議長")
+
+    def test_repeated_keyword_is_matched_in_order(self) -> None:
+        text = "○議長 開会。◆委員 質問。○議長 閉会。"
+        result = split_by_keywords(text, ["○議長", "◆委員", "○議長"])
+
+        sections = [text[span.start : span.end] for span in result.spans]
+        assert sections == ["○議長 開会。", "◆委員 質問。", "○議長 閉会。"]